@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Compares cpu time used by ns-2 scripted mobility using refresh ticks, against
+using a precomputed contact plan, for a random waypoint scenario. Commands are
+mocked out, so this measures control plane overhead only.
+"""
+import json
+import random
+import time
+from argparse import ArgumentDefaultsHelpFormatter, ArgumentParser, Namespace
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Dict
+from unittest import mock
+
+from core.emulator.data import InterfaceData, NodeOptions
+from core.emulator.session import Session
+from core.location.contactplan import load_plan
+from core.location.mobility import BasicRangeModel, Ns2ScriptedMobility
+from core.nodes.base import CoreNode
+from core.nodes.network import WlanNode
+
+
+def write_script(path: Path, args: Namespace) -> None:
+    rand = random.Random(args.seed)
+    lines = []
+    for node_id in range(1, args.nodes + 1):
+        x, y = rand.uniform(0, args.size), rand.uniform(0, args.size)
+        lines.append(f"$node_({node_id}) set X_ {x:.2f}")
+        lines.append(f"$node_({node_id}) set Y_ {y:.2f}")
+        lines.append(f"$node_({node_id}) set Z_ 0.00")
+        t = 0.0
+        while t < args.duration:
+            t += rand.uniform(1, 20)
+            x, y = rand.uniform(0, args.size), rand.uniform(0, args.size)
+            speed = rand.uniform(1, 30)
+            lines.append(
+                f'$ns_ at {t:.2f} "$node_({node_id}) setdest {x:.2f} {y:.2f} {speed:.2f}"'
+            )
+    path.write_text("\n".join(lines) + "\n")
+
+
+def create_session(script: Path, args: Namespace) -> Ns2ScriptedMobility:
+    session = Session(1, mkdir=False)
+    wlan = session.add_node(WlanNode)
+    session.mobility.set_model(wlan, BasicRangeModel, {"range": str(args.range)})
+    for node_id in range(1, args.nodes + 1):
+        node = session.add_node(
+            CoreNode, node_id + 1, NodeOptions(model=None, legacy=True)
+        )
+        session.add_link(node.id, wlan.id, InterfaceData())
+    config = {
+        "file": str(script),
+        "refresh_ms": str(args.refresh),
+        "loop": "0",
+        "autostart": "",
+        "map": ",".join(f"{x}:{x + 1}" for x in range(1, args.nodes + 1)),
+        "script_start": "",
+        "script_pause": "",
+        "script_stop": "",
+    }
+    session.mobility.set_model(wlan, Ns2ScriptedMobility, config)
+    return wlan.mobility
+
+
+def run_ticks(mobility: Ns2ScriptedMobility, duration: float) -> Dict[str, float]:
+    mobility.movenodesinitial()
+    mobility.loopwaypoints()
+    mobility.timezero = 0.0
+    mobility.endtime = 0
+    dt = 0.001 * mobility.refresh_ms
+    now = 0.0
+    rounds = 0
+    start = time.process_time()
+    while now < duration:
+        now += dt
+        mobility.lasttime = now
+        mobility.updatepoints(now)
+        moved_ifaces = []
+        for iface in mobility.net.get_ifaces():
+            if mobility.movenode(iface.node, dt):
+                moved_ifaces.append(iface)
+        mobility.net.model.update(moved_ifaces)
+        rounds += 1
+    return dict(cpu=time.process_time() - start, rounds=rounds)
+
+
+def run_plan(mobility: Ns2ScriptedMobility, duration: float) -> Dict[str, float]:
+    mobility.movenodesinitial()
+    mobility.loopwaypoints()
+    model = mobility.net.model
+    ifaces = {x.node.id: x for x in mobility.net.get_ifaces()}
+    start = time.process_time()
+    initial = {x: y.node.getposition() for x, y in ifaces.items()}
+    waypoints = {}
+    for wp in sorted(mobility.queue):
+        waypoints.setdefault(wp.node_id, []).append((wp.time, wp.coords, wp.speed))
+    plan = load_plan(mobility.file, initial, waypoints, model.range)
+    plan_time = time.process_time() - start
+    dt = 0.001 * mobility.plan_refresh_ms
+    now = 0.0
+    rounds = 0
+    index = 0
+    applied = 0
+    while now < duration:
+        now += dt
+        moved_ifaces = []
+        for node_id, position in plan.positions(now).items():
+            iface = ifaces[node_id]
+            if iface.node.getposition() != position:
+                mobility.setnodeposition(iface.node, *position)
+                moved_ifaces.append(iface)
+        model.update_positions(moved_ifaces)
+        while index < len(plan.contacts) and plan.contacts[index].time <= now:
+            mobility.apply_contact(plan.contacts[index], ifaces)
+            index += 1
+            applied += 1
+        rounds += 1
+    return dict(
+        cpu=time.process_time() - start,
+        plan_cpu=plan_time,
+        rounds=rounds,
+        contacts=len(plan.contacts),
+        applied=applied,
+    )
+
+
+def main() -> None:
+    parser = ArgumentParser(
+        description="contact plan mobility benchmark",
+        formatter_class=ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument("-n", "--nodes", type=int, default=50, help="number of nodes")
+    parser.add_argument(
+        "-d", "--duration", type=float, default=300, help="script duration (s)"
+    )
+    parser.add_argument("-r", "--range", type=int, default=275, help="wireless range")
+    parser.add_argument("-s", "--size", type=float, default=1500, help="area size")
+    parser.add_argument("--refresh", type=int, default=50, help="tick refresh (ms)")
+    parser.add_argument("--seed", type=int, default=1, help="random seed")
+    args = parser.parse_args()
+    with TemporaryDirectory() as directory, mock.patch("core.utils.cmd"), mock.patch(
+        "core.nodes.netclient.get_net_client"
+    ):
+        script = Path(directory) / "random.scen"
+        write_script(script, args)
+        ticks = run_ticks(create_session(script, args), args.duration)
+        plan = run_plan(create_session(script, args), args.duration)
+        cached = run_plan(create_session(script, args), args.duration)
+    results = dict(
+        nodes=args.nodes,
+        duration=args.duration,
+        ticks=ticks,
+        plan=plan,
+        plan_cached=cached,
+        speedup=ticks["cpu"] / max(plan["cpu"], 1e-9),
+    )
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,393 @@
+#!/usr/bin/env python3
+"""
+Benchmarks control plane code paths for varying topology sizes. Commands and
+network clients are mocked out, the same as the test suite, so this measures
+python overhead only and does not require root.
+
+Results are written as json, and can be compared against a baseline results
+file to check for regressions.
+"""
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+from argparse import ArgumentDefaultsHelpFormatter, ArgumentParser, Namespace
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Any, Callable, Dict, List, Tuple
+from unittest import mock
+
+from core.api.grpc import core_pb2, wrappers
+from core.api.grpc.client import InterfaceHelper
+from core.api.grpc.server import CoreGrpcServer
+from core.constants import COREDPY_VERSION
+from core.emulator.coreemu import CoreEmu
+from core.emulator.data import IpPrefixes, NodeOptions
+from core.emulator.distributed import DistributedServer
+from core.emulator.enumerations import EventTypes
+from core.emulator.session import Session
+from core.location.mobility import BasicRangeModel
+from core.nodes.base import CoreNode
+from core.nodes.netclient import LinuxNetClient
+from core.nodes.network import NftablesQueue, SwitchNode, WlanNode
+from core.xml.corexml import CoreXmlReader, CoreXmlWriter
+
+# nodes per switch for wired topologies
+SWITCH_SIZE: int = 50
+# average number of neighbors in range for wireless topologies
+NEIGHBORS: int = 10
+WIRELESS_RANGE: int = 275
+
+Setup = Callable[[int, Namespace], Tuple[Callable[[], Any], Callable[[], None]]]
+
+
+def patches() -> List[Any]:
+    return [
+        mock.patch("core.utils.cmd"),
+        mock.patch("core.utils.which"),
+        mock.patch("core.nodes.netclient.get_net_client"),
+        mock.patch.object(LinuxNetClient, "get_mac", return_value="00:00:00:00:00:00"),
+        mock.patch.object(CoreNode, "create_file"),
+        mock.patch.object(Session, "write_state"),
+        mock.patch.object(Session, "write_nodes"),
+        mock.patch.object(DistributedServer, "remote_cmd", return_value="1"),
+    ]
+
+
+def wired_topology(session: Session, size: int) -> None:
+    """
+    Create nodes linked to switches, with switches linked in a chain.
+    """
+    prefixes = IpPrefixes(ip4_prefix="10.0.0.0/8")
+    switch = None
+    for index in range(size):
+        if index % SWITCH_SIZE == 0:
+            previous = switch
+            switch = session.add_node(SwitchNode)
+            if previous:
+                session.add_link(previous.id, switch.id)
+        node = session.add_node(CoreNode)
+        iface_data = prefixes.create_iface(node)
+        session.add_link(node.id, switch.id, iface1_data=iface_data)
+
+
+def wireless_topology(
+    session: Session, size: int, seed: int
+) -> Tuple[WlanNode, BasicRangeModel]:
+    """
+    Create nodes randomly placed within an area sized for an average number of
+    neighbors in range, linked to a basic range wlan.
+    """
+    rand = random.Random(seed)
+    area = (size * 3.14 * WIRELESS_RANGE ** 2 / NEIGHBORS) ** 0.5
+    prefixes = IpPrefixes(ip4_prefix="10.0.0.0/8")
+    wlan = session.add_node(WlanNode)
+    session.mobility.set_model(wlan, BasicRangeModel, {"range": str(WIRELESS_RANGE)})
+    for _ in range(size):
+        options = NodeOptions(model="mdr")
+        options.set_position(rand.uniform(0, area), rand.uniform(0, area))
+        node = session.add_node(CoreNode, options=options)
+        iface_data = prefixes.create_iface(node)
+        session.add_link(node.id, wlan.id, iface1_data=iface_data)
+    return wlan, wlan.model
+
+
+def create_session(args: Namespace) -> Tuple[Session, Callable[[], None]]:
+    coreemu = args.coreemu
+    session = coreemu.create_session()
+    return session, lambda: coreemu.delete_session(session.id)
+
+
+def setup_add_node(size: int, args: Namespace):
+    session, cleanup = create_session(args)
+    session.set_state(EventTypes.CONFIGURATION_STATE)
+
+    def run() -> None:
+        for _ in range(size):
+            session.add_node(CoreNode)
+
+    return run, cleanup
+
+
+def setup_add_link(size: int, args: Namespace):
+    session, cleanup = create_session(args)
+    session.set_state(EventTypes.CONFIGURATION_STATE)
+    prefixes = IpPrefixes(ip4_prefix="10.0.0.0/8")
+    links = []
+    switch = None
+    for index in range(size):
+        if index % SWITCH_SIZE == 0:
+            switch = session.add_node(SwitchNode)
+        node = session.add_node(CoreNode)
+        links.append((node.id, switch.id, prefixes.create_iface(node)))
+
+    def run() -> None:
+        for node_id, switch_id, iface_data in links:
+            session.add_link(node_id, switch_id, iface1_data=iface_data)
+
+    return run, cleanup
+
+
+def setup_start_session(size: int, args: Namespace):
+    server = CoreGrpcServer(args.coreemu)
+    session, cleanup = create_session(args)
+    helper = InterfaceHelper(ip4_prefix="10.0.0.0/8")
+    proto = wrappers.Session(id=session.id)
+    position = wrappers.Position(x=0, y=0)
+    switch = None
+    node_id = 1
+    for index in range(size):
+        if index % SWITCH_SIZE == 0:
+            previous = switch
+            switch = proto.add_node(
+                node_id, _type=wrappers.NodeType.SWITCH, position=position
+            )
+            node_id += 1
+            if previous:
+                proto.add_link(node1=previous, node2=switch)
+        node = proto.add_node(node_id, position=position)
+        node_id += 1
+        iface = helper.create_iface(node.id, 0)
+        proto.add_link(node1=node, node2=switch, iface1=iface)
+    request = core_pb2.StartSessionRequest(session=proto.to_proto())
+    context = mock.MagicMock()
+
+    def run() -> None:
+        response = server.StartSession(request, context)
+        if not response.result:
+            raise RuntimeError(f"start session failed: {response.exceptions}")
+
+    return run, cleanup
+
+
+def setup_xml_write(size: int, args: Namespace):
+    session, cleanup = create_session(args)
+    wired_topology(session, size)
+    path = Path(args.directory) / f"write-{size}.xml"
+
+    def run() -> None:
+        CoreXmlWriter(session).write(path)
+
+    return run, cleanup
+
+
+def setup_xml_read(size: int, args: Namespace):
+    session, cleanup = create_session(args)
+    wired_topology(session, size)
+    path = Path(args.directory) / f"read-{size}.xml"
+    CoreXmlWriter(session).write(path)
+    cleanup()
+    session, cleanup = create_session(args)
+
+    def run() -> None:
+        CoreXmlReader(session).read(path)
+
+    return run, cleanup
+
+
+def setup_range_tick(size: int, args: Namespace):
+    session, cleanup = create_session(args)
+    wlan, model = wireless_topology(session, size, args.seed)
+    ifaces = wlan.get_ifaces()
+    for iface in ifaces:
+        model.iface_to_pos[iface] = iface.node.position.get()
+    model.update(ifaces[:1])
+    rand = random.Random(args.seed)
+    moved = rand.sample(ifaces, max(1, int(size * args.moved)))
+    for iface in moved:
+        x, y, _ = iface.node.position.get()
+        iface.node.position.set(x + rand.uniform(-50, 50), y + rand.uniform(-50, 50))
+
+    def run() -> None:
+        model.update(list(moved))
+
+    return run, cleanup
+
+
+def setup_nftables(size: int, args: Namespace):
+    session, cleanup = create_session(args)
+    wlan = session.add_node(WlanNode)
+    prefixes = IpPrefixes(ip4_prefix="10.0.0.0/8")
+    for _ in range(size):
+        node = session.add_node(CoreNode)
+        session.add_link(node.id, wlan.id, iface1_data=prefixes.create_iface(node))
+    ifaces = sorted(wlan.get_ifaces())
+    for index, iface in enumerate(ifaces):
+        for other in ifaces[index + 1 : index + 1 + NEIGHBORS // 2]:
+            wlan.link(iface, other)
+    queue = NftablesQueue()
+
+    def run() -> None:
+        queue.cmds.clear()
+        queue.build_cmds(wlan)
+
+    return run, cleanup
+
+
+BENCHMARKS: Dict[str, Setup] = {
+    "add_node": setup_add_node,
+    "add_link": setup_add_link,
+    "start_session": setup_start_session,
+    "xml_write": setup_xml_write,
+    "xml_read": setup_xml_read,
+    "range_tick": setup_range_tick,
+    "nftables": setup_nftables,
+}
+
+
+def run_benchmark(name: str, size: int, args: Namespace) -> Dict[str, Any]:
+    setup = BENCHMARKS[name]
+    times = []
+    cpu_times = []
+    for _ in range(args.repeat):
+        run, cleanup = setup(size, args)
+        try:
+            start = time.perf_counter()
+            cpu_start = time.process_time()
+            run()
+            cpu_times.append(time.process_time() - cpu_start)
+            times.append(time.perf_counter() - start)
+        finally:
+            cleanup()
+    return dict(
+        benchmark=name,
+        size=size,
+        repeat=args.repeat,
+        min=min(times),
+        median=statistics.median(times),
+        cpu=min(cpu_times),
+        per_node=min(times) / size,
+    )
+
+
+def run_benchmarks(args: Namespace) -> Dict[str, Any]:
+    results = []
+    with TemporaryDirectory() as directory:
+        args.directory = directory
+        for name in args.benchmarks:
+            for size in args.sizes:
+                result = run_benchmark(name, size, args)
+                print(
+                    f"{name:>14} {size:>6} min({result['min']:.4f}s) "
+                    f"median({result['median']:.4f}s)",
+                    file=sys.stderr,
+                )
+                results.append(result)
+    meta = dict(
+        core=COREDPY_VERSION,
+        python=platform.python_version(),
+        machine=platform.machine(),
+        time=time.time(),
+        moved=args.moved,
+        seed=args.seed,
+    )
+    return dict(meta=meta, results=results)
+
+
+def compare(
+    baseline: Dict[str, Any], current: Dict[str, Any], threshold: float
+) -> List[Dict[str, Any]]:
+    """
+    Compare the minimum times of current results against baseline results, for
+    benchmarks found in both.
+    """
+    expected = {(x["benchmark"], x["size"]): x for x in baseline["results"]}
+    comparisons = []
+    for result in current["results"]:
+        key = (result["benchmark"], result["size"])
+        base = expected.get(key)
+        if base is None:
+            continue
+        ratio = result["min"] / max(base["min"], 1e-9)
+        comparisons.append(
+            dict(
+                benchmark=result["benchmark"],
+                size=result["size"],
+                baseline=base["min"],
+                current=result["min"],
+                ratio=ratio,
+                regression=ratio > 1 + threshold,
+            )
+        )
+    return comparisons
+
+
+def parse_list(value: str, value_type: Callable[[str], Any]) -> List[Any]:
+    return [value_type(x) for x in value.split(",") if x]
+
+
+def main() -> None:
+    parser = ArgumentParser(
+        description="control plane benchmarks",
+        formatter_class=ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument(
+        "-b",
+        "--benchmarks",
+        type=lambda x: parse_list(x, str),
+        default=list(BENCHMARKS),
+        help=f"comma separated benchmarks to run, from: {', '.join(BENCHMARKS)}",
+    )
+    parser.add_argument(
+        "-s",
+        "--sizes",
+        type=lambda x: parse_list(x, int),
+        default=[10, 100, 1000, 5000],
+        help="comma separated topology sizes, in nodes",
+    )
+    parser.add_argument("-r", "--repeat", type=int, default=3, help="runs per size")
+    parser.add_argument(
+        "-m", "--moved", type=float, default=0.01, help="fraction moved per range tick"
+    )
+    parser.add_argument("--seed", type=int, default=1, help="random seed")
+    parser.add_argument("-o", "--output", type=Path, help="file to write results to")
+    parser.add_argument(
+        "-c", "--compare", type=Path, help="baseline results to compare against"
+    )
+    parser.add_argument(
+        "--current",
+        type=Path,
+        help="existing results to compare against baseline, instead of running",
+    )
+    parser.add_argument(
+        "-t",
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="allowed slowdown ratio before flagging a regression",
+    )
+    args = parser.parse_args()
+    unknown = set(args.benchmarks) - set(BENCHMARKS)
+    if unknown:
+        parser.error(f"unknown benchmarks: {', '.join(sorted(unknown))}")
+
+    if args.current:
+        results = json.loads(args.current.read_text())
+    else:
+        active = patches()
+        for patch in active:
+            patch.start()
+        try:
+            args.coreemu = CoreEmu({"registry_cache": ""})
+            results = run_benchmarks(args)
+            args.coreemu.shutdown()
+        finally:
+            for patch in active:
+                patch.stop()
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())
+        comparisons = compare(baseline, results, args.threshold)
+        print(json.dumps(comparisons, indent=2))
+        if any(x["regression"] for x in comparisons):
+            sys.exit(1)
+    elif not args.output:
+        print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Benchmarks drawing sessions of varying sizes within the gui canvas, as done when
+joining a session. The gui is created without connecting to a server, but
+requires a display to draw to, which can be virtual on headless hosts:
+
+    xvfb-run python3 benchmarks/gui_draw.py -o gui_draw.json
+
+Results are written as json, in the same format as the control plane benchmarks,
+so they can be compared against a baseline using those benchmarks.
+"""
+import json
+import platform
+import statistics
+import sys
+import time
+from argparse import ArgumentDefaultsHelpFormatter, ArgumentParser, Namespace
+from pathlib import Path
+from tkinter import TclError
+from typing import Any, Callable, Dict, List
+from unittest import mock
+
+from core.api.grpc import wrappers
+from core.api.grpc.client import InterfaceHelper
+from core.constants import COREDPY_VERSION
+from core.gui import appconfig, images
+from core.gui.app import Application
+from core.gui.coreclient import CoreClient
+
+# nodes per switch
+SWITCH_SIZE: int = 50
+# nodes per row and spacing between nodes when laying out the topology
+COLUMNS: int = 100
+SPACING: int = 60
+
+
+def create_session(size: int) -> wrappers.Session:
+    """
+    Create a session with nodes linked to switches laid out in a grid, with
+    switches linked in a chain.
+    """
+    session = wrappers.Session(id=1)
+    helper = InterfaceHelper(ip4_prefix="10.0.0.0/8")
+    switch = None
+    node_id = 1
+    for index in range(size):
+        x = SPACING + (index % COLUMNS) * SPACING
+        y = SPACING + (index // COLUMNS) * SPACING
+        if index % SWITCH_SIZE == 0:
+            previous = switch
+            position = wrappers.Position(x=x, y=y + SPACING / 2)
+            switch = session.add_node(
+                node_id, _type=wrappers.NodeType.SWITCH, position=position
+            )
+            node_id += 1
+            if previous:
+                session.add_link(node1=previous, node2=switch)
+        position = wrappers.Position(x=x, y=y)
+        node = session.add_node(node_id, position=position)
+        node_id += 1
+        iface = helper.create_iface(node.id, 0)
+        session.add_link(node1=node, node2=switch, iface1=iface)
+    return session
+
+
+def run_benchmark(app: Application, size: int, args: Namespace) -> Dict[str, Any]:
+    session = create_session(size)
+    times = []
+    cpu_times = []
+    for _ in range(args.repeat):
+        app.core.reset()
+        app.core.session = session
+        start = time.perf_counter()
+        cpu_start = time.process_time()
+        app.manager.join(session)
+        app.update_idletasks()
+        cpu_times.append(time.process_time() - cpu_start)
+        times.append(time.perf_counter() - start)
+    return dict(
+        benchmark="draw_session",
+        size=size,
+        repeat=args.repeat,
+        min=min(times),
+        median=statistics.median(times),
+        cpu=min(cpu_times),
+        per_node=min(times) / size,
+    )
+
+
+def run_benchmarks(args: Namespace) -> Dict[str, Any]:
+    appconfig.check_directory()
+    images.load_all()
+    try:
+        with mock.patch.object(CoreClient, "setup"):
+            app = Application(proxy=False)
+    except TclError as e:
+        sys.exit(f"unable to create gui, a display is required: {e}")
+    results = []
+    try:
+        for size in args.sizes:
+            result = run_benchmark(app, size, args)
+            print(
+                f"{result['benchmark']:>14} {size:>6} min({result['min']:.4f}s) "
+                f"median({result['median']:.4f}s)",
+                file=sys.stderr,
+            )
+            results.append(result)
+    finally:
+        app.master.destroy()
+    meta = dict(
+        core=COREDPY_VERSION,
+        python=platform.python_version(),
+        machine=platform.machine(),
+        time=time.time(),
+    )
+    return dict(meta=meta, results=results)
+
+
+def parse_list(value: str, value_type: Callable[[str], Any]) -> List[Any]:
+    return [value_type(x) for x in value.split(",") if x]
+
+
+def main() -> None:
+    parser = ArgumentParser(
+        description="gui draw benchmarks", formatter_class=ArgumentDefaultsHelpFormatter
+    )
+    parser.add_argument(
+        "-s",
+        "--sizes",
+        type=lambda x: parse_list(x, int),
+        default=[1000, 5000],
+        help="comma separated topology sizes, in nodes",
+    )
+    parser.add_argument("-r", "--repeat", type=int, default=3, help="runs per size")
+    parser.add_argument("-o", "--output", type=Path, help="file to write results to")
+    args = parser.parse_args()
+    results = run_benchmarks(args)
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
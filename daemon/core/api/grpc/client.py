@@ -7,7 +7,17 @@ import threading
 from contextlib import contextmanager
 from pathlib import Path
 from queue import Queue
-from typing import Any, Callable, Dict, Generator, Iterable, List, Optional, Tuple
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
 
 import grpc
 
@@ -145,6 +155,29 @@ class InterfaceHelper:
             mac=iface_data.mac,
         )
 
+    def create_ifaces(
+        self, node_ids: List[int], iface_id: int
+    ) -> List[wrappers.Interface]:
+        """
+        Create interface protobuf objects for several nodes at once.
+
+        :param node_ids: node ids to create interfaces for
+        :param iface_id: interface id to use for each interface
+        :return: interface protobufs, in the same order as node ids
+        """
+        ifaces = []
+        for iface_data in self.prefixes.gen_ifaces(node_ids):
+            iface = wrappers.Interface(
+                id=iface_id,
+                ip4=iface_data.ip4,
+                ip4_mask=iface_data.ip4_mask,
+                ip6=iface_data.ip6,
+                ip6_mask=iface_data.ip6_mask,
+                mac=iface_data.mac,
+            )
+            ifaces.append(iface)
+        return ifaces
+
 
 def throughput_listener(
     stream: Any, handler: Callable[[wrappers.ThroughputsEvent], None]
@@ -300,6 +333,24 @@ class CoreGrpcClient:
         response = self.stub.CheckSession(request)
         return response.result
 
+    def get_session_profile(
+        self, session_id: int, commands: bool = False
+    ) -> wrappers.SessionProfile:
+        """
+        Retrieve the boot profile for a session, which is also written as a
+        chrome trace file within the session directory.
+
+        :param session_id: id of session
+        :param commands: True to include each command run, False otherwise
+        :return: session boot profile
+        :raises grpc.RpcError: when session doesn't exist
+        """
+        request = core_pb2.GetSessionProfileRequest(
+            session_id=session_id, commands=commands
+        )
+        response = self.stub.GetSessionProfile(request)
+        return wrappers.SessionProfile.from_proto(response)
+
     def get_session(self, session_id: int) -> wrappers.Session:
         """
         Retrieve a session.
@@ -312,6 +363,25 @@ class CoreGrpcClient:
         response = self.stub.GetSession(request)
         return wrappers.Session.from_proto(response.session)
 
+    def get_session_changes(
+        self, session_id: int, version: int
+    ) -> wrappers.SessionChanges:
+        """
+        Retrieve the nodes and links changed since a session version, as returned
+        with a session. The full session is returned instead, when those changes are
+        no longer available.
+
+        :param session_id: id of session
+        :param version: session version to get changes after
+        :return: session changes
+        :raises grpc.RpcError: when session doesn't exist
+        """
+        request = core_pb2.GetSessionChangesRequest(
+            session_id=session_id, version=version
+        )
+        response = self.stub.GetSessionChanges(request)
+        return wrappers.SessionChanges.from_proto(response)
+
     def alert(
         self,
         session_id: int,
@@ -493,15 +563,17 @@ class CoreGrpcClient:
         response = self.stub.MoveNode(request)
         return response.result
 
-    def move_nodes(self, streamer: MoveNodesStreamer) -> None:
+    def move_nodes(self, streamer: MoveNodesStreamer) -> wrappers.MoveNodesStats:
         """
-        Stream node movements using the provided iterator.
+        Stream node movements using the provided iterator. Movements are applied
+        by the server in time windowed batches.
 
         :param streamer: move nodes streamer
-        :return: nothing
+        :return: batching stats for the stream
         :raises grpc.RpcError: when session or nodes do not exist
         """
-        self.stub.MoveNodes(streamer.iter())
+        response = self.stub.MoveNodes(streamer.iter())
+        return wrappers.MoveNodesStats.from_proto(response)
 
     def delete_node(self, session_id: int, node_id: int, source: str = None) -> bool:
         """
@@ -548,6 +620,43 @@ class CoreGrpcClient:
         response = self.stub.NodeCommand(request)
         return response.return_code, response.output
 
+    def node_commands(
+        self,
+        session_id: int,
+        command: str,
+        node_ids: List[int] = None,
+        shell: bool = False,
+        timeout: float = 0,
+        parallel: int = 0,
+    ) -> Iterator[wrappers.NodeCommandResult]:
+        """
+        Run a command on many nodes, receiving each result as it completes.
+        Closing the returned iterator cancels commands that have not started.
+
+        :param session_id: session id
+        :param command: command to run on nodes
+        :param node_ids: ids of nodes to run command on, defaults to all nodes
+        :param shell: send shell command
+        :param timeout: seconds a command may run on a node, 0 for no timeout
+        :param parallel: maximum commands to run at once, 0 for server default
+        :return: iterator of command results, in completion order
+        :raises grpc.RpcError: when session or nodes don't exist
+        """
+        request = core_pb2.NodeCommandsRequest(
+            session_id=session_id,
+            node_ids=node_ids,
+            command=command,
+            shell=shell,
+            timeout=timeout,
+            parallel=parallel,
+        )
+        stream = self.stub.NodeCommands(request)
+        try:
+            for event in stream:
+                yield wrappers.NodeCommandResult.from_proto(event)
+        finally:
+            stream.cancel()
+
     def get_node_terminal(self, session_id: int, node_id: int) -> str:
         """
         Retrieve terminal command string for launching a local terminal.
@@ -0,0 +1,200 @@
+"""
+Runs a command on many nodes for the node commands stream, using a dedicated
+executor with bounded parallelism, rather than the grpc worker pool.
+"""
+import logging
+import shlex
+import threading
+import time
+from concurrent import futures
+from typing import Any, Callable, Iterator, List, Set
+
+from core.api.grpc import core_pb2
+from core.errors import CoreCommandError
+from core.executables import BASH, TIMEOUT
+from core.nodes.base import CoreNode
+
+logger = logging.getLogger(__name__)
+
+# time between checks for a cancelled stream, while waiting on commands
+POLL_INTERVAL: float = 0.5
+# time allowed after a command times out, before it is killed
+KILL_DELAY: int = 1
+# exit statuses for commands stopped by timeout, or killed after the kill delay
+TIMEOUT_STATUSES: Set[int] = {124, 137}
+# return code for commands that failed to run on a node, such as api errors
+ERROR_STATUS: int = -1
+
+
+class CommandExecutor(futures.Executor):
+    """
+    Thread pool for node commands, which cancels commands not yet started when
+    shutdown, as ThreadPoolExecutor only supports this from python 3.9.
+    """
+
+    def __init__(self, max_workers: int) -> None:
+        """
+        Create a CommandExecutor instance.
+
+        :param max_workers: maximum number of threads running commands
+        """
+        self.executor: futures.ThreadPoolExecutor = futures.ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="node-commands"
+        )
+        self.lock: threading.Lock = threading.Lock()
+        self.pending: Set[futures.Future] = set()
+
+    def submit(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        with self.lock:
+            future = self.executor.submit(func, *args, **kwargs)
+            self.pending.add(future)
+        future.add_done_callback(self._done)
+        return future
+
+    def _done(self, future: futures.Future) -> None:
+        with self.lock:
+            self.pending.discard(future)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Cancel commands not yet started and stop accepting new commands. Commands
+        already running are left to complete.
+
+        :param wait: True to wait for running commands to complete
+        :return: nothing
+        """
+        with self.lock:
+            pending = list(self.pending)
+        for future in pending:
+            future.cancel()
+        self.executor.shutdown(wait)
+
+
+class NodeCommandRunner:
+    """
+    Runs a command on a set of nodes, keeping at most a given number of commands
+    in flight, and providing results as each command completes.
+    """
+
+    def __init__(
+        self,
+        executor: futures.Executor,
+        nodes: List[CoreNode],
+        command: str,
+        shell: bool = False,
+        timeout: float = 0,
+        parallel: int = 1,
+    ) -> None:
+        """
+        Create a NodeCommandRunner instance.
+
+        :param executor: executor to run commands on
+        :param nodes: nodes to run command on
+        :param command: command to run
+        :param shell: True to use shell, False otherwise
+        :param timeout: seconds a command may run on a node, 0 for no timeout
+        :param parallel: maximum number of commands to run at once
+        """
+        self.executor: futures.Executor = executor
+        self.nodes: List[CoreNode] = nodes
+        self.command: str = command
+        self.shell: bool = shell
+        self.timeout: float = timeout
+        self.parallel: int = max(parallel, 1)
+
+    def node_args(self) -> str:
+        """
+        Create the command to run on a node, wrapping it to be stopped by timeout
+        when a timeout is configured.
+
+        :return: command to run
+        """
+        if self.timeout <= 0:
+            return self.command
+        args = f"{TIMEOUT} -k {KILL_DELAY} {self.timeout:g}"
+        if self.shell:
+            return f"{args} {BASH} -c {shlex.quote(self.command)}"
+        else:
+            return f"{args} {self.command}"
+
+    def run_node(self, node: CoreNode) -> core_pb2.NodeCommandsEvent:
+        """
+        Run the command on a node. Failing to run the command, for reasons other
+        than the command exiting with an error, is reported as a result with an
+        error return code and the error as output, so one node does not end the
+        results of the others.
+
+        :param node: node to run command on
+        :return: result of running command
+        """
+        shell = self.shell and self.timeout <= 0
+        start = time.monotonic()
+        try:
+            output = node.cmd(self.node_args(), shell=shell)
+            return_code = 0
+        except CoreCommandError as e:
+            output = e.stderr
+            return_code = e.returncode
+        except Exception as e:
+            logger.exception("error running node(%s) command", node.name)
+            output = str(e)
+            return_code = ERROR_STATUS
+        duration = time.monotonic() - start
+        timed_out = (
+            self.timeout > 0
+            and duration >= self.timeout
+            and return_code in TIMEOUT_STATUSES
+        )
+        return core_pb2.NodeCommandsEvent(
+            node_id=node.id,
+            output=output,
+            return_code=return_code,
+            timed_out=timed_out,
+            duration=duration,
+        )
+
+    def run(
+        self, is_active: Callable[[], bool]
+    ) -> Iterator[core_pb2.NodeCommandsEvent]:
+        """
+        Run the command on all nodes, yielding each result as it completes. No
+        more commands are started once inactive or the executor is shutdown, and
+        commands not yet started are cancelled.
+
+        :param is_active: checks if results are still wanted
+        :return: results of running command, in completion order
+        """
+        nodes = iter(self.nodes)
+        running = set()
+
+        def submit() -> None:
+            nonlocal nodes
+            node = next(nodes, None)
+            if node is None:
+                return
+            try:
+                running.add(self.executor.submit(self.run_node, node))
+            except RuntimeError:
+                logger.info("node commands executor shutdown: %s", self.command)
+                nodes = iter(())
+
+        for _ in range(self.parallel):
+            submit()
+        try:
+            while running:
+                done, _ = futures.wait(
+                    running, timeout=POLL_INTERVAL, return_when=futures.FIRST_COMPLETED
+                )
+                if not is_active():
+                    logger.info("node commands cancelled: %s", self.command)
+                    break
+                for future in done:
+                    running.remove(future)
+                    if is_active():
+                        submit()
+                    if future.cancelled():
+                        continue
+                    yield future.result()
+        finally:
+            for future in running:
+                future.cancel()
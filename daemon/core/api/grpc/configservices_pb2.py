@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: core/api/grpc/configservices.proto
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import message as _message
+from google.protobuf import reflection as _reflection
+from google.protobuf import symbol_database as _symbol_database
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from core.api.grpc import common_pb2 as core_dot_api_dot_grpc_dot_common__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\"core/api/grpc/configservices.proto\x12\x0e\x63onfigservices\x1a\x1a\x63ore/api/grpc/common.proto\"\x9d\x02\n\x13\x43onfigServiceConfig\x12\x0f\n\x07node_id\x18\x01 \x01(\x05\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x45\n\ttemplates\x18\x03 \x03(\x0b\x32\x32.configservices.ConfigServiceConfig.TemplatesEntry\x12?\n\x06\x63onfig\x18\x04 \x03(\x0b\x32/.configservices.ConfigServiceConfig.ConfigEntry\x1a\x30\n\x0eTemplatesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x1a-\n\x0b\x43onfigEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"P\n\x1b\x43onfigServiceValidationMode\"1\n\x04\x45num\x12\x0c\n\x08\x42LOCKING\x10\x00\x12\x10\n\x0cNON_BLOCKING\x10\x01\x12\t\n\x05TIMER\x10\x02\"\xb0\x02\n\rConfigService\x12\r\n\x05group\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x13\n\x0b\x65xecutables\x18\x03 \x03(\t\x12\x14\n\x0c\x64\x65pendencies\x18\x04 \x03(\t\x12\x13\n\x0b\x64irectories\x18\x05 \x03(\t\x12\r\n\x05\x66iles\x18\x06 \x03(\t\x12\x0f\n\x07startup\x18\x07 \x03(\t\x12\x10\n\x08validate\x18\x08 \x03(\t\x12\x10\n\x08shutdown\x18\t \x03(\t\x12I\n\x0fvalidation_mode\x18\n \x01(\x0e\x32\x30.configservices.ConfigServiceValidationMode.Enum\x12\x18\n\x10validation_timer\x18\x0b \x01(\x05\x12\x19\n\x11validation_period\x18\x0c \x01(\x02\"\x81\x01\n\nConfigMode\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x36\n\x06\x63onfig\x18\x02 \x03(\x0b\x32&.configservices.ConfigMode.ConfigEntry\x1a-\n\x0b\x43onfigEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"/\n\x1fGetConfigServiceDefaultsRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\"\xe6\x02\n GetConfigServiceDefaultsResponse\x12R\n\ttemplates\x18\x01 \x03(\x0b\x32?.configservices.GetConfigServiceDefaultsResponse.TemplatesEntry\x12L\n\x06\x63onfig\x18\x02 \x03(\x0b\x32<.configservices.GetConfigServiceDefaultsResponse.ConfigEntry\x12)\n\x05modes\x18\x03 \x03(\x0b\x32\x1a.configservices.ConfigMode\x1a\x30\n\x0eTemplatesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x1a\x43\n\x0b\x43onfigEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12#\n\x05value\x18\x02 \x01(\x0b\x32\x14.common.ConfigOption:\x02\x38\x01\"P\n\x1bGetNodeConfigServiceRequest\x12\x12\n\nsession_id\x18\x01 \x01(\x05\x12\x0f\n\x07node_id\x18\x02 \x01(\x05\x12\x0c\n\x04name\x18\x03 \x01(\t\"\x97\x01\n\x1cGetNodeConfigServiceResponse\x12H\n\x06\x63onfig\x18\x01 \x03(\x0b\x32\x38.configservices.GetNodeConfigServiceResponse.ConfigEntry\x1a-\n\x0b\x43onfigEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x62\x06proto3')
+
+
+
+_CONFIGSERVICECONFIG = DESCRIPTOR.message_types_by_name['ConfigServiceConfig']
+_CONFIGSERVICECONFIG_TEMPLATESENTRY = _CONFIGSERVICECONFIG.nested_types_by_name['TemplatesEntry']
+_CONFIGSERVICECONFIG_CONFIGENTRY = _CONFIGSERVICECONFIG.nested_types_by_name['ConfigEntry']
+_CONFIGSERVICEVALIDATIONMODE = DESCRIPTOR.message_types_by_name['ConfigServiceValidationMode']
+_CONFIGSERVICE = DESCRIPTOR.message_types_by_name['ConfigService']
+_CONFIGMODE = DESCRIPTOR.message_types_by_name['ConfigMode']
+_CONFIGMODE_CONFIGENTRY = _CONFIGMODE.nested_types_by_name['ConfigEntry']
+_GETCONFIGSERVICEDEFAULTSREQUEST = DESCRIPTOR.message_types_by_name['GetConfigServiceDefaultsRequest']
+_GETCONFIGSERVICEDEFAULTSRESPONSE = DESCRIPTOR.message_types_by_name['GetConfigServiceDefaultsResponse']
+_GETCONFIGSERVICEDEFAULTSRESPONSE_TEMPLATESENTRY = _GETCONFIGSERVICEDEFAULTSRESPONSE.nested_types_by_name['TemplatesEntry']
+_GETCONFIGSERVICEDEFAULTSRESPONSE_CONFIGENTRY = _GETCONFIGSERVICEDEFAULTSRESPONSE.nested_types_by_name['ConfigEntry']
+_GETNODECONFIGSERVICEREQUEST = DESCRIPTOR.message_types_by_name['GetNodeConfigServiceRequest']
+_GETNODECONFIGSERVICERESPONSE = DESCRIPTOR.message_types_by_name['GetNodeConfigServiceResponse']
+_GETNODECONFIGSERVICERESPONSE_CONFIGENTRY = _GETNODECONFIGSERVICERESPONSE.nested_types_by_name['ConfigEntry']
+_CONFIGSERVICEVALIDATIONMODE_ENUM = _CONFIGSERVICEVALIDATIONMODE.enum_types_by_name['Enum']
+ConfigServiceConfig = _reflection.GeneratedProtocolMessageType('ConfigServiceConfig', (_message.Message,), {
+
+  'TemplatesEntry' : _reflection.GeneratedProtocolMessageType('TemplatesEntry', (_message.Message,), {
+    'DESCRIPTOR' : _CONFIGSERVICECONFIG_TEMPLATESENTRY,
+    '__module__' : 'core.api.grpc.configservices_pb2'
+    # @@protoc_insertion_point(class_scope:configservices.ConfigServiceConfig.TemplatesEntry)
+    })
+  ,
+
+  'ConfigEntry' : _reflection.GeneratedProtocolMessageType('ConfigEntry', (_message.Message,), {
+    'DESCRIPTOR' : _CONFIGSERVICECONFIG_CONFIGENTRY,
+    '__module__' : 'core.api.grpc.configservices_pb2'
+    # @@protoc_insertion_point(class_scope:configservices.ConfigServiceConfig.ConfigEntry)
+    })
+  ,
+  'DESCRIPTOR' : _CONFIGSERVICECONFIG,
+  '__module__' : 'core.api.grpc.configservices_pb2'
+  # @@protoc_insertion_point(class_scope:configservices.ConfigServiceConfig)
+  })
+_sym_db.RegisterMessage(ConfigServiceConfig)
+_sym_db.RegisterMessage(ConfigServiceConfig.TemplatesEntry)
+_sym_db.RegisterMessage(ConfigServiceConfig.ConfigEntry)
+
+ConfigServiceValidationMode = _reflection.GeneratedProtocolMessageType('ConfigServiceValidationMode', (_message.Message,), {
+  'DESCRIPTOR' : _CONFIGSERVICEVALIDATIONMODE,
+  '__module__' : 'core.api.grpc.configservices_pb2'
+  # @@protoc_insertion_point(class_scope:configservices.ConfigServiceValidationMode)
+  })
+_sym_db.RegisterMessage(ConfigServiceValidationMode)
+
+ConfigService = _reflection.GeneratedProtocolMessageType('ConfigService', (_message.Message,), {
+  'DESCRIPTOR' : _CONFIGSERVICE,
+  '__module__' : 'core.api.grpc.configservices_pb2'
+  # @@protoc_insertion_point(class_scope:configservices.ConfigService)
+  })
+_sym_db.RegisterMessage(ConfigService)
+
+ConfigMode = _reflection.GeneratedProtocolMessageType('ConfigMode', (_message.Message,), {
+
+  'ConfigEntry' : _reflection.GeneratedProtocolMessageType('ConfigEntry', (_message.Message,), {
+    'DESCRIPTOR' : _CONFIGMODE_CONFIGENTRY,
+    '__module__' : 'core.api.grpc.configservices_pb2'
+    # @@protoc_insertion_point(class_scope:configservices.ConfigMode.ConfigEntry)
+    })
+  ,
+  'DESCRIPTOR' : _CONFIGMODE,
+  '__module__' : 'core.api.grpc.configservices_pb2'
+  # @@protoc_insertion_point(class_scope:configservices.ConfigMode)
+  })
+_sym_db.RegisterMessage(ConfigMode)
+_sym_db.RegisterMessage(ConfigMode.ConfigEntry)
+
+GetConfigServiceDefaultsRequest = _reflection.GeneratedProtocolMessageType('GetConfigServiceDefaultsRequest', (_message.Message,), {
+  'DESCRIPTOR' : _GETCONFIGSERVICEDEFAULTSREQUEST,
+  '__module__' : 'core.api.grpc.configservices_pb2'
+  # @@protoc_insertion_point(class_scope:configservices.GetConfigServiceDefaultsRequest)
+  })
+_sym_db.RegisterMessage(GetConfigServiceDefaultsRequest)
+
+GetConfigServiceDefaultsResponse = _reflection.GeneratedProtocolMessageType('GetConfigServiceDefaultsResponse', (_message.Message,), {
+
+  'TemplatesEntry' : _reflection.GeneratedProtocolMessageType('TemplatesEntry', (_message.Message,), {
+    'DESCRIPTOR' : _GETCONFIGSERVICEDEFAULTSRESPONSE_TEMPLATESENTRY,
+    '__module__' : 'core.api.grpc.configservices_pb2'
+    # @@protoc_insertion_point(class_scope:configservices.GetConfigServiceDefaultsResponse.TemplatesEntry)
+    })
+  ,
+
+  'ConfigEntry' : _reflection.GeneratedProtocolMessageType('ConfigEntry', (_message.Message,), {
+    'DESCRIPTOR' : _GETCONFIGSERVICEDEFAULTSRESPONSE_CONFIGENTRY,
+    '__module__' : 'core.api.grpc.configservices_pb2'
+    # @@protoc_insertion_point(class_scope:configservices.GetConfigServiceDefaultsResponse.ConfigEntry)
+    })
+  ,
+  'DESCRIPTOR' : _GETCONFIGSERVICEDEFAULTSRESPONSE,
+  '__module__' : 'core.api.grpc.configservices_pb2'
+  # @@protoc_insertion_point(class_scope:configservices.GetConfigServiceDefaultsResponse)
+  })
+_sym_db.RegisterMessage(GetConfigServiceDefaultsResponse)
+_sym_db.RegisterMessage(GetConfigServiceDefaultsResponse.TemplatesEntry)
+_sym_db.RegisterMessage(GetConfigServiceDefaultsResponse.ConfigEntry)
+
+GetNodeConfigServiceRequest = _reflection.GeneratedProtocolMessageType('GetNodeConfigServiceRequest', (_message.Message,), {
+  'DESCRIPTOR' : _GETNODECONFIGSERVICEREQUEST,
+  '__module__' : 'core.api.grpc.configservices_pb2'
+  # @@protoc_insertion_point(class_scope:configservices.GetNodeConfigServiceRequest)
+  })
+_sym_db.RegisterMessage(GetNodeConfigServiceRequest)
+
+GetNodeConfigServiceResponse = _reflection.GeneratedProtocolMessageType('GetNodeConfigServiceResponse', (_message.Message,), {
+
+  'ConfigEntry' : _reflection.GeneratedProtocolMessageType('ConfigEntry', (_message.Message,), {
+    'DESCRIPTOR' : _GETNODECONFIGSERVICERESPONSE_CONFIGENTRY,
+    '__module__' : 'core.api.grpc.configservices_pb2'
+    # @@protoc_insertion_point(class_scope:configservices.GetNodeConfigServiceResponse.ConfigEntry)
+    })
+  ,
+  'DESCRIPTOR' : _GETNODECONFIGSERVICERESPONSE,
+  '__module__' : 'core.api.grpc.configservices_pb2'
+  # @@protoc_insertion_point(class_scope:configservices.GetNodeConfigServiceResponse)
+  })
+_sym_db.RegisterMessage(GetNodeConfigServiceResponse)
+_sym_db.RegisterMessage(GetNodeConfigServiceResponse.ConfigEntry)
+
+if _descriptor._USE_C_DESCRIPTORS == False:
+
+  DESCRIPTOR._options = None
+  _CONFIGSERVICECONFIG_TEMPLATESENTRY._options = None
+  _CONFIGSERVICECONFIG_TEMPLATESENTRY._serialized_options = b'8\001'
+  _CONFIGSERVICECONFIG_CONFIGENTRY._options = None
+  _CONFIGSERVICECONFIG_CONFIGENTRY._serialized_options = b'8\001'
+  _CONFIGMODE_CONFIGENTRY._options = None
+  _CONFIGMODE_CONFIGENTRY._serialized_options = b'8\001'
+  _GETCONFIGSERVICEDEFAULTSRESPONSE_TEMPLATESENTRY._options = None
+  _GETCONFIGSERVICEDEFAULTSRESPONSE_TEMPLATESENTRY._serialized_options = b'8\001'
+  _GETCONFIGSERVICEDEFAULTSRESPONSE_CONFIGENTRY._options = None
+  _GETCONFIGSERVICEDEFAULTSRESPONSE_CONFIGENTRY._serialized_options = b'8\001'
+  _GETNODECONFIGSERVICERESPONSE_CONFIGENTRY._options = None
+  _GETNODECONFIGSERVICERESPONSE_CONFIGENTRY._serialized_options = b'8\001'
+  _CONFIGSERVICECONFIG._serialized_start=83
+  _CONFIGSERVICECONFIG._serialized_end=368
+  _CONFIGSERVICECONFIG_TEMPLATESENTRY._serialized_start=273
+  _CONFIGSERVICECONFIG_TEMPLATESENTRY._serialized_end=321
+  _CONFIGSERVICECONFIG_CONFIGENTRY._serialized_start=323
+  _CONFIGSERVICECONFIG_CONFIGENTRY._serialized_end=368
+  _CONFIGSERVICEVALIDATIONMODE._serialized_start=370
+  _CONFIGSERVICEVALIDATIONMODE._serialized_end=450
+  _CONFIGSERVICEVALIDATIONMODE_ENUM._serialized_start=401
+  _CONFIGSERVICEVALIDATIONMODE_ENUM._serialized_end=450
+  _CONFIGSERVICE._serialized_start=453
+  _CONFIGSERVICE._serialized_end=757
+  _CONFIGMODE._serialized_start=760
+  _CONFIGMODE._serialized_end=889
+  _CONFIGMODE_CONFIGENTRY._serialized_start=323
+  _CONFIGMODE_CONFIGENTRY._serialized_end=368
+  _GETCONFIGSERVICEDEFAULTSREQUEST._serialized_start=891
+  _GETCONFIGSERVICEDEFAULTSREQUEST._serialized_end=938
+  _GETCONFIGSERVICEDEFAULTSRESPONSE._serialized_start=941
+  _GETCONFIGSERVICEDEFAULTSRESPONSE._serialized_end=1299
+  _GETCONFIGSERVICEDEFAULTSRESPONSE_TEMPLATESENTRY._serialized_start=273
+  _GETCONFIGSERVICEDEFAULTSRESPONSE_TEMPLATESENTRY._serialized_end=321
+  _GETCONFIGSERVICEDEFAULTSRESPONSE_CONFIGENTRY._serialized_start=1232
+  _GETCONFIGSERVICEDEFAULTSRESPONSE_CONFIGENTRY._serialized_end=1299
+  _GETNODECONFIGSERVICEREQUEST._serialized_start=1301
+  _GETNODECONFIGSERVICEREQUEST._serialized_end=1381
+  _GETNODECONFIGSERVICERESPONSE._serialized_start=1384
+  _GETNODECONFIGSERVICERESPONSE._serialized_end=1535
+  _GETNODECONFIGSERVICERESPONSE_CONFIGENTRY._serialized_start=323
+  _GETNODECONFIGSERVICERESPONSE_CONFIGENTRY._serialized_end=368
+# @@protoc_insertion_point(module_scope)
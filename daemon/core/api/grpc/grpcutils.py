@@ -18,12 +18,13 @@ from core.api.grpc.services_pb2 import (
 )
 from core.config import ConfigurableOptions
 from core.emane.nodes import EmaneNet
+from core.emulator.changes import LinkKey, link_key_matches
 from core.emulator.data import InterfaceData, LinkData, LinkOptions, NodeOptions
 from core.emulator.enumerations import LinkTypes, NodeTypes
 from core.emulator.session import Session
 from core.errors import CoreError
 from core.location.mobility import BasicRangeModel, Ns2ScriptedMobility
-from core.nodes.base import CoreNode, CoreNodeBase, NodeBase
+from core.nodes.base import CoreNetworkBase, CoreNode, CoreNodeBase, NodeBase
 from core.nodes.docker import DockerNode
 from core.nodes.interface import CoreInterface
 from core.nodes.lxd import LxcNode
@@ -109,7 +110,7 @@ def link_iface(iface_proto: core_pb2.Interface) -> InterfaceData:
 
 
 def add_link_data(
-    link_proto: core_pb2.Link
+    link_proto: core_pb2.Link,
 ) -> Tuple[InterfaceData, InterfaceData, LinkOptions, LinkTypes]:
     """
     Convert link proto to link interfaces and options data.
@@ -621,6 +622,8 @@ def get_mobility_node(
 
 
 def convert_session(session: Session) -> wrappers.Session:
+    # read version first, so changes made while converting are not missed
+    version = session.changes.version
     links = []
     nodes = []
     emane_configs = get_emane_model_configs_dict(session)
@@ -659,6 +662,95 @@ def convert_session(session: Session) -> wrappers.Session:
         file=session_file,
         options=options,
         servers=servers,
+        version=version,
+    )
+
+
+def get_key_links(
+    session: Session, key: LinkKey, net_links: Dict[int, List[LinkData]]
+) -> List[LinkData]:
+    """
+    Retrieve the current links matching a link key.
+
+    :param session: session to get links from
+    :param key: key of links to get
+    :param net_links: links for networks already built, by network id
+    :return: matching links
+    """
+    nets = {}
+    for node_id, _ in key:
+        node = session.nodes.get(node_id)
+        if isinstance(node, CoreNetworkBase):
+            nets[node.id] = node
+        elif isinstance(node, CoreNodeBase):
+            for iface in node.get_ifaces():
+                if iface.net:
+                    nets[iface.net.id] = iface.net
+    links = []
+    for net in nets.values():
+        if net.id not in net_links:
+            net_links[net.id] = net.links()
+        for link_data in net_links[net.id]:
+            node_ids = (link_data.node1_id, link_data.node2_id)
+            if not all(x in session.nodes for x in node_ids):
+                continue
+            iface1_id = link_data.iface1.id if link_data.iface1 else None
+            iface2_id = link_data.iface2.id if link_data.iface2 else None
+            if link_key_matches(
+                key, link_data.node1_id, link_data.node2_id, iface1_id, iface2_id
+            ):
+                links.append(link_data)
+    return links
+
+
+def convert_session_changes(
+    session: Session, version: int
+) -> core_pb2.GetSessionChangesResponse:
+    """
+    Convert the changes made to a session since a given version, falling back to
+    a full session when the changes are no longer available.
+
+    :param session: session to get changes for
+    :param version: version to get changes after
+    :return: session changes response
+    """
+    changes = session.changes.since(version)
+    if changes is None:
+        session_proto = convert_session(session)
+        return core_pb2.GetSessionChangesResponse(
+            version=session_proto.version, session=session_proto
+        )
+    nodes = []
+    deleted_node_ids = []
+    emane_configs = get_emane_model_configs_dict(session) if changes.nodes else {}
+    for node_id, deleted in changes.nodes.items():
+        node = session.nodes.get(node_id)
+        if deleted or node is None:
+            deleted_node_ids.append(node_id)
+        elif not isinstance(node, (PtpNet, CtrlNet)):
+            node_emane_configs = emane_configs.get(node.id, [])
+            nodes.append(get_node_proto(session, node, node_emane_configs))
+    links = []
+    deleted_links = []
+    net_links = {}
+    for key, deleted in changes.links.items():
+        key_links = [] if deleted else get_key_links(session, key, net_links)
+        if key_links:
+            links.extend(convert_link(x) for x in key_links)
+        else:
+            (node1_id, iface1_id), (node2_id, iface2_id) = key
+            iface1 = core_pb2.Interface(id=iface1_id) if iface1_id is not None else None
+            iface2 = core_pb2.Interface(id=iface2_id) if iface2_id is not None else None
+            link = core_pb2.Link(
+                node1_id=node1_id, node2_id=node2_id, iface1=iface1, iface2=iface2
+            )
+            deleted_links.append(link)
+    return core_pb2.GetSessionChangesResponse(
+        version=changes.version,
+        nodes=nodes,
+        deleted_node_ids=deleted_node_ids,
+        links=links,
+        deleted_links=deleted_links,
     )
 
 
@@ -3,10 +3,12 @@ import logging
 import os
 import re
 import tempfile
+import threading
 import time
 from concurrent import futures
 from pathlib import Path
-from typing import Iterable, Optional, Pattern, Type
+from queue import Empty, Full, Queue
+from typing import Iterable, Iterator, List, Optional, Pattern, Type
 
 import grpc
 from grpc import ServicerContext
@@ -19,6 +21,7 @@ from core.api.grpc import (
     core_pb2_grpc,
     grpcutils,
 )
+from core.api.grpc.commands import CommandExecutor, NodeCommandRunner
 from core.api.grpc.configservices_pb2 import (
     ConfigService,
     GetConfigServiceDefaultsRequest,
@@ -93,6 +96,12 @@ logger = logging.getLogger(__name__)
 _ONE_DAY_IN_SECONDS: int = 60 * 60 * 24
 _INTERFACE_REGEX: Pattern = re.compile(r"veth(?P<node>[0-9a-fA-F]+)")
 _MAX_WORKERS = 1000
+_MOVE_NODES_WINDOW: float = 0.05
+_MOVE_NODES_BATCH: int = 5000
+_MOVE_NODES_PENDING: int = 10000
+_MOVE_NODES_POLL: float = 1.0
+_NODE_COMMANDS_WORKERS: int = 256
+_NODE_COMMANDS_PARALLEL: int = 32
 
 
 class CoreGrpcServer(core_pb2_grpc.CoreApiServicer):
@@ -107,11 +116,13 @@ class CoreGrpcServer(core_pb2_grpc.CoreApiServicer):
         self.coreemu: CoreEmu = coreemu
         self.running: bool = True
         self.server: Optional[grpc.Server] = None
+        self.command_executor: CommandExecutor = CommandExecutor(_NODE_COMMANDS_WORKERS)
         atexit.register(self._exit_handler)
 
     def _exit_handler(self) -> None:
         logger.debug("catching exit, stop running")
         self.running = False
+        self.command_executor.shutdown(wait=False)
 
     def _is_running(self, context) -> bool:
         return self.running and context.is_active()
@@ -131,6 +142,10 @@ class CoreGrpcServer(core_pb2_grpc.CoreApiServicer):
                 time.sleep(_ONE_DAY_IN_SECONDS)
         except KeyboardInterrupt:
             self.server.stop(None)
+        finally:
+            # node command threads are joined on exit, before exit handlers run
+            self.running = False
+            self.command_executor.shutdown(wait=False)
 
     def get_session(self, session_id: int, context: ServicerContext) -> Session:
         """
@@ -205,8 +220,7 @@ class CoreGrpcServer(core_pb2_grpc.CoreApiServicer):
         self, request: core_pb2.GetConfigRequest, context: ServicerContext
     ) -> core_pb2.GetConfigResponse:
         services = []
-        for name in ServiceManager.services:
-            service = ServiceManager.services[name]
+        for service in ServiceManager.services.values():
             service_proto = Service(group=service.group, name=service.name)
             services.append(service_proto)
         config_services = []
@@ -311,6 +325,10 @@ class CoreGrpcServer(core_pb2_grpc.CoreApiServicer):
             exceptions = [str(x) for x in exceptions]
             return core_pb2.StartSessionResponse(result=False, exceptions=exceptions)
 
+        # pre-warm containers for defined container nodes, to be claimed on start
+        if request.definition and session.options.get_config("prewarm") == "1":
+            session.prewarm_containers()
+
         # set to instantiation and start
         if not request.definition:
             session.set_state(EventTypes.INSTANTIATION_STATE)
@@ -322,9 +340,9 @@ class CoreGrpcServer(core_pb2_grpc.CoreApiServicer):
                     for service_exception in boot_exception.args:
                         exceptions.append(str(service_exception))
                 return core_pb2.StartSessionResponse(
-                    result=False, exceptions=exceptions
+                    result=False, exceptions=exceptions, metrics=session.start_metrics
                 )
-        return core_pb2.StartSessionResponse(result=True)
+        return core_pb2.StartSessionResponse(result=True, metrics=session.start_metrics)
 
     def StopSession(
         self, request: core_pb2.StopSessionRequest, context: ServicerContext
@@ -340,7 +358,7 @@ class CoreGrpcServer(core_pb2_grpc.CoreApiServicer):
         session = self.get_session(request.session_id, context)
         session.data_collect()
         session.shutdown()
-        return core_pb2.StopSessionResponse(result=True)
+        return core_pb2.StopSessionResponse(result=True, metrics=session.stop_metrics)
 
     def CreateSession(
         self, request: core_pb2.CreateSessionRequest, context: ServicerContext
@@ -412,6 +430,52 @@ class CoreGrpcServer(core_pb2_grpc.CoreApiServicer):
         result = request.session_id in self.coreemu.sessions
         return core_pb2.CheckSessionResponse(result=result)
 
+    def GetSessionProfile(
+        self, request: core_pb2.GetSessionProfileRequest, context: ServicerContext
+    ) -> core_pb2.GetSessionProfileResponse:
+        """
+        Retrieve the boot profile for a session, writing it as a chrome trace
+        file within the session directory.
+
+        :param request: get session profile request
+        :param context: context object
+        :return: get session profile response
+        """
+        session = self.get_session(request.session_id, context)
+        profiler = session.profiler
+        spans = []
+        for span in list(profiler.spans):
+            spans.append(
+                core_pb2.ProfileSpan(
+                    name=span.name,
+                    category=span.category,
+                    start=span.start - profiler.start,
+                    duration=span.duration,
+                    thread=span.thread,
+                    parent=span.parent.name if span.parent else "",
+                    args=span.args,
+                    commands=span.commands,
+                    command_time=span.command_time,
+                )
+            )
+        commands = []
+        if request.commands:
+            for command in list(profiler.commands):
+                commands.append(
+                    core_pb2.ProfileCommand(
+                        command=command.command,
+                        start=command.start - profiler.start,
+                        duration=command.duration,
+                        thread=command.thread,
+                        span=command.span,
+                        server=command.server or "",
+                    )
+                )
+        path = session.write_profile()
+        return core_pb2.GetSessionProfileResponse(
+            spans=spans, commands=commands, path=str(path)
+        )
+
     def GetSession(
         self, request: core_pb2.GetSessionRequest, context: ServicerContext
     ) -> core_pb2.GetSessionResponse:
@@ -427,6 +491,21 @@ class CoreGrpcServer(core_pb2_grpc.CoreApiServicer):
         session_proto = grpcutils.convert_session(session)
         return core_pb2.GetSessionResponse(session=session_proto)
 
+    def GetSessionChanges(
+        self, request: core_pb2.GetSessionChangesRequest, context: ServicerContext
+    ) -> core_pb2.GetSessionChangesResponse:
+        """
+        Retrieve nodes and links changed since a given session version, or the
+        full session when those changes are no longer available.
+
+        :param request: get-session-changes request
+        :param context: context object
+        :return: get-session-changes response
+        """
+        logger.debug("get session changes: %s", request)
+        session = self.get_session(request.session_id, context)
+        return grpcutils.convert_session_changes(session, request.version)
+
     def SessionAlert(
         self, request: core_pb2.SessionAlertRequest, context: ServicerContext
     ) -> core_pb2.SessionAlertResponse:
@@ -595,24 +674,131 @@ class CoreGrpcServer(core_pb2_grpc.CoreApiServicer):
         context: ServicerContext,
     ) -> core_pb2.MoveNodesResponse:
         """
-        Stream node movements
+        Stream node movements, applied in time windowed batches. Only the latest
+        movement for a node within a batch is applied, with wireless models and
+        emane locations updated once per batch. Reading from the stream pauses
+        when too many movements are pending. Stops when the stream ends, or the
+        client cancels it.
 
         :param request_iterator: move nodes request iterator
         :param context: context object
-        :return: move nodes response
+        :return: move nodes response with batching stats
         """
-        for request in request_iterator:
+        requests = Queue(maxsize=_MOVE_NODES_PENDING)
+        thread = threading.Thread(
+            target=self._read_moves,
+            args=(request_iterator, requests, context),
+            daemon=True,
+        )
+        thread.start()
+        response = core_pb2.MoveNodesResponse()
+        done = False
+        while not done:
+            try:
+                request = requests.get(timeout=_MOVE_NODES_POLL)
+            except Empty:
+                if context.is_active():
+                    continue
+                break
+            if request is None:
+                break
+            response.max_pending = max(response.max_pending, requests.qsize() + 1)
+            batch = [request]
+            deadline = time.monotonic() + _MOVE_NODES_WINDOW
+            while len(batch) < _MOVE_NODES_BATCH:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    request = requests.get(timeout=timeout)
+                except Empty:
+                    break
+                if request is None:
+                    done = True
+                    break
+                batch.append(request)
+            start = time.monotonic()
+            applied = self.move_nodes(context, batch)
+            batch_ms = (time.monotonic() - start) * 1000
+            response.received += len(batch)
+            response.applied += applied
+            response.coalesced += len(batch) - applied
+            response.batches += 1
+            response.max_batch_ms = max(response.max_batch_ms, batch_ms)
+        logger.debug(
+            "move nodes stream received(%s) applied(%s) batches(%s)",
+            response.received,
+            response.applied,
+            response.batches,
+        )
+        return response
+
+    def _read_moves(
+        self,
+        request_iterator: Iterable[core_pb2.MoveNodesRequest],
+        requests: Queue,
+        context: ServicerContext,
+    ) -> None:
+        """
+        Read move requests from a stream into a bounded queue, followed by None
+        once the stream ends.
+
+        :param request_iterator: move nodes request iterator
+        :param requests: queue to place requests in
+        :param context: context object
+        :return: nothing
+        """
+
+        def put(value: Optional[core_pb2.MoveNodesRequest]) -> bool:
+            while True:
+                try:
+                    requests.put(value, timeout=_MOVE_NODES_POLL)
+                    return True
+                except Full:
+                    if not context.is_active():
+                        return False
+
+        try:
+            for request in request_iterator:
+                if not put(request):
+                    return
+        except Exception:
+            logger.exception("error reading move nodes stream")
+        finally:
+            put(None)
+
+    def move_nodes(
+        self, context: ServicerContext, requests: List[core_pb2.MoveNodesRequest]
+    ) -> int:
+        """
+        Apply a batch of move requests, using the latest request for each node.
+
+        :param context: context object
+        :param requests: move requests to apply
+        :return: number of node movements applied
+        """
+        latest = {}
+        for request in requests:
+            latest[(request.session_id, request.node_id)] = request
+        moves = {}
+        for (session_id, node_id), request in latest.items():
             geo = request.geo if request.HasField("geo") else None
             position = request.position if request.HasField("position") else None
-            self.move_node(
-                context,
-                request.session_id,
-                request.node_id,
-                geo,
-                position,
-                request.source,
-            )
-        return core_pb2.MoveNodesResponse()
+            if not geo and not position:
+                raise CoreError("move node must provide a geo or position to move")
+            session = self.get_session(session_id, context)
+            node = self.get_node(session, node_id, context, NodeBase)
+            if geo:
+                move = (node, None, (geo.lon, geo.lat, geo.alt))
+            else:
+                move = (node, (position.x, position.y), None)
+            session_moves = moves.setdefault(session_id, (session, []))[1]
+            session_moves.append((move, request.source or None))
+        for session, session_moves in moves.values():
+            session.set_node_positions([x[0] for x in session_moves])
+            for (node, _, _), source in session_moves:
+                session.broadcast_node(node, source=source)
+        return len(latest)
 
     def EditNode(
         self, request: core_pb2.EditNodeRequest, context: ServicerContext
@@ -673,6 +859,40 @@ class CoreGrpcServer(core_pb2_grpc.CoreApiServicer):
             return_code = e.returncode
         return core_pb2.NodeCommandResponse(output=output, return_code=return_code)
 
+    def NodeCommands(
+        self, request: core_pb2.NodeCommandsRequest, context: ServicerContext
+    ) -> Iterator[core_pb2.NodeCommandsEvent]:
+        """
+        Run a command on a set of nodes, defaulting to all container nodes, and
+        stream each result as it completes. Commands run on a dedicated executor,
+        with bounded parallelism, and stop being started when the stream is
+        cancelled.
+
+        :param request: node-commands request
+        :param context: context object
+        :return: result of running command for each node
+        """
+        logger.debug("sending node commands: %s", request)
+        session = self.get_session(request.session_id, context)
+        if request.node_ids:
+            nodes = [
+                self.get_node(session, x, context, CoreNode) for x in request.node_ids
+            ]
+        else:
+            with session.nodes_lock:
+                nodes = [x for x in session.nodes.values() if isinstance(x, CoreNode)]
+        parallel = request.parallel if request.parallel else _NODE_COMMANDS_PARALLEL
+        parallel = min(parallel, _NODE_COMMANDS_WORKERS)
+        runner = NodeCommandRunner(
+            self.command_executor,
+            nodes,
+            request.command,
+            request.shell,
+            request.timeout,
+            parallel,
+        )
+        yield from runner.run(lambda: self._is_running(context))
+
     def GetNodeTerminal(
         self, request: core_pb2.GetNodeTerminalRequest, context: ServicerContext
     ) -> core_pb2.GetNodeTerminalResponse:
@@ -851,6 +1071,7 @@ class CoreGrpcServer(core_pb2_grpc.CoreApiServicer):
         session.mobility.set_model_config(
             mobility_config.node_id, Ns2ScriptedMobility.name, mobility_config.config
         )
+        session.changes.node_changed(mobility_config.node_id)
         return SetMobilityConfigResponse(result=True)
 
     def MobilityAction(
@@ -1073,6 +1294,7 @@ class CoreGrpcServer(core_pb2_grpc.CoreApiServicer):
         if session.state == EventTypes.RUNTIME_STATE:
             node = self.get_node(session, node_id, context, WlanNode)
             node.updatemodel(config)
+        session.changes.node_changed(node_id)
         return SetWlanConfigResponse(result=True)
 
     def GetEmaneModelConfig(
@@ -1110,6 +1332,7 @@ class CoreGrpcServer(core_pb2_grpc.CoreApiServicer):
         model_config = request.emane_model_config
         _id = utils.iface_config_id(model_config.node_id, model_config.iface_id)
         session.emane.set_config(_id, model_config.model, model_config.config)
+        session.changes.node_changed(model_config.node_id)
         return SetEmaneModelConfigResponse(result=True)
 
     def SaveXml(
@@ -361,6 +361,25 @@ class CpuUsageEvent:
         return CpuUsageEvent(usage=proto.usage)
 
 
+@dataclass
+class NodeCommandResult:
+    node_id: int
+    output: str
+    return_code: int
+    timed_out: bool
+    duration: float
+
+    @classmethod
+    def from_proto(cls, proto: core_pb2.NodeCommandsEvent) -> "NodeCommandResult":
+        return NodeCommandResult(
+            node_id=proto.node_id,
+            output=proto.output,
+            return_code=proto.return_code,
+            timed_out=proto.timed_out,
+            duration=proto.duration,
+        )
+
+
 @dataclass
 class SessionLocation:
     x: float
@@ -869,6 +888,7 @@ class Session:
     file: Path = None
     options: Dict[str, ConfigOption] = field(default_factory=dict)
     servers: List[Server] = field(default_factory=list)
+    version: int = 0
 
     @classmethod
     def from_proto(cls, proto: core_pb2.Session) -> "Session":
@@ -895,6 +915,7 @@ class Session:
             file=file_path,
             options=options,
             servers=servers,
+            version=proto.version,
         )
 
     def to_proto(self) -> core_pb2.Session:
@@ -924,6 +945,7 @@ class Session:
             file=file,
             options=options,
             servers=servers,
+            version=self.version,
         )
 
     def add_node(
@@ -1203,3 +1225,111 @@ class MoveNodesRequest:
             position=position,
             geo=geo,
         )
+
+
+@dataclass
+class MoveNodesStats:
+    received: int
+    applied: int
+    coalesced: int
+    batches: int
+    max_pending: int
+    max_batch_ms: float
+
+    @classmethod
+    def from_proto(cls, proto: core_pb2.MoveNodesResponse) -> "MoveNodesStats":
+        return MoveNodesStats(
+            received=proto.received,
+            applied=proto.applied,
+            coalesced=proto.coalesced,
+            batches=proto.batches,
+            max_pending=proto.max_pending,
+            max_batch_ms=proto.max_batch_ms,
+        )
+
+
+@dataclass
+class ProfileSpan:
+    name: str
+    category: str
+    start: float
+    duration: float
+    thread: int
+    parent: Optional[str]
+    args: Dict[str, str]
+    commands: int
+    command_time: float
+
+    @classmethod
+    def from_proto(cls, proto: core_pb2.ProfileSpan) -> "ProfileSpan":
+        return ProfileSpan(
+            name=proto.name,
+            category=proto.category,
+            start=proto.start,
+            duration=proto.duration,
+            thread=proto.thread,
+            parent=proto.parent or None,
+            args=dict(proto.args),
+            commands=proto.commands,
+            command_time=proto.command_time,
+        )
+
+
+@dataclass
+class ProfileCommand:
+    command: str
+    start: float
+    duration: float
+    thread: int
+    span: str
+    server: Optional[str]
+
+    @classmethod
+    def from_proto(cls, proto: core_pb2.ProfileCommand) -> "ProfileCommand":
+        return ProfileCommand(
+            command=proto.command,
+            start=proto.start,
+            duration=proto.duration,
+            thread=proto.thread,
+            span=proto.span,
+            server=proto.server or None,
+        )
+
+
+@dataclass
+class SessionProfile:
+    spans: List[ProfileSpan]
+    commands: List[ProfileCommand]
+    path: Path
+
+    @classmethod
+    def from_proto(cls, proto: core_pb2.GetSessionProfileResponse) -> "SessionProfile":
+        return SessionProfile(
+            spans=[ProfileSpan.from_proto(x) for x in proto.spans],
+            commands=[ProfileCommand.from_proto(x) for x in proto.commands],
+            path=Path(proto.path),
+        )
+
+
+@dataclass
+class SessionChanges:
+    version: int
+    session: Optional[Session]
+    nodes: List[Node]
+    deleted_node_ids: List[int]
+    links: List[Link]
+    deleted_links: List[Link]
+
+    @classmethod
+    def from_proto(cls, proto: core_pb2.GetSessionChangesResponse) -> "SessionChanges":
+        session = None
+        if proto.HasField("session"):
+            session = Session.from_proto(proto.session)
+        return SessionChanges(
+            version=proto.version,
+            session=session,
+            nodes=[Node.from_proto(x) for x in proto.nodes],
+            deleted_node_ids=list(proto.deleted_node_ids),
+            links=[Link.from_proto(x) for x in proto.links],
+            deleted_links=[Link.from_proto(x) for x in proto.deleted_links],
+        )
@@ -1186,15 +1186,13 @@ class CoreHandler(socketserver.BaseRequestHandler):
             # send back a list of available services
             if opaque is None:
                 type_flag = ConfigFlags.NONE.value
-                data_types = tuple(
-                    repeat(ConfigDataTypes.BOOL.value, len(ServiceManager.services))
-                )
+                services = ServiceManager.services.values()
+                data_types = tuple(repeat(ConfigDataTypes.BOOL.value, len(services)))
 
                 # sort groups by name and map services to groups
                 groups = set()
                 group_map = {}
-                for name in ServiceManager.services:
-                    service_name = ServiceManager.services[name]
+                for service_name in services:
                     group = service_name.group
                     groups.add(group)
                     group_map.setdefault(group, []).append(service_name)
@@ -5,7 +5,7 @@ import logging
 import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from mako import exceptions
 from mako.lookup import TemplateLookup
@@ -152,25 +152,34 @@ class ConfigService(abc.ABC):
     def validation_mode(self) -> ConfigServiceMode:
         raise NotImplementedError
 
-    def start(self) -> None:
+    def start(self, prepared: bool = False) -> None:
         """
         Creates services files/directories, runs startup, and validates based on
         validation mode.
 
+        :param prepared: True when service directories and files were already
+            created, False otherwise
         :return: nothing
         :raises ConfigServiceBootError: when there is an error starting service
         """
         logger.info("node(%s) service(%s) starting...", self.node.name, self.name)
-        self.create_shadow_dirs()
-        self.create_dirs()
-        self.create_files()
+        profiler = self.node.session.profiler
+        args = dict(node=self.node.name, service=self.name)
+        if not prepared:
+            with profiler.span("directories", "config_service", **args):
+                self.create_shadow_dirs()
+                self.create_dirs()
+            with profiler.span("files", "config_service", **args):
+                self.create_files()
         wait = self.validation_mode == ConfigServiceMode.BLOCKING
-        self.run_startup(wait)
+        with profiler.span("startup", "config_service", **args):
+            self.run_startup(wait)
         if not wait:
-            if self.validation_mode == ConfigServiceMode.TIMER:
-                self.wait_validation()
-            else:
-                self.run_validation()
+            with profiler.span("validation", "config_service", **args):
+                if self.validation_mode == ConfigServiceMode.TIMER:
+                    self.wait_validation()
+                else:
+                    self.run_validation()
 
     def stop(self) -> None:
         """
@@ -246,13 +255,16 @@ class ConfigService(abc.ABC):
             # create all files within node, from templates when configured
             data = self.data()
             templates = TemplateLookup(directories=src_path)
+            files = []
             for path, dst_path in file_paths:
                 if shadow_dir.templates:
                     template = templates.get_template(path.name)
                     rendered = self._render(template, data)
-                    self.node.create_file(dst_path, rendered)
+                    files.append((dst_path, rendered, 0o644))
                 else:
                     self.node.copy_file(path, dst_path)
+            if files:
+                self.node.create_files(files)
 
     def create_dirs(self) -> None:
         """
@@ -327,7 +339,16 @@ class ConfigService(abc.ABC):
 
         :return: nothing
         """
+        self.node.create_files(self.get_files())
+
+    def get_files(self) -> List[Tuple[Path, str, int]]:
+        """
+        Renders service files to create inside associated node.
+
+        :return: tuples of file path, contents, and mode for files to create
+        """
         data = self.data()
+        files = []
         for file in sorted(self.files):
             logger.debug(
                 "node(%s) service(%s) template(%s)", self.node.name, self.name, file
@@ -342,7 +363,8 @@ class ConfigService(abc.ABC):
             else:
                 text = self.get_text_template(file)
                 rendered = self.render_text(text, data)
-            self.node.create_file(file_path, rendered)
+            files.append((file_path, rendered, 0o644))
+        return files
 
     def run_startup(self, wait: bool) -> None:
         """
@@ -353,9 +375,10 @@ class ConfigService(abc.ABC):
         :return: nothing
         :raises ConfigServiceBootError: when a command that waits fails
         """
-        for cmd in self.startup:
+        results = self.node.cmds(self.startup, wait=wait, stop_on_error=True)
+        for result in results:
             try:
-                self.node.cmd(cmd, wait=wait)
+                result.check()
             except CoreCommandError as e:
                 raise ConfigServiceBootError(
                     f"node({self.node.name}) service({self.name}) failed startup: {e}"
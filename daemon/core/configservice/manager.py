@@ -2,11 +2,12 @@ import logging
 import pathlib
 import pkgutil
 from pathlib import Path
-from typing import Dict, List, Type
+from typing import List, Type
 
 from core import configservices, utils
 from core.configservice.base import ConfigService
 from core.errors import CoreError
+from core.registry import LazyRegistry, RegistryCache, RegistryEntry
 
 logger = logging.getLogger(__name__)
 
@@ -16,11 +17,15 @@ class ConfigServiceManager:
     Manager for configurable services.
     """
 
-    def __init__(self):
+    def __init__(self, cache: RegistryCache = None):
         """
         Create a ConfigServiceManager instance.
+
+        :param cache: cache of service metadata, avoids importing service modules
+            that have not changed
         """
-        self.services: Dict[str, Type[ConfigService]] = {}
+        self.services: LazyRegistry = LazyRegistry(ConfigService)
+        self.cache: RegistryCache = cache if cache else RegistryCache()
 
     def get_service(self, name: str) -> Type[ConfigService]:
         """
@@ -62,6 +67,32 @@ class ConfigServiceManager:
         # make service available
         self.services[name] = service
 
+    def add_entry(self, entry: RegistryEntry) -> None:
+        """
+        Add service to manager by its metadata, checking service requirements have
+        been met, deferring importing the service until first used.
+
+        :param entry: entry for service to add
+        :return: nothing
+        :raises CoreError: when service is a duplicate or has unmet executables
+        """
+        name = entry.name
+        logger.debug("indexing service: class(%s) name(%s)", entry.class_name, name)
+
+        # avoid duplicate services
+        if name in self.services:
+            raise CoreError(f"duplicate service being added: {name}")
+
+        # validate dependent executables are present
+        for executable in entry.executables:
+            try:
+                utils.which(executable, required=True)
+            except CoreError as e:
+                raise CoreError(f"config service({name}): {e}")
+
+        # make service available, to be loaded on first use
+        self.services.add_entry(entry)
+
     def load_locals(self) -> List[str]:
         """
         Search and add config service from local core module.
@@ -72,13 +103,19 @@ class ConfigServiceManager:
         for module_info in pkgutil.walk_packages(
             configservices.__path__, f"{configservices.__name__}."
         ):
-            services = utils.load_module(module_info.name, ConfigService)
-            for service in services:
+            name = module_info.name.split(".")[-1]
+            file_path = Path(module_info.module_finder.path) / name
+            if module_info.ispkg:
+                file_path = file_path / "__init__.py"
+            else:
+                file_path = file_path.with_suffix(".py")
+            entries = self.cache.entries(module_info.name, file_path, ConfigService)
+            for entry in entries:
                 try:
-                    self.add(service)
+                    self.add_entry(entry)
                 except CoreError as e:
-                    errors.append(service.name)
-                    logger.debug("not loading config service(%s): %s", service.name, e)
+                    errors.append(entry.name)
+                    logger.debug("not loading config service(%s): %s", entry.name, e)
         return errors
 
     def load(self, path: Path) -> List[str]:
@@ -94,11 +131,11 @@ class ConfigServiceManager:
         service_errors = []
         for subdir in subdirs:
             logger.debug("loading config services from: %s", subdir)
-            services = utils.load_classes(subdir, ConfigService)
-            for service in services:
-                try:
-                    self.add(service)
-                except CoreError as e:
-                    service_errors.append(service.name)
-                    logger.debug("not loading service(%s): %s", service.name, e)
+            for module, file_path in utils.find_modules(subdir):
+                for entry in self.cache.entries(module, file_path, ConfigService):
+                    try:
+                        self.add_entry(entry)
+                    except CoreError as e:
+                        service_errors.append(entry.name)
+                        logger.debug("not loading service(%s): %s", entry.name, e)
         return service_errors
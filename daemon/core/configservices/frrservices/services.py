@@ -5,7 +5,7 @@ from core.config import Configuration
 from core.configservice.base import ConfigService, ConfigServiceMode
 from core.emane.nodes import EmaneNet
 from core.nodes.base import CoreNodeBase
-from core.nodes.interface import DEFAULT_MTU, CoreInterface
+from core.nodes.interface import CoreInterface
 from core.nodes.network import WlanNode
 
 GROUP: str = "FRR"
@@ -18,14 +18,7 @@ def has_mtu_mismatch(iface: CoreInterface) -> bool:
     mtu-ignore command. This is needed when e.g. a node is linked via a
     GreTap device.
     """
-    if iface.mtu != DEFAULT_MTU:
-        return True
-    if not iface.net:
-        return False
-    for iface in iface.net.get_ifaces():
-        if iface.mtu != iface.mtu:
-            return True
-    return False
+    return iface.session.topology.has_mtu_mismatch(iface)
 
 
 def get_min_mtu(iface: CoreInterface) -> int:
@@ -33,24 +26,14 @@ def get_min_mtu(iface: CoreInterface) -> int:
     Helper to discover the minimum MTU of interfaces linked with the
     given interface.
     """
-    mtu = iface.mtu
-    if not iface.net:
-        return mtu
-    for iface in iface.net.get_ifaces():
-        if iface.mtu < mtu:
-            mtu = iface.mtu
-    return mtu
+    return iface.session.topology.min_mtu(iface)
 
 
 def get_router_id(node: CoreNodeBase) -> str:
     """
     Helper to return the first IPv4 address of a node as its router ID.
     """
-    for iface in node.get_ifaces(control=False):
-        ip4 = iface.get_ip4()
-        if ip4:
-            return str(ip4.ip)
-    return "0.0.0.0"
+    return node.session.topology.router_id(node) or "0.0.0.0"
 
 
 class FRRZebra(ConfigService):
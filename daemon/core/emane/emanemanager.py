@@ -6,6 +6,7 @@ import logging
 import os
 import threading
 from enum import Enum
+from pathlib import Path
 from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple, Type, Union
 
 from core import utils
@@ -45,6 +46,7 @@ except ImportError:
         EventServiceException = None
         logger.debug("compatible emane python bindings not installed")
 
+IfaceConfigKey = Tuple[int, int, Optional[int], str]
 DEFAULT_EMANE_PREFIX = "/usr"
 DEFAULT_DEV = "ctrl0"
 DEFAULT_LOG_LEVEL: int = 3
@@ -145,12 +147,22 @@ class EmaneManager:
         # model for global EMANE configuration options
         self.node_configs: Dict[int, Dict[str, Dict[str, str]]] = {}
         self.node_models: Dict[int, str] = {}
+        # resolved interface configurations, sharing identical configurations
+        self.iface_configs: Dict[IfaceConfigKey, Dict[str, str]] = {}
+        self.unique_configs: Dict[Tuple[Tuple[str, str], ...], Dict[str, str]] = {}
+        self.default_configs: Dict[str, Dict[str, str]] = {}
+        # rendered model xml documents, by model, document, and config values
+        self.xml_cache: Dict[Tuple[str, str, Tuple[str, ...]], bytes] = {}
+        # shared model xml files written, by server name and path
+        self.xml_files: Set[Tuple[Optional[str], Path]] = set()
 
         # link  monitor
         self.link_monitor: EmaneLinkMonitor = EmaneLinkMonitor(self)
         # emane event monitoring
         self.services: Dict[str, EmaneEventService] = {}
         self.nem_service: Dict[int, EmaneEventService] = {}
+        # sequence of session position changes already published
+        self.position_sequence: int = 0
 
     def next_nem_id(self, iface: CoreInterface) -> int:
         nem_id = self.session.options.get_config_int("nem_id_start")
@@ -200,6 +212,7 @@ class EmaneManager:
         model_config.update(config)
         model_configs = self.node_configs.setdefault(key, {})
         model_configs[model] = model_config
+        self.clear_config_cache()
 
     def get_model(self, model_name: str) -> Type[EmaneModel]:
         """
@@ -219,10 +232,27 @@ class EmaneManager:
         specific config, node specific config, network specific config, and finally
         falling back to the default configuration settings.
 
+        Resolved configurations are cached until configurations change, with
+        identical configurations shared across interfaces, and should not be
+        modified.
+
         :param emane_net: emane network the interface is connected to
         :param iface: interface running emane
         :return: net, node, or interface model configuration
         """
+        model_name = emane_net.model.name
+        key = (emane_net.id, iface.node.id, iface.node_id, model_name)
+        config = self.iface_configs.get(key)
+        if config is None:
+            config = self._resolve_iface_config(emane_net, iface)
+            unique_key = tuple(sorted(config.items()))
+            config = self.unique_configs.setdefault(unique_key, dict(config))
+            self.iface_configs[key] = config
+        return config
+
+    def _resolve_iface_config(
+        self, emane_net: EmaneNet, iface: CoreInterface
+    ) -> Dict[str, str]:
         model_name = emane_net.model.name
         config = None
         # try to retrieve interface specific configuration
@@ -239,9 +269,25 @@ class EmaneManager:
             config = self.get_config(emane_net.id, model_name, default=False)
         # return default config values, when a config is not present
         if not config:
-            config = emane_net.model.default_values()
+            config = self.default_configs.get(model_name)
+            if config is None:
+                config = emane_net.model.default_values()
+                self.default_configs[model_name] = config
         return config
 
+    def clear_config_cache(self) -> None:
+        """
+        Clear resolved interface configurations and rendered xml documents, after
+        configurations have changed.
+
+        :return: nothing
+        """
+        self.iface_configs.clear()
+        self.unique_configs.clear()
+        self.default_configs.clear()
+        self.xml_cache.clear()
+        self.xml_files.clear()
+
     def config_reset(self, node_id: int = None) -> None:
         if node_id is None:
             self.node_configs.clear()
@@ -249,6 +295,7 @@ class EmaneManager:
         else:
             self.node_configs.get(node_id, {}).clear()
             self.node_models.pop(node_id, None)
+        self.clear_config_cache()
 
     def add_node(self, emane_net: EmaneNet) -> None:
         """
@@ -418,12 +465,13 @@ class EmaneManager:
         return int(f"47{nem_id:03}")
 
     def get_nem_position(
-        self, iface: CoreInterface
+        self, iface: CoreInterface, position: Tuple[float, float, float] = None
     ) -> Optional[Tuple[int, float, float, int]]:
         """
         Retrieves nem position for a given interface.
 
         :param iface: interface to get nem emane position for
+        :param position: x,y,z position of interface node, when already known
         :return: nem position tuple, None otherwise
         """
         nem_id = self.get_nem_id(iface)
@@ -431,7 +479,7 @@ class EmaneManager:
             logger.info("nem for %s is unknown", iface.localname)
             return
         node = iface.node
-        x, y, z = node.getposition()
+        x, y, z = position if position else node.getposition()
         lat, lon, alt = self.session.location.getgeo(x, y, z)
         if node.position.alt is not None:
             alt = node.position.alt
@@ -462,8 +510,11 @@ class EmaneManager:
         if not moved_ifaces:
             return
         services = {}
+        sequence, positions = self.session.positions.changed(self.position_sequence)
+        self.position_sequence = sequence
         for iface in moved_ifaces:
-            position = self.get_nem_position(iface)
+            position = positions.get(iface.node.position.slot)
+            position = self.get_nem_position(iface, position)
             if not position:
                 continue
             nem_id, lon, lat, alt = position
@@ -513,6 +564,7 @@ class EmaneManager:
             self.ifaces_to_nems.clear()
             self.nems_to_ifaces.clear()
             self.services.clear()
+        self.clear_config_cache()
 
     def shutdown(self) -> None:
         """
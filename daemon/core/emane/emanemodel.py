@@ -131,10 +131,10 @@ class EmaneModel(WirelessModel):
         :param iface: interface to run emane for
         :return: nothing
         """
-        # create nem, mac, and phy xml files
-        emanexml.create_nem_xml(self, iface, config)
-        emanexml.create_mac_xml(self, iface, config)
-        emanexml.create_phy_xml(self, iface, config)
+        # create shared mac and phy xml files, and a nem file pointing to them
+        mac_name = emanexml.create_mac_xml(self, iface, config)
+        phy_name = emanexml.create_phy_xml(self, iface, config)
+        emanexml.create_nem_xml(self, iface, config, mac_name, phy_name)
         emanexml.create_transport_xml(iface, config)
 
     def post_startup(self, iface: CoreInterface) -> None:
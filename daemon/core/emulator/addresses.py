@@ -0,0 +1,273 @@
+"""
+Incremental address allocation for ip prefixes and mac addresses. Addresses are
+handed out from integer counters, with an index of used values to detect
+collisions, and only formatted as strings when requested.
+"""
+import random
+import socket
+import threading
+from typing import Dict, Hashable, Iterator, List, Sequence, Union, overload
+
+import netaddr
+
+from core import utils
+
+# oui used for generated mac addresses, matching utils.random_mac
+MAC_OUI: int = 0x00163E
+MAC_SIZE: int = 0x1000000
+
+
+class AddressBlock(Sequence[str]):
+    """
+    Addresses allocated in bulk, formatted when accessed.
+    """
+
+    def __init__(self, pool: "AddressPool", values: List[int]) -> None:
+        """
+        Create an AddressBlock instance.
+
+        :param pool: pool addresses were allocated from
+        :param values: allocated address values
+        """
+        self.pool: "AddressPool" = pool
+        self.values: List[int] = values
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    @overload
+    def __getitem__(self, index: int) -> str:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[str]:
+        ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[str, List[str]]:
+        if isinstance(index, slice):
+            return [self.pool.format(x) for x in self.values[index]]
+        return self.pool.format(self.values[index])
+
+    def __iter__(self) -> Iterator[str]:
+        for value in self.values:
+            yield self.pool.format(value)
+
+
+class AddressPool:
+    """
+    Allocates addresses within an ip4 or ip6 prefix.
+    """
+
+    def __init__(self, prefix: str) -> None:
+        """
+        Create an AddressPool instance.
+
+        :param prefix: ip4 or ip6 prefix to allocate from
+        :raises netaddr.AddrFormatError: when prefix is invalid
+        """
+        network = netaddr.IPNetwork(prefix)
+        self.prefix: netaddr.IPNetwork = network.cidr
+        self.prefixlen: int = network.prefixlen
+        self.first: int = network.first
+        self.size: int = network.size
+        if network.version == 4:
+            self.family: int = socket.AF_INET
+            self.width: int = 4
+        else:
+            self.family: int = socket.AF_INET6
+            self.width: int = 16
+        self.lock: threading.Lock = threading.Lock()
+        self.next: int = 1
+        self.used: Dict[int, Hashable] = {}
+
+    def __len__(self) -> int:
+        return len(self.used)
+
+    def format(self, value: int) -> str:
+        """
+        Format an address value as a string.
+
+        :param value: address value
+        :return: formatted address
+        """
+        return socket.inet_ntop(self.family, value.to_bytes(self.width, "big"))
+
+    def _value(self, index: int) -> int:
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError(f"index({index}) outside of prefix({self.prefix})")
+        return self.first + index
+
+    def address(self, index: int) -> str:
+        """
+        Retrieve the address at an index within the prefix, the same as indexing
+        a netaddr network.
+
+        :param index: index of address, negative values index from the end
+        :return: formatted address
+        :raises IndexError: when index is outside of the prefix
+        """
+        return self.format(self._value(index))
+
+    def index(self, address: str) -> int:
+        """
+        Retrieve the index of an address within the prefix.
+
+        :param address: address to get index for
+        :return: index of address
+        :raises ValueError: when address is invalid or outside of the prefix
+        """
+        try:
+            data = socket.inet_pton(self.family, address)
+        except OSError:
+            raise ValueError(f"invalid address({address}) for prefix({self.prefix})")
+        index = int.from_bytes(data, "big") - self.first
+        if not 0 <= index < self.size:
+            raise ValueError(f"address({address}) outside of prefix({self.prefix})")
+        return index
+
+    def reserve(self, index: int, owner: Hashable = None) -> bool:
+        """
+        Mark the address at an index as used, so it will not be allocated.
+
+        :param index: index of address to reserve
+        :param owner: owner of address, reserving again for the same owner is
+            not considered a collision
+        :return: True if reserved, False if already used by a different owner
+        :raises IndexError: when index is outside of the prefix
+        """
+        value = self._value(index)
+        with self.lock:
+            current = self.used.setdefault(value, owner)
+        return current == owner
+
+    def release(self, index: int) -> None:
+        """
+        Release the address at an index, allowing it to be allocated again.
+
+        :param index: index of address to release
+        :return: nothing
+        """
+        value = self._value(index)
+        with self.lock:
+            self.used.pop(value, None)
+
+    def _allocate(self, owner: Hashable) -> int:
+        # skip network and broadcast addresses for ip4 prefixes with hosts
+        last = self.size - 1
+        if self.family == socket.AF_INET and self.size > 2:
+            last -= 1
+        if last < 1:
+            raise IndexError(f"no addresses available within {self.prefix}")
+        start = self.next
+        while True:
+            value = self.first + self.next
+            self.next = self.next + 1 if self.next < last else 1
+            if value not in self.used:
+                self.used[value] = owner
+                return value
+            if self.next == start:
+                raise IndexError(f"no addresses available within {self.prefix}")
+
+    def allocate(self, owner: Hashable = None) -> str:
+        """
+        Allocate the next unused address within the prefix.
+
+        :param owner: owner of allocated address
+        :return: allocated address
+        :raises IndexError: when no addresses are available
+        """
+        with self.lock:
+            value = self._allocate(owner)
+        return self.format(value)
+
+    def allocate_many(self, count: int, owner: Hashable = None) -> AddressBlock:
+        """
+        Allocate several unused addresses at once, for building topologies.
+
+        :param count: number of addresses to allocate
+        :param owner: owner of allocated addresses
+        :return: allocated addresses
+        :raises IndexError: when not enough addresses are available
+        """
+        with self.lock:
+            values = []
+            try:
+                for _ in range(count):
+                    values.append(self._allocate(owner))
+            except IndexError:
+                for value in values:
+                    self.used.pop(value, None)
+                raise
+        return AddressBlock(self, values)
+
+
+class MacPool:
+    """
+    Allocates mac addresses within the oui used for generated mac addresses.
+    """
+
+    def __init__(self, start: int = None) -> None:
+        """
+        Create a MacPool instance.
+
+        :param start: first value to allocate, random by default to avoid
+            overlapping with other pools
+        """
+        self.lock: threading.Lock = threading.Lock()
+        if start is None:
+            start = random.randint(0, MAC_SIZE - 1)
+        self.next: int = start % MAC_SIZE
+        self.used: Dict[int, Hashable] = {}
+
+    def __len__(self) -> int:
+        return len(self.used)
+
+    def reserve(self, mac: str, owner: Hashable = None) -> bool:
+        """
+        Mark a mac address as used, so it will not be allocated.
+
+        :param mac: mac address to reserve
+        :param owner: owner of mac address
+        :return: True if reserved, False if already used by a different owner
+        """
+        value = int(netaddr.EUI(mac))
+        with self.lock:
+            current = self.used.setdefault(value, owner)
+        return current == owner
+
+    def _allocate(self, owner: Hashable) -> int:
+        start = self.next
+        while True:
+            value = (MAC_OUI << 24) | self.next
+            self.next = (self.next + 1) % MAC_SIZE
+            if value not in self.used:
+                self.used[value] = owner
+                return value
+            if self.next == start:
+                raise IndexError("no mac addresses available")
+
+    def allocate(self, owner: Hashable = None) -> str:
+        """
+        Allocate the next unused mac address.
+
+        :param owner: owner of allocated mac address
+        :return: allocated mac address
+        :raises IndexError: when no mac addresses are available
+        """
+        with self.lock:
+            value = self._allocate(owner)
+        return utils.format_mac(value)
+
+    def allocate_many(self, count: int, owner: Hashable = None) -> List[str]:
+        """
+        Allocate several unused mac addresses at once.
+
+        :param count: number of mac addresses to allocate
+        :param owner: owner of allocated mac addresses
+        :return: allocated mac addresses
+        """
+        with self.lock:
+            values = [self._allocate(owner) for _ in range(count)]
+        return [utils.format_mac(x) for x in values]
@@ -0,0 +1,187 @@
+"""
+Session change tracking, providing a monotonically increasing version for session
+nodes and links along with a bounded log of recent changes. Clients can request
+the changes made since a version they have already seen, rather than reloading
+the entire session.
+"""
+import itertools
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, Optional, Tuple
+
+CHANGE_LOG_SIZE: int = 10000
+LinkEndpoint = Tuple[int, Optional[int]]
+LinkKey = Tuple[LinkEndpoint, LinkEndpoint]
+
+
+def link_key(
+    node1_id: int, node2_id: int, iface1_id: int = None, iface2_id: int = None
+) -> LinkKey:
+    """
+    Create a key identifying a link, independent of the order of its endpoints.
+
+    :param node1_id: node one id
+    :param node2_id: node two id
+    :param iface1_id: node one interface id, None when not known
+    :param iface2_id: node two interface id, None when not known
+    :return: link key
+    """
+    endpoint1 = (node1_id, iface1_id)
+    endpoint2 = (node2_id, iface2_id)
+    if endpoint2[0] < endpoint1[0]:
+        endpoint1, endpoint2 = endpoint2, endpoint1
+    return endpoint1, endpoint2
+
+
+def link_key_matches(
+    key: LinkKey,
+    node1_id: int,
+    node2_id: int,
+    iface1_id: int = None,
+    iface2_id: int = None,
+) -> bool:
+    """
+    Check if a link matches a link key. Interface ids missing from either the key
+    or the link match any interface.
+
+    :param key: link key to check
+    :param node1_id: link node one id
+    :param node2_id: link node two id
+    :param iface1_id: link node one interface id
+    :param iface2_id: link node two interface id
+    :return: True if link matches key, False otherwise
+    """
+
+    def endpoint_matches(endpoint: LinkEndpoint, node_id: int, iface_id: int) -> bool:
+        key_node_id, key_iface_id = endpoint
+        if key_node_id != node_id:
+            return False
+        return key_iface_id is None or iface_id is None or key_iface_id == iface_id
+
+    endpoint1, endpoint2 = key
+    return (
+        endpoint_matches(endpoint1, node1_id, iface1_id)
+        and endpoint_matches(endpoint2, node2_id, iface2_id)
+    ) or (
+        endpoint_matches(endpoint1, node2_id, iface2_id)
+        and endpoint_matches(endpoint2, node1_id, iface1_id)
+    )
+
+
+@dataclass(frozen=True)
+class SessionChange:
+    """
+    A change to a session node or link.
+    """
+
+    version: int
+    node_id: Optional[int] = None
+    link: Optional[LinkKey] = None
+    deleted: bool = False
+
+
+@dataclass
+class ChangeSet:
+    """
+    Latest changes to nodes and links since a given version, mapping each changed
+    node id or link key to True when it was deleted, False otherwise.
+    """
+
+    version: int
+    nodes: Dict[int, bool]
+    links: Dict[LinkKey, bool]
+
+
+class SessionChanges:
+    """
+    Tracks the current version of session nodes and links, along with a ring
+    buffer of the most recent changes.
+    """
+
+    def __init__(self, size: int = CHANGE_LOG_SIZE) -> None:
+        """
+        Create a SessionChanges instance.
+
+        :param size: maximum number of changes to keep
+        """
+        self.version: int = 0
+        self.base: int = 0
+        self.log: Deque[SessionChange] = deque(maxlen=size)
+        self.lock: threading.Lock = threading.Lock()
+
+    def _add(self, change: SessionChange) -> None:
+        if len(self.log) == self.log.maxlen:
+            self.base = self.log[0].version
+        self.log.append(change)
+
+    def node_changed(self, node_id: int, deleted: bool = False) -> int:
+        """
+        Record a node being added, updated, or deleted.
+
+        :param node_id: id of node that changed
+        :param deleted: True when node was deleted, False otherwise
+        :return: version of change
+        """
+        with self.lock:
+            self.version += 1
+            self._add(SessionChange(self.version, node_id=node_id, deleted=deleted))
+            return self.version
+
+    def link_changed(
+        self,
+        node1_id: int,
+        node2_id: int,
+        iface1_id: int = None,
+        iface2_id: int = None,
+        deleted: bool = False,
+    ) -> int:
+        """
+        Record a link being added, updated, or deleted.
+
+        :param node1_id: node one id
+        :param node2_id: node two id
+        :param iface1_id: node one interface id, None when not known
+        :param iface2_id: node two interface id, None when not known
+        :param deleted: True when link was deleted, False otherwise
+        :return: version of change
+        """
+        key = link_key(node1_id, node2_id, iface1_id, iface2_id)
+        with self.lock:
+            self.version += 1
+            self._add(SessionChange(self.version, link=key, deleted=deleted))
+            return self.version
+
+    def truncate(self) -> None:
+        """
+        Drop all logged changes, requiring clients to reload the whole session.
+
+        :return: nothing
+        """
+        with self.lock:
+            self.version += 1
+            self.base = self.version
+            self.log.clear()
+
+    def since(self, version: int) -> Optional[ChangeSet]:
+        """
+        Retrieve the latest changes to each node and link made after the given
+        version.
+
+        :param version: version to get changes after
+        :return: changes since version, None when changes are no longer available
+            or the version is unknown
+        """
+        with self.lock:
+            if version < self.base or version > self.version:
+                return None
+            nodes = {}
+            links = {}
+            # logged versions are consecutive, so skip directly to newer changes
+            start = version - self.log[0].version + 1 if self.log else 0
+            for change in itertools.islice(self.log, max(start, 0), None):
+                if change.link is not None:
+                    links[change.link] = change.deleted
+                else:
+                    nodes[change.node_id] = change.deleted
+            return ChangeSet(self.version, nodes, links)
@@ -0,0 +1,231 @@
+"""
+Control network provisioning, creating the control interfaces of local nodes in
+bulk phases, rather than creating and configuring each interface on its own.
+"""
+import logging
+import time
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, Tuple, Union
+
+from core import utils
+from core.emulator.data import InterfaceData
+from core.executables import ETHTOOL, IP
+from core.nodes.base import CoreNetworkBase, CoreNode
+from core.nodes.interface import Veth
+from core.nodes.network import CtrlNet
+from core.nodes.physical import PhysicalNode
+
+logger = logging.getLogger(__name__)
+
+if TYPE_CHECKING:
+    from core.emulator.session import Session
+
+# maximum lines provided to a single ip batch command
+BATCH_LINES: int = 1000
+
+
+def uses_default_iface(node: Union[CoreNode, PhysicalNode]) -> bool:
+    """
+    Check if a node adds interfaces and runs network commands using the default
+    logic, within its own namespace using host tools, allowing its control
+    interface to be provisioned in bulk.
+
+    :param node: node to check
+    :return: True if node uses the default interface logic, False otherwise
+    """
+    if not isinstance(node, CoreNode):
+        return False
+    return all(
+        getattr(type(node), x) is getattr(CoreNode, x)
+        for x in ("new_iface", "newveth", "add_iface", "create_node_net_client")
+    )
+
+
+class ControlNetPlan:
+    """
+    Plan for adding control interfaces to nodes. Local nodes using the default
+    interface logic have their veths created, configured, and moved into their
+    namespaces using ip batches, then are configured within each namespace using
+    a single command. All other nodes add their control interface using their
+    own logic.
+    """
+
+    def __init__(self, session: "Session", net: CtrlNet, net_index: int) -> None:
+        """
+        Create a ControlNetPlan instance.
+
+        :param session: session to plan control interfaces for
+        :param net: control network to add interfaces to
+        :param net_index: control network index
+        """
+        self.session: "Session" = session
+        self.net: CtrlNet = net
+        self.net_index: int = net_index
+        self.nodes: List[Tuple[CoreNode, InterfaceData]] = []
+        self.others: List[Tuple[Union[CoreNode, PhysicalNode], InterfaceData]] = []
+        self.flow_ids: Dict[int, int] = {}
+        self.metrics: Dict[str, float] = {}
+
+    def add_nodes(self, nodes: Iterable[Union[CoreNode, PhysicalNode]]) -> None:
+        """
+        Add nodes to the plan, ignoring nodes with an existing control interface.
+
+        :param nodes: nodes to add
+        :return: nothing
+        """
+        bulk = (
+            self.net.up
+            and self.net.server is None
+            and not self.net.has_custom_iface
+            and not self.session.use_ovs()
+        )
+        for node in nodes:
+            iface_data = self.session.control_iface_data(self.net, node, self.net_index)
+            if iface_data is None:
+                continue
+            if bulk and uses_default_iface(node) and node.up and node.server is None:
+                self.nodes.append((node, iface_data))
+            else:
+                self.others.append((node, iface_data))
+
+    def run(self) -> Dict[str, float]:
+        """
+        Run all phases, recording the time taken for each.
+
+        :return: phase names mapped to time taken
+        """
+        start = time.monotonic()
+        self.run_phase("nodes", self.add_others)
+        self.run_phase("devices", self.create_devices)
+        self.run_phase("namespaces", self.configure_namespaces)
+        self.run_phase("interfaces", self.add_ifaces)
+        self.metrics["total"] = time.monotonic() - start
+        logger.info(
+            "session(%s) control net(%s) bulk(%s) other(%s) metrics: %s",
+            self.session.id,
+            self.net.brname,
+            len(self.nodes),
+            len(self.others),
+            self.metrics,
+        )
+        return self.metrics
+
+    def run_phase(self, name: str, func: Callable[[], None]) -> None:
+        """
+        Run a phase, recording the time taken.
+
+        :param name: name of phase
+        :param func: function running phase
+        :return: nothing
+        """
+        start = time.monotonic()
+        try:
+            func()
+        finally:
+            self.metrics[name] = time.monotonic() - start
+
+    def add_others(self) -> None:
+        """
+        Add control interfaces to nodes not provisioned in bulk, using their own
+        interface logic.
+
+        :return: nothing
+        """
+        for node, iface_data in self.others:
+            try:
+                iface = node.new_iface(self.net, iface_data)
+                iface.control = True
+            except (ValueError, IndexError):
+                logger.exception("control interface not added to node %s", node.id)
+
+    def create_devices(self) -> None:
+        """
+        Create all control veths, attach them to the control network bridge, and
+        move them into their node namespaces, using ip batches.
+
+        :return: nothing
+        """
+        if not self.nodes:
+            return
+        lines = []
+        checksums = []
+        for node, iface_data in self.nodes:
+            name, localname = node.veth_names(iface_data.id)
+            mtu = iface_data.mtu
+            lines.append(f"link add name {localname} type veth peer name {name}")
+            lines.append(f"link set {name} mtu {mtu}")
+            lines.append(f"link set {localname} mtu {mtu}")
+            lines.append(f"link set {localname} master {self.net.brname}")
+            lines.append(f"link set {localname} up")
+            lines.append(f"link set {name} address {iface_data.mac}")
+            checksums.append(f"{ETHTOOL} -K {name} rx off tx off")
+        for start in range(0, len(lines), BATCH_LINES):
+            batch = "\n".join(lines[start : start + BATCH_LINES])
+            utils.cmd(f"{IP} -batch - <<'EOF'\n{batch}\nEOF", shell=True)
+        for start in range(0, len(checksums), BATCH_LINES):
+            batch = "\n".join(checksums[start : start + BATCH_LINES])
+            utils.cmd(f"sh -e <<'EOF'\n{batch}\nEOF", shell=True)
+        lines = []
+        for node, iface_data in self.nodes:
+            name, _ = node.veth_names(iface_data.id)
+            lines.append(f"link set {name} netns {node.pid}")
+        for start in range(0, len(lines), BATCH_LINES):
+            batch = "\n".join(lines[start : start + BATCH_LINES])
+            utils.cmd(f"{IP} -batch - <<'EOF'\n{batch}\nEOF", shell=True)
+
+    def configure_namespace(self, node: CoreNode, iface_data: InterfaceData) -> None:
+        """
+        Name, address, and bring up a control interface within a node namespace,
+        using a single command.
+
+        :param node: node to configure control interface for
+        :param iface_data: control interface data
+        :return: nothing
+        """
+        name, _ = node.veth_names(iface_data.id)
+        ifname = iface_data.name
+        args = [f"{IP} link set {name} name {ifname}"]
+        for ip in iface_data.get_ips():
+            args.append(f"{IP} address add {ip} broadcast + dev {ifname}")
+        args.append(f"{IP} link set {ifname} up")
+        args.append(f"cat /sys/class/net/{ifname}/ifindex")
+        output = node.cmd(" && ".join(args), shell=True)
+        self.flow_ids[node.id] = int(output.split()[-1])
+
+    def configure_namespaces(self) -> None:
+        """
+        Configure control interfaces within all node namespaces, concurrently.
+        Nodes failing configuration will not have a control interface added.
+
+        :return: nothing
+        """
+        funcs = [(self.configure_namespace, x, {}) for x in self.nodes]
+        _, exceptions = utils.threadpool(funcs)
+        for exception in exceptions:
+            logger.error("error configuring control interface: %s", exception)
+
+    def add_ifaces(self) -> None:
+        """
+        Create the interfaces for bulk provisioned control interfaces, reflecting
+        the devices that were created.
+
+        :return: nothing
+        """
+        for node, iface_data in self.nodes:
+            if node.id not in self.flow_ids:
+                continue
+            name, localname = node.veth_names(iface_data.id)
+            iface = Veth(
+                self.session, name, localname, iface_data.mtu, node.server, node
+            )
+            iface.up = True
+            iface.flow_id = self.flow_ids[node.id]
+            iface.set_mac(iface_data.mac)
+            iface.name = iface_data.name
+            iface.control = True
+            with node.lock:
+                node.add_iface(iface, iface_data.id)
+            # bridge membership was set when creating devices
+            CoreNetworkBase.attach(self.net, iface)
+            iface.net = self.net
+            for ip in iface_data.get_ips():
+                iface.add_ip(ip)
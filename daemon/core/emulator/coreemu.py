@@ -3,6 +3,7 @@ import logging
 import os
 import signal
 import sys
+import time
 from pathlib import Path
 from typing import Dict, List, Type
 
@@ -12,11 +13,13 @@ from core.configservice.manager import ConfigServiceManager
 from core.emane.modelmanager import EmaneModelManager
 from core.emulator.session import Session
 from core.executables import get_requirements
+from core.registry import RegistryCache
 from core.services.coreservices import ServiceManager
 
 logger = logging.getLogger(__name__)
 
 DEFAULT_EMANE_PREFIX: str = "/usr"
+DEFAULT_REGISTRY_CACHE: str = "/var/cache/core/registry.json"
 
 
 def signal_handler(signal_number: int, _) -> None:
@@ -59,17 +62,37 @@ class CoreEmu:
         # session management
         self.sessions: Dict[int, Session] = {}
 
+        # cache of service and model metadata, to avoid imports on startup
+        start = time.monotonic()
+        self.load_metrics: Dict[str, float] = {}
+        registry_cache = self.config.get("registry_cache", DEFAULT_REGISTRY_CACHE)
+        registry_cache = Path(registry_cache) if registry_cache else None
+        self.registry_cache: RegistryCache = RegistryCache(registry_cache)
+
         # load services
         self.service_errors: List[str] = []
-        self.service_manager: ConfigServiceManager = ConfigServiceManager()
+        self.service_manager: ConfigServiceManager = ConfigServiceManager(
+            self.registry_cache
+        )
         self._load_services()
+        self.load_metrics["services"] = time.monotonic() - start
 
         # check and load emane
         self.has_emane: bool = False
+        emane_start = time.monotonic()
         self._load_emane()
+        self.load_metrics["emane"] = time.monotonic() - emane_start
+        self.registry_cache.save()
 
         # check executables exist on path
         self._validate_env()
+        self.load_metrics["total"] = time.monotonic() - start
+        logger.info(
+            "loaded services and models cache hits(%s) misses(%s) metrics: %s",
+            self.registry_cache.hits,
+            self.registry_cache.misses,
+            self.load_metrics,
+        )
 
         # catch exit event
         atexit.register(self.shutdown)
@@ -92,14 +115,16 @@ class CoreEmu:
         :return: nothing
         """
         # load default services
-        self.service_errors = core.services.load()
+        self.service_errors = core.services.load(self.registry_cache)
         # load custom services
         service_paths = self.config.get("custom_services_dir")
         logger.debug("custom service paths: %s", service_paths)
         if service_paths is not None:
             for service_path in service_paths.split(","):
                 service_path = Path(service_path.strip())
-                custom_service_errors = ServiceManager.add_services(service_path)
+                custom_service_errors = ServiceManager.add_services(
+                    service_path, self.registry_cache
+                )
                 self.service_errors.extend(custom_service_errors)
         # load default config services
         self.service_manager.load_locals()
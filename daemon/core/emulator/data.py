@@ -1,22 +1,70 @@
 """
 CORE data objects.
 """
+import dataclasses
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, List, Optional, Tuple, Type, TypeVar
 
 import netaddr
 
-from core import utils
+from core.emulator.addresses import AddressPool, MacPool
 from core.emulator.enumerations import (
     EventTypes,
     ExceptionLevels,
     LinkTypes,
     MessageFlags,
 )
+from core.errors import CoreCommandError
 
 if TYPE_CHECKING:
     from core.nodes.base import CoreNode, NodeBase
 
+T = TypeVar("T")
+
+
+def slotted(cls: Type[T]) -> Type[T]:
+    """
+    Recreate a dataclass to store its fields within __slots__, rather than a dict
+    per instance, as dataclass(slots=True) does for newer python versions.
+
+    :param cls: dataclass to recreate
+    :return: dataclass using slots
+    """
+    names = tuple(x.name for x in dataclasses.fields(cls))
+    cls_dict = dict(cls.__dict__)
+    cls_dict["__slots__"] = names
+    for name in names:
+        cls_dict.pop(name, None)
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+    slotted_cls = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    slotted_cls.__qualname__ = cls.__qualname__
+    return slotted_cls
+
+
+class Snapshot:
+    """
+    Mixin for an immutable version of a slotted dataclass, allowing an instance to
+    be shared, rather than copied, by everything it is given to.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, **values: Any) -> None:
+        names = {x.name for x in dataclasses.fields(self)}
+        unknown = values.keys() - names
+        if unknown:
+            raise TypeError(f"unexpected fields: {', '.join(sorted(unknown))}")
+        for data_field in dataclasses.fields(self):
+            value = values.get(data_field.name, data_field.default)
+            object.__setattr__(self, data_field.name, value)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise dataclasses.FrozenInstanceError(f"cannot assign to field '{name}'")
+
+    def __delattr__(self, name: str) -> None:
+        raise dataclasses.FrozenInstanceError(f"cannot delete field '{name}'")
+
 
 @dataclass
 class ConfigData:
@@ -71,6 +119,29 @@ class FileData:
     compressed_data: str = None
 
 
+@dataclass
+class CommandResult:
+    """
+    Result of a command run as part of a batch of commands.
+    """
+
+    args: str
+    status: int = 0
+    stdout: str = ""
+    stderr: str = ""
+
+    def check(self) -> str:
+        """
+        Check result for a failed status.
+
+        :return: command stdout
+        :raises CoreCommandError: when command had a non-zero exit status
+        """
+        if self.status != 0:
+            raise CoreCommandError(self.status, self.args, self.stdout, self.stderr)
+        return self.stdout
+
+
 @dataclass
 class NodeOptions:
     """
@@ -118,6 +189,7 @@ class NodeOptions:
         self.alt = alt
 
 
+@slotted
 @dataclass
 class NodeData:
     """
@@ -129,6 +201,7 @@ class NodeData:
     source: str = None
 
 
+@slotted
 @dataclass
 class InterfaceData:
     """
@@ -158,6 +231,23 @@ class InterfaceData:
         return ips
 
 
+class InterfaceSnapshot(Snapshot, InterfaceData):
+    """
+    Immutable interface data, shared across link data.
+    """
+
+    __slots__ = ()
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, InterfaceData):
+            return NotImplemented
+        return all(
+            getattr(self, x.name) == getattr(other, x.name)
+            for x in dataclasses.fields(self)
+        )
+
+
+@slotted
 @dataclass
 class LinkOptions:
     """
@@ -238,6 +328,19 @@ class LinkOptions:
         )
 
 
+class LinkOptionsSnapshot(Snapshot, LinkOptions):
+    """
+    Immutable link options, shared across link data.
+    """
+
+    __slots__ = ()
+
+
+# shared by link data without options of its own
+EMPTY_LINK_OPTIONS: LinkOptionsSnapshot = LinkOptionsSnapshot()
+
+
+@slotted
 @dataclass
 class LinkData:
     """
@@ -252,7 +355,7 @@ class LinkData:
     network_id: int = None
     iface1: InterfaceData = None
     iface2: InterfaceData = None
-    options: LinkOptions = LinkOptions()
+    options: LinkOptions = field(default_factory=lambda: EMPTY_LINK_OPTIONS)
     color: str = None
     source: str = None
 
@@ -274,11 +377,16 @@ class IpPrefixes:
             raise ValueError("ip4 or ip6 must be provided")
 
         self.ip4 = None
+        self.ip4_pool: Optional[AddressPool] = None
         if ip4_prefix:
             self.ip4 = netaddr.IPNetwork(ip4_prefix)
+            self.ip4_pool = AddressPool(ip4_prefix)
         self.ip6 = None
+        self.ip6_pool: Optional[AddressPool] = None
         if ip6_prefix:
             self.ip6 = netaddr.IPNetwork(ip6_prefix)
+            self.ip6_pool = AddressPool(ip6_prefix)
+        self.macs: MacPool = MacPool()
 
     def ip4_address(self, node_id: int) -> str:
         """
@@ -289,7 +397,7 @@ class IpPrefixes:
         """
         if not self.ip4:
             raise ValueError("ip4 prefixes have not been set")
-        return str(self.ip4[node_id])
+        return self.ip4_pool.address(node_id)
 
     def ip6_address(self, node_id: int) -> str:
         """
@@ -300,7 +408,7 @@ class IpPrefixes:
         """
         if not self.ip6:
             raise ValueError("ip6 prefixes have not been set")
-        return str(self.ip6[node_id])
+        return self.ip6_pool.address(node_id)
 
     def gen_iface(self, node_id: int, name: str = None, mac: str = None):
         """
@@ -319,6 +427,7 @@ class IpPrefixes:
         if self.ip4:
             ip4 = self.ip4_address(node_id)
             ip4_mask = self.ip4.prefixlen
+            self.ip4_pool.reserve(node_id, node_id)
 
         # generate ip6 data
         ip6 = None
@@ -326,10 +435,11 @@ class IpPrefixes:
         if self.ip6:
             ip6 = self.ip6_address(node_id)
             ip6_mask = self.ip6.prefixlen
+            self.ip6_pool.reserve(node_id, node_id)
 
-        # random mac
+        # generated mac
         if not mac:
-            mac = utils.random_mac()
+            mac = self.macs.allocate(node_id)
 
         return InterfaceData(
             name=name, ip4=ip4, ip4_mask=ip4_mask, ip6=ip6, ip6_mask=ip6_mask, mac=mac
@@ -351,3 +461,30 @@ class IpPrefixes:
         iface_data = self.gen_iface(node.id, name, mac)
         iface_data.id = node.next_iface_id()
         return iface_data
+
+    def gen_ifaces(self, node_ids: List[int]) -> List[InterfaceData]:
+        """
+        Creates interface data for several nodes at once, the same as calling
+        gen_iface for each node, for building large topologies.
+
+        :param node_ids: node ids to create interfaces for
+        :return: new interface data for each node, in the same order as node ids
+        """
+        ip4_mask = self.ip4.prefixlen if self.ip4 else None
+        ip6_mask = self.ip6.prefixlen if self.ip6 else None
+        macs = self.macs.allocate_many(len(node_ids))
+        ifaces = []
+        for node_id, mac in zip(node_ids, macs):
+            ip4 = None
+            if self.ip4:
+                ip4 = self.ip4_pool.address(node_id)
+                self.ip4_pool.reserve(node_id, node_id)
+            ip6 = None
+            if self.ip6:
+                ip6 = self.ip6_pool.address(node_id)
+                self.ip6_pool.reserve(node_id, node_id)
+            iface_data = InterfaceData(
+                ip4=ip4, ip4_mask=ip4_mask, ip6=ip6, ip6_mask=ip6_mask, mac=mac
+            )
+            ifaces.append(iface_data)
+        return ifaces
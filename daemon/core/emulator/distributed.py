@@ -2,21 +2,40 @@
 Defines distributed server functionality.
 """
 
+import base64
+import concurrent.futures
+import io
 import logging
-import os
+import shlex
+import tarfile
 import threading
+import time
+import uuid
 from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass
 from pathlib import Path
-from tempfile import NamedTemporaryFile
-from typing import TYPE_CHECKING, Callable, Dict, Tuple
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import netaddr
 from fabric import Connection
-from invoke import UnexpectedExit
+from invoke import Result, UnexpectedExit
 
 from core import utils
+from core.emulator import profiler
+from core.emulator.data import CommandResult
 from core.errors import CoreCommandError, CoreError
-from core.executables import get_requirements
+from core.executables import IP, get_requirements
 from core.nodes.interface import GreTap
 from core.nodes.network import CoreNetwork, CtrlNet
 
@@ -27,6 +46,345 @@ if TYPE_CHECKING:
 
 LOCK = threading.Lock()
 CMD_HIDE = True
+DEFAULT_CONNECTIONS: int = 4
+BATCH_MARKER: str = "core-batch"
+BATCH_SCRIPT: str = "batch.sh"
+
+
+def create_connection(host: str) -> Connection:
+    """
+    Create the default ssh connection used to reach a distributed server.
+
+    :param host: host to connect to
+    :return: ssh connection, connected lazily on first use
+    """
+    return Connection(host, user="root")
+
+
+@dataclass
+class ServerStats:
+    """
+    Latency and queueing metrics for commands and transfers run against a
+    distributed server.
+    """
+
+    commands: int = 0
+    transfers: int = 0
+    errors: int = 0
+    total_time: float = 0.0
+    max_time: float = 0.0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+    pending: int = 0
+    max_pending: int = 0
+
+    @property
+    def average_time(self) -> float:
+        count = self.commands + self.transfers
+        return self.total_time / count if count else 0.0
+
+    @property
+    def average_wait(self) -> float:
+        count = self.commands + self.transfers
+        return self.total_wait / count if count else 0.0
+
+
+def gretap_cmds(tap: GreTap, bridge_name: str) -> List[str]:
+    """
+    Create ip batch commands to create a gre tap, bring it up, and attach it to
+    a Linux bridge.
+
+    :param tap: gre tap to create commands for
+    :param bridge_name: name of bridge to attach gre tap to
+    :return: ip batch commands
+    """
+    cmd = f"link add {tap.localname} type gretap remote {tap.remote_ip}"
+    if tap.local_ip is not None:
+        cmd += f" local {tap.local_ip}"
+    if tap.ttl is not None:
+        cmd += f" ttl {tap.ttl}"
+    if tap.key is not None:
+        cmd += f" key {tap.key}"
+    cmds = [cmd]
+    if tap.mtu > 0:
+        cmds.append(f"link set {tap.localname} mtu {tap.mtu}")
+    cmds.append(f"link set {tap.localname} up")
+    cmds.append(f"link set dev {tap.localname} master {bridge_name}")
+    return cmds
+
+
+class ConnectionPool:
+    """
+    Pool of ssh connections to a single host, allowing commands and transfers to
+    run concurrently, each on a separate connection. Connections borrowed when
+    the pool is closed are closed once returned.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        size: int = DEFAULT_CONNECTIONS,
+        factory: Callable[[str], Connection] = create_connection,
+    ) -> None:
+        """
+        Create a ConnectionPool instance.
+
+        :param host: host to connect to
+        :param size: maximum number of concurrent connections
+        :param factory: function used to create a connection for a host
+        """
+        self.host: str = host
+        self.size: int = max(1, size)
+        self.factory: Callable[[str], Connection] = factory
+        self.created: List[Connection] = []
+        self.available: List[Connection] = []
+        self.closing: int = 0
+        self.generation: int = 0
+        self.lock: threading.Lock = threading.Lock()
+        self.condition: threading.Condition = threading.Condition(self.lock)
+        self.stats: ServerStats = ServerStats()
+
+    def _acquire(self) -> Tuple[Connection, int]:
+        with self.condition:
+            while not self.available:
+                if len(self.created) + self.closing < self.size:
+                    conn = self.factory(self.host)
+                    self.created.append(conn)
+                    return conn, self.generation
+                self.condition.wait()
+            return self.available.pop(), self.generation
+
+    def _release(self, conn: Connection, generation: int) -> None:
+        with self.condition:
+            if generation == self.generation:
+                self.available.append(conn)
+                conn = None
+            else:
+                self.closing -= 1
+            self.condition.notify()
+        if conn is not None:
+            conn.close()
+
+    @contextmanager
+    def connection(self, transfer: bool = False) -> Iterator[Connection]:
+        """
+        Borrow a connection from the pool, waiting for one to become available
+        when all connections are in use, and record timing metrics.
+
+        :param transfer: True when used for a file transfer, False for a command
+        :return: pooled connection
+        """
+        start = time.monotonic()
+        with self.lock:
+            self.stats.pending += 1
+            self.stats.max_pending = max(self.stats.max_pending, self.stats.pending)
+        try:
+            conn, generation = self._acquire()
+        except Exception:
+            with self.lock:
+                self.stats.pending -= 1
+                self.stats.errors += 1
+            raise
+        acquired = time.monotonic()
+        failed = False
+        try:
+            yield conn
+        except Exception:
+            failed = True
+            raise
+        finally:
+            self._release(conn, generation)
+            done = time.monotonic()
+            wait = acquired - start
+            elapsed = done - acquired
+            with self.lock:
+                stats = self.stats
+                stats.pending -= 1
+                if transfer:
+                    stats.transfers += 1
+                else:
+                    stats.commands += 1
+                if failed:
+                    stats.errors += 1
+                stats.total_wait += wait
+                stats.max_wait = max(stats.max_wait, wait)
+                stats.total_time += elapsed
+                stats.max_time = max(stats.max_time, elapsed)
+
+    def run(self, cmd: str, env: Dict[str, str] = None, cwd: str = None) -> Result:
+        """
+        Run a command using a pooled connection.
+
+        :param cmd: command to run
+        :param env: environment for remote command, default is None
+        :param cwd: directory to run command in, defaults to None
+        :return: command result
+        :raises UnexpectedExit: when a non-zero exit status occurs
+        """
+        replace_env = env is not None
+        with self.connection() as conn:
+            if cwd is None:
+                return conn.run(cmd, hide=CMD_HIDE, env=env, replace_env=replace_env)
+            else:
+                with conn.cd(cwd):
+                    return conn.run(
+                        cmd, hide=CMD_HIDE, env=env, replace_env=replace_env
+                    )
+
+    def put(self, src: Union[str, IO], dst_path: Path) -> None:
+        """
+        Transfer a local file or in memory file object to the remote host.
+
+        :param src: local file path or file like object to transfer
+        :param dst_path: remote destination path
+        :return: nothing
+        """
+        with self.connection(transfer=True) as conn:
+            conn.put(src, str(dst_path))
+
+    def close(self) -> None:
+        """
+        Close all available connections created by this pool, and the borrowed
+        connections once returned.
+
+        :return: nothing
+        """
+        with self.lock:
+            available = self.available
+            self.closing += len(self.created) - len(available)
+            self.created = []
+            self.available = []
+            self.generation += 1
+        for conn in available:
+            conn.close()
+
+
+class RemoteBatch:
+    """
+    Collects files and commands to run on a distributed server, which are shipped
+    to the server as a single archive and run there by a generated script, using
+    one transfer and one remote command for the whole batch.
+    """
+
+    def __init__(self, server: "DistributedServer") -> None:
+        """
+        Create a RemoteBatch instance.
+
+        :param server: server to run batch on
+        """
+        self.server: "DistributedServer" = server
+        self.files: List[Tuple[Path, bytes, int]] = []
+        self.cmds: List[Tuple[str, bool]] = []
+
+    def add_file(self, file_path: Path, contents: str, mode: int = 0o644) -> None:
+        """
+        Add a file to create on the server, creating parent directories as needed.
+
+        :param file_path: remote path for file
+        :param contents: contents of file
+        :param mode: mode for file
+        :return: nothing
+        """
+        self.files.append((file_path, contents.encode("utf-8"), mode))
+
+    def add_cmd(self, args: str, wait: bool = True) -> None:
+        """
+        Add a command to run on the server, after all files have been created.
+
+        :param args: command to run
+        :param wait: True to wait for status, False to background process
+        :return: nothing
+        """
+        self.cmds.append((args, wait))
+
+    def script(self, stop_on_error: bool = False) -> str:
+        """
+        Generate the script used to run the batch on the server. Each command
+        writes a result line containing its index, status, and base64 encoded
+        stdout and stderr.
+
+        :param stop_on_error: True to stop running commands after a failure
+        :return: batch script
+        """
+        lines = ['d="$1"']
+        for index, (file_path, _, mode) in enumerate(self.files):
+            dst_path = shlex.quote(str(file_path))
+            parent_path = shlex.quote(str(file_path.parent))
+            lines.append(
+                f"mkdir -m {0o755:o} -p {parent_path} && "
+                f'mv "$d/{index}" {dst_path} && chmod {mode:o} {dst_path} || exit 1'
+            )
+        for index, (args, wait) in enumerate(self.cmds):
+            if wait:
+                lines.append(f'(\n{args}\n) >"$d/out" 2>"$d/err"')
+                lines.append("s=$?")
+            else:
+                lines.append(f"(\n{args} &\n) >/dev/null 2>&1")
+                lines.append(': >"$d/out"; : >"$d/err"; s=0')
+            lines.append(
+                f'echo "{BATCH_MARKER} {index} $s x$(base64 -w0 <"$d/out") '
+                f'x$(base64 -w0 <"$d/err")"'
+            )
+            if stop_on_error:
+                lines.append('[ "$s" -eq 0 ] || exit 0')
+        lines.append("exit 0")
+        return "\n".join(lines) + "\n"
+
+    def archive(self, stop_on_error: bool = False) -> bytes:
+        """
+        Create an in memory archive containing batch files and script.
+
+        :param stop_on_error: True to stop running commands after a failure
+        :return: gzipped tar archive
+        """
+        data = io.BytesIO()
+        with tarfile.open(fileobj=data, mode="w:gz") as tar:
+            entries = [(str(i), x[1]) for i, x in enumerate(self.files)]
+            entries.append((BATCH_SCRIPT, self.script(stop_on_error).encode("utf-8")))
+            for name, contents in entries:
+                info = tarfile.TarInfo(name)
+                info.size = len(contents)
+                info.mode = 0o600
+                tar.addfile(info, io.BytesIO(contents))
+        return data.getvalue()
+
+    def run(self, stop_on_error: bool = False) -> List[CommandResult]:
+        """
+        Ship and run batch on the server.
+
+        :param stop_on_error: True to stop running commands after a failure
+        :return: results for each command that was run, in order added
+        :raises CoreCommandError: when files could not be created
+        """
+        if not self.files and not self.cmds:
+            return []
+        archive_path = f"/tmp/pycore.batch.{uuid.uuid4().hex}.tgz"
+        cmd = (
+            f'd=$(mktemp -d) && tar --no-same-owner -xzf {archive_path} -C "$d" && '
+            f'sh "$d/{BATCH_SCRIPT}" "$d"; s=$?; rm -rf "$d" {archive_path}; exit $s'
+        )
+        logger.debug(
+            "remote batch server(%s) files(%s) cmds(%s)",
+            self.server.host,
+            len(self.files),
+            len(self.cmds),
+        )
+        self.server.pool.put(io.BytesIO(self.archive(stop_on_error)), archive_path)
+        try:
+            result = self.server.pool.run(cmd)
+        except UnexpectedExit as e:
+            stdout, stderr = e.streams_for_display()
+            raise CoreCommandError(e.result.exited, cmd, stdout, stderr)
+        results = []
+        for line in result.stdout.splitlines():
+            values = line.split()
+            if len(values) != 5 or values[0] != BATCH_MARKER:
+                continue
+            args, _ = self.cmds[int(values[1])]
+            stdout = base64.b64decode(values[3][1:]).decode("utf-8").strip()
+            stderr = base64.b64decode(values[4][1:]).decode("utf-8").strip()
+            results.append(CommandResult(args, int(values[2]), stdout, stderr))
+        return results
 
 
 class DistributedServer:
@@ -34,17 +392,33 @@ class DistributedServer:
     Provides distributed server interactions.
     """
 
-    def __init__(self, name: str, host: str) -> None:
+    def __init__(
+        self,
+        name: str,
+        host: str,
+        connections: int = DEFAULT_CONNECTIONS,
+        factory: Callable[[str], Connection] = create_connection,
+    ) -> None:
         """
         Create a DistributedServer instance.
 
         :param name: convenience name to associate with host
         :param host: host to connect to
+        :param connections: maximum number of concurrent connections to host
+        :param factory: function used to create a connection for a host
         """
         self.name: str = name
         self.host: str = host
-        self.conn: Connection = Connection(host, user="root")
-        self.lock: threading.Lock = threading.Lock()
+        self.pool: ConnectionPool = ConnectionPool(host, connections, factory)
+
+    @property
+    def stats(self) -> ServerStats:
+        """
+        Latency and queue metrics for this server.
+
+        :return: server metrics
+        """
+        return self.pool.stats
 
     def remote_cmd(
         self, cmd: str, env: Dict[str, str] = None, cwd: str = None, wait: bool = True
@@ -60,27 +434,20 @@ class DistributedServer:
         :return: stdout when success
         :raises CoreCommandError: when a non-zero exit status occurs
         """
-
-        replace_env = env is not None
         if not wait:
             cmd += " &"
         logger.debug(
             "remote cmd server(%s) cwd(%s) wait(%s): %s", self.host, cwd, wait, cmd
         )
+        start = time.monotonic()
         try:
-            if cwd is None:
-                result = self.conn.run(
-                    cmd, hide=CMD_HIDE, env=env, replace_env=replace_env
-                )
-            else:
-                with self.conn.cd(cwd):
-                    result = self.conn.run(
-                        cmd, hide=CMD_HIDE, env=env, replace_env=replace_env
-                    )
+            result = self.pool.run(cmd, env, cwd)
             return result.stdout.strip()
         except UnexpectedExit as e:
             stdout, stderr = e.streams_for_display()
             raise CoreCommandError(e.result.exited, cmd, stdout, stderr)
+        finally:
+            profiler.record_command(cmd, start, self.name)
 
     def remote_put(self, src_path: Path, dst_path: Path) -> None:
         """
@@ -90,24 +457,34 @@ class DistributedServer:
         :param dst_path: destination file location
         :return: nothing
         """
-        with self.lock:
-            self.conn.put(str(src_path), str(dst_path))
+        self.pool.put(str(src_path), dst_path)
 
     def remote_put_temp(self, dst_path: Path, data: str) -> None:
         """
-        Remote push file contents to a remote server, using a temp file as an
-        intermediate step.
+        Remote push file contents to a remote server, streaming the data from
+        memory.
 
         :param dst_path: file destination for data
         :param data: data to store in remote file
         :return: nothing
         """
-        with self.lock:
-            temp = NamedTemporaryFile(delete=False)
-            temp.write(data.encode("utf-8"))
-            temp.close()
-            self.conn.put(temp.name, str(dst_path))
-            os.unlink(temp.name)
+        self.pool.put(io.BytesIO(data.encode("utf-8")), dst_path)
+
+    def remote_batch(self) -> RemoteBatch:
+        """
+        Create a batch of files and commands to run on this server in one transfer.
+
+        :return: remote batch
+        """
+        return RemoteBatch(self)
+
+    def close(self) -> None:
+        """
+        Close all connections to this server.
+
+        :return: nothing
+        """
+        self.pool.close()
 
 
 class DistributedController:
@@ -124,6 +501,8 @@ class DistributedController:
         self.session: "Session" = session
         self.servers: Dict[str, DistributedServer] = OrderedDict()
         self.tunnels: Dict[int, Tuple[GreTap, GreTap]] = {}
+        self.tunnels_lock: threading.Lock = threading.Lock()
+        self.tunnel_times: Dict[str, float] = {}
         self.address: str = self.session.options.get_config(
             "distributed_address", default=None
         )
@@ -137,34 +516,60 @@ class DistributedController:
         :return: nothing
         :raises CoreError: when there is an error validating server
         """
-        server = DistributedServer(name, host)
-        for requirement in get_requirements(self.session.use_ovs()):
-            try:
-                server.remote_cmd(f"which {requirement}")
-            except CoreCommandError:
-                raise CoreError(
-                    f"server({server.name}) failed validation for "
-                    f"command({requirement})"
-                )
+        connections = self.session.options.get_config_int(
+            "distributed_connections", default=DEFAULT_CONNECTIONS
+        )
+        server = DistributedServer(name, host, connections)
+        requirements = get_requirements(self.session.use_ovs())
+        with concurrent.futures.ThreadPoolExecutor(server.pool.size) as executor:
+            futures = {
+                executor.submit(server.remote_cmd, f"which {x}"): x
+                for x in requirements
+            }
+            for future in concurrent.futures.as_completed(futures):
+                requirement = futures[future]
+                try:
+                    future.result()
+                except CoreCommandError:
+                    raise CoreError(
+                        f"server({server.name}) failed validation for "
+                        f"command({requirement})"
+                    )
         self.servers[name] = server
         cmd = f"mkdir -p {self.session.directory}"
         server.remote_cmd(cmd)
 
     def execute(self, func: Callable[[DistributedServer], None]) -> None:
         """
-        Convenience for executing logic against all distributed servers.
+        Convenience for executing logic against all distributed servers, running
+        against each server in parallel when there are multiple servers.
 
         :param func: function to run, that takes a DistributedServer as a parameter
         :return: nothing
+        :raises Exception: first exception raised by func, after all servers finish
+        """
+        servers = list(self.servers.values())
+        if len(servers) < 2:
+            for server in servers:
+                func(server)
+            return
+        with concurrent.futures.ThreadPoolExecutor(len(servers)) as executor:
+            futures = [executor.submit(func, x) for x in servers]
+        for future in futures:
+            future.result()
+
+    def stats(self) -> Dict[str, ServerStats]:
         """
-        for name in self.servers:
-            server = self.servers[name]
-            func(server)
+        Retrieve latency and queue metrics for all distributed servers.
+
+        :return: dict of server name to server metrics
+        """
+        return {x.name: x.stats for x in self.servers.values()}
 
     def shutdown(self) -> None:
         """
-        Shutdown logic for dealing with distributed tunnels and server session
-        directories.
+        Shutdown logic for dealing with distributed tunnels, server session
+        directories, and server connections.
 
         :return: nothing
         """
@@ -174,12 +579,13 @@ class DistributedController:
             for tunnel in tunnels:
                 tunnel.shutdown()
         # remove all remote session directories
-        for name in self.servers:
-            server = self.servers[name]
-            cmd = f"rm -rf {self.session.directory}"
-            server.remote_cmd(cmd)
+        cmd = f"rm -rf {self.session.directory}"
+        self.execute(lambda x: x.remote_cmd(cmd))
         # clear tunnels
         self.tunnels.clear()
+        # close pooled connections, which are reopened when next used
+        for server in self.servers.values():
+            server.close()
 
     def start(self) -> None:
         """
@@ -187,16 +593,103 @@ class DistributedController:
 
         :return: nothing
         """
+        self.tunnel_times.clear()
         mtu = self.session.options.get_config_int("mtu")
+        nets = []
         for node_id in self.session.nodes:
             node = self.session.nodes[node_id]
             if not isinstance(node, CoreNetwork):
                 continue
             if isinstance(node, CtrlNet) and node.serverintf is not None:
                 continue
-            for name in self.servers:
-                server = self.servers[name]
-                self.create_gre_tunnel(node, server, mtu, True)
+            nets.append(node)
+        if not nets or not self.servers:
+            return
+        start = time.monotonic()
+        if self.session.use_ovs():
+            # ovs ports are not managed by ip, create each tunnel individually
+            funcs = []
+            for node in nets:
+                for server in self.servers.values():
+                    funcs.append(
+                        (self.create_gre_tunnel, (node, server, mtu, True), {})
+                    )
+            workers = sum(x.pool.size for x in self.servers.values())
+            _, exceptions = utils.threadpool(funcs, workers)
+        else:
+            exceptions = self.start_batched(nets, mtu)
+        self.tunnel_times["total"] = time.monotonic() - start
+        logger.info("distributed tunnel times: %s", self.tunnel_times)
+        if exceptions:
+            raise CoreError(f"error creating distributed tunnels: {exceptions[0]}")
+
+    def start_batched(self, nets: List[CoreNetwork], mtu: int) -> List[Exception]:
+        """
+        Plan all tunnels for the provided networks up front and create them using
+        a single ip batch command on the local host and on each server, run in
+        parallel.
+
+        :param nets: networks to create tunnels for
+        :param mtu: mtu for gre taps
+        :return: exceptions from creating tunnels
+        """
+        local_cmds = []
+        server_cmds = {x: [] for x in self.servers}
+        keys = []
+        taps = []
+        for node in nets:
+            for name, server in self.servers.items():
+                key = self.tunnel_key(node.id, netaddr.IPAddress(server.host).value)
+                with self.tunnels_lock:
+                    if key in self.tunnels:
+                        continue
+                local_tap, remote_tap = self.create_gre_tunnel(node, server, mtu, False)
+                local_cmds.extend(gretap_cmds(local_tap, node.brname))
+                server_cmds[name].extend(gretap_cmds(remote_tap, node.brname))
+                keys.append(key)
+                taps.extend([local_tap, remote_tap])
+        if not taps:
+            return []
+        funcs = [(self.run_ip_batch, (None, local_cmds), {})]
+        for name, cmds in server_cmds.items():
+            if cmds:
+                funcs.append((self.run_ip_batch, (self.servers[name], cmds), {}))
+        _, exceptions = utils.threadpool(funcs, len(funcs))
+        if exceptions:
+            # forget planned tunnels and remove any partly created taps, so they
+            # are created again when retried
+            with self.tunnels_lock:
+                for key in keys:
+                    self.tunnels.pop(key, None)
+            for tap in taps:
+                tap.shutdown()
+        else:
+            for tap in taps:
+                tap.up = True
+        return exceptions
+
+    def run_ip_batch(
+        self, server: Optional[DistributedServer], cmds: List[str]
+    ) -> None:
+        """
+        Run ip commands as a single batch on the local host or a server, recording
+        the time taken.
+
+        :param server: server to run commands on, None for the local host
+        :param cmds: ip batch commands to run
+        :return: nothing
+        :raises CoreCommandError: when a non-zero exit status occurs
+        """
+        start = time.monotonic()
+        lines = "\n".join(cmds)
+        args = f"{IP} -batch - <<'EOF'\n{lines}\nEOF"
+        if server is None:
+            name = "local"
+            utils.cmd(args, shell=True)
+        else:
+            name = server.name
+            server.remote_cmd(args)
+        self.tunnel_times[name] = time.monotonic() - start
 
     def create_gre_tunnel(
         self, node: CoreNetwork, server: DistributedServer, mtu: int, start: bool
@@ -212,7 +705,8 @@ class DistributedController:
         """
         host = server.host
         key = self.tunnel_key(node.id, netaddr.IPAddress(host).value)
-        tunnel = self.tunnels.get(key)
+        with self.tunnels_lock:
+            tunnel = self.tunnels.get(key)
         if tunnel is not None:
             return tunnel
         # local to server
@@ -231,7 +725,8 @@ class DistributedController:
             remote_tap.net_client.set_iface_master(node.brname, remote_tap.localname)
         # save tunnels for shutdown
         tunnel = (local_tap, remote_tap)
-        self.tunnels[key] = tunnel
+        with self.tunnels_lock:
+            self.tunnels[key] = tunnel
         return tunnel
 
     def tunnel_key(self, node1_id: int, node2_id: int) -> int:
@@ -0,0 +1,214 @@
+"""
+Session wide storage of node positions, kept within contiguous arrays indexed by a
+slot allocated per node. Rows changed are kept in order of their last change,
+along with its sequence number, allowing consumers to read only the positions
+changed since a sequence they have already seen.
+"""
+import math
+import threading
+from array import array
+from collections import OrderedDict, deque
+from typing import Deque, Dict, List, Optional, Tuple
+
+PositionRow = Tuple[Optional[float], Optional[float], Optional[float]]
+# bits within a row flags value, marking columns set from int values
+XYZ_SHIFT: int = 0
+GEO_SHIFT: int = 3
+
+
+def _to_float(value: Optional[float]) -> float:
+    return math.nan if value is None else value
+
+
+def _from_float(value: float, is_int: bool) -> Optional[float]:
+    if math.isnan(value):
+        return None
+    return int(value) if is_int else value
+
+
+def _int_flags(*values: Optional[float]) -> int:
+    flags = 0
+    for index, value in enumerate(values):
+        if isinstance(value, int):
+            flags |= 1 << index
+    return flags
+
+
+class PositionStore:
+    """
+    Table of x,y,z and lon,lat,alt positions, with unset values stored as nan, and
+    flags per row to return values set as ints as ints, and the sequence of the
+    last change of changed rows.
+    """
+
+    def __init__(self) -> None:
+        """
+        Create a PositionStore instance.
+        """
+        self.lock: threading.Lock = threading.Lock()
+        self.sequence: int = 0
+        self.x: array = array("d")
+        self.y: array = array("d")
+        self.z: array = array("d")
+        self.lon: array = array("d")
+        self.lat: array = array("d")
+        self.alt: array = array("d")
+        self.flags: array = array("B")
+        # changed slots to the sequence of their last change, oldest first
+        self.changes: Dict[int, int] = OrderedDict()
+        self.owners: List[Optional[int]] = []
+        self.free: List[int] = []
+        # slots released without taking the lock, freed on next allocation
+        self.released: Deque[int] = deque()
+
+    def __len__(self) -> int:
+        return len(self.owners) - len(self.free) - len(self.released)
+
+    def _columns(self) -> Tuple[array, ...]:
+        return self.x, self.y, self.z, self.lon, self.lat, self.alt
+
+    def allocate(self, owner: int = None) -> int:
+        """
+        Allocate a row with all values unset.
+
+        :param owner: id of node owning the row
+        :return: slot of allocated row
+        """
+        with self.lock:
+            while self.released:
+                self._release(self.released.popleft())
+            if self.free:
+                slot = self.free.pop()
+                for column in self._columns():
+                    column[slot] = math.nan
+                self.flags[slot] = 0
+                self.owners[slot] = owner
+            else:
+                slot = len(self.owners)
+                for column in self._columns():
+                    column.append(math.nan)
+                self.flags.append(0)
+                self.owners.append(owner)
+            return slot
+
+    def release(self, slot: int) -> None:
+        """
+        Release a row, allowing it to be allocated again.
+
+        :param slot: slot of row to release
+        :return: nothing
+        """
+        with self.lock:
+            self._release(slot)
+
+    def release_later(self, slot: int) -> None:
+        """
+        Release a row on the next allocation, without taking the lock, allowing
+        rows to be released from finalizers.
+
+        :param slot: slot of row to release
+        :return: nothing
+        """
+        self.released.append(slot)
+
+    def _release(self, slot: int) -> None:
+        self.owners[slot] = None
+        self.changes.pop(slot, None)
+        self.free.append(slot)
+
+    def set(self, slot: int, x: float = None, y: float = None, z: float = None) -> bool:
+        """
+        Set the x,y,z position of a row, marking it changed when different.
+
+        :param slot: slot of row to set
+        :param x: x position
+        :param y: y position
+        :param z: z position
+        :return: True if position changed, False otherwise
+        """
+        with self.lock:
+            if self.get(slot) == (x, y, z):
+                return False
+            self.x[slot] = _to_float(x)
+            self.y[slot] = _to_float(y)
+            self.z[slot] = _to_float(z)
+            flags = self.flags[slot] & ~(0b111 << XYZ_SHIFT)
+            self.flags[slot] = flags | _int_flags(x, y, z) << XYZ_SHIFT
+            self.sequence += 1
+            self.changes.pop(slot, None)
+            self.changes[slot] = self.sequence
+            return True
+
+    def get(self, slot: int) -> PositionRow:
+        """
+        Retrieve the x,y,z position of a row.
+
+        :param slot: slot of row to get
+        :return: x,y,z position tuple
+        """
+        flags = self.flags[slot] >> XYZ_SHIFT
+        return (
+            _from_float(self.x[slot], flags & 0b001),
+            _from_float(self.y[slot], flags & 0b010),
+            _from_float(self.z[slot], flags & 0b100),
+        )
+
+    def set_geo(self, slot: int, lon: float, lat: float, alt: float) -> None:
+        """
+        Set the lon,lat,alt position of a row.
+
+        :param slot: slot of row to set
+        :param lon: longitude value
+        :param lat: latitude value
+        :param alt: altitude value
+        :return: nothing
+        """
+        with self.lock:
+            self.lon[slot] = _to_float(lon)
+            self.lat[slot] = _to_float(lat)
+            self.alt[slot] = _to_float(alt)
+            flags = self.flags[slot] & ~(0b111 << GEO_SHIFT)
+            self.flags[slot] = flags | _int_flags(lon, lat, alt) << GEO_SHIFT
+
+    def get_geo(self, slot: int) -> PositionRow:
+        """
+        Retrieve the lon,lat,alt position of a row.
+
+        :param slot: slot of row to get
+        :return: lon,lat,alt position tuple
+        """
+        flags = self.flags[slot] >> GEO_SHIFT
+        return (
+            _from_float(self.lon[slot], flags & 0b001),
+            _from_float(self.lat[slot], flags & 0b010),
+            _from_float(self.alt[slot], flags & 0b100),
+        )
+
+    def get_many(self, slots: List[int]) -> List[PositionRow]:
+        """
+        Retrieve the x,y,z positions for several rows at once.
+
+        :param slots: slots of rows to get
+        :return: x,y,z position tuples, in the same order as slots
+        """
+        with self.lock:
+            return [self.get(slot) for slot in slots]
+
+    def changed(self, since: int) -> Tuple[int, Dict[int, PositionRow]]:
+        """
+        Retrieve the x,y,z positions of all rows changed after the given sequence.
+
+        :param since: sequence to get changes after
+        :return: current sequence and changed positions mapped by slot
+        """
+        with self.lock:
+            positions = {}
+            for slot in reversed(self.changes):
+                if self.changes[slot] <= since:
+                    break
+                positions[slot] = self.get(slot)
+            return self.sequence, positions
+
+
+# store for positions not belonging to a session, such as those of removed nodes
+DEFAULT_STORE: PositionStore = PositionStore()
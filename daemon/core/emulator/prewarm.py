@@ -0,0 +1,303 @@
+"""
+Pre-warmed container pool, providing stopped containers ready to be claimed and
+renamed by container nodes at startup, along with per session overlays of node
+files common to all nodes using the same image, model, and services.
+"""
+import logging
+import shutil
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple, Type
+
+from core import utils
+
+logger = logging.getLogger(__name__)
+
+if TYPE_CHECKING:
+    from core.emulator.session import Session
+    from core.nodes.base import CoreNode
+
+    PoolKey = Tuple[Type[CoreNode], str, Optional[str], Tuple[str, ...]]
+
+OverlayFiles = Dict[Path, Tuple[bytes, int]]
+
+
+class ContainerOverlay:
+    """
+    Tracks files created on nodes sharing a pool key, to determine the files
+    common to all of them.
+    """
+
+    def __init__(self) -> None:
+        self.node_files: Dict[int, OverlayFiles] = {}
+
+    def add_files(self, node_id: int, files: OverlayFiles) -> None:
+        """
+        Record files created on a node.
+
+        :param node_id: id of node files were created on
+        :param files: files created, mapped to contents and mode
+        :return: nothing
+        """
+        self.node_files.setdefault(node_id, {}).update(files)
+
+    def common(self) -> OverlayFiles:
+        """
+        Files created with the same contents and mode on all tracked nodes.
+
+        :return: common files
+        """
+        node_files = list(self.node_files.values())
+        if not node_files:
+            return {}
+        common = dict(node_files[0])
+        for files in node_files[1:]:
+            for path in list(common):
+                if files.get(path) != common[path]:
+                    common.pop(path)
+        return common
+
+    def write(self, directory: Path, files: OverlayFiles) -> None:
+        """
+        Write overlay files to a host directory, mirroring their container paths.
+
+        :param directory: directory to write overlay files to
+        :param files: files to write
+        :return: nothing
+        """
+        for path, (contents, mode) in files.items():
+            file_path = directory / path.relative_to("/")
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            file_path.write_bytes(contents)
+            file_path.chmod(mode)
+
+
+class ContainerPool:
+    """
+    Pool of stopped containers created ahead of time for a session, keyed by node
+    class, image, model, and services, so baked files only reach nodes running
+    the services that created them.
+    """
+
+    def __init__(self, session: "Session") -> None:
+        """
+        Create a ContainerPool instance.
+
+        :param session: session pool is for
+        """
+        self.session: "Session" = session
+        self.lock: threading.Lock = threading.Lock()
+        self.containers: Dict["PoolKey", List[Tuple[Any, OverlayFiles]]] = {}
+        self.overlays: Dict["PoolKey", ContainerOverlay] = {}
+        self.count: int = 0
+
+    @classmethod
+    def key(cls, node: "CoreNode") -> "PoolKey":
+        """
+        Create the pool key for a container node.
+
+        :param node: container node to get key for
+        :return: pool key
+        """
+        services = [x.name for x in node.services]
+        services.extend(node.config_services)
+        return node.__class__, node.image, node.type, tuple(sorted(services))
+
+    def available(self, key: "PoolKey") -> int:
+        """
+        Number of containers available to claim for a given key.
+
+        :param key: pool key to check
+        :return: number of available containers
+        """
+        with self.lock:
+            return len(self.containers.get(key, []))
+
+    def prewarm(
+        self,
+        _class: Type["CoreNode"],
+        image: str,
+        model: Optional[str],
+        count: int,
+        services: Tuple[str, ...] = (),
+    ) -> List[Exception]:
+        """
+        Create stopped containers for a node class, image, model, and services,
+        concurrently. Files common to all nodes with the same key, rendered or
+        created so far within this session, are baked into each container.
+
+        :param _class: container node class to create containers for
+        :param image: image to create containers from
+        :param model: model of nodes that will claim the containers
+        :param count: number of containers to create
+        :param services: sorted names of services run by nodes that will claim
+            the containers
+        :return: exceptions from creating containers
+        """
+        key = (_class, image, model, services)
+        with self.lock:
+            overlay = self.overlays.get(key)
+            files = overlay.common() if overlay else {}
+            names = []
+            for _ in range(count):
+                self.count += 1
+                names.append(f"prewarm-{self.session.id}-{self.count}")
+        directory = None
+        if files:
+            directory = self.session.directory / "overlays" / names[0]
+            overlay.write(directory, files)
+        funcs = []
+        for name in names:
+            args = (_class, name, image, files, directory)
+            funcs.append((self.create_container, args, {}))
+        results, exceptions = utils.threadpool(funcs)
+        if directory:
+            shutil.rmtree(directory, ignore_errors=True)
+        with self.lock:
+            containers = self.containers.setdefault(key, [])
+            containers.extend((x, files) for x in results)
+        logger.info(
+            "prewarmed containers class(%s) image(%s) model(%s) services(%s) "
+            "count(%s) files(%s)",
+            _class.__name__,
+            image,
+            model,
+            len(services),
+            len(results),
+            len(files),
+        )
+        return exceptions
+
+    def create_container(
+        self,
+        _class: Type["CoreNode"],
+        name: str,
+        image: str,
+        files: OverlayFiles,
+        directory: Optional[Path],
+    ) -> Any:
+        """
+        Create a stopped container, with overlay files.
+
+        :param _class: container node class to create container for
+        :param name: name for container
+        :param image: image to create container from
+        :param files: overlay files to bake into container
+        :param directory: host directory overlay files were written to
+        :return: client for created container
+        """
+        client = _class.create_client(self.session, name, image)
+        client.create()
+        if files:
+            client.put_overlay(files, directory)
+        return client
+
+    def render_files(self, node: "CoreNode") -> OverlayFiles:
+        """
+        Render the files of the services a node runs, without creating them.
+        Files of customized legacy services are left out, as they may be copied
+        from host files.
+
+        :param node: container node to render service files for
+        :return: rendered files
+        """
+        files = []
+        for service in node.services:
+            if not service.custom:
+                files.extend(self.session.services.get_service_files(node, service))
+        for service in node.config_services.values():
+            files.extend(service.get_files())
+        return {
+            node.resolve_path(path): (contents.encode("utf-8"), mode)
+            for path, contents, mode in files
+        }
+
+    def prewarm_nodes(self, nodes: Iterable["CoreNode"]) -> List[Exception]:
+        """
+        Pre-warm containers for the provided container nodes that are not yet up,
+        accounting for containers already available. Service files are rendered
+        for each node first, so files common to nodes sharing a key are baked.
+
+        :param nodes: container nodes to pre-warm containers for
+        :return: exceptions from creating containers
+        """
+        counts = {}
+        for node in nodes:
+            if node.up or node.server is not None:
+                continue
+            key = self.key(node)
+            counts[key] = counts.get(key, 0) + 1
+            try:
+                files = self.render_files(node)
+            except Exception:
+                logger.exception("error rendering files to prewarm node(%s)", node.id)
+                continue
+            with self.lock:
+                overlay = self.overlays.setdefault(key, ContainerOverlay())
+                overlay.add_files(node.id, files)
+        exceptions = []
+        for key, count in counts.items():
+            count -= self.available(key)
+            if count > 0:
+                _class, image, model, services = key
+                exceptions.extend(self.prewarm(_class, image, model, count, services))
+        return exceptions
+
+    def claim(self, node: "CoreNode") -> Optional[Tuple[Any, OverlayFiles]]:
+        """
+        Claim a pre-warmed container for a node.
+
+        :param node: container node to claim a container for
+        :return: container client and overlay files baked into it, None when
+            no container is available
+        """
+        if node.server is not None:
+            return None
+        with self.lock:
+            containers = self.containers.get(self.key(node))
+            if not containers:
+                return None
+            return containers.pop()
+
+    def add_files(
+        self, node: "CoreNode", files: List[Tuple[Path, bytes, int]]
+    ) -> List[Tuple[Path, bytes, int]]:
+        """
+        Record files being created on a node, to learn common files for its key,
+        and filter out files already present from its baked overlay.
+
+        :param node: container node files are being created on
+        :param files: tuples of absolute file path, contents, and mode
+        :return: files that still need to be created on the node
+        """
+        key = self.key(node)
+        with self.lock:
+            overlay = self.overlays.setdefault(key, ContainerOverlay())
+            overlay.add_files(node.id, {x[0]: (x[1], x[2]) for x in files})
+        baked = node.overlay
+        return [x for x in files if baked.get(x[0]) != (x[1], x[2])]
+
+    def reset(self) -> None:
+        """
+        Forget files learned from nodes, as node ids are reused by the next
+        session definition. Unclaimed containers are kept, to be claimed.
+
+        :return: nothing
+        """
+        with self.lock:
+            self.overlays.clear()
+
+    def shutdown(self) -> None:
+        """
+        Remove all unclaimed containers.
+
+        :return: nothing
+        """
+        with self.lock:
+            clients = [x[0] for y in self.containers.values() for x in y]
+            self.containers.clear()
+            self.overlays.clear()
+        funcs = [(x.stop_container, (), {}) for x in clients]
+        _, exceptions = utils.threadpool(funcs)
+        for exception in exceptions:
+            logger.error("error removing prewarmed container: %s", exception)
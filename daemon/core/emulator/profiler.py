@@ -0,0 +1,304 @@
+"""
+Session boot profiling, recording nested timing spans for instantiation phases,
+nodes, and services, along with the host and remote commands run within them.
+Profiles can be exported in the chrome trace event format.
+"""
+import json
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+try:
+    from contextvars import ContextVar, copy_context
+except ImportError:
+    # python 3.6, falls back to per thread tracking below
+    ContextVar = None
+    copy_context = None
+
+logger = logging.getLogger(__name__)
+
+
+class _ThreadVar:
+    """
+    Fallback for contextvars.ContextVar before python 3.7, tracking a value per
+    thread, which is not carried into thread pools.
+    """
+
+    def __init__(self, name: str, default: Any = None) -> None:
+        self.name: str = name
+        self.default: Any = default
+        self.local: threading.local = threading.local()
+
+    def get(self) -> Any:
+        return getattr(self.local, "value", self.default)
+
+    def set(self, value: Any) -> Any:
+        token = self.get()
+        self.local.value = value
+        return token
+
+    def reset(self, token: Any) -> None:
+        self.local.value = token
+
+
+class _EmptyContext:
+    """
+    Fallback for contextvars.Context before python 3.7, running functions as is.
+    """
+
+    def run(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        return func(*args, **kwargs)
+
+
+if ContextVar is None:
+    ContextVar = _ThreadVar
+    copy_context = _EmptyContext
+
+_CURRENT: ContextVar = ContextVar("profiler_span", default=None)
+
+
+@dataclass
+class ProfileCommand:
+    """
+    Timing for a command run within a span.
+    """
+
+    command: str
+    start: float
+    duration: float
+    thread: int
+    span: str
+    server: Optional[str] = None
+
+
+@dataclass
+class Span:
+    """
+    Timing for a named section of work, along with totals for commands run
+    while it was the innermost span.
+    """
+
+    name: str
+    category: str
+    start: float
+    thread: int
+    profiler: "BootProfiler" = field(repr=False)
+    parent: Optional["Span"] = None
+    args: Dict[str, str] = field(default_factory=dict)
+    end: Optional[float] = None
+    commands: int = 0
+    command_time: float = 0.0
+
+    @property
+    def duration(self) -> float:
+        end = self.end if self.end is not None else time.monotonic()
+        return end - self.start
+
+
+class BootProfiler:
+    """
+    Records spans and commands for a session boot. Spans are tracked per
+    context, so spans started within threads of a threadpool are nested within
+    the span active when the work was submitted. Recording stops once a boot
+    completes, until the profile is cleared, so spans and commands run while a
+    session is running are timed but not kept.
+    """
+
+    def __init__(self, session_id: int) -> None:
+        """
+        Create a BootProfiler instance.
+
+        :param session_id: id of session being profiled
+        """
+        self.session_id: int = session_id
+        self.start: float = time.monotonic()
+        self.spans: List[Span] = []
+        self.commands: List[ProfileCommand] = []
+        self.recording: bool = True
+        self.lock: threading.Lock = threading.Lock()
+
+    def clear(self) -> None:
+        """
+        Clear recorded spans and commands, restarting the profile.
+
+        :return: nothing
+        """
+        with self.lock:
+            self.start = time.monotonic()
+            self.spans.clear()
+            self.commands.clear()
+            self.recording = True
+
+    def stop(self) -> None:
+        """
+        Stop recording spans and commands, keeping those already recorded.
+
+        :return: nothing
+        """
+        with self.lock:
+            self.recording = False
+
+    @contextmanager
+    def span(self, name: str, category: str = "phase", **args: Any) -> Iterator[Span]:
+        """
+        Record a span for the duration of the context.
+
+        :param name: name of span
+        :param category: category of span, used to group spans
+        :param args: additional values to record with span
+        :return: the recorded span
+        """
+        parent = _CURRENT.get()
+        span = Span(
+            name=name,
+            category=category,
+            start=time.monotonic(),
+            thread=threading.get_ident(),
+            profiler=self,
+            parent=parent,
+            args={k: str(v) for k, v in args.items()},
+        )
+        with self.lock:
+            if self.recording:
+                self.spans.append(span)
+        token = _CURRENT.set(span)
+        try:
+            yield span
+        finally:
+            span.end = time.monotonic()
+            _CURRENT.reset(token)
+
+    def add_command(
+        self, span: Span, command: str, start: float, server: str = None
+    ) -> None:
+        """
+        Record a command run within a span.
+
+        :param span: span command was run within
+        :param command: command that was run
+        :param start: monotonic time command was started
+        :param server: name of server command was run on, None for local
+        :return: nothing
+        """
+        duration = time.monotonic() - start
+        profile_command = ProfileCommand(
+            command=command,
+            start=start,
+            duration=duration,
+            thread=threading.get_ident(),
+            span=span.name,
+            server=server,
+        )
+        with self.lock:
+            span.commands += 1
+            span.command_time += duration
+            if self.recording:
+                self.commands.append(profile_command)
+
+    def metrics(self) -> Dict[str, float]:
+        """
+        Total time for spans by name and category.
+
+        :return: dict of span category and name to total time
+        """
+        metrics = {}
+        with self.lock:
+            for span in self.spans:
+                key = f"{span.category}.{span.name}"
+                metrics[key] = metrics.get(key, 0.0) + span.duration
+        return metrics
+
+    def to_trace(self) -> Dict[str, Any]:
+        """
+        Create a chrome trace event format representation of the profile.
+
+        :return: chrome trace data
+        """
+        pid = self.session_id
+        events = [
+            {
+                "name": "process_name",
+                "ph": "M",
+                "pid": pid,
+                "args": {"name": f"session {self.session_id}"},
+            }
+        ]
+        with self.lock:
+            for span in self.spans:
+                args = dict(span.args)
+                args["commands"] = span.commands
+                args["command_time"] = span.command_time
+                if span.parent:
+                    args["parent"] = span.parent.name
+                events.append(
+                    {
+                        "name": span.name,
+                        "cat": span.category,
+                        "ph": "X",
+                        "ts": (span.start - self.start) * 1e6,
+                        "dur": span.duration * 1e6,
+                        "pid": pid,
+                        "tid": span.thread,
+                        "args": args,
+                    }
+                )
+            for command in self.commands:
+                events.append(
+                    {
+                        "name": command.command.split(" ", 1)[0],
+                        "cat": "command",
+                        "ph": "X",
+                        "ts": (command.start - self.start) * 1e6,
+                        "dur": command.duration * 1e6,
+                        "pid": pid,
+                        "tid": command.thread,
+                        "args": {
+                            "command": command.command,
+                            "server": command.server or "localhost",
+                            "span": command.span,
+                        },
+                    }
+                )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write(self, path: Path) -> None:
+        """
+        Write profile as a chrome trace json file.
+
+        :param path: path to write file to
+        :return: nothing
+        """
+        try:
+            path.write_text(json.dumps(self.to_trace()))
+        except OSError:
+            logger.exception("error writing boot profile: %s", path)
+
+
+def current_span() -> Optional[Span]:
+    """
+    Retrieve the innermost span for the current context.
+
+    :return: current span, None when not within a span
+    """
+    return _CURRENT.get()
+
+
+def record_command(command: Any, start: float, server: str = None) -> None:
+    """
+    Record a command against the current span, when within a span.
+
+    :param command: command that was run, as a string or arguments
+    :param start: monotonic time command was started
+    :param server: name of server command was run on, None for local
+    :return: nothing
+    """
+    span = _CURRENT.get()
+    if span is None:
+        return
+    if not isinstance(command, str):
+        command = " ".join(command)
+    span.profiler.add_command(span, command, start, server)
@@ -14,12 +14,27 @@ import tempfile
 import threading
 import time
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Type, TypeVar, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 from core import constants, utils
 from core.configservice.manager import ConfigServiceManager
 from core.emane.emanemanager import EmaneManager, EmaneState
 from core.emane.nodes import EmaneNet
+from core.emulator.addresses import MacPool
+from core.emulator.changes import SessionChanges
+from core.emulator.controlnet import ControlNetPlan
 from core.emulator.data import (
     ConfigData,
     EventData,
@@ -39,7 +54,12 @@ from core.emulator.enumerations import (
     MessageFlags,
     NodeTypes,
 )
+from core.emulator.positions import PositionStore
+from core.emulator.prewarm import ContainerPool
+from core.emulator.profiler import BootProfiler
 from core.emulator.sessionconfig import SessionConfig
+from core.emulator.teardown import TeardownPlan
+from core.emulator.topology import TopologyIndex
 from core.errors import CoreError
 from core.location.event import EventLoop
 from core.location.geo import GeoLocation
@@ -85,6 +105,8 @@ NODES_TYPE: Dict[Type[NodeBase], NodeTypes] = {NODES[x]: x for x in NODES}
 CONTAINER_NODES: Set[Type[NodeBase]] = {DockerNode, LxcNode}
 CTRL_NET_ID: int = 9001
 LINK_COLORS: List[str] = ["green", "blue", "orange", "purple", "turquoise"]
+# start metrics for control network setup
+CONTROL_METRICS: List[str] = ["control_net", "control_ifaces", "control_hosts"]
 NT: TypeVar = TypeVar("NT", bound=NodeBase)
 
 
@@ -120,10 +142,17 @@ class Session:
         # dict of nodes: all nodes and nets
         self.nodes: Dict[int, NodeBase] = {}
         self.nodes_lock = threading.Lock()
+        self.changes: SessionChanges = SessionChanges()
+        self.positions: PositionStore = PositionStore()
+        self.topology: TopologyIndex = TopologyIndex()
+        self.macs: MacPool = MacPool()
 
         # states and hooks handlers
         self.state: EventTypes = EventTypes.DEFINITION_STATE
         self.state_time: float = time.monotonic()
+        self.start_metrics: Dict[str, float] = {}
+        self.stop_metrics: Dict[str, float] = {}
+        self.profiler: BootProfiler = BootProfiler(self.id)
         self.hooks: Dict[EventTypes, List[Tuple[str, str]]] = {}
         self.state_hooks: Dict[EventTypes, List[Callable[[EventTypes], None]]] = {}
         self.add_state_hook(
@@ -150,6 +179,9 @@ class Session:
         # distributed support and logic
         self.distributed: DistributedController = DistributedController(self)
 
+        # pre-warmed containers for container nodes
+        self.container_pool: ContainerPool = ContainerPool(self)
+
         # initialize session feature helpers
         self.location: GeoLocation = GeoLocation()
         self.mobility: MobilityManager = MobilityManager(self)
@@ -232,6 +264,38 @@ class Session:
         iface2_data: InterfaceData = None,
         options: LinkOptions = None,
         link_type: LinkTypes = LinkTypes.WIRED,
+    ) -> Tuple[CoreInterface, CoreInterface]:
+        """
+        Add a link between nodes, profiled as a span.
+
+        :param node1_id: node one id
+        :param node2_id: node two id
+        :param iface1_data: node one interface
+            data, defaults to none
+        :param iface2_data: node two interface
+            data, defaults to none
+        :param options: data for creating link,
+            defaults to no options
+        :param link_type: type of link to add
+        :return: tuple of created core interfaces, depending on link
+        """
+        node1 = self.get_node(node1_id, NodeBase)
+        node2 = self.get_node(node2_id, NodeBase)
+        with self.profiler.span(
+            "link", "interfaces", node1=node1.name, node2=node2.name
+        ):
+            return self._add_link(
+                node1_id, node2_id, iface1_data, iface2_data, options, link_type
+            )
+
+    def _add_link(
+        self,
+        node1_id: int,
+        node2_id: int,
+        iface1_data: InterfaceData = None,
+        iface2_data: InterfaceData = None,
+        options: LinkOptions = None,
+        link_type: LinkTypes = LinkTypes.WIRED,
     ) -> Tuple[CoreInterface, CoreInterface]:
         """
         Add a link between nodes.
@@ -317,9 +381,37 @@ class Session:
             if isinstance(node2, TunnelNode):
                 logger.info("setting tunnel key for: %s", node2.name)
                 node2.setkey(key, iface2_data)
+            iface1_id = iface1.node_id if iface1 else None
+            iface2_id = iface2.node_id if iface2 else None
+            self._link_changed(node1, node2, iface1_id, iface2_id)
         self.sdt.add_link(node1_id, node2_id)
         return iface1, iface2
 
+    def _link_changed(
+        self,
+        node1: NodeBase,
+        node2: NodeBase,
+        iface1_id: Optional[int],
+        iface2_id: Optional[int],
+        deleted: bool = False,
+    ) -> None:
+        """
+        Record a wired link change, identifying the link by the interfaces of the
+        nodes involved, when they are not networks.
+
+        :param node1: node one
+        :param node2: node two
+        :param iface1_id: node one interface id
+        :param iface2_id: node two interface id
+        :param deleted: True when link was deleted, False otherwise
+        :return: nothing
+        """
+        if not isinstance(node1, CoreNodeBase):
+            iface1_id = None
+        if not isinstance(node2, CoreNodeBase):
+            iface2_id = None
+        self.changes.link_changed(node1.id, node2.id, iface1_id, iface2_id, deleted)
+
     def delete_link(
         self,
         node1_id: int,
@@ -392,6 +484,7 @@ class Session:
                     raise CoreError(
                         f"node1({node1.name}) and node2({node2.name}) are not connected"
                     )
+            self._link_changed(node1, node2, iface1_id, iface2_id, deleted=True)
         self.sdt.delete_link(node1_id, node2_id)
 
     def update_link(
@@ -487,6 +580,7 @@ class Session:
                 raise CoreError(
                     f"cannot update link node1({type(node1)}) node2({type(node2)})"
                 )
+            self._link_changed(node1, node2, iface1_id, iface2_id)
 
     def next_node_id(self) -> int:
         """
@@ -545,9 +639,12 @@ class Session:
             start,
         )
         kwargs = dict(_id=_id, name=name, server=server)
-        if _class in CONTAINER_NODES:
+        is_container = _class in CONTAINER_NODES
+        if is_container:
             kwargs["image"] = options.image
-        node = self.create_node(_class, start, **kwargs)
+        # container nodes are started once their model is known, allowing them
+        # to claim a pre-warmed container
+        node = self.create_node(_class, start and not is_container, **kwargs)
 
         # set node attributes
         node.icon = options.icon
@@ -575,6 +672,9 @@ class Session:
             for name in config_services:
                 service_class = self.service_manager.get_service(name)
                 node.add_config_service(service_class)
+        if start and is_container:
+            with self.profiler.span("startup", "node", node=node.name):
+                node.startup()
 
         # set network mtu, if configured
         mtu = self.options.get_config_int("mtu")
@@ -600,6 +700,7 @@ class Session:
             self.boot_node(node)
 
         self.sdt.add_node(node)
+        self.changes.node_changed(node.id)
         return node
 
     def set_node_pos(self, node: NodeBase, x: float, y: float) -> None:
@@ -607,6 +708,7 @@ class Session:
         self.sdt.edit_node(
             node, node.position.lon, node.position.lat, node.position.alt
         )
+        self.changes.node_changed(node.id)
 
     def set_node_geo(self, node: NodeBase, lon: float, lat: float, alt: float) -> None:
         x, y, _ = self.location.getxyz(lat, lon, alt)
@@ -617,6 +719,58 @@ class Session:
         node.setposition(x, y, None)
         node.position.set_geo(lon, lat, alt)
         self.sdt.edit_node(node, lon, lat, alt)
+        self.changes.node_changed(node.id)
+
+    def set_node_positions(
+        self,
+        positions: List[
+            Tuple[NodeBase, Optional[Tuple[float, float]], Optional[Tuple[float, ...]]]
+        ],
+    ) -> List[NodeBase]:
+        """
+        Move several nodes at once, without running interface position hooks per
+        node. Wireless models are then updated once per network and emane
+        locations are published once, for all moved interfaces. Moved nodes are
+        recorded as changed when callers broadcast them.
+
+        :param positions: node, with either x,y position or lon,lat,alt geo
+            position to move it to
+        :return: nodes that changed position
+        """
+        moved = []
+        for node, position, geo in positions:
+            if geo:
+                lon, lat, alt = geo
+                x, y, _ = self.location.getxyz(lat, lon, alt)
+                if math.isinf(x) or math.isinf(y):
+                    raise CoreError(
+                        f"invalid geo for current reference/scale: {lon},{lat},{alt}"
+                    )
+            else:
+                x, y = position
+            changed = node.position.set(x, y, None)
+            if geo:
+                node.position.set_geo(*geo)
+            self.sdt.edit_node(
+                node, node.position.lon, node.position.lat, node.position.alt
+            )
+            if changed:
+                moved.append(node)
+        wlan_ifaces = {}
+        emane_ifaces = []
+        for node in moved:
+            if not isinstance(node, CoreNodeBase):
+                continue
+            for iface in node.get_ifaces():
+                if isinstance(iface.net, EmaneNet):
+                    emane_ifaces.append(iface)
+                elif isinstance(iface.net, WlanNode) and iface.net.model:
+                    wlan_ifaces.setdefault(iface.net, []).append(iface)
+        for net, ifaces in wlan_ifaces.items():
+            net.model.update(ifaces)
+        if emane_ifaces:
+            self.emane.set_nem_positions(emane_ifaces)
+        return moved
 
     def start_mobility(self, node_ids: List[int] = None) -> None:
         """
@@ -727,6 +881,7 @@ class Session:
         self.services.reset()
         self.mobility.config_reset()
         self.link_colors.clear()
+        self.container_pool.reset()
 
     def start_events(self) -> None:
         """
@@ -771,6 +926,8 @@ class Session:
             self.clear()
             # shutdown sdt
             self.sdt.shutdown()
+            # remove unclaimed pre-warmed containers
+            self.container_pool.shutdown()
         # remove this sessions working directory
         preserve = self.options.get_config("preservedir") == "1"
         if not preserve:
@@ -812,6 +969,8 @@ class Session:
         """
         if not node.apitype:
             return
+        deleted = message_type == MessageFlags.DELETE
+        self.changes.node_changed(node.id, deleted)
         node_data = NodeData(node=node, message_type=message_type, source=source)
         for handler in self.node_handlers:
             handler(node_data)
@@ -858,6 +1017,8 @@ class Session:
             return
         self.state = state
         self.state_time = time.monotonic()
+        if state == EventTypes.CONFIGURATION_STATE:
+            self.profiler.clear()
         logger.info("changing session(%s) to state %s", self.id, state.name)
         self.write_state(state)
         self.run_hooks(state)
@@ -1071,10 +1232,12 @@ class Session:
             node = _class(self, *args, **kwargs)
             if node.id in self.nodes:
                 node.shutdown()
+                node.position.detach()
                 raise CoreError(f"duplicate node id {node.id} for {node.name}")
             self.nodes[node.id] = node
         if start:
-            node.startup()
+            with self.profiler.span("startup", "node", node=node.name):
+                node.startup()
         return node
 
     def get_node(self, _id: int, _class: Type[NT]) -> NT:
@@ -1111,23 +1274,34 @@ class Session:
                 logger.info("deleted node(%s)", node.name)
         if node:
             node.shutdown()
+            node.position.detach()
+            self.topology.invalidate()
             self.sdt.delete_node(_id)
+            if not isinstance(node, (PtpNet, CtrlNet)):
+                self.changes.node_changed(_id, deleted=True)
         return node is not None
 
     def delete_nodes(self) -> None:
         """
-        Clear the nodes dictionary, and call shutdown for each node.
+        Clear the nodes dictionary, and tear down all nodes in bulk phases,
+        recording the time taken for each phase.
         """
         nodes_ids = []
         with self.nodes_lock:
-            funcs = []
-            while self.nodes:
-                _, node = self.nodes.popitem()
-                nodes_ids.append(node.id)
-                funcs.append((node.shutdown, [], {}))
-            utils.threadpool(funcs)
+            plan = TeardownPlan(self)
+            plan.add_nodes(self.nodes.values())
+            nodes_ids.extend(self.nodes)
+            nodes = list(self.nodes.values())
+            self.nodes.clear()
+            try:
+                self.stop_metrics = plan.run()
+            finally:
+                for node in nodes:
+                    node.position.detach()
+        self.topology.invalidate()
         for node_id in nodes_ids:
             self.sdt.delete_node(node_id)
+        self.changes.truncate()
 
     def write_nodes(self) -> None:
         """
@@ -1165,6 +1339,19 @@ class Session:
         )
         self.broadcast_exception(exception_data)
 
+    def prewarm_containers(self) -> List[Exception]:
+        """
+        Create stopped containers ahead of time for container nodes, to be
+        claimed as they boot.
+
+        :return: exceptions from creating containers
+        """
+        nodes = [x for x in self.nodes.values() if type(x) in CONTAINER_NODES]
+        exceptions = self.container_pool.prewarm_nodes(nodes)
+        for exception in exceptions:
+            logger.error("error prewarming container: %s", exception)
+        return exceptions
+
     def instantiate(self) -> List[Exception]:
         """
         We have entered the instantiation state, invoke startup methods
@@ -1173,23 +1360,50 @@ class Session:
 
         :return: list of service boot errors during startup
         """
+        self.start_metrics.clear()
+        start = time.monotonic()
+
         # write current nodes out to session directory file
         self.write_nodes()
 
         # create control net interfaces and network tunnels
         # which need to exist for emane to sync on location events
         # in distributed scenarios
-        self.add_remove_control_net(0, remove=False)
+        with self.profiler.span("control_net") as span:
+            self.add_remove_control_net(0, remove=False)
+        self.start_metrics["control_net"] = span.duration
 
         # initialize distributed tunnels
-        self.distributed.start()
+        with self.profiler.span("distributed_tunnels") as span:
+            self.distributed.start()
+        self.start_metrics["distributed_tunnels"] = span.duration
+        for name, value in self.distributed.tunnel_times.items():
+            self.start_metrics[f"distributed_tunnels.{name}"] = value
 
         # instantiate will be invoked again upon emane configure
-        if self.emane.startup() == EmaneState.NOT_READY:
+        with self.profiler.span("emane") as span:
+            emane_state = self.emane.startup()
+        self.start_metrics["emane"] = span.duration
+        if emane_state == EmaneState.NOT_READY:
             return []
 
+        # pre-warm containers for container nodes, claimed as they boot
+        if self.options.get_config("prewarm") == "1":
+            with self.profiler.span("prewarm") as span:
+                self.prewarm_containers()
+            self.start_metrics["prewarm"] = span.duration
+
         # boot node services and then start mobility
-        exceptions = self.boot_nodes()
+        with self.profiler.span("boot_nodes") as span:
+            exceptions = self.boot_nodes()
+        self.start_metrics["boot_nodes"] = span.duration
+        total = time.monotonic() - start
+        control = sum(self.start_metrics.get(x, 0.0) for x in CONTROL_METRICS)
+        self.start_metrics["total"] = total
+        self.start_metrics["control_share"] = control / total if total else 0.0
+        logger.info("session(%s) start metrics: %s", self.id, self.start_metrics)
+        self.write_profile()
+        self.profiler.stop()
         if not exceptions:
             self.mobility.startup()
 
@@ -1300,8 +1514,9 @@ class Session:
         :return: nothing
         """
         logger.info("booting node(%s): %s", node.name, [x.name for x in node.services])
-        self.services.boot_services(node)
-        node.start_config_services()
+        with self.profiler.span("boot", "node", node=node.name):
+            self.services.boot_services(node)
+            node.start_config_services()
 
     def boot_nodes(self) -> List[Exception]:
         """
@@ -1312,19 +1527,37 @@ class Session:
         :return: service boot exceptions
         """
         with self.nodes_lock:
-            funcs = []
-            start = time.monotonic()
+            nodes = []
             for node in self.nodes.values():
                 if isinstance(node, (CoreNode, PhysicalNode)):
-                    self.add_remove_control_iface(node, remove=False)
-                    funcs.append((self.boot_node, (node,), {}))
-            results, exceptions = utils.threadpool(funcs)
-            total = time.monotonic() - start
-            logger.debug("boot run time: %s", total)
+                    nodes.append(node)
+            with self.profiler.span("control_ifaces") as span:
+                self.add_control_ifaces(nodes)
+            self.start_metrics["control_ifaces"] = span.duration
+            # boot nodes providing services others wait to be ready on first
+            self.services.clear_ready()
+            nodes.sort(key=self.services.ready_depth)
+            funcs = [(self.boot_node, (x,), {}) for x in nodes]
+            with self.profiler.span("nodes") as span:
+                results, exceptions = utils.threadpool(funcs)
+            logger.debug("boot run time: %s", span.duration)
         if not exceptions:
-            self.update_control_iface_hosts()
+            with self.profiler.span("control_hosts") as span:
+                self.update_control_iface_hosts()
+            self.start_metrics["control_hosts"] = span.duration
         return exceptions
 
+    def write_profile(self) -> Path:
+        """
+        Write the boot profile for this session, as a chrome trace json file
+        within the session directory.
+
+        :return: path of written profile
+        """
+        path = self.directory / "boot-profile.json"
+        self.profiler.write(path)
+        return path
+
     def get_control_net_prefixes(self) -> List[str]:
         """
         Retrieve control net prefixes.
@@ -1488,27 +1721,70 @@ class Session:
             return
         if not node:
             return
+        iface_data = self.control_iface_data(control_net, node, net_index)
+        if iface_data is None:
+            return
+        iface = node.new_iface(control_net, iface_data)
+        iface.control = True
+
+    def add_control_ifaces(
+        self,
+        nodes: Iterable[Union[CoreNode, PhysicalNode]],
+        net_index: int = 0,
+        conf_required: bool = True,
+    ) -> None:
+        """
+        Add control interfaces to several nodes at once, when a 'controlnet'
+        prefix is configured, creating the control network as necessary. Control
+        interfaces for local nodes are created in bulk.
+
+        :param nodes: nodes to add control interfaces to
+        :param net_index: network index
+        :param conf_required: flag to check if conf is required
+        :return: nothing
+        """
+        control_net = self.add_remove_control_net(net_index, False, conf_required)
+        if not control_net:
+            return
+        plan = ControlNetPlan(self, control_net, net_index)
+        plan.add_nodes(nodes)
+        plan.run()
+
+    def control_iface_data(
+        self, control_net: CtrlNet, node: Union[CoreNode, PhysicalNode], net_index: int
+    ) -> Optional[InterfaceData]:
+        """
+        Create the interface data for a node control interface.
+
+        :param control_net: control network for interface
+        :param node: node to create control interface data for
+        :param net_index: network index
+        :return: control interface data, None when the node already has a control
+            interface or an address is not available
+        """
         # ctrl# already exists
         if node.ifaces.get(control_net.CTRLIF_IDX_BASE + net_index):
-            return
+            return None
         try:
-            ip4 = control_net.prefix[node.id]
-            ip4_mask = control_net.prefix.prefixlen
-            iface_data = InterfaceData(
-                id=control_net.CTRLIF_IDX_BASE + net_index,
-                name=f"ctrl{net_index}",
-                mac=utils.random_mac(),
-                ip4=ip4,
-                ip4_mask=ip4_mask,
-                mtu=DEFAULT_MTU,
-            )
-            iface = node.new_iface(control_net, iface_data)
-            iface.control = True
-        except ValueError:
+            ip4 = control_net.addresses.address(node.id)
+        except (ValueError, IndexError):
             msg = f"Control interface not added to node {node.id}. "
             msg += f"Invalid control network prefix ({control_net.prefix}). "
             msg += "A longer prefix length may be required for this many nodes."
             logger.exception(msg)
+            return None
+        if not control_net.addresses.reserve(node.id, node.id):
+            logger.warning(
+                "node(%s) control address(%s) is already in use", node.id, ip4
+            )
+        return InterfaceData(
+            id=control_net.CTRLIF_IDX_BASE + net_index,
+            name=f"ctrl{net_index}",
+            mac=self.macs.allocate(node.id),
+            ip4=ip4,
+            ip4_mask=control_net.prefix.prefixlen,
+            mtu=DEFAULT_MTU,
+        )
 
     def update_control_iface_hosts(
         self, net_index: int = 0, remove: bool = False
@@ -30,6 +30,7 @@ class SessionConfig(ConfigurableManager, ConfigurableOptions):
         ConfigBool(id="enablesdt", default="0", label="Enable SDT3D output"),
         ConfigString(id="sdturl", default=Sdt.DEFAULT_SDT_URL, label="SDT3D URL"),
         ConfigBool(id="ovs", default="0", label="Enable OVS"),
+        ConfigBool(id="prewarm", default="0", label="Pre-warm Containers"),
         ConfigInt(id="platform_id_start", default="1", label="EMANE Platform ID Start"),
         ConfigInt(id="nem_id_start", default="1", label="EMANE NEM ID Start"),
         ConfigBool(id="link_enabled", default="1", label="EMANE Links?"),
@@ -0,0 +1,234 @@
+"""
+Session teardown planning, collecting the processes, devices, nftables tables,
+and directories of local nodes and networks to remove them in bulk phases,
+rather than shutting down each node and interface on its own.
+"""
+import logging
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List
+
+from core import utils
+from core.errors import CoreCommandError
+from core.executables import IP, NFTABLES
+from core.nodes.base import CoreNode, NodeBase
+from core.nodes.network import CoreNetwork, nft_queue
+
+logger = logging.getLogger(__name__)
+
+if TYPE_CHECKING:
+    from core.emulator.session import Session
+
+
+class TeardownPlan:
+    """
+    Plan for removing session nodes. Local nodes and networks using the default
+    shutdown logic are torn down in bulk, all other nodes are shutdown
+    concurrently using their own logic.
+
+    Node processes are killed together, which removes their namespaces and all
+    interfaces within them, along with their veth peers, so node interfaces do
+    not need to be deleted individually.
+    """
+
+    def __init__(self, session: "Session") -> None:
+        """
+        Create a TeardownPlan instance.
+
+        :param session: session to plan teardown for
+        """
+        self.session: "Session" = session
+        self.nodes: List[CoreNode] = []
+        self.nets: List[CoreNetwork] = []
+        self.others: List[NodeBase] = []
+        self.pids: List[int] = []
+        self.tables: List[str] = []
+        self.devices: List[str] = []
+        self.paths: List[Path] = []
+        self.metrics: Dict[str, float] = {}
+
+    def add_nodes(self, nodes: Iterable[NodeBase]) -> None:
+        """
+        Add nodes to the plan.
+
+        :param nodes: nodes to add
+        :return: nothing
+        """
+        preserve = self.session.options.get_config("preservedir") == "1"
+        use_ovs = self.session.use_ovs()
+        for node in nodes:
+            default_shutdown = type(node).shutdown in (
+                CoreNode.shutdown,
+                CoreNetwork.shutdown,
+            )
+            if node.server is not None or not default_shutdown:
+                self.others.append(node)
+            elif isinstance(node, CoreNode):
+                self.add_node(node, preserve)
+            elif isinstance(node, CoreNetwork) and not use_ovs:
+                self.add_net(node)
+            else:
+                self.others.append(node)
+
+    def add_node(self, node: CoreNode, preserve: bool) -> None:
+        """
+        Add the process and directories of a local node.
+
+        :param node: node to add
+        :param preserve: True to preserve node directories, False otherwise
+        :return: nothing
+        """
+        self.nodes.append(node)
+        if node.up:
+            self.pids.append(node.pid)
+            self.paths.append(node.ctrlchnlname)
+        if not preserve and node.tmpnodedir:
+            self.paths.append(node.directory)
+
+    def add_net(self, net: CoreNetwork) -> None:
+        """
+        Add the bridge, nftables table, and bridge to bridge veths of a local
+        network.
+
+        :param net: network to add
+        :return: nothing
+        """
+        self.nets.append(net)
+        if not net.up:
+            return
+        self.devices.append(net.brname)
+        if net.has_nftables_chain:
+            self.tables.append(net.brname)
+        for iface in net.get_ifaces():
+            if iface.node is None and iface.up and iface.localname:
+                self.devices.append(iface.localname)
+
+    def run(self) -> Dict[str, float]:
+        """
+        Run all teardown phases, recording the time taken for each.
+
+        :return: phase names mapped to time taken
+        """
+        start = time.monotonic()
+        self.run_phase("nodes", self.shutdown_others)
+        self.run_phase("processes", self.kill_processes)
+        self.run_phase("nftables", self.delete_tables)
+        self.run_phase("devices", self.delete_devices)
+        self.run_phase("directories", self.remove_paths)
+        self.mark_down()
+        self.metrics["total"] = time.monotonic() - start
+        logger.info(
+            "session(%s) teardown nodes(%s) nets(%s) other(%s) metrics: %s",
+            self.session.id,
+            len(self.nodes),
+            len(self.nets),
+            len(self.others),
+            self.metrics,
+        )
+        return self.metrics
+
+    def run_phase(self, name: str, func: Callable[[], None]) -> None:
+        """
+        Run a teardown phase, logging errors so remaining phases still run.
+
+        :param name: name of phase
+        :param func: function running phase
+        :return: nothing
+        """
+        start = time.monotonic()
+        try:
+            func()
+        except CoreCommandError:
+            logger.exception("error during teardown phase: %s", name)
+        self.metrics[name] = time.monotonic() - start
+
+    def shutdown_others(self) -> None:
+        """
+        Shutdown nodes that are not torn down in bulk, concurrently.
+
+        :return: nothing
+        """
+        funcs = [(x.shutdown, [], {}) for x in self.others]
+        _, exceptions = utils.threadpool(funcs)
+        for exception in exceptions:
+            logger.error("error shutting down node: %s", exception)
+
+    def kill_processes(self) -> None:
+        """
+        Kill all node processes, removing their namespaces.
+
+        :return: nothing
+        """
+        if self.pids:
+            pids = " ".join(str(x) for x in self.pids)
+            utils.cmd(f"kill -9 {pids}")
+
+    def delete_tables(self) -> None:
+        """
+        Delete the nftables tables of all networks in a single transaction,
+        falling back to deleting each table when it fails.
+
+        :return: nothing
+        """
+        if not self.nets:
+            return
+        nft_queue.stop()
+        if not self.tables:
+            return
+        lines = "\n".join(f"delete table bridge {x}" for x in self.tables)
+        try:
+            utils.cmd(f"{NFTABLES} -f - <<'EOF'\n{lines}\nEOF", shell=True)
+        except CoreCommandError:
+            logger.exception("error deleting nftables tables, deleting each")
+            for table in self.tables:
+                try:
+                    utils.cmd(f"{NFTABLES} delete table bridge {table}")
+                except CoreCommandError:
+                    logger.exception("error deleting nftables table: %s", table)
+
+    def delete_devices(self) -> None:
+        """
+        Delete all bridges and bridge to bridge veths in a single ip batch,
+        continuing past devices that no longer exist.
+
+        :return: nothing
+        """
+        if self.devices:
+            lines = "\n".join(f"link delete {x}" for x in self.devices)
+            utils.cmd(f"{IP} -force -batch - <<'EOF'\n{lines}\nEOF", shell=True)
+
+    def remove_paths(self) -> None:
+        """
+        Remove all node control channels and directories.
+
+        :return: nothing
+        """
+        if self.paths:
+            paths = " ".join(str(x) for x in self.paths)
+            utils.cmd(f"rm -rf {paths}")
+
+    def mark_down(self) -> None:
+        """
+        Update the state of bulk torn down nodes and networks to reflect being
+        shutdown.
+
+        :return: nothing
+        """
+        for node in self.nodes:
+            with node.lock:
+                if not node.up:
+                    continue
+                node._mounts = []
+                for iface in node.get_ifaces():
+                    iface.up = False
+                node.ifaces.clear()
+                node.client.close()
+                node.up = False
+        for net in self.nets:
+            if not net.up:
+                continue
+            for iface in net.get_ifaces():
+                iface.up = False
+            net.ifaces.clear()
+            net.linked.clear()
+            net.up = False
@@ -0,0 +1,135 @@
+"""
+Session topology index, memoizing per network and per node queries used when
+generating service configurations. Results are computed once per network or node
+and reused until a link or interface changes.
+"""
+import threading
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+from core.nodes.interface import DEFAULT_MTU
+
+if TYPE_CHECKING:
+    from core.nodes.base import CoreNetworkBase, CoreNodeBase
+    from core.nodes.interface import CoreInterface
+
+    CommonNet = Tuple[Optional[CoreNetworkBase], CoreInterface, CoreInterface]
+
+
+class TopologyIndex:
+    """
+    Memoized topology queries, cleared whenever the topology changes.
+    """
+
+    def __init__(self) -> None:
+        """
+        Create a TopologyIndex instance.
+        """
+        self.lock: threading.RLock = threading.RLock()
+        self.mtus: Dict["CoreNetworkBase", Tuple[Optional[int], Optional[int]]] = {}
+        self.router_ids: Dict["CoreNodeBase", Optional[str]] = {}
+        self.node_nets: Dict[
+            "CoreNodeBase", Dict[Optional["CoreNetworkBase"], List["CoreInterface"]]
+        ] = {}
+
+    def invalidate(self) -> None:
+        """
+        Clear memoized results, after a link or interface has changed.
+
+        :return: nothing
+        """
+        with self.lock:
+            self.mtus.clear()
+            self.router_ids.clear()
+            self.node_nets.clear()
+
+    def _net_mtus(self, net: "CoreNetworkBase") -> Tuple[Optional[int], Optional[int]]:
+        mtus = self.mtus.get(net)
+        if mtus is None:
+            with self.lock:
+                values = [x.mtu for x in net.get_ifaces()]
+                mtus = (min(values), max(values)) if values else (None, None)
+                self.mtus[net] = mtus
+        return mtus
+
+    def min_mtu(self, iface: "CoreInterface") -> int:
+        """
+        Retrieve the minimum mtu of the interfaces linked with a given interface.
+
+        :param iface: interface to get minimum mtu for
+        :return: minimum mtu
+        """
+        if not iface.net:
+            return iface.mtu
+        min_mtu, _ = self._net_mtus(iface.net)
+        if min_mtu is None:
+            return iface.mtu
+        return min(min_mtu, iface.mtu)
+
+    def has_mtu_mismatch(self, iface: "CoreInterface") -> bool:
+        """
+        Check if an interface has a non default mtu, or an mtu differing from
+        any interface it is linked with.
+
+        :param iface: interface to check
+        :return: True if mtu is mismatched, False otherwise
+        """
+        if iface.mtu != DEFAULT_MTU:
+            # a workaround for PhysicalNode GreTap, which has no knowledge of
+            # the other nodes/nets
+            return True
+        if not iface.net:
+            return False
+        min_mtu, max_mtu = self._net_mtus(iface.net)
+        if min_mtu is None:
+            return False
+        return min_mtu != iface.mtu or max_mtu != iface.mtu
+
+    def router_id(self, node: "CoreNodeBase") -> Optional[str]:
+        """
+        Retrieve the first ipv4 address of a node, for use as a router id.
+
+        :param node: node to get router id for
+        :return: first ipv4 address, None when node has no ipv4 addresses
+        """
+        if node in self.router_ids:
+            return self.router_ids[node]
+        with self.lock:
+            router_id = None
+            for iface in node.get_ifaces(control=False):
+                ip4 = iface.get_ip4()
+                if ip4:
+                    router_id = str(ip4.ip)
+                    break
+            self.router_ids[node] = router_id
+        return router_id
+
+    def _nets(
+        self, node: "CoreNodeBase"
+    ) -> Dict[Optional["CoreNetworkBase"], List["CoreInterface"]]:
+        nets = self.node_nets.get(node)
+        if nets is None:
+            with self.lock:
+                nets = {}
+                for iface in node.get_ifaces():
+                    nets.setdefault(iface.net, []).append(iface)
+                self.node_nets[node] = nets
+        return nets
+
+    def common_nets(
+        self, node1: "CoreNodeBase", node2: "CoreNodeBase", want_ctrl: bool = False
+    ) -> List["CommonNet"]:
+        """
+        Retrieve the networks common to two nodes, along with the interfaces
+        of each node on that network.
+
+        :param node1: first node
+        :param node2: second node
+        :param want_ctrl: True to include control networks, False otherwise
+        :return: tuples of network, node one interface, and node two interface
+        """
+        nets = self._nets(node2)
+        common = []
+        for iface1 in node1.get_ifaces(control=want_ctrl):
+            for iface2 in nets.get(iface1.net, []):
+                common.append((iface1.net, iface1, iface2))
+        return common
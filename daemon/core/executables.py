@@ -11,6 +11,7 @@ MOUNT: str = "mount"
 UMOUNT: str = "umount"
 OVS_VSCTL: str = "ovs-vsctl"
 TEST: str = "test"
+TIMEOUT: str = "timeout"
 NFTABLES: str = "nft"
 
 COMMON_REQUIREMENTS: List[str] = [
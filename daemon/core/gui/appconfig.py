@@ -37,6 +37,7 @@ TERMINALS: Dict[str, str] = {
     "gnome-terminal": "gnome-terminal --window --",
 }
 EDITORS: List[str] = ["$EDITOR", "vim", "emacs", "gedit", "nano", "vi"]
+DEFAULT_FRAME_RATE: int = 30
 
 
 class IndentDumper(yaml.Dumper):
@@ -84,6 +85,7 @@ class PreferencesConfig(yaml.YAMLObject):
         gui3d: str = "/usr/local/bin/std3d.sh",
         width: int = 1000,
         height: int = 750,
+        frame_rate: int = DEFAULT_FRAME_RATE,
     ) -> None:
         self.theme: str = theme
         self.editor: str = editor
@@ -91,6 +93,7 @@ class PreferencesConfig(yaml.YAMLObject):
         self.gui3d: str = gui3d
         self.width: int = width
         self.height: int = height
+        self.frame_rate: int = frame_rate
 
 
 class LocationConfig(yaml.YAMLObject):
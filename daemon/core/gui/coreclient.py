@@ -41,6 +41,7 @@ from core.gui.appconfig import XMLS_PATH, CoreServer, Observer
 from core.gui.dialogs.emaneinstall import EmaneInstallDialog
 from core.gui.dialogs.mobilityplayer import MobilityPlayer
 from core.gui.dialogs.sessions import SessionsDialog
+from core.gui.eventbuffer import EventBuffer
 from core.gui.graph.edges import CanvasEdge
 from core.gui.graph.node import CanvasNode
 from core.gui.interface import InterfaceManager
@@ -94,6 +95,7 @@ class CoreClient:
         self.handling_throughputs: Optional[grpc.Future] = None
         self.handling_cpu_usage: Optional[grpc.Future] = None
         self.handling_events: Optional[grpc.Future] = None
+        self.event_buffer: EventBuffer = EventBuffer(app)
 
     @property
     def client(self) -> client.CoreGrpcClient:
@@ -129,6 +131,7 @@ class CoreClient:
         # clear streams
         self.cancel_throughputs()
         self.cancel_events()
+        self.event_buffer.clear()
 
     def close_mobility_players(self) -> None:
         for mobility_player in self.mobility_players.values():
@@ -160,7 +163,7 @@ class CoreClient:
             )
             return
         if event.link_event:
-            self.app.after(0, self.handle_link_event, event.link_event)
+            self.event_buffer.add_link_event(event.link_event)
         elif event.session_event:
             logger.info("session event: %s", event)
             session_event = event.session_event
@@ -179,7 +182,7 @@ class CoreClient:
             else:
                 logger.warning("unknown session event: %s", session_event)
         elif event.node_event:
-            self.app.after(0, self.handle_node_event, event.node_event)
+            self.event_buffer.add_node_event(event.node_event)
         elif event.config_event:
             logger.info("config event: %s", event)
         elif event.exception_event:
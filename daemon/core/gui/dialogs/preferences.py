@@ -26,6 +26,8 @@ class PreferencesDialog(Dialog):
         self.theme: tk.StringVar = tk.StringVar(value=preferences.theme)
         self.terminal: tk.StringVar = tk.StringVar(value=preferences.terminal)
         self.gui3d: tk.StringVar = tk.StringVar(value=preferences.gui3d)
+        frame_rate = getattr(preferences, "frame_rate", appconfig.DEFAULT_FRAME_RATE)
+        self.frame_rate: tk.IntVar = tk.IntVar(value=frame_rate)
         self.draw()
 
     def draw(self) -> None:
@@ -67,11 +69,16 @@ class PreferencesDialog(Dialog):
         entry = ttk.Entry(frame, textvariable=self.gui3d)
         entry.grid(row=3, column=1, sticky=tk.EW)
 
-        label = ttk.Label(frame, text="Scaling")
+        label = ttk.Label(frame, text="Frame Rate")
         label.grid(row=4, column=0, pady=PADY, padx=PADX, sticky=tk.W)
+        entry = validation.PositiveIntEntry(frame, textvariable=self.frame_rate)
+        entry.grid(row=4, column=1, sticky=tk.EW)
+
+        label = ttk.Label(frame, text="Scaling")
+        label.grid(row=5, column=0, pady=PADY, padx=PADX, sticky=tk.W)
 
         scale_frame = ttk.Frame(frame)
-        scale_frame.grid(row=4, column=1, sticky=tk.EW)
+        scale_frame.grid(row=5, column=1, sticky=tk.EW)
         scale_frame.columnconfigure(0, weight=1)
         scale = ttk.Scale(
             scale_frame,
@@ -113,6 +120,7 @@ class PreferencesDialog(Dialog):
         preferences.editor = self.editor.get()
         preferences.gui3d = self.gui3d.get()
         preferences.theme = self.theme.get()
+        preferences.frame_rate = self.frame_rate.get() or appconfig.DEFAULT_FRAME_RATE
         self.gui_scale.set(round(self.gui_scale.get(), 2))
         app_scale = self.gui_scale.get()
         self.app.guiconfig.scale = app_scale
@@ -0,0 +1,129 @@
+"""
+Buffers node and link events received from the server, applying them to the
+canvas once per frame. Node positions are coalesced per node, wireless links are
+coalesced per link, and each edge is redrawn at most once per frame.
+"""
+import logging
+import threading
+from typing import TYPE_CHECKING, Dict, List, Optional, Set, Union
+
+from core.api.grpc.wrappers import LinkEvent, LinkType, MessageType, NodeEvent
+from core.gui.appconfig import DEFAULT_FRAME_RATE
+from core.gui.graph.edges import create_wireless_token
+
+logger = logging.getLogger(__name__)
+
+if TYPE_CHECKING:
+    from core.gui.app import Application
+    from core.gui.graph.edges import Edge
+    from core.gui.graph.node import CanvasNode
+
+
+class EventBuffer:
+    def __init__(self, app: "Application") -> None:
+        self.app: "Application" = app
+        self.lock: threading.Lock = threading.Lock()
+        self.events: List[Union[NodeEvent, LinkEvent]] = []
+        self.positions: Dict[int, NodeEvent] = {}
+        self.wireless: Dict[str, LinkEvent] = {}
+        self.scheduled: bool = False
+
+    def frame_delay(self) -> int:
+        preferences = self.app.guiconfig.preferences
+        frame_rate = getattr(preferences, "frame_rate", DEFAULT_FRAME_RATE)
+        frame_rate = frame_rate if frame_rate > 0 else DEFAULT_FRAME_RATE
+        return max(int(1000 / frame_rate), 1)
+
+    def _schedule(self) -> None:
+        if not self.scheduled:
+            self.scheduled = True
+            self.app.after(self.frame_delay(), self.flush)
+
+    def add_node_event(self, event: NodeEvent) -> None:
+        with self.lock:
+            if event.message_type == MessageType.NONE:
+                self.positions[event.node.id] = event
+            else:
+                # positions received before an add or delete are applied first
+                self._flush_position(event.node.id)
+                self.events.append(event)
+            self._schedule()
+
+    def add_link_event(self, event: LinkEvent) -> None:
+        with self.lock:
+            if event.link.type == LinkType.WIRELESS:
+                link = event.link
+                network_id = link.network_id if link.network_id else None
+                token = create_wireless_token(link.node1_id, link.node2_id, network_id)
+                current = self.wireless.get(token)
+                if (
+                    current
+                    and current.message_type == MessageType.ADD
+                    and event.message_type == MessageType.NONE
+                ):
+                    event = LinkEvent(MessageType.ADD, event.link)
+                self.wireless[token] = event
+            else:
+                self.events.append(event)
+            self._schedule()
+
+    def _flush_position(self, node_id: int) -> None:
+        event = self.positions.pop(node_id, None)
+        if event:
+            self.events.append(event)
+
+    def clear(self) -> None:
+        with self.lock:
+            self.events.clear()
+            self.positions.clear()
+            self.wireless.clear()
+
+    def flush(self) -> None:
+        with self.lock:
+            events, self.events = self.events, []
+            positions, self.positions = self.positions, {}
+            wireless, self.wireless = self.wireless, {}
+            self.scheduled = False
+        if not self.app.core.session:
+            return
+        moved = {}
+        for event in events:
+            if isinstance(event, NodeEvent) and event.message_type == MessageType.NONE:
+                self.move_node(event, moved)
+                continue
+            # redraw moved edges before nodes or edges are added or removed
+            self.move_edges(moved)
+            moved.clear()
+            if isinstance(event, LinkEvent):
+                self.app.core.handle_link_event(event)
+            else:
+                self.app.core.handle_node_event(event)
+        for event in positions.values():
+            self.move_node(event, moved)
+        self.move_edges(moved)
+        for event in wireless.values():
+            link = event.link
+            canvas_nodes = self.app.core.canvas_nodes
+            if link.node1_id not in canvas_nodes or link.node2_id not in canvas_nodes:
+                continue
+            self.app.core.handle_link_event(event)
+        # cull or restore items moved or added relative to the view
+        for canvas in self.app.manager.all():
+            canvas.schedule_view()
+
+    def move_node(
+        self, event: NodeEvent, moved: Dict["Edge", Set["CanvasNode"]]
+    ) -> None:
+        node = event.node
+        canvas_node: Optional["CanvasNode"] = self.app.core.canvas_nodes.get(node.id)
+        if canvas_node is None:
+            return
+        canvas_node.move(node.position.x, node.position.y, move_edges=False)
+        if node.icon and node.icon != canvas_node.core_node.icon:
+            canvas_node.update_icon(node.icon)
+        for edge in canvas_node.edges | canvas_node.wireless_edges:
+            moved.setdefault(edge, set()).add(canvas_node)
+
+    def move_edges(self, moved: Dict["Edge", Set["CanvasNode"]]) -> None:
+        for edge, nodes in moved.items():
+            edge.move_nodes(nodes)
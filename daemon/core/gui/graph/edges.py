@@ -2,7 +2,7 @@ import functools
 import logging
 import math
 import tkinter as tk
-from typing import TYPE_CHECKING, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Optional, Set, Tuple, Union
 
 from core.api.grpc.wrappers import Interface, Link
 from core.gui import themes
@@ -206,7 +206,7 @@ class Edge:
             *src_pos,
             *arc_pos,
             *dst_pos,
-            smooth=True,
+            smooth=not canvas.low_detail,
             tags=self.tag,
             width=self.scaled_width(),
             fill=self.color,
@@ -328,6 +328,14 @@ class Edge:
         else:
             self.move_dst()
 
+    def move_nodes(self, nodes: Set["CanvasNode"]) -> None:
+        if len(nodes) == 1 or self.id2 or self.has_shadows():
+            for node in nodes:
+                self.move_node(node)
+        elif self.id:
+            # both nodes moved, redraw edge once between their current positions
+            self.moved(self.src.position(), self.dst.position())
+
     def move_shadow(self, node: "ShadowNode") -> None:
         if self.src_shadow == node:
             self.move_src_shadow()
@@ -423,11 +431,17 @@ class Edge:
             self.src_shadow.hide()
         if self.dst_shadow:
             self.dst_shadow.hide()
+        self.src.canvas.keep_hidden(
+            self.id, self.src_label, self.dst_label, self.middle_label
+        )
         self.src.canvas.itemconfigure(self.id, state=tk.HIDDEN)
         self.src.canvas.itemconfigure(self.src_label, state=tk.HIDDEN)
         self.src.canvas.itemconfigure(self.dst_label, state=tk.HIDDEN)
         self.src.canvas.itemconfigure(self.middle_label, state=tk.HIDDEN)
         if self.id2:
+            self.dst.canvas.keep_hidden(
+                self.id2, self.src_label2, self.dst_label2, self.middle_label2
+            )
             self.dst.canvas.itemconfigure(self.id2, state=tk.HIDDEN)
             self.dst.canvas.itemconfigure(self.src_label2, state=tk.HIDDEN)
             self.dst.canvas.itemconfigure(self.dst_label2, state=tk.HIDDEN)
@@ -30,6 +30,12 @@ ZOOM_OUT: float = 0.9
 MOVE_NODE_MODES: Set[GraphMode] = {GraphMode.NODE, GraphMode.SELECT}
 MOVE_SHAPE_MODES: Set[GraphMode] = {GraphMode.ANNOTATION, GraphMode.SELECT}
 BACKGROUND_COLOR: str = "#cccccc"
+# zoom ratio below which edges are drawn unsmoothed and labels are hidden
+DETAIL_RATIO: float = 0.5
+# fraction of the visible area kept drawn around it, to avoid popping in on pans
+VIEW_MARGIN: float = 0.5
+# delay in ms between updates of drawn items after the view changes
+VIEW_DELAY: int = 100
 
 
 class CanvasGraph(tk.Canvas):
@@ -66,6 +72,8 @@ class CanvasGraph(tk.Canvas):
         self.offset: Tuple[int, int] = (0, 0)
         self.cursor: Tuple[int, int] = (0, 0)
         self.to_copy: List[CanvasNode] = []
+        self.low_detail: bool = False
+        self.view_scheduled: bool = False
 
         # background related
         self.wallpaper_id: Optional[int] = None
@@ -118,7 +126,68 @@ class CanvasGraph(tk.Canvas):
         self.bind("<Button-4>", lambda e: self.zoom(e, ZOOM_IN))
         self.bind("<Button-5>", lambda e: self.zoom(e, ZOOM_OUT))
         self.bind("<ButtonPress-3>", lambda e: self.scan_mark(e.x, e.y))
-        self.bind("<B3-Motion>", lambda e: self.scan_dragto(e.x, e.y, gain=1))
+        self.bind("<B3-Motion>", self.scan_drag)
+        self.bind("<Configure>", lambda e: self.schedule_view())
+
+    def scan_drag(self, event: tk.Event) -> None:
+        self.scan_dragto(event.x, event.y, gain=1)
+        self.schedule_view()
+
+    def schedule_view(self) -> None:
+        if not self.view_scheduled:
+            self.view_scheduled = True
+            self.after(VIEW_DELAY, self.update_view)
+
+    def uncull(self) -> None:
+        """
+        Restore items hidden for being outside of the view or for low detail.
+        """
+        self.itemconfigure(tags.CULLED, state=tk.NORMAL)
+        self.dtag(tags.CULLED, tags.CULLED)
+
+    def keep_hidden(self, *item_ids: Optional[int]) -> None:
+        """
+        Stop tracking items as culled, so they remain hidden when culled items are
+        restored.
+        """
+        for item_id in item_ids:
+            if item_id is not None:
+                self.dtag(item_id, tags.CULLED)
+
+    def update_view(self) -> None:
+        """
+        Update level of detail for the current zoom and hide items far outside of
+        the visible area, tagging them as culled so they can be restored. Only
+        items currently shown are culled, leaving items hidden otherwise untouched.
+        """
+        self.view_scheduled = False
+        self.uncull()
+        low_detail = self.ratio < DETAIL_RATIO
+        if low_detail != self.low_detail:
+            self.low_detail = low_detail
+            self.itemconfigure(tags.EDGE, smooth=not low_detail)
+        if low_detail:
+            for tag in tags.LABEL_TAGS:
+                self.addtag_withtag(tags.CULLED, tag)
+        width, height = self.winfo_width(), self.winfo_height()
+        if width > 1 and height > 1:
+            margin_x, margin_y = width * VIEW_MARGIN, height * VIEW_MARGIN
+            x1 = self.canvasx(0) - margin_x
+            y1 = self.canvasy(0) - margin_y
+            x2 = self.canvasx(width) + margin_x
+            y2 = self.canvasy(height) + margin_y
+            self.dtag(tags.VIEW, tags.VIEW)
+            self.addtag_overlapping(tags.VIEW, x1, y1, x2, y2)
+            for tag in tags.CULL_TAGS:
+                self.addtag_withtag(tags.CULLED, f"{tag}&&!{tags.VIEW}")
+        # overlapping items only include those not hidden
+        bbox = self.bbox(tk.ALL)
+        if not bbox:
+            return
+        self.dtag(tags.SHOWN, tags.SHOWN)
+        self.addtag_overlapping(tags.SHOWN, *bbox)
+        self.dtag(f"!{tags.SHOWN}", tags.CULLED)
+        self.itemconfigure(tags.CULLED, state=tk.HIDDEN)
 
     def get_shadow(self, node: CanvasNode) -> ShadowNode:
         shadow_node = self.shadow_core_nodes.get(node.core_node.id)
@@ -326,6 +395,7 @@ class CanvasGraph(tk.Canvas):
         for node in self.nodes.values():
             if node.hidden:
                 node.show()
+        self.schedule_view()
 
     def zoom(self, event: tk.Event, factor: float = None) -> None:
         if not factor:
@@ -343,6 +413,7 @@ class CanvasGraph(tk.Canvas):
         self.app.statusbar.set_zoom(self.ratio)
         if self.wallpaper:
             self.redraw_wallpaper()
+        self.schedule_view()
 
     def click_press(self, event: tk.Event) -> None:
         """
@@ -621,6 +692,7 @@ class CanvasGraph(tk.Canvas):
         self.delete(tags.GRIDLINE)
         self.draw_grid()
         self.app.manager.show_grid.click_handler()
+        self.schedule_view()
 
     def redraw_wallpaper(self) -> None:
         if self.adjust_to_dim.get():
@@ -640,6 +712,9 @@ class CanvasGraph(tk.Canvas):
         self.organize()
 
     def organize(self) -> None:
+        # organized once after drawing many items at a time
+        if self.manager.organize_deferred:
+            return
         for tag in tags.ORGANIZE_TAGS:
             self.tag_raise(tag)
 
@@ -1,5 +1,6 @@
 import json
 import logging
+import time
 import tkinter as tk
 from copy import deepcopy
 from tkinter import BooleanVar, messagebox, ttk
@@ -38,12 +39,14 @@ class ShowVar(BooleanVar):
         return tk.NORMAL if self.get() else tk.HIDDEN
 
     def click_handler(self) -> None:
+        self.manager.uncull()
         for canvas in self.manager.all():
             canvas.itemconfigure(self.tag, state=self.state())
 
 
 class ShowNodeLabels(ShowVar):
     def click_handler(self) -> None:
+        self.manager.uncull()
         state = self.state()
         for canvas in self.manager.all():
             for node in canvas.nodes.values():
@@ -53,6 +56,7 @@ class ShowNodeLabels(ShowVar):
 
 class ShowLinks(ShowVar):
     def click_handler(self) -> None:
+        self.manager.uncull()
         for edge in self.manager.edges.values():
             if not edge.hidden:
                 edge.check_visibility()
@@ -60,6 +64,7 @@ class ShowLinks(ShowVar):
 
 class ShowLinkLabels(ShowVar):
     def click_handler(self) -> None:
+        self.manager.uncull()
         state = self.state()
         for edge in self.manager.edges.values():
             if not edge.hidden:
@@ -79,6 +84,7 @@ class CanvasManager:
         self.annotation_type: Optional[ShapeType] = None
         self.node_draw: Optional[NodeDraw] = None
         self.canvases: Dict[int, CanvasGraph] = {}
+        self.organize_deferred: bool = False
 
         # global edge management
         self.edges: Dict[str, CanvasEdge] = {}
@@ -234,7 +240,35 @@ class CanvasManager:
         # draw session
         self.draw_session(session)
 
+    def uncull(self) -> None:
+        """
+        Restore all culled items, allowing their visibility to be changed, and
+        cull them again once the view updates.
+        """
+        for canvas in self.all():
+            canvas.uncull()
+            canvas.schedule_view()
+
     def draw_session(self, session: Session) -> None:
+        start = time.perf_counter()
+        # canvases are organized once, after all nodes and links are drawn
+        self.organize_deferred = True
+        try:
+            self._draw_session(session)
+        finally:
+            self.organize_deferred = False
+        # organize canvas order and update drawn items for the current view
+        for canvas in self.canvases.values():
+            canvas.organize()
+            canvas.schedule_view()
+        logger.info(
+            "drew session nodes(%s) links(%s) in %.3fs",
+            len(session.nodes),
+            len(session.links),
+            time.perf_counter() - start,
+        )
+
+    def _draw_session(self, session: Session) -> None:
         # draw canvas configurations and shapes
         self.parse_metadata_canvas(session.metadata)
         self.parse_metadata_shapes(session.metadata)
@@ -261,10 +295,6 @@ class CanvasManager:
             else:
                 self.add_wired_edge(node1, node2, link)
 
-        # organize canvas order
-        for canvas in self.canvases.values():
-            canvas.organize()
-
         # parse metada for edge configs and hidden nodes
         self.parse_metadata_edges(session.metadata)
         self.parse_metadata_hidden(session.metadata)
@@ -150,14 +150,20 @@ class CanvasNode:
         new_y = self._get_label_y()
         self.canvas.move(self.text_id, 0, new_y - prev_y)
 
-    def move(self, x: float, y: float) -> None:
+    def move(self, x: float, y: float, move_edges: bool = True) -> None:
         x, y = self.canvas.get_scaled_coords(x, y)
         current_x, current_y = self.position()
         x_offset = x - current_x
         y_offset = y - current_y
-        self.motion(x_offset, y_offset, update=False)
+        self.motion(x_offset, y_offset, update=False, move_edges=move_edges)
 
-    def motion(self, x_offset: float, y_offset: float, update: bool = True) -> None:
+    def motion(
+        self,
+        x_offset: float,
+        y_offset: float,
+        update: bool = True,
+        move_edges: bool = True,
+    ) -> None:
         original_position = self.position()
         self.canvas.move(self.id, x_offset, y_offset)
 
@@ -175,11 +181,12 @@ class CanvasNode:
         for antenna_id in self.antennas:
             self.canvas.move(antenna_id, x_offset, y_offset)
 
-        # move edges
-        for edge in self.edges:
-            edge.move_node(self)
-        for edge in self.wireless_edges:
-            edge.move_node(self)
+        # move edges, unless they will be moved together later
+        if move_edges:
+            for edge in self.edges:
+                edge.move_node(self)
+            for edge in self.wireless_edges:
+                edge.move_node(self)
 
         # set actual coords for node and update core is running
         pos = self.position()
@@ -429,6 +436,7 @@ class CanvasNode:
 
     def hide(self) -> None:
         self.hidden = True
+        self.canvas.keep_hidden(self.id, self.text_id, *self.antennas)
         self.canvas.itemconfig(self.id, state=tk.HIDDEN)
         self.canvas.itemconfig(self.text_id, state=tk.HIDDEN)
         for antenna in self.antennas:
@@ -563,6 +571,7 @@ class ShadowNode:
         self.canvas.delete(self.text_id)
 
     def hide(self) -> None:
+        self.canvas.keep_hidden(self.id, self.text_id)
         self.canvas.itemconfig(self.id, state=tk.HIDDEN)
         self.canvas.itemconfig(self.text_id, state=tk.HIDDEN)
 
@@ -15,6 +15,9 @@ WALLPAPER: str = "wallpaper"
 SELECTION: str = "selectednodes"
 MARKER: str = "marker"
 HIDDEN: str = "hidden"
+CULLED: str = "culled"
+VIEW: str = "view"
+SHOWN: str = "shown"
 ORGANIZE_TAGS: List[str] = [
     WALLPAPER,
     GRIDLINE,
@@ -42,3 +45,5 @@ RESET_TAGS: List[str] = [
     SHAPE_TEXT,
     MARKER,
 ]
+CULL_TAGS: List[str] = [NODE, NODE_LABEL, ANTENNA, EDGE, WIRELESS_EDGE, LINK_LABEL]
+LABEL_TAGS: List[str] = [NODE_LABEL, LINK_LABEL]
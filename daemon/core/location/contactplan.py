@@ -0,0 +1,379 @@
+"""
+Contact plans: link up/down times between node pairs computed ahead of time from
+piecewise linear node trajectories, as defined by mobility script waypoints.
+"""
+
+import bisect
+import hashlib
+import json
+import logging
+import math
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+Point = Tuple[float, float, Optional[float]]
+PLAN_SUFFIX: str = ".plan"
+
+
+@dataclass(frozen=True)
+class Segment:
+    """
+    Linear movement between two points over a time span.
+    """
+
+    start: float
+    end: float
+    p1: Point
+    p2: Point
+
+    def position(self, t: float) -> Point:
+        """
+        Position along the segment at a given time.
+
+        :param t: time to get position for
+        :return: position
+        """
+        if self.end <= self.start or t >= self.end:
+            return self.p2
+        if t <= self.start:
+            return self.p1
+        f = (t - self.start) / (self.end - self.start)
+        x = self.p1[0] + (self.p2[0] - self.p1[0]) * f
+        y = self.p1[1] + (self.p2[1] - self.p1[1]) * f
+        return x, y, self.p1[2]
+
+    def velocity(self) -> Tuple[float, float]:
+        """
+        Velocity along the segment.
+
+        :return: x and y velocity
+        """
+        duration = self.end - self.start
+        if duration <= 0:
+            return 0.0, 0.0
+        return (
+            (self.p2[0] - self.p1[0]) / duration,
+            (self.p2[1] - self.p1[1]) / duration,
+        )
+
+
+class Trajectory:
+    """
+    Piecewise linear node trajectory, stationary before its first and after its
+    last segment.
+    """
+
+    def __init__(self, initial: Point, segments: List[Segment]) -> None:
+        self.initial: Point = initial
+        self.segments: List[Segment] = segments
+        self.starts: List[float] = [x.start for x in segments]
+
+    @property
+    def end(self) -> float:
+        """
+        Time the node reaches its final position.
+
+        :return: end time
+        """
+        return self.segments[-1].end if self.segments else 0.0
+
+    def times(self) -> List[float]:
+        """
+        Times the trajectory changes direction or speed.
+
+        :return: sorted segment boundary times
+        """
+        times = set()
+        for segment in self.segments:
+            times.add(segment.start)
+            times.add(segment.end)
+        return sorted(times)
+
+    def segment(self, t: float) -> Optional[Segment]:
+        """
+        Retrieve the segment the node is on at a given time, favoring the latest
+        segment starting at that time.
+
+        :param t: time to get segment for
+        :return: segment, None when before the first segment
+        """
+        index = bisect.bisect_right(self.starts, t) - 1
+        if index < 0:
+            return None
+        return self.segments[index]
+
+    def position(self, t: float) -> Point:
+        """
+        Position of the node at a given time.
+
+        :param t: time to get position for
+        :return: position
+        """
+        segment = self.segment(t)
+        if segment is None:
+            return self.initial
+        return segment.position(t)
+
+
+def build_trajectory(
+    initial: Point, waypoints: Iterable[Tuple[float, Point, float]]
+) -> Trajectory:
+    """
+    Build a node trajectory from waypoints, following the same movement rules
+    as tick based waypoint mobility: at a waypoint time a node heads in a
+    straight line from its current position to the waypoint destination at the
+    waypoint speed, with a speed of zero being an instantaneous move.
+
+    :param initial: initial position of the node
+    :param waypoints: waypoint time, destination, and speed, sorted by time
+    :return: node trajectory
+    """
+    segments = []
+    position = initial
+    for wp_time, coords, speed in waypoints:
+        if segments:
+            last = segments[-1]
+            if wp_time < last.end:
+                # change of direction before reaching the previous destination
+                position = last.position(wp_time)
+                segments[-1] = Segment(last.start, wp_time, last.p1, position)
+            else:
+                position = last.p2
+        if speed == 0:
+            target = coords
+            end = wp_time
+        else:
+            target = (coords[0], coords[1], position[2])
+            distance = math.hypot(target[0] - position[0], target[1] - position[1])
+            end = wp_time + distance / speed
+        segments.append(Segment(wp_time, end, position, target))
+    return Trajectory(initial, segments)
+
+
+def _range_state(
+    rx: float, ry: float, vx: float, vy: float, dz: float, s: float, radius: float
+) -> bool:
+    x = rx + vx * s
+    y = ry + vy * s
+    return x * x + y * y + dz * dz <= radius * radius
+
+
+def compute_contacts(
+    trajectory1: Trajectory, trajectory2: Trajectory, radius: float
+) -> Tuple[bool, List[Tuple[float, bool]]]:
+    """
+    Compute the times two nodes come in and out of range of each other.
+
+    :param trajectory1: trajectory of node one
+    :param trajectory2: trajectory of node two
+    :param radius: range for being linked
+    :return: initial linked state, and sorted times and new linked states
+    """
+    times = sorted(set(trajectory1.times()) | set(trajectory2.times()))
+    end = times[-1] if times else 0.0
+    # add a trailing stationary interval to capture final positions
+    times.append(end + 1.0)
+    initial = None
+    state = None
+    changes = []
+    start = 0.0
+    for t in times:
+        if t < start:
+            continue
+        if t == start and state is not None:
+            continue
+        segment1 = trajectory1.segment(start)
+        segment2 = trajectory2.segment(start)
+        p1 = trajectory1.position(start)
+        p2 = trajectory2.position(start)
+        v1 = segment1.velocity() if segment1 and start < segment1.end else (0, 0)
+        v2 = segment2.velocity() if segment2 and start < segment2.end else (0, 0)
+        rx, ry = p1[0] - p2[0], p1[1] - p2[1]
+        vx, vy = v1[0] - v2[0], v1[1] - v2[1]
+        dz = 0.0
+        if p1[2] is not None and p2[2] is not None:
+            dz = p1[2] - p2[2]
+        length = t - start
+        # solve |r + v*s|^2 = radius^2 for crossing points within the interval
+        points = [0.0]
+        a = vx * vx + vy * vy
+        if a > 0 and length > 0:
+            b = 2 * (rx * vx + ry * vy)
+            c = rx * rx + ry * ry + dz * dz - radius * radius
+            discriminant = b * b - 4 * a * c
+            if discriminant >= 0:
+                root = math.sqrt(discriminant)
+                for s in sorted(((-b - root) / (2 * a), (-b + root) / (2 * a))):
+                    if 0 < s < length:
+                        points.append(s)
+        points.append(length)
+        for index in range(len(points) - 1):
+            s1, s2 = points[index], points[index + 1]
+            if s2 > s1:
+                s = (s1 + s2) / 2
+            elif length == 0:
+                s = 0.0
+            else:
+                continue
+            linked = _range_state(rx, ry, vx, vy, dz, s, radius)
+            if state is None:
+                initial = state = linked
+            elif linked != state:
+                state = linked
+                changes.append((start + s1, linked))
+        start = t
+    return bool(initial), changes
+
+
+@dataclass(frozen=True)
+class Contact:
+    """
+    Scheduled link state change between two nodes.
+    """
+
+    time: float
+    node1_id: int
+    node2_id: int
+    linked: bool
+
+
+class ContactPlan:
+    """
+    Sorted link state changes for all node pairs, along with node trajectories
+    for computing positions.
+    """
+
+    def __init__(
+        self, trajectories: Dict[int, Trajectory], contacts: List[Contact], key: str
+    ) -> None:
+        self.trajectories: Dict[int, Trajectory] = trajectories
+        self.contacts: List[Contact] = contacts
+        self.key: str = key
+
+    @property
+    def end(self) -> float:
+        """
+        Time the last node reaches its final position.
+
+        :return: end time
+        """
+        return max((x.end for x in self.trajectories.values()), default=0.0)
+
+    def positions(self, t: float) -> Dict[int, Point]:
+        """
+        Positions for all nodes at a given time.
+
+        :param t: time to get positions for
+        :return: node ids mapped to positions
+        """
+        return {x: y.position(t) for x, y in self.trajectories.items()}
+
+
+def plan_key(
+    initial: Dict[int, Point],
+    waypoints: Dict[int, List[Tuple[float, Point, float]]],
+    radius: float,
+) -> str:
+    """
+    Create a key identifying the inputs of a contact plan.
+
+    :param initial: node ids mapped to initial positions
+    :param waypoints: node ids mapped to waypoints
+    :param radius: range for being linked
+    :return: plan key
+    """
+    data = {
+        "initial": sorted((x, list(y)) for x, y in initial.items()),
+        "waypoints": sorted((x, [list(w) for w in y]) for x, y in waypoints.items()),
+        "range": radius,
+    }
+    data = json.dumps(data, sort_keys=True).encode("utf-8")
+    return hashlib.sha256(data).hexdigest()
+
+
+def create_plan(
+    initial: Dict[int, Point],
+    waypoints: Dict[int, List[Tuple[float, Point, float]]],
+    radius: float,
+) -> ContactPlan:
+    """
+    Create a contact plan for all pairs of the provided nodes.
+
+    :param initial: node ids mapped to initial positions, for all nodes
+    :param waypoints: node ids mapped to waypoints, sorted by time
+    :param radius: range for being linked
+    :return: contact plan
+    """
+    trajectories = {}
+    for node_id, position in initial.items():
+        trajectories[node_id] = build_trajectory(position, waypoints.get(node_id, []))
+    contacts = []
+    node_ids = sorted(trajectories)
+    for index, node1_id in enumerate(node_ids):
+        for node2_id in node_ids[index + 1 :]:
+            trajectory1 = trajectories[node1_id]
+            trajectory2 = trajectories[node2_id]
+            if not trajectory1.segments and not trajectory2.segments:
+                continue
+            _, changes = compute_contacts(trajectory1, trajectory2, radius)
+            for t, linked in changes:
+                contacts.append(Contact(t, node1_id, node2_id, linked))
+    contacts.sort(key=lambda x: (x.time, x.node1_id, x.node2_id))
+    key = plan_key(initial, waypoints, radius)
+    return ContactPlan(trajectories, contacts, key)
+
+
+def plan_path(script_path: Path) -> Path:
+    """
+    Path of the contact plan cache file for a mobility script.
+
+    :param script_path: path to mobility script
+    :return: path to plan cache file
+    """
+    return script_path.with_name(script_path.name + PLAN_SUFFIX)
+
+
+def load_plan(
+    script_path: Path,
+    initial: Dict[int, Point],
+    waypoints: Dict[int, List[Tuple[float, Point, float]]],
+    radius: float,
+) -> ContactPlan:
+    """
+    Load a contact plan from the cache file next to a mobility script, creating
+    and caching a new plan when missing or created from different inputs.
+
+    :param script_path: path to mobility script
+    :param initial: node ids mapped to initial positions, for all nodes
+    :param waypoints: node ids mapped to waypoints, sorted by time
+    :param radius: range for being linked
+    :return: contact plan
+    """
+    path = plan_path(script_path)
+    key = plan_key(initial, waypoints, radius)
+    try:
+        data = json.loads(path.read_text())
+        if data.get("key") == key:
+            trajectories = {}
+            for node_id, position in initial.items():
+                node_waypoints = waypoints.get(node_id, [])
+                trajectories[node_id] = build_trajectory(position, node_waypoints)
+            contacts = [Contact(*x) for x in data["contacts"]]
+            logger.info("loaded contact plan: %s", path)
+            return ContactPlan(trajectories, contacts, key)
+    except (OSError, ValueError, TypeError, KeyError):
+        pass
+    plan = create_plan(initial, waypoints, radius)
+    data = {
+        "key": plan.key,
+        "contacts": [[x.time, x.node1_id, x.node2_id, x.linked] for x in plan.contacts],
+    }
+    try:
+        path.write_text(json.dumps(data))
+        logger.info("saved contact plan: %s", path)
+    except OSError:
+        logger.warning("unable to save contact plan: %s", path)
+    return plan
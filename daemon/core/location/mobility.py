@@ -27,6 +27,7 @@ from core.emulator.data import EventData, LinkData, LinkOptions
 from core.emulator.enumerations import EventTypes, LinkTypes, MessageFlags, RegisterTlvs
 from core.errors import CoreError
 from core.executables import BASH
+from core.location.contactplan import Contact, ContactPlan, load_plan
 from core.nodes.base import CoreNode
 from core.nodes.interface import CoreInterface
 from core.nodes.network import WlanNode
@@ -257,6 +258,15 @@ class WirelessModel(ConfigurableOptions):
         """
         raise NotImplementedError
 
+    def remove_iface(self, iface: CoreInterface) -> None:
+        """
+        Remove state tracked for a network interface that has left the network.
+
+        :param iface: network interface removed
+        :return: nothing
+        """
+        pass
+
     def update_config(self, config: Dict[str, str]) -> None:
         """
         For run-time updates of model config. Returns True when position callback and
@@ -283,6 +293,13 @@ class BasicRangeModel(WirelessModel):
         ConfigInt(id="delay", default="5000", label="transmission delay (usec)"),
         ConfigFloat(id="error", default="0.0", label="loss (%)"),
         ConfigBool(id="promiscuous", default="0", label="promiscuous mode"),
+        ConfigInt(
+            id="inner_range", default="0", label="link up range, 0 for range (pixels)"
+        ),
+        ConfigInt(
+            id="outer_range", default="0", label="link down range, 0 for range (pixels)"
+        ),
+        ConfigInt(id="dwell", default="0", label="minimum link state dwell time (ms)"),
     ]
 
     @classmethod
@@ -301,12 +318,19 @@ class BasicRangeModel(WirelessModel):
         self.wlan: WlanNode = session.get_node(_id, WlanNode)
         self.iface_to_pos: Dict[CoreInterface, Tuple[float, float, float]] = {}
         self.iface_lock: threading.Lock = threading.Lock()
+        self.position_sequence: int = 0
         self.range: int = 0
         self.bw: Optional[int] = None
         self.delay: Optional[int] = None
         self.loss: Optional[float] = None
         self.jitter: Optional[int] = None
         self.promiscuous: bool = False
+        self.inner_range: int = 0
+        self.outer_range: int = 0
+        self.dwell: int = 0
+        self.changed: Dict[Tuple[CoreInterface, CoreInterface], float] = {}
+        self.pruned: float = 0.0
+        self.suppressed: Dict[str, int] = {"hysteresis": 0, "dwell": 0}
 
     def setlinkparams(self) -> None:
         """
@@ -363,16 +387,89 @@ class BasicRangeModel(WirelessModel):
         :return: nothing
         """
         with self.iface_lock:
+            self._update_positions()
+            pending = set(moved_ifaces)
             while len(moved_ifaces):
                 iface = moved_ifaces.pop()
-                nx, ny, nz = iface.node.getposition()
-                if iface in self.iface_to_pos:
-                    self.iface_to_pos[iface] = (nx, ny, nz)
+                pending.discard(iface)
                 for iface2 in self.iface_to_pos:
-                    if iface2 in moved_ifaces:
+                    if iface2 in pending:
                         continue
                     self.calclink(iface, iface2)
 
+    def update_positions(self, moved_ifaces: List[CoreInterface]) -> None:
+        """
+        Update tracked positions from node.position, without re-calculating links.
+        Used when links are being managed externally, such as by a contact plan.
+
+        :param moved_ifaces: moved network interfaces
+        :return: nothing
+        """
+        with self.iface_lock:
+            self._update_positions()
+
+    def _update_positions(self) -> None:
+        sequence, positions = self.session.positions.changed(self.position_sequence)
+        self.position_sequence = sequence
+        if not positions:
+            return
+        for iface in self.iface_to_pos:
+            position = positions.get(iface.node.position.slot)
+            if position is not None:
+                self.iface_to_pos[iface] = position
+
+    def remove_iface(self, iface: CoreInterface) -> None:
+        """
+        Stop tracking a network interface that has left the wlan, along with the
+        change times of pairs it was part of.
+
+        :param iface: network interface removed
+        :return: nothing
+        """
+        with self.iface_lock:
+            self.iface_to_pos.pop(iface, None)
+            for pair in [x for x in self.changed if iface in x]:
+                self.changed.pop(pair)
+
+    def prune_changed(self, now: float) -> None:
+        """
+        Remove change times older than the dwell time, as those pairs are free to
+        change state again. Runs at most once per dwell time.
+
+        :param now: current monotonic time
+        :return: nothing
+        """
+        if (now - self.pruned) * 1000 < self.dwell:
+            return
+        self.pruned = now
+        for pair, changed in list(self.changed.items()):
+            if (now - changed) * 1000 >= self.dwell:
+                self.changed.pop(pair)
+
+    def set_link(self, iface: CoreInterface, iface2: CoreInterface, link: bool) -> None:
+        """
+        Link or unlink two interfaces, when not already in the desired state,
+        and send the related link/unlink message.
+
+        :param iface: interface one
+        :param iface2: interface two
+        :param link: True to link interfaces, False to unlink
+        :return: nothing
+        """
+        # ordering is important, to keep the wlan._linked dict organized
+        a = min(iface, iface2)
+        b = max(iface, iface2)
+        with self.wlan.linked_lock:
+            linked = self.wlan.is_linked(a, b)
+        if linked and not link:
+            logger.debug("was linked, unlinking")
+            self.wlan.unlink(a, b)
+            self.sendlinkmsg(a, b, unlink=True)
+        elif not linked and link:
+            logger.debug("was not linked, linking")
+            self.wlan.link(a, b)
+            self.sendlinkmsg(a, b)
+
     def calclink(self, iface: CoreInterface, iface2: CoreInterface) -> None:
         """
         Helper used by set_position() and update() to
@@ -392,24 +489,48 @@ class BasicRangeModel(WirelessModel):
             if x2 is None or y2 is None:
                 return
             d = self.calcdistance((x, y, z), (x2, y2, z2))
-            # ordering is important, to keep the wlan._linked dict organized
             a = min(iface, iface2)
             b = max(iface, iface2)
             with self.wlan.linked_lock:
                 linked = self.wlan.is_linked(a, b)
-            if d > self.range:
-                if linked:
-                    logger.debug("was linked, unlinking")
-                    self.wlan.unlink(a, b)
-                    self.sendlinkmsg(a, b, unlink=True)
-            else:
-                if not linked:
-                    logger.debug("was not linked, linking")
-                    self.wlan.link(a, b)
-                    self.sendlinkmsg(a, b)
+            self.set_link(a, b, self.link_decision(a, b, d, linked))
         except KeyError:
             logger.exception("error getting interfaces during calclink")
 
+    def link_decision(
+        self, a: CoreInterface, b: CoreInterface, distance: float, linked: bool
+    ) -> bool:
+        """
+        Decide the link state for an ordered interface pair at a given distance.
+        Unlinked pairs link within the inner range, linked pairs unlink beyond the
+        outer range, and a pair keeps its state for at least the dwell time after
+        changing it. Transitions a plain range check would have made, but were
+        held back, are counted in suppressed.
+
+        :param a: lesser interface of pair
+        :param b: greater interface of pair
+        :param distance: distance between interfaces
+        :param linked: current linked state of pair
+        :return: True if pair should be linked, False otherwise
+        """
+        if linked:
+            link = distance <= (self.outer_range or self.range)
+        else:
+            link = distance <= (self.inner_range or self.range)
+        if link == linked:
+            if (distance <= self.range) != linked:
+                self.suppressed["hysteresis"] += 1
+            return linked
+        if self.dwell:
+            now = time.monotonic()
+            self.prune_changed(now)
+            changed = self.changed.get((a, b))
+            if changed is not None and (now - changed) * 1000 < self.dwell:
+                self.suppressed["dwell"] += 1
+                return linked
+            self.changed[(a, b)] = now
+        return link
+
     @staticmethod
     def calcdistance(
         p1: Tuple[float, float, float], p2: Tuple[float, float, float]
@@ -449,6 +570,20 @@ class BasicRangeModel(WirelessModel):
         elif not self.promiscuous and promiscuous:
             self.wlan.net_client.set_mac_learning(self.wlan.brname, LEARNING_DISABLED)
         self.promiscuous = promiscuous
+        self.inner_range = get_config_int(self.inner_range, config, "inner_range")
+        self.outer_range = get_config_int(self.outer_range, config, "outer_range")
+        self.dwell = get_config_int(self.dwell, config, "dwell")
+        inner_range = self.inner_range or self.range
+        outer_range = self.outer_range or self.range
+        if inner_range > outer_range:
+            logger.warning(
+                "wlan %s inner range(%s) greater than outer range(%s), ignoring both",
+                self.wlan.name,
+                inner_range,
+                outer_range,
+            )
+            self.inner_range = 0
+            self.outer_range = 0
         self.setlinkparams()
 
     def create_link_data(
@@ -864,6 +999,10 @@ class Ns2ScriptedMobility(WayPointMobility):
         ConfigString(id="script_start", label="script file to run upon start"),
         ConfigString(id="script_pause", label="script file to run upon pause"),
         ConfigString(id="script_stop", label="script file to run upon stop"),
+        ConfigBool(id="contact_plan", default="0", label="precompute contact plan"),
+        ConfigInt(
+            id="plan_refresh_ms", default="1000", label="contact plan refresh time (ms)"
+        ),
     ]
 
     @classmethod
@@ -886,6 +1025,11 @@ class Ns2ScriptedMobility(WayPointMobility):
         self.script_start: Optional[str] = None
         self.script_pause: Optional[str] = None
         self.script_stop: Optional[str] = None
+        self.contact_plan: bool = False
+        self.plan_refresh_ms: int = 1000
+        self.plan: Optional[ContactPlan] = None
+        self.plan_index: int = 0
+        self.plan_positions: Dict[int, Tuple[float, float, Optional[float]]] = {}
 
     def update_config(self, config: Dict[str, str]) -> None:
         self.file = Path(config["file"])
@@ -901,6 +1045,8 @@ class Ns2ScriptedMobility(WayPointMobility):
         self.script_start = config["script_start"]
         self.script_pause = config["script_pause"]
         self.script_stop = config["script_stop"]
+        self.contact_plan = config.get("contact_plan", "0") == "1"
+        self.plan_refresh_ms = int(config.get("plan_refresh_ms") or 1000)
         self.readscriptfile()
         self.copywaypoints()
         self.setendtime()
@@ -1070,9 +1216,123 @@ class Ns2ScriptedMobility(WayPointMobility):
 
         :return: nothing
         """
+        self.plan = None
+        if self.contact_plan:
+            if isinstance(self.net.model, BasicRangeModel):
+                self.movenodesinitial()
+                self.plan = self.create_plan()
+            else:
+                logger.warning(
+                    "contact plan requires %s, using refresh ticks for %s",
+                    BasicRangeModel.name,
+                    self.net.name,
+                )
         super().run()
         self.statescript("run")
 
+    def create_plan(self) -> ContactPlan:
+        """
+        Create the contact plan for the script, from current node positions and
+        script waypoints, loading it from the cache next to the script file when
+        previously created from the same inputs.
+
+        :return: contact plan
+        """
+        initial = {}
+        for iface in self.net.get_ifaces():
+            initial[iface.node.id] = iface.node.getposition()
+        waypoints = {}
+        for wp in sorted(self.queue):
+            if wp.node_id in initial:
+                node_waypoints = waypoints.setdefault(wp.node_id, [])
+                node_waypoints.append((wp.time, wp.coords, wp.speed))
+        file_path = self.findfile(self.file)
+        plan = load_plan(file_path, initial, waypoints, self.net.model.range)
+        self.plan_index = 0
+        self.plan_positions = dict(initial)
+        logger.info(
+            "contact plan for %s: contacts(%s) end(%s)",
+            self.net.name,
+            len(plan.contacts),
+            plan.end,
+        )
+        return plan
+
+    def runround(self) -> None:
+        """
+        Advance script time, using the contact plan when enabled.
+
+        :return: nothing
+        """
+        if self.plan is None:
+            super().runround()
+        else:
+            self.runplan()
+
+    def runplan(self) -> None:
+        """
+        Advance script time using the contact plan. Scheduled link changes are
+        applied when their time has come, and node positions are computed from
+        their trajectories and broadcast every plan refresh period, without any
+        range calculations.
+
+        :return: nothing
+        """
+        if self.state != self.STATE_RUNNING or self.plan is None:
+            return
+        self.lasttime = time.monotonic()
+        now = self.lasttime - self.timezero
+        ifaces = {x.node.id: x for x in self.net.get_ifaces()}
+
+        # move nodes to their current positions
+        moved_ifaces = []
+        for node_id, position in self.plan.positions(now).items():
+            if self.plan_positions.get(node_id) == position:
+                continue
+            self.plan_positions[node_id] = position
+            iface = ifaces.get(node_id)
+            if iface is None:
+                continue
+            self.setnodeposition(iface.node, *position)
+            moved_ifaces.append(iface)
+        self.net.model.update_positions(moved_ifaces)
+
+        # apply scheduled link changes
+        contacts = self.plan.contacts
+        while self.plan_index < len(contacts):
+            contact = contacts[self.plan_index]
+            if contact.time > now:
+                break
+            self.apply_contact(contact, ifaces)
+            self.plan_index += 1
+
+        # check for completion
+        if self.plan_index >= len(contacts) and now >= self.plan.end:
+            self.endtime = self.plan.end
+            if not self.loopwaypoints():
+                return self.stop(move_initial=False)
+            return self.run()
+
+        # schedule next round, at the next contact or position refresh
+        delay = 0.001 * self.plan_refresh_ms
+        if self.plan_index < len(contacts):
+            delay = min(delay, contacts[self.plan_index].time - now)
+        self.session.event_loop.add_event(max(delay, 0.0), self.runplan)
+
+    def apply_contact(self, contact: Contact, ifaces: Dict[int, CoreInterface]) -> None:
+        """
+        Apply a scheduled link change.
+
+        :param contact: link change to apply
+        :param ifaces: node ids mapped to network interfaces
+        :return: nothing
+        """
+        iface1 = ifaces.get(contact.node1_id)
+        iface2 = ifaces.get(contact.node2_id)
+        if iface1 is None or iface2 is None:
+            return
+        self.net.model.set_link(iface1, iface2, contact.linked)
+
     def pause(self) -> None:
         """
         Pause the mobility script.
@@ -5,16 +5,18 @@ import abc
 import logging
 import shutil
 import threading
+from contextlib import contextmanager
 from pathlib import Path
 from threading import RLock
-from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Type, Union
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple, Type, Union
 
 import netaddr
 
 from core import utils
 from core.configservice.dependencies import ConfigServiceDependencies
-from core.emulator.data import InterfaceData, LinkData
+from core.emulator.data import CommandResult, InterfaceData, LinkData
 from core.emulator.enumerations import LinkTypes, MessageFlags, NodeTypes
+from core.emulator.positions import DEFAULT_STORE, PositionStore
 from core.errors import CoreCommandError, CoreError
 from core.executables import MOUNT, TEST, VNODED
 from core.nodes.client import VnodeClient
@@ -73,7 +75,7 @@ class NodeBase(abc.ABC):
         self.iface_id: int = 0
         self.canvas: Optional[int] = None
         self.icon: Optional[str] = None
-        self.position: Position = Position()
+        self.position: Position = Position(store=session.positions, owner=self.id)
         self.up: bool = False
         self.net_client: LinuxNetClient = get_net_client(
             self.session.use_ovs(), self.host_cmd
@@ -258,6 +260,16 @@ class CoreNodeBase(NodeBase):
         """
         raise NotImplementedError
 
+    def create_files(self, files: List[Tuple[Path, str, int]]) -> None:
+        """
+        Create multiple node files, each with a given mode.
+
+        :param files: tuples of file path, contents, and mode for files to create
+        :return: nothing
+        """
+        for file_path, contents, mode in files:
+            self.create_file(file_path, contents, mode)
+
     @abc.abstractmethod
     def copy_file(self, src_path: Path, dst_path: Path, mode: int = None) -> None:
         """
@@ -296,6 +308,34 @@ class CoreNodeBase(NodeBase):
         """
         raise NotImplementedError
 
+    def cmds(
+        self,
+        args: List[str],
+        wait: bool = True,
+        shell: bool = False,
+        stop_on_error: bool = False,
+    ) -> List[CommandResult]:
+        """
+        Runs multiple commands within a node container, collecting the result of
+        each command individually.
+
+        :param args: commands to run
+        :param wait: True to wait for status, False otherwise
+        :param shell: True to use shell, False otherwise
+        :param stop_on_error: True to stop running commands after a failure
+        :return: result for each command that was run
+        """
+        results = []
+        for cmd in args:
+            try:
+                output = self.cmd(cmd, wait, shell)
+                results.append(CommandResult(cmd, 0, output))
+            except CoreCommandError as e:
+                results.append(CommandResult(cmd, e.returncode, e.output, e.stderr))
+                if stop_on_error:
+                    break
+        return results
+
     @abc.abstractmethod
     def termcmdstring(self, sh: str) -> str:
         """
@@ -377,9 +417,20 @@ class CoreNodeBase(NodeBase):
         :return: nothing
         """
         startup_paths = ConfigServiceDependencies(self.config_services).startup_paths()
-        for startup_path in startup_paths:
-            for service in startup_path:
-                service.start()
+        services = [x for startup_path in startup_paths for x in startup_path]
+        # create directories and files for all services in a single pass
+        profiler = self.session.profiler
+        with profiler.span("directories", "config_services", node=self.name):
+            for service in services:
+                service.create_shadow_dirs()
+                service.create_dirs()
+        with profiler.span("files", "config_services", node=self.name):
+            files = []
+            for service in services:
+                files.extend(service.get_files())
+            self.create_files(files)
+        for service in services:
+            service.start(prepared=True)
 
     def makenodedir(self) -> None:
         """
@@ -418,6 +469,7 @@ class CoreNodeBase(NodeBase):
             raise CoreError(f"interface({iface_id}) already exists")
         self.ifaces[iface_id] = iface
         iface.node_id = iface_id
+        self.session.topology.invalidate()
 
     def delete_iface(self, iface_id: int) -> None:
         """
@@ -429,6 +481,7 @@ class CoreNodeBase(NodeBase):
         if iface_id not in self.ifaces:
             raise CoreError(f"node({self.name}) interface({iface_id}) does not exist")
         iface = self.ifaces.pop(iface_id)
+        self.session.topology.invalidate()
         logger.info("node(%s) removing interface(%s)", self.name, iface.name)
         iface.detachnet()
         iface.shutdown()
@@ -480,12 +533,7 @@ class CoreNodeBase(NodeBase):
         :param want_ctrl: flag set to determine if control network are wanted
         :return: tuples of common networks
         """
-        common = []
-        for iface1 in self.get_ifaces(control=want_ctrl):
-            for iface2 in node.get_ifaces():
-                if iface1.net == iface2.net:
-                    common.append((iface1.net, iface1, iface2))
-        return common
+        return self.session.topology.common_nets(self, node, want_ctrl)
 
 
 class CoreNode(CoreNodeBase):
@@ -520,6 +568,8 @@ class CoreNode(CoreNodeBase):
         self.pid: Optional[int] = None
         self.lock: RLock = RLock()
         self._mounts: List[Tuple[Path, Path]] = []
+        # commands deferred by the current thread, within a command batch
+        self._batch: threading.local = threading.local()
         self.node_net_client: LinuxNetClient = self.create_node_net_client(
             self.session.use_ovs()
         )
@@ -643,8 +693,66 @@ class CoreNode(CoreNodeBase):
             return self.client.check_cmd(args, wait=wait, shell=shell)
         else:
             args = self.client.create_cmd(args, shell)
+            batch = getattr(self._batch, "cmds", None)
+            if batch is not None:
+                batch.add_cmd(args, wait)
+                return ""
             return self.server.remote_cmd(args, wait=wait)
 
+    @contextmanager
+    def cmd_batch(self) -> Iterator[None]:
+        """
+        Defer commands run by this thread using cmd() within the context, and run
+        them as a single batch when the context exits, for nodes on a distributed
+        server. Deferred commands return empty output, so only commands whose
+        output is not used should be run within the context. Commands run as
+        normal for local nodes.
+
+        :return: nothing
+        :raises CoreCommandError: when a deferred command fails
+        """
+        if self.server is None or getattr(self._batch, "cmds", None) is not None:
+            yield
+            return
+        batch = self.server.remote_batch()
+        self._batch.cmds = batch
+        try:
+            yield
+        finally:
+            self._batch.cmds = None
+        for result in batch.run(stop_on_error=True):
+            if result.status:
+                raise CoreCommandError(
+                    result.status, result.args, result.stdout, result.stderr
+                )
+
+    def cmds(
+        self,
+        args: List[str],
+        wait: bool = True,
+        shell: bool = False,
+        stop_on_error: bool = False,
+    ) -> List[CommandResult]:
+        """
+        Runs multiple commands within a node. Commands for nodes on a distributed
+        server are run as a single batch on the server.
+
+        :param args: commands to run
+        :param wait: True to wait for status, False otherwise
+        :param shell: True to use shell, False otherwise
+        :param stop_on_error: True to stop running commands after a failure
+        :return: result for each command that was run
+        """
+        if self.server is None or not args:
+            return super().cmds(args, wait, shell, stop_on_error)
+        batch = self.server.remote_batch()
+        for cmd in args:
+            batch.add_cmd(self.client.create_cmd(cmd, shell), wait)
+        results = batch.run(stop_on_error)
+        for cmd, result in zip(args, results):
+            result.args = cmd
+        return results
+
     def path_exists(self, path: str) -> bool:
         """
         Determines if a file or directory path exists.
@@ -712,6 +820,21 @@ class CoreNode(CoreNodeBase):
         with self.lock:
             return super().next_iface_id()
 
+    def veth_names(self, iface_id: int) -> Tuple[str, str]:
+        """
+        Retrieve the names used for the veth pair of an interface.
+
+        :param iface_id: id of interface
+        :return: node side name and host side local name
+        """
+        sessionid = self.session.short_session_id()
+        try:
+            suffix = f"{self.id:x}.{iface_id}.{sessionid}"
+        except TypeError:
+            suffix = f"{self.id}.{iface_id}.{sessionid}"
+        localname = f"veth{suffix}"
+        return f"{localname}p", localname
+
     def newveth(self, iface_id: int = None, ifname: str = None, mtu: int = None) -> int:
         """
         Create a new interface.
@@ -725,13 +848,7 @@ class CoreNode(CoreNodeBase):
             mtu = mtu if mtu is not None else DEFAULT_MTU
             iface_id = iface_id if iface_id is not None else self.next_iface_id()
             ifname = ifname if ifname is not None else f"eth{iface_id}"
-            sessionid = self.session.short_session_id()
-            try:
-                suffix = f"{self.id:x}.{iface_id}.{sessionid}"
-            except TypeError:
-                suffix = f"{self.id}.{iface_id}.{sessionid}"
-            localname = f"veth{suffix}"
-            name = f"{localname}p"
+            name, localname = self.veth_names(iface_id)
             veth = Veth(self.session, name, localname, mtu, self.server, self)
             veth.adopt_node(iface_id, ifname, self.up)
             return iface_id
@@ -840,11 +957,12 @@ class CoreNode(CoreNodeBase):
                     )
                 iface_id = self.newveth(iface_id, iface_data.name, iface_data.mtu)
                 self.attachnet(iface_id, net)
-                if iface_data.mac:
-                    self.set_mac(iface_id, iface_data.mac)
-                for ip in iface_data.get_ips():
-                    self.add_ip(iface_id, ip)
-                self.ifup(iface_id)
+                with self.cmd_batch():
+                    if iface_data.mac:
+                        self.set_mac(iface_id, iface_data.mac)
+                    for ip in iface_data.get_ips():
+                        self.add_ip(iface_id, ip)
+                    self.ifup(iface_id)
                 return self.get_iface(iface_id)
 
     def addfile(self, src_path: Path, file_path: Path) -> None:
@@ -912,6 +1030,54 @@ class CoreNode(CoreNodeBase):
             self.server.remote_put_temp(host_path, contents)
             self.host_cmd(f"chmod {mode:o} {host_path}")
 
+    def _mount_path(self, path: Path) -> Path:
+        """
+        Resolve the host path for a node path from the directories mounted within
+        this node, without checking the node for existing directories.
+
+        :param path: node path to resolve
+        :return: host path for node path
+        """
+        mount_path = None
+        mount_parts = -1
+        for src_path, target_path in self._mounts:
+            parts = len(target_path.parts)
+            if parts > mount_parts and target_path in path.parents:
+                mount_path = src_path / path.relative_to(target_path)
+                mount_parts = parts
+        if mount_path is None:
+            mount_path = self.host_path(path)
+        return mount_path
+
+    def create_files(self, files: List[Tuple[Path, str, int]]) -> None:
+        """
+        Create multiple files within a node in one pass. Host paths are resolved
+        from the directories mounted within the node, parent directories are
+        created once, and files for nodes on a distributed server are created on
+        the server as a single batch.
+
+        :param files: tuples of file path, contents, and mode for files to create
+        :return: nothing
+        """
+        host_files = []
+        for file_path, contents, mode in files:
+            logger.debug(
+                "node(%s) create file(%s) mode(%o)", self.name, file_path, mode
+            )
+            host_files.append((self._mount_path(file_path), contents, mode))
+        if self.server is None:
+            for directory in sorted({x[0].parent for x in host_files}):
+                directory.mkdir(parents=True, mode=0o755, exist_ok=True)
+            for host_path, contents, mode in host_files:
+                with host_path.open("w") as f:
+                    f.write(contents)
+                host_path.chmod(mode)
+        else:
+            batch = self.server.remote_batch()
+            for host_path, contents, mode in host_files:
+                batch.add_file(host_path, contents, mode)
+            batch.run()
+
     def copy_file(self, src_path: Path, dst_path: Path, mode: int = None) -> None:
         """
         Copy source file to node host destination, updating the file mode when
@@ -1027,6 +1193,7 @@ class CoreNetworkBase(NodeBase):
         iface.net_id = i
         with self.linked_lock:
             self.linked[iface] = {}
+        self.session.topology.invalidate()
 
     def detach(self, iface: CoreInterface) -> None:
         """
@@ -1039,6 +1206,7 @@ class CoreNetworkBase(NodeBase):
         iface.net_id = None
         with self.linked_lock:
             del self.linked[iface]
+        self.session.topology.invalidate()
 
     def links(self, flags: MessageFlags = MessageFlags.NONE) -> List[LinkData]:
         """
@@ -1070,9 +1238,8 @@ class CoreNetworkBase(NodeBase):
                 node1_id=self.id,
                 node2_id=linked_node.id,
                 iface2=iface_data,
-                options=iface.local_options,
+                options=iface.get_options(unidirectional),
             )
-            link_data.options.unidirectional = unidirectional
             all_links.append(link_data)
             if unidirectional:
                 link_data = LinkData(
@@ -1080,32 +1247,82 @@ class CoreNetworkBase(NodeBase):
                     type=self.linktype,
                     node1_id=linked_node.id,
                     node2_id=self.id,
-                    options=iface.options,
+                    options=iface.get_options(unidirectional, use_local=False),
                 )
-                link_data.options.unidirectional = unidirectional
                 all_links.append(link_data)
         return all_links
 
 
 class Position:
     """
-    Helper class for Cartesian coordinate position
+    Helper class for Cartesian coordinate position, viewing a row of a position
+    store shared by all nodes within a session.
     """
 
-    def __init__(self, x: float = None, y: float = None, z: float = None) -> None:
+    __slots__ = ("store", "slot")
+
+    def __init__(
+        self,
+        x: float = None,
+        y: float = None,
+        z: float = None,
+        store: PositionStore = None,
+        owner: int = None,
+    ) -> None:
         """
         Creates a Position instance.
 
         :param x: x position
         :param y: y position
         :param z: z position
-        """
-        self.x: float = x
-        self.y: float = y
-        self.z: float = z
-        self.lon: Optional[float] = None
-        self.lat: Optional[float] = None
-        self.alt: Optional[float] = None
+        :param store: position store to keep values in, uses the shared default
+            store when not provided
+        :param owner: id of node owning this position
+        """
+        store = store if store is not None else DEFAULT_STORE
+        self.slot: int = store.allocate(owner)
+        self.store: PositionStore = store
+        if x is not None or y is not None or z is not None:
+            self.store.set(self.slot, x, y, z)
+
+    @property
+    def x(self) -> Optional[float]:
+        return self.store.get(self.slot)[0]
+
+    @property
+    def y(self) -> Optional[float]:
+        return self.store.get(self.slot)[1]
+
+    @property
+    def z(self) -> Optional[float]:
+        return self.store.get(self.slot)[2]
+
+    @property
+    def lon(self) -> Optional[float]:
+        return self.store.get_geo(self.slot)[0]
+
+    @lon.setter
+    def lon(self, value: Optional[float]) -> None:
+        _, lat, alt = self.store.get_geo(self.slot)
+        self.store.set_geo(self.slot, value, lat, alt)
+
+    @property
+    def lat(self) -> Optional[float]:
+        return self.store.get_geo(self.slot)[1]
+
+    @lat.setter
+    def lat(self, value: Optional[float]) -> None:
+        lon, _, alt = self.store.get_geo(self.slot)
+        self.store.set_geo(self.slot, lon, value, alt)
+
+    @property
+    def alt(self) -> Optional[float]:
+        return self.store.get_geo(self.slot)[2]
+
+    @alt.setter
+    def alt(self, value: Optional[float]) -> None:
+        lon, lat, _ = self.store.get_geo(self.slot)
+        self.store.set_geo(self.slot, lon, lat, value)
 
     def set(self, x: float = None, y: float = None, z: float = None) -> bool:
         """
@@ -1116,12 +1333,7 @@ class Position:
         :param z: z position
         :return: True if position changed, False otherwise
         """
-        if self.x == x and self.y == y and self.z == z:
-            return False
-        self.x = x
-        self.y = y
-        self.z = z
-        return True
+        return self.store.set(self.slot, x, y, z)
 
     def get(self) -> Tuple[float, float, float]:
         """
@@ -1129,7 +1341,7 @@ class Position:
 
         :return: x,y,z position tuple
         """
-        return self.x, self.y, self.z
+        return self.store.get(self.slot)
 
     def set_geo(self, lon: float, lat: float, alt: float) -> None:
         """
@@ -1140,9 +1352,7 @@ class Position:
         :param alt: altitude value
         :return: nothing
         """
-        self.lon = lon
-        self.lat = lat
-        self.alt = alt
+        self.store.set_geo(self.slot, lon, lat, alt)
 
     def get_geo(self) -> Tuple[float, float, float]:
         """
@@ -1150,4 +1360,22 @@ class Position:
 
         :return: lon, lat, alt position tuple
         """
-        return self.lon, self.lat, self.alt
+        return self.store.get_geo(self.slot)
+
+    def detach(self) -> None:
+        """
+        Move values to the shared default store, releasing the row within the
+        current store, such as when a node is removed from a session.
+
+        :return: nothing
+        """
+        store = DEFAULT_STORE
+        slot = store.allocate()
+        store.set(slot, *self.get())
+        store.set_geo(slot, *self.get_geo())
+        self.store.release(self.slot)
+        self.store, self.slot = store, slot
+
+    def __del__(self) -> None:
+        if getattr(self, "store", None) is DEFAULT_STORE:
+            self.store.release_later(self.slot)
@@ -1,22 +1,363 @@
+import http.client
+import io
 import json
 import logging
+import shlex
+import socket
+import tarfile
+import threading
+import time
+import urllib.parse
+from contextlib import contextmanager
 from pathlib import Path
+from queue import Queue
 from tempfile import NamedTemporaryFile
-from typing import TYPE_CHECKING, Callable, Dict, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 from core import utils
 from core.emulator.distributed import DistributedServer
 from core.emulator.enumerations import NodeTypes
-from core.errors import CoreCommandError
+from core.errors import CoreCommandError, CoreError
 from core.nodes.base import CoreNode
 from core.nodes.netclient import LinuxNetClient, get_net_client
 
 logger = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
+    from core.emulator.prewarm import OverlayFiles
     from core.emulator.session import Session
 
 
+DOCKER_SOCKET: str = "/var/run/docker.sock"
+DOCKER_API_CONNECTIONS: int = 10
+STREAM_HEADER_SIZE: int = 8
+STREAM_STDERR: int = 2
+
+
+class UnixHTTPConnection(http.client.HTTPConnection):
+    """
+    HTTP connection made over a unix domain socket.
+    """
+
+    def __init__(self, path: str, timeout: float = None) -> None:
+        super().__init__("localhost", timeout=timeout)
+        self.socket_path: str = path
+
+    def connect(self) -> None:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        if self.timeout is not None:
+            sock.settimeout(self.timeout)
+        sock.connect(self.socket_path)
+        self.sock = sock
+
+
+def demux_stream(data: bytes) -> Tuple[str, str]:
+    """
+    Split a multiplexed docker output stream into stdout and stderr.
+
+    :param data: multiplexed stream data
+    :return: stdout and stderr
+    """
+    stdout = []
+    stderr = []
+    index = 0
+    while index + STREAM_HEADER_SIZE <= len(data):
+        stream = data[index]
+        size = int.from_bytes(data[index + 4 : index + STREAM_HEADER_SIZE], "big")
+        index += STREAM_HEADER_SIZE
+        frame = data[index : index + size]
+        index += size
+        if stream == STREAM_STDERR:
+            stderr.append(frame)
+        else:
+            stdout.append(frame)
+    stdout = b"".join(stdout).decode("utf-8", errors="replace").strip()
+    stderr = b"".join(stderr).decode("utf-8", errors="replace").strip()
+    return stdout, stderr
+
+
+def create_archive(files: List[Tuple[Path, bytes, int]]) -> bytes:
+    """
+    Create an uncompressed tar archive, rooted at /, containing the provided files.
+
+    :param files: tuples of absolute file path, contents, and mode
+    :return: archive data
+    """
+    now = time.time()
+    data = io.BytesIO()
+    with tarfile.open(fileobj=data, mode="w") as tar:
+        for file_path, contents, mode in files:
+            info = tarfile.TarInfo(str(file_path).lstrip("/"))
+            info.size = len(contents)
+            info.mode = mode
+            info.mtime = now
+            tar.addfile(info, io.BytesIO(contents))
+    return data.getvalue()
+
+
+class DockerApi:
+    """
+    Docker engine api client, talking to the docker daemon over its unix socket
+    using a pool of persistent http connections, allowing concurrent requests.
+    """
+
+    def __init__(
+        self, path: str = DOCKER_SOCKET, size: int = DOCKER_API_CONNECTIONS
+    ) -> None:
+        """
+        Create a DockerApi instance.
+
+        :param path: path to docker daemon unix socket
+        :param size: max number of concurrent connections
+        """
+        self.path: str = path
+        self.size: int = size
+        self.created: List[UnixHTTPConnection] = []
+        self.available: Queue = Queue()
+        self.lock: threading.Lock = threading.Lock()
+
+    @contextmanager
+    def connection(self) -> Iterator[UnixHTTPConnection]:
+        """
+        Borrow a connection from the pool, creating a new one when none are
+        available and the pool is not full.
+
+        :return: pooled connection
+        """
+        with self.lock:
+            if self.available.empty() and len(self.created) < self.size:
+                conn = UnixHTTPConnection(self.path)
+                self.created.append(conn)
+                self.available.put(conn)
+        conn = self.available.get()
+        try:
+            yield conn
+        except (OSError, http.client.HTTPException):
+            conn.close()
+            raise
+        finally:
+            self.available.put(conn)
+
+    def request(
+        self, method: str, url: str, body: Any = None, params: Dict[str, str] = None
+    ) -> Tuple[int, bytes]:
+        """
+        Send a request to the docker daemon. Raw bytes are sent as a tar archive,
+        anything else is sent as json.
+
+        :param method: http method
+        :param url: request url path
+        :param body: json serializable data or tar archive bytes to send
+        :param params: query parameters
+        :return: response status and body
+        :raises CoreError: when unable to communicate with the docker daemon
+        """
+        if params:
+            url = f"{url}?{urllib.parse.urlencode(params)}"
+        headers = {}
+        if isinstance(body, bytes):
+            headers["Content-Type"] = "application/x-tar"
+        elif body is not None:
+            body = json.dumps(body).encode("utf-8")
+            headers["Content-Type"] = "application/json"
+        try:
+            with self.connection() as conn:
+                conn.request(method, url, body=body, headers=headers)
+                response = conn.getresponse()
+                data = response.read()
+                if response.will_close:
+                    conn.close()
+                return response.status, data
+        except (OSError, http.client.HTTPException) as e:
+            raise CoreError(f"docker api error {method} {url}: {e}")
+
+    def check(
+        self, method: str, url: str, body: Any = None, params: Dict[str, str] = None
+    ) -> bytes:
+        """
+        Send a request to the docker daemon, checking for a successful status.
+
+        :param method: http method
+        :param url: request url path
+        :param body: json serializable data or tar archive bytes to send
+        :param params: query parameters
+        :return: response body
+        :raises CoreCommandError: when the docker daemon returns an error status
+        """
+        status, data = self.request(method, url, body, params)
+        if status >= 400:
+            try:
+                message = json.loads(data).get("message", "")
+            except ValueError:
+                message = data.decode("utf-8", errors="replace")
+            raise CoreCommandError(status, f"{method} {url}", stderr=message)
+        return data
+
+    def create_container(self, name: str, image: str, start: bool = True) -> str:
+        """
+        Create a container.
+
+        :param name: name of container
+        :param image: image to create container from
+        :param start: True to start container, False otherwise
+        :return: container id
+        """
+        config = {
+            "Image": image,
+            "Hostname": name,
+            "Cmd": ["/bin/bash"],
+            "Tty": True,
+            "OpenStdin": True,
+            "HostConfig": {
+                "Init": True,
+                "NetworkMode": "none",
+                "Privileged": True,
+                "Sysctls": {"net.ipv6.conf.all.disable_ipv6": "0"},
+            },
+        }
+        params = {"name": name}
+        try:
+            data = self.check("POST", "/containers/create", config, params)
+        except CoreCommandError as e:
+            # unlike docker run, creating from a missing image does not pull it
+            if e.returncode != 404:
+                raise
+            self.pull_image(image)
+            data = self.check("POST", "/containers/create", config, params)
+        container_id = json.loads(data)["Id"]
+        if start:
+            self.start_container(container_id)
+        return container_id
+
+    def pull_image(self, image: str) -> None:
+        """
+        Pull an image, defaulting to the latest tag when none is given, rather
+        than pulling all tags.
+
+        :param image: image to pull
+        :return: nothing
+        :raises CoreCommandError: when the image fails to be pulled
+        """
+        params = {"fromImage": image}
+        name = image.rsplit("/", 1)[-1]
+        if ":" not in name and "@" not in name:
+            params["tag"] = "latest"
+        logger.info("pulling docker image: %s", image)
+        data = self.check("POST", "/images/create", params=params)
+        # pull errors are reported within the progress stream
+        for line in data.splitlines():
+            try:
+                progress = json.loads(line)
+            except ValueError:
+                continue
+            if "error" in progress:
+                raise CoreCommandError(
+                    1, "POST /images/create", stderr=progress["error"]
+                )
+
+    def start_container(self, name: str) -> None:
+        """
+        Start a created container.
+
+        :param name: name or id of container
+        :return: nothing
+        """
+        self.check("POST", f"/containers/{name}/start")
+
+    def rename_container(self, name: str, new_name: str) -> None:
+        """
+        Rename a container.
+
+        :param name: name or id of container
+        :param new_name: new name for container
+        :return: nothing
+        """
+        self.check("POST", f"/containers/{name}/rename", params={"name": new_name})
+
+    def inspect(self, name: str) -> Dict:
+        """
+        Retrieve container information.
+
+        :param name: name or id of container
+        :return: container information
+        """
+        data = self.check("GET", f"/containers/{name}/json")
+        return json.loads(data)
+
+    def remove_container(self, name: str) -> None:
+        """
+        Forcefully remove a container.
+
+        :param name: name or id of container
+        :return: nothing
+        """
+        self.check("DELETE", f"/containers/{name}", params={"force": "1"})
+
+    def exec(
+        self, name: str, args: List[str], wait: bool = True
+    ) -> Tuple[int, str, str]:
+        """
+        Run a command within a container.
+
+        :param name: name or id of container
+        :param args: command arguments
+        :param wait: True to wait for status and output, False otherwise
+        :return: exit status, stdout and stderr
+        """
+        config = {"Cmd": args, "AttachStdout": wait, "AttachStderr": wait}
+        data = self.check("POST", f"/containers/{name}/exec", config)
+        exec_id = json.loads(data)["Id"]
+        data = self.check("POST", f"/exec/{exec_id}/start", {"Detach": not wait})
+        if not wait:
+            return 0, "", ""
+        stdout, stderr = demux_stream(data)
+        data = self.check("GET", f"/exec/{exec_id}/json")
+        status = json.loads(data)["ExitCode"]
+        return status, stdout, stderr
+
+    def put_archive(self, name: str, data: bytes, path: str = "/") -> None:
+        """
+        Extract a tar archive within a container.
+
+        :param name: name or id of container
+        :param data: tar archive data
+        :param path: container directory to extract archive in
+        :return: nothing
+        """
+        self.check("PUT", f"/containers/{name}/archive", data, {"path": path})
+
+    def close(self) -> None:
+        """
+        Close all pooled connections.
+
+        :return: nothing
+        """
+        with self.lock:
+            for conn in self.created:
+                conn.close()
+
+
+_docker_apis: Dict[str, DockerApi] = {}
+_docker_apis_lock: threading.Lock = threading.Lock()
+
+
+def get_docker_api(path: str) -> Optional[DockerApi]:
+    """
+    Retrieve the shared docker api client for a docker daemon socket.
+
+    :param path: path to docker daemon socket
+    :return: docker api client, None when the socket is not present
+    """
+    if not path or not Path(path).is_socket():
+        return None
+    with _docker_apis_lock:
+        api = _docker_apis.get(path)
+        if api is None:
+            api = DockerApi(path)
+            _docker_apis[path] = api
+        return api
+
+
 class DockerClient:
     def __init__(self, name: str, image: str, run: Callable[..., str]) -> None:
         self.name: str = name
@@ -33,6 +374,24 @@ class DockerClient:
         self.pid = self.get_pid()
         return self.pid
 
+    def create(self) -> None:
+        self.run(
+            f"docker create -t --init --net=none --hostname {self.name} "
+            f"--name {self.name} --sysctl net.ipv6.conf.all.disable_ipv6=0 "
+            f"--privileged {self.image} /bin/bash"
+        )
+
+    def start_container(self) -> str:
+        self.run(f"docker start {self.name}")
+        return self.get_pid()
+
+    def rename(self, name: str) -> None:
+        self.run(f"docker rename {self.name} {name}")
+        self.name = name
+
+    def put_overlay(self, files: "OverlayFiles", directory: Path) -> None:
+        self.run(f"docker cp {directory}/. {self.name}:/")
+
     def get_info(self) -> Dict:
         args = f"docker inspect {self.name}"
         output = self.run(args)
@@ -51,6 +410,11 @@ class DockerClient:
     def stop_container(self) -> None:
         self.run(f"docker rm -f {self.name}")
 
+    def create_cmd(self, cmd: str, shell: bool = False) -> str:
+        if shell:
+            cmd = f"/bin/sh -c {shlex.quote(cmd)}"
+        return f"docker exec {self.name} {cmd}"
+
     def check_cmd(self, cmd: str, wait: bool = True, shell: bool = False) -> str:
         logger.info("docker cmd output: %s", cmd)
         return utils.cmd(f"docker exec {self.name} {cmd}", wait=wait, shell=shell)
@@ -70,6 +434,69 @@ class DockerClient:
         return self.run(args)
 
 
+class DockerApiClient(DockerClient):
+    """
+    Docker client using the docker engine api, rather than the docker cli.
+    """
+
+    def __init__(self, name: str, image: str, api: DockerApi) -> None:
+        super().__init__(name, image, None)
+        self.api: DockerApi = api
+
+    def create_container(self) -> str:
+        self.api.create_container(self.name, self.image)
+        self.pid = self.get_pid()
+        return self.pid
+
+    def create(self) -> None:
+        self.api.create_container(self.name, self.image, start=False)
+
+    def start_container(self) -> str:
+        self.api.start_container(self.name)
+        return self.get_pid()
+
+    def rename(self, name: str) -> None:
+        self.api.rename_container(self.name, name)
+        self.name = name
+
+    def put_overlay(self, files: "OverlayFiles", directory: Path) -> None:
+        self.put_files([(path, x[0], x[1]) for path, x in files.items()])
+
+    def get_info(self) -> Dict:
+        return self.api.inspect(self.name)
+
+    def stop_container(self) -> None:
+        self.api.remove_container(self.name)
+
+    def check_cmd(self, cmd: str, wait: bool = True, shell: bool = False) -> str:
+        logger.info("docker api cmd output: %s", cmd)
+        args = ["/bin/sh", "-c", cmd] if shell else shlex.split(cmd)
+        status, stdout, stderr = self.api.exec(self.name, args, wait)
+        if status:
+            raise CoreCommandError(status, cmd, stdout, stderr)
+        return stdout
+
+    def get_pid(self) -> str:
+        self.pid = str(self.get_info()["State"]["Pid"])
+        logger.debug("node(%s) pid: %s", self.name, self.pid)
+        return self.pid
+
+    def copy_file(self, src_path: Path, dst_path: Path) -> str:
+        mode = src_path.stat().st_mode & 0o7777
+        self.put_files([(dst_path, src_path.read_bytes(), mode)])
+        return ""
+
+    def put_files(self, files: List[Tuple[Path, bytes, int]]) -> None:
+        """
+        Stream files into the container as a single tar archive.
+
+        :param files: tuples of file path, contents, and mode
+        :return: nothing
+        """
+        files = [(Path("/") / path, contents, mode) for path, contents, mode in files]
+        self.api.put_archive(self.name, create_archive(files))
+
+
 class DockerNode(CoreNode):
     apitype = NodeTypes.DOCKER
 
@@ -96,8 +523,27 @@ class DockerNode(CoreNode):
         if image is None:
             image = "ubuntu"
         self.image: str = image
+        self.overlay: "OverlayFiles" = {}
         super().__init__(session, _id, name, directory, server)
 
+    @classmethod
+    def create_client(cls, session: "Session", name: str, image: str) -> DockerClient:
+        """
+        Create a client for a container on the local host, using the docker api
+        when its socket is present.
+
+        :param session: session container is for
+        :param name: name of container
+        :param image: image for container
+        :return: docker client
+        """
+        path = session.options.get_config("docker_socket", default=DOCKER_SOCKET)
+        api = get_docker_api(path)
+        if api:
+            return DockerApiClient(name, image, api)
+        else:
+            return DockerClient(name, image, utils.cmd)
+
     def create_node_net_client(self, use_ovs: bool) -> LinuxNetClient:
         """
         Create node network client for running network commands within the nodes
@@ -108,6 +554,16 @@ class DockerNode(CoreNode):
         """
         return get_net_client(use_ovs, self.nsenter_cmd)
 
+    def set_hostname(self) -> None:
+        """
+        Set the hostname of a claimed pre-warmed container, including within
+        /etc/hostname, which still holds the name it was created with.
+
+        :return: nothing
+        """
+        args = f"hostname {self.name} && echo {self.name} > /etc/hostname"
+        self.client.check_cmd(f"sh -c {shlex.quote(args)}")
+
     def alive(self) -> bool:
         """
         Check if the node is alive.
@@ -128,8 +584,20 @@ class DockerNode(CoreNode):
             if self.up:
                 raise ValueError("starting a node that is already up")
             self.makenodedir()
-            self.client = DockerClient(self.name, self.image, self.host_cmd)
-            self.pid = self.client.create_container()
+            claimed = self.session.container_pool.claim(self)
+            if claimed:
+                self.client, self.overlay = claimed
+                self.client.rename(self.name)
+                self.pid = self.client.start_container()
+                self.set_hostname()
+            else:
+                if self.server is None:
+                    self.client = self.create_client(
+                        self.session, self.name, self.image
+                    )
+                else:
+                    self.client = DockerClient(self.name, self.image, self.host_cmd)
+                self.pid = self.client.create_container()
             self.up = True
 
     def shutdown(self) -> None:
@@ -145,6 +613,7 @@ class DockerNode(CoreNode):
         with self.lock:
             self.ifaces.clear()
             self.client.stop_container()
+            self.overlay = {}
             self.up = False
 
     def nsenter_cmd(self, args: str, wait: bool = True, shell: bool = False) -> str:
@@ -187,6 +656,17 @@ class DockerNode(CoreNode):
         logger.debug("mounting source(%s) target(%s)", src_path, target_path)
         raise Exception("not supported")
 
+    @classmethod
+    def resolve_path(cls, file_path: Path) -> Path:
+        """
+        Resolve the absolute path of a node file within a container, relative
+        paths being relative to the container root.
+
+        :param file_path: node file path
+        :return: absolute path within container
+        """
+        return Path("/") / file_path
+
     def create_file(self, file_path: Path, contents: str, mode: int = 0o644) -> None:
         """
         Create a node file with a given mode.
@@ -197,6 +677,9 @@ class DockerNode(CoreNode):
         :return: nothing
         """
         logger.debug("node(%s) create file(%s) mode(%o)", self.name, file_path, mode)
+        if isinstance(self.client, DockerApiClient):
+            self.client.put_files([(file_path, contents.encode("utf-8"), mode)])
+            return
         temp = NamedTemporaryFile(delete=False)
         temp.write(contents.encode("utf-8"))
         temp.close()
@@ -212,6 +695,29 @@ class DockerNode(CoreNode):
             self.host_cmd(f"rm -f {temp_path}")
         temp_path.unlink()
 
+    def create_files(self, files: List[Tuple[Path, str, int]]) -> None:
+        """
+        Create multiple node files. Files already baked into a pre-warmed container
+        are skipped. When using the docker api, all files are streamed into the
+        container as a single archive.
+
+        :param files: tuples of file path, contents, and mode
+        :return: nothing
+        """
+        files = [
+            (self.resolve_path(path), contents.encode("utf-8"), mode)
+            for path, contents, mode in files
+        ]
+        files = self.session.container_pool.add_files(self, files)
+        logger.debug("node(%s) create files: %s", self.name, len(files))
+        if not files:
+            return
+        elif isinstance(self.client, DockerApiClient):
+            self.client.put_files(files)
+        else:
+            for file_path, contents, mode in files:
+                self.create_file(file_path, contents.decode("utf-8"), mode)
+
     def copy_file(self, src_path: Path, dst_path: Path, mode: int = None) -> None:
         """
         Copy a file to a node, following symlinks and preserving metadata.
@@ -11,7 +11,12 @@ from typing import TYPE_CHECKING, Callable, Dict, List, Optional
 import netaddr
 
 from core import utils
-from core.emulator.data import InterfaceData, LinkOptions
+from core.emulator.data import (
+    InterfaceData,
+    InterfaceSnapshot,
+    LinkOptions,
+    LinkOptionsSnapshot,
+)
 from core.emulator.enumerations import TransportType
 from core.errors import CoreCommandError, CoreError
 from core.executables import TC
@@ -76,6 +81,34 @@ class CoreInterface:
     Base class for network interfaces.
     """
 
+    __slots__ = (
+        "session",
+        "node",
+        "name",
+        "localname",
+        "up",
+        "mtu",
+        "net",
+        "othernet",
+        "ip4s",
+        "ip6s",
+        "mac",
+        "poshook",
+        "transport_type",
+        "node_id",
+        "net_id",
+        "flow_id",
+        "server",
+        "net_client",
+        "control",
+        "has_local_netem",
+        "local_options",
+        "has_netem",
+        "options",
+        "data_snapshot",
+        "options_snapshots",
+    )
+
     def __init__(
         self,
         session: "Session",
@@ -130,6 +163,9 @@ class CoreInterface:
         self.local_options: LinkOptions = LinkOptions()
         self.has_netem: bool = False
         self.options: LinkOptions = LinkOptions()
+        # immutable copies of current data and options, shared by link data
+        self.data_snapshot: Optional[InterfaceSnapshot] = None
+        self.options_snapshots: List[Optional[LinkOptionsSnapshot]] = [None, None]
 
     def host_cmd(
         self,
@@ -208,6 +244,8 @@ class CoreInterface:
                 self.ip4s.append(ip)
             else:
                 self.ip6s.append(ip)
+            self.data_snapshot = None
+            self.session.topology.invalidate()
         except netaddr.AddrFormatError as e:
             raise CoreError(f"adding invalid address {ip}: {e}")
 
@@ -226,6 +264,8 @@ class CoreInterface:
                 self.ip4s.remove(ip)
             else:
                 self.ip6s.remove(ip)
+            self.data_snapshot = None
+            self.session.topology.invalidate()
         except (netaddr.AddrFormatError, ValueError) as e:
             raise CoreError(f"deleting invalid address {ip}: {e}")
 
@@ -261,6 +301,7 @@ class CoreInterface:
         :return: nothing
         :raises CoreError: when there is an invalid mac address
         """
+        self.data_snapshot = None
         if mac is None:
             self.mac = mac
         else:
@@ -316,6 +357,8 @@ class CoreInterface:
         name = self.localname if use_local else self.name
         current_options = self.local_options if use_local else self.options
         changed = current_options.update(options)
+        if changed:
+            self.options_snapshots[use_local] = None
         # nothing more to do when nothing has changed or not up
         if not changed or not self.up:
             return
@@ -341,7 +384,8 @@ class CoreInterface:
 
     def get_data(self) -> InterfaceData:
         """
-        Retrieve the data representation of this interface.
+        Retrieve the data representation of this interface. This is an immutable
+        snapshot, reused until the interface changes.
 
         :return: interface data
         """
@@ -349,18 +393,40 @@ class CoreInterface:
             iface_id = self.node.get_iface_id(self)
         else:
             iface_id = self.othernet.get_iface_id(self)
-        data = InterfaceData(
+        data = self.data_snapshot
+        if data is not None and data.id == iface_id and data.name == self.name:
+            return data
+        values = dict(
             id=iface_id, name=self.name, mac=str(self.mac) if self.mac else None
         )
         ip4 = self.get_ip4()
         if ip4:
-            data.ip4 = str(ip4.ip)
-            data.ip4_mask = ip4.prefixlen
+            values.update(ip4=str(ip4.ip), ip4_mask=ip4.prefixlen)
         ip6 = self.get_ip6()
         if ip6:
-            data.ip6 = str(ip6.ip)
-            data.ip6_mask = ip6.prefixlen
-        return data
+            values.update(ip6=str(ip6.ip), ip6_mask=ip6.prefixlen)
+        self.data_snapshot = InterfaceSnapshot(**values)
+        return self.data_snapshot
+
+    def get_options(self, unidirectional: int, use_local: bool = True) -> LinkOptions:
+        """
+        Retrieve an immutable snapshot of current link options, reused until the
+        options change.
+
+        :param unidirectional: 1 when options only apply in one direction,
+            0 otherwise
+        :param use_local: True to get local options, False for options applied
+            to the other end of the link
+        :return: link options
+        """
+        snapshot = self.options_snapshots[use_local]
+        if snapshot is None or snapshot.unidirectional != unidirectional:
+            options = self.local_options if use_local else self.options
+            values = {x: getattr(options, x) for x in options.__slots__}
+            values["unidirectional"] = unidirectional
+            snapshot = LinkOptionsSnapshot(**values)
+            self.options_snapshots[use_local] = snapshot
+        return snapshot
 
 
 class Veth(CoreInterface):
@@ -368,6 +434,8 @@ class Veth(CoreInterface):
     Provides virtual ethernet functionality for core nodes.
     """
 
+    __slots__ = ()
+
     def adopt_node(self, iface_id: int, name: str, start: bool) -> None:
         """
         Adopt this interface to the provided node, configuring and associating
@@ -435,6 +503,8 @@ class TunTap(CoreInterface):
     TUN/TAP virtual device in TAP mode
     """
 
+    __slots__ = ()
+
     def startup(self) -> None:
         """
         Startup logic for a tunnel tap.
@@ -579,6 +649,8 @@ class GreTap(CoreInterface):
     having a MAC address. The MAC address is required for bridging.
     """
 
+    __slots__ = ("id", "remote_ip", "ttl", "key", "local_ip")
+
     def __init__(
         self,
         session: "Session",
@@ -1,9 +1,10 @@
 import json
 import logging
+import shlex
 import time
 from pathlib import Path
 from tempfile import NamedTemporaryFile
-from typing import TYPE_CHECKING, Callable, Dict, Optional
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
 
 from core import utils
 from core.emulator.distributed import DistributedServer
@@ -15,6 +16,7 @@ from core.nodes.interface import CoreInterface
 logger = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
+    from core.emulator.prewarm import OverlayFiles
     from core.emulator.session import Session
 
 
@@ -46,6 +48,23 @@ class LxdClient:
         except CoreCommandError:
             return False
 
+    def create(self) -> None:
+        self.run(f"lxc init {self.image} {self.name}")
+
+    def start_container(self) -> int:
+        self.run(f"lxc start {self.name}")
+        data = self.get_info()
+        self.pid = data["state"]["pid"]
+        return self.pid
+
+    def rename(self, name: str) -> None:
+        self.run(f"lxc move {self.name} {name}")
+        self.name = name
+
+    def put_overlay(self, files: "OverlayFiles", directory: Path) -> None:
+        sources = " ".join(str(x) for x in sorted(directory.iterdir()))
+        self.run(f"lxc file push -r -p {sources} {self.name}/")
+
     def stop_container(self) -> None:
         self.run(f"lxc delete --force {self.name}")
 
@@ -92,8 +111,31 @@ class LxcNode(CoreNode):
         if image is None:
             image = "ubuntu"
         self.image: str = image
+        self.overlay: "OverlayFiles" = {}
         super().__init__(session, _id, name, directory, server)
 
+    @classmethod
+    def create_client(cls, session: "Session", name: str, image: str) -> LxdClient:
+        """
+        Create a client for a container on the local host.
+
+        :param session: session container is for
+        :param name: name of container
+        :param image: image for container
+        :return: lxd client
+        """
+        return LxdClient(name, image, utils.cmd)
+
+    def set_hostname(self) -> None:
+        """
+        Set the hostname of a claimed pre-warmed container, including within
+        /etc/hostname, which still holds the name it was created with.
+
+        :return: nothing
+        """
+        args = f"hostname {self.name} && echo {self.name} > /etc/hostname"
+        self.client.check_cmd(f"sh -c {shlex.quote(args)}")
+
     def alive(self) -> bool:
         """
         Check if the node is alive.
@@ -112,8 +154,15 @@ class LxcNode(CoreNode):
             if self.up:
                 raise ValueError("starting a node that is already up")
             self.makenodedir()
-            self.client = LxdClient(self.name, self.image, self.host_cmd)
-            self.pid = self.client.create_container()
+            claimed = self.session.container_pool.claim(self)
+            if claimed:
+                self.client, self.overlay = claimed
+                self.client.rename(self.name)
+                self.pid = self.client.start_container()
+                self.set_hostname()
+            else:
+                self.client = LxdClient(self.name, self.image, self.host_cmd)
+                self.pid = self.client.create_container()
             self.up = True
 
     def shutdown(self) -> None:
@@ -129,6 +178,7 @@ class LxcNode(CoreNode):
         with self.lock:
             self.ifaces.clear()
             self.client.stop_container()
+            self.overlay = {}
             self.up = False
 
     def termcmdstring(self, sh: str = "/bin/sh") -> str:
@@ -163,6 +213,17 @@ class LxcNode(CoreNode):
         logger.debug("mounting source(%s) target(%s)", src_path, target_path)
         raise Exception("not supported")
 
+    @classmethod
+    def resolve_path(cls, file_path: Path) -> Path:
+        """
+        Resolve the absolute path of a node file within a container, relative
+        paths being copied into the home directory of root.
+
+        :param file_path: node file path
+        :return: absolute path within container
+        """
+        return Path("/root/") / file_path
+
     def create_file(self, file_path: Path, contents: str, mode: int = 0o644) -> None:
         """
         Create a node file with a given mode.
@@ -189,6 +250,22 @@ class LxcNode(CoreNode):
         temp_path.unlink()
         logger.debug("node(%s) added file: %s; mode: 0%o", self.name, file_path, mode)
 
+    def create_files(self, files: List[Tuple[Path, str, int]]) -> None:
+        """
+        Create multiple node files, skipping files already baked into a
+        pre-warmed container.
+
+        :param files: tuples of file path, contents, and mode
+        :return: nothing
+        """
+        files = [
+            (self.resolve_path(path), contents.encode("utf-8"), mode)
+            for path, contents, mode in files
+        ]
+        files = self.session.container_pool.add_files(self, files)
+        for file_path, contents, mode in files:
+            self.create_file(file_path, contents.decode("utf-8"), mode)
+
     def copy_file(self, src_path: Path, dst_path: Path, mode: int = None) -> None:
         """
         Copy a file to a node, following symlinks and preserving metadata.
@@ -12,6 +12,7 @@ from typing import TYPE_CHECKING, Dict, List, Optional, Type
 import netaddr
 
 from core import utils
+from core.emulator.addresses import AddressPool
 from core.emulator.data import InterfaceData, LinkData
 from core.emulator.enumerations import (
     LinkTypes,
@@ -409,6 +410,7 @@ class CoreNetwork(CoreNetworkBase):
             net.linked[iface] = {}
         iface.net = self
         iface.othernet = net
+        self.session.topology.invalidate()
         return iface
 
     def get_linked_iface(self, net: CoreNetworkBase) -> Optional[CoreInterface]:
@@ -598,6 +600,7 @@ class CtrlNet(CoreNetwork):
         :return:
         """
         self.prefix: netaddr.IPNetwork = netaddr.IPNetwork(prefix).cidr
+        self.addresses: AddressPool = AddressPool(str(self.prefix))
         self.hostid: Optional[int] = hostid
         self.assign_address: bool = assign_address
         self.updown_script: Optional[str] = updown_script
@@ -612,7 +615,8 @@ class CtrlNet(CoreNetwork):
         :return: nothing
         """
         use_ovs = self.session.use_ovs()
-        address = self.prefix[index]
+        address = self.addresses.address(index)
+        self.addresses.reserve(index, self.brname)
         current = f"{address}/{self.prefix.prefixlen}"
         net_client = get_net_client(use_ovs, utils.cmd)
         net_client.create_address(self.brname, current)
@@ -620,7 +624,8 @@ class CtrlNet(CoreNetwork):
         for name in servers:
             server = servers[name]
             index -= 1
-            address = self.prefix[index]
+            address = self.addresses.address(index)
+            self.addresses.reserve(index, name)
             current = f"{address}/{self.prefix.prefixlen}"
             net_client = get_net_client(use_ovs, server.remote_cmd)
             net_client.create_address(self.brname, current)
@@ -735,9 +740,8 @@ class PtpNet(CoreNetwork):
             node2_id=iface2.node.id,
             iface1=iface1_data,
             iface2=iface2_data,
-            options=iface1.local_options,
+            options=iface1.get_options(unidirectional),
         )
-        link_data.options.unidirectional = unidirectional
         all_links.append(link_data)
         # build a 2nd link message for the upstream link parameters
         # (swap if1 and if2)
@@ -749,9 +753,8 @@ class PtpNet(CoreNetwork):
                 node2_id=iface1.node.id,
                 iface1=InterfaceData(id=iface2_data.id),
                 iface2=InterfaceData(id=iface1_data.id),
-                options=iface2.local_options,
+                options=iface2.get_options(unidirectional),
             )
-            link_data.options.unidirectional = unidirectional
             all_links.append(link_data)
         return all_links
 
@@ -840,6 +843,17 @@ class WlanNode(CoreNetwork):
             iface.poshook = self.model.position_callback
             iface.setposition()
 
+    def detach(self, iface: CoreInterface) -> None:
+        """
+        Detach a network interface.
+
+        :param iface: network interface
+        :return: nothing
+        """
+        super().detach(iface)
+        if self.model:
+            self.model.remove_iface(iface)
+
     def setmodel(self, model: "WirelessModelType", config: Dict[str, str]):
         """
         Sets the mobility and wireless model.
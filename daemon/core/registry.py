@@ -0,0 +1,335 @@
+"""
+Lazy registry for services and models, backed by a cache of class metadata
+indexed from their modules. Modules are only imported on a cache miss, or when
+a class is first used.
+"""
+import importlib
+import json
+import logging
+import os
+import sys
+import threading
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Iterator,
+    List,
+    MutableMapping,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+from core import utils
+from core.constants import COREDPY_VERSION
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+CACHE_VERSION: int = 2
+
+
+@dataclass
+class RegistryEntry:
+    """
+    Metadata for a registered class, allowing it to be validated and listed
+    without importing its module.
+    """
+
+    module: str
+    class_name: str
+    name: str
+    group: Optional[str] = None
+    executables: List[str] = field(default_factory=list)
+    dependencies: List[str] = field(default_factory=list)
+    on_load: bool = False
+
+    @classmethod
+    def from_class(cls, module: str, clazz: Type, base: Type = None) -> "RegistryEntry":
+        """
+        Create an entry from a loaded class.
+
+        :param module: import statement for module class is defined in
+        :param clazz: class to create entry for
+        :param base: class type inherited from, to check if on load is overridden
+        :return: registry entry
+        """
+        on_load = getattr(getattr(clazz, "on_load", None), "__func__", None)
+        base_on_load = getattr(getattr(base, "on_load", None), "__func__", None)
+        return RegistryEntry(
+            module=module,
+            class_name=clazz.__name__,
+            name=clazz.name,
+            group=getattr(clazz, "group", None),
+            executables=list(getattr(clazz, "executables", ())),
+            dependencies=list(getattr(clazz, "dependencies", ())),
+            on_load=on_load is not base_on_load,
+        )
+
+
+class RegistryCache:
+    """
+    Cache of registry entries for the classes within module files, validated
+    by module file modification time and size, persisted to a json file. The
+    file is never opened through a symlink, is only readable by its owner, and
+    is only used within a directory no other user can write to.
+    """
+
+    def __init__(self, path: Optional[Path] = None) -> None:
+        """
+        Create a RegistryCache instance.
+
+        :param path: file to persist cache to, None to only cache in memory
+        """
+        self.path: Optional[Path] = path
+        self.modules: Dict[str, Dict[str, Any]] = {}
+        self.changed: bool = False
+        self.hits: int = 0
+        self.misses: int = 0
+        self.load()
+
+    def header(self) -> Dict[str, Any]:
+        """
+        Values that invalidate the whole cache when changed.
+
+        :return: cache header values
+        """
+        return {
+            "version": CACHE_VERSION,
+            "core": COREDPY_VERSION,
+            "python": sys.version,
+        }
+
+    def load(self) -> None:
+        """
+        Load cached entries from file, ignoring a missing, invalid, or outdated
+        cache file.
+
+        :return: nothing
+        """
+        if self.path is None:
+            return
+        try:
+            self.check_directory()
+            fd = os.open(self.path, os.O_RDONLY | os.O_NOFOLLOW)
+            with open(fd) as f:
+                self.check_file(fd)
+                data = json.load(f)
+            if data.get("header") == self.header():
+                self.modules = data["modules"]
+        except (OSError, ValueError, KeyError):
+            logger.debug("registry cache not loaded: %s", self.path)
+
+    def save(self) -> None:
+        """
+        Save cached entries to file, when changed.
+
+        :return: nothing
+        """
+        if self.path is None or not self.changed:
+            return
+        data = {"header": self.header(), "modules": self.modules}
+        flags = os.O_WRONLY | os.O_CREAT | os.O_NOFOLLOW
+        try:
+            self.path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            self.check_directory()
+            fd = os.open(self.path, flags, 0o600)
+            with open(fd, "w") as f:
+                self.check_file(fd)
+                f.truncate()
+                json.dump(data, f)
+            self.changed = False
+        except OSError as e:
+            logger.warning("unable to save registry cache %s: %s", self.path, e)
+
+    def check_directory(self) -> None:
+        """
+        Check the cache file directory is owned by the current user or root, and
+        cannot be written to by other users.
+
+        :return: nothing
+        :raises PermissionError: when directory is not trusted
+        """
+        directory = self.path.parent
+        info = os.stat(directory)
+        if info.st_uid not in (0, os.geteuid()) or info.st_mode & 0o022:
+            raise PermissionError(f"untrusted registry cache directory: {directory}")
+
+    def check_file(self, fd: int) -> None:
+        """
+        Check an opened cache file is owned by the current user and only
+        accessible by its owner.
+
+        :param fd: file descriptor of opened cache file
+        :return: nothing
+        :raises PermissionError: when file is not trusted
+        """
+        info = os.fstat(fd)
+        if info.st_uid != os.geteuid() or info.st_mode & 0o077:
+            raise PermissionError(f"untrusted registry cache file: {self.path}")
+
+    def entries(
+        self, module: str, file_path: Path, clazz: Type[T]
+    ) -> List[RegistryEntry]:
+        """
+        Retrieve entries for the classes of a given type within a module,
+        importing the module only when not cached or changed.
+
+        :param module: import statement for module
+        :param file_path: path to module file
+        :param clazz: class type expected to be inherited from
+        :return: entries for classes in module
+        """
+        try:
+            stat = file_path.stat()
+        except OSError:
+            stat = None
+        key = f"{clazz.__module__}.{clazz.__name__}:{module}"
+        cached = self.modules.get(key)
+        if stat is not None and cached is not None:
+            if cached["mtime"] == stat.st_mtime and cached["size"] == stat.st_size:
+                self.hits += 1
+                return [RegistryEntry(**x) for x in cached["entries"]]
+        self.misses += 1
+        entries = [
+            RegistryEntry.from_class(module, x, clazz)
+            for x in utils.load_module(module, clazz)
+        ]
+        if stat is not None:
+            self.modules[key] = {
+                "mtime": stat.st_mtime,
+                "size": stat.st_size,
+                "entries": [asdict(x) for x in entries],
+            }
+            self.changed = True
+        return entries
+
+
+class LazyRegistry(MutableMapping, Generic[T]):
+    """
+    Mapping of names to classes, where classes added by entry are only imported
+    and loaded when first retrieved. Iterating names and checking membership do
+    not import classes. Iterating values or items loads classes, skipping those
+    that fail to load, which are removed and recorded in errors.
+    """
+
+    def __init__(
+        self, clazz: Type[T] = None, loader: Callable[[Type[T]], None] = None
+    ) -> None:
+        """
+        Create a LazyRegistry instance.
+
+        :param clazz: class type registered classes must inherit from, None to
+            not check
+        :param loader: function invoked with a class when first loaded, an
+            exception marks the class as unavailable
+        """
+        self.clazz: Optional[Type[T]] = clazz
+        self.loader: Optional[Callable[[Type[T]], None]] = loader
+        self.entries: Dict[str, RegistryEntry] = {}
+        self.loaded: Dict[str, Type[T]] = {}
+        self.errors: List[str] = []
+        self.lock: threading.RLock = threading.RLock()
+
+    def add_entry(self, entry: RegistryEntry) -> None:
+        """
+        Register a class by entry, to be imported on first use.
+
+        :param entry: entry to register
+        :return: nothing
+        """
+        with self.lock:
+            self.entries[entry.name] = entry
+
+    def get_entry(self, name: str) -> Optional[RegistryEntry]:
+        """
+        Retrieve metadata for a registered class, without importing it.
+
+        :param name: name of class
+        :return: entry for class, None when not registered
+        """
+        with self.lock:
+            entry = self.entries.get(name)
+            if entry is None and name in self.loaded:
+                clazz = self.loaded[name]
+                entry = RegistryEntry.from_class(clazz.__module__, clazz)
+            return entry
+
+    def __getitem__(self, name: str) -> Type[T]:
+        with self.lock:
+            clazz = self.loaded.get(name)
+            if clazz is not None:
+                return clazz
+            entry = self.entries[name]
+            try:
+                module = importlib.import_module(entry.module)
+                clazz = getattr(module, entry.class_name)
+                if self.clazz and not issubclass(clazz, self.clazz):
+                    raise TypeError(f"{entry.class_name} is not a {self.clazz}")
+                if self.loader:
+                    self.loader(clazz)
+            except Exception:
+                logger.exception("error loading %s from %s", name, entry.module)
+                self.entries.pop(name)
+                self.errors.append(name)
+                raise KeyError(name)
+            logger.debug("loaded %s from %s", name, entry.module)
+            self.loaded[name] = clazz
+            return clazz
+
+    def __setitem__(self, name: str, clazz: Type[T]) -> None:
+        with self.lock:
+            self.entries.pop(name, None)
+            self.loaded[name] = clazz
+
+    def __delitem__(self, name: str) -> None:
+        with self.lock:
+            entry = self.entries.pop(name, None)
+            clazz = self.loaded.pop(name, None)
+            if entry is None and clazz is None:
+                raise KeyError(name)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self.loaded or name in self.entries
+
+    def __iter__(self) -> Iterator[str]:
+        with self.lock:
+            names = list(self.loaded)
+            names.extend(x for x in self.entries if x not in self.loaded)
+        return iter(names)
+
+    def __len__(self) -> int:
+        with self.lock:
+            return len(self.loaded.keys() | self.entries.keys())
+
+    def items(self) -> List[Tuple[str, Type[T]]]:
+        items = []
+        for name in self:
+            try:
+                items.append((name, self[name]))
+            except KeyError:
+                continue
+        return items
+
+    def values(self) -> List[Type[T]]:
+        return [x for _, x in self.items()]
+
+    def load(self, names: List[str]) -> List[str]:
+        """
+        Load the given classes now, rather than on first use.
+
+        :param names: names of classes to load
+        :return: names of classes that failed to load
+        """
+        errors = []
+        for name in names:
+            try:
+                self[name]
+            except KeyError:
+                errors.append(name)
+        return errors
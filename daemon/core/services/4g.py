@@ -3,7 +3,13 @@ Simple example custom service, used to drive shell commands on a node.
 """
 from typing import Tuple
 from core.nodes.base import CoreNode
-from core.services.coreservices import CoreService, ServiceMode
+from core.services.coreservices import (
+    CoreService,
+    ListenProbe,
+    LogProbe,
+    ReadinessProbe,
+    ServiceMode,
+)
 
 GROUP_NAME = "4G"
 
@@ -48,6 +54,10 @@ class HSSService(CoreService):
     validation_mode: ServiceMode = ServiceMode.NON_BLOCKING
     validation_timer: int = 5
     validation_period: float = 0.5
+    readiness: Tuple[ReadinessProbe, ...] = (
+        LogProbe("/var/log/open5gs/hss.log", "initialize...done"),
+    )
+    ready_dependencies: Tuple[str, ...] = ()
     shutdown: Tuple[str, ...] = ()
 
     @classmethod
@@ -177,6 +187,10 @@ class MMEService(CoreService):
     validation_mode: ServiceMode = ServiceMode.NON_BLOCKING
     validation_timer: int = 5
     validation_period: float = 0.5
+    readiness: Tuple[ReadinessProbe, ...] = (
+        ListenProbe(36412, "sctp"),
+    )
+    ready_dependencies: Tuple[str, ...] = ("HSS", "SGWC")
     shutdown: Tuple[str, ...] = ()
 
     @classmethod
@@ -306,6 +320,10 @@ class PCRFService(CoreService):
     validation_mode: ServiceMode = ServiceMode.NON_BLOCKING
     validation_timer: int = 5
     validation_period: float = 0.5
+    readiness: Tuple[ReadinessProbe, ...] = (
+        LogProbe("/var/log/open5gs/pcrf.log", "initialize...done"),
+    )
+    ready_dependencies: Tuple[str, ...] = ()
     shutdown: Tuple[str, ...] = ()
 
     @classmethod
@@ -432,6 +450,11 @@ class SGWCService(CoreService):
     validation_mode: ServiceMode = ServiceMode.NON_BLOCKING
     validation_timer: int = 5
     validation_period: float = 0.5
+    readiness: Tuple[ReadinessProbe, ...] = (
+        ListenProbe(2123, "udp"),
+        LogProbe("/var/log/open5gs/sgwc.log", "initialize...done"),
+    )
+    ready_dependencies: Tuple[str, ...] = ("SGWU",)
     shutdown: Tuple[str, ...] = ()
 
     @classmethod
@@ -668,6 +691,12 @@ class SGWUService(CoreService):
     validation_mode: ServiceMode = ServiceMode.NON_BLOCKING
     validation_timer: int = 5
     validation_period: float = 0.5
+    readiness: Tuple[ReadinessProbe, ...] = (
+        ListenProbe(8805, "udp"),
+        ListenProbe(2152, "udp"),
+        LogProbe("/var/log/open5gs/sgwu.log", "initialize...done"),
+    )
+    ready_dependencies: Tuple[str, ...] = ()
     shutdown: Tuple[str, ...] = ()
 
     @classmethod
@@ -893,6 +922,12 @@ class PGWCService(CoreService):
     validation_mode: ServiceMode = ServiceMode.NON_BLOCKING
     validation_timer: int = 5
     validation_period: float = 0.5
+    readiness: Tuple[ReadinessProbe, ...] = (
+        ListenProbe(8805, "udp"),
+        ListenProbe(2123, "udp"),
+        LogProbe("/var/log/open5gs/smf.log", "initialize...done"),
+    )
+    ready_dependencies: Tuple[str, ...] = ("PGWU",)
     shutdown: Tuple[str, ...] = ()
 
     @classmethod
@@ -1534,6 +1569,12 @@ class PGWUService(CoreService):
     validation_mode: ServiceMode = ServiceMode.NON_BLOCKING
     validation_timer: int = 5
     validation_period: float = 0.5
+    readiness: Tuple[ReadinessProbe, ...] = (
+        ListenProbe(8805, "udp"),
+        ListenProbe(2152, "udp"),
+        LogProbe("/var/log/open5gs/upf.log", "initialize...done"),
+    )
+    ready_dependencies: Tuple[str, ...] = ()
     shutdown: Tuple[str, ...] = ()
 
     @classmethod
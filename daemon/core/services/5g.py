@@ -3,7 +3,13 @@ Simple example custom service, used to drive shell commands on a node.
 """
 from typing import Tuple
 from core.nodes.base import CoreNode
-from core.services.coreservices import CoreService, ServiceMode
+from core.services.coreservices import (
+    CoreService,
+    ListenProbe,
+    LogProbe,
+    ReadinessProbe,
+    ServiceMode,
+)
 
 GROUP_NAME = "5G"
 
@@ -48,6 +54,12 @@ class AMFService(CoreService):
     validation_mode: ServiceMode = ServiceMode.NON_BLOCKING
     validation_timer: int = 5
     validation_period: float = 0.5
+    readiness: Tuple[ReadinessProbe, ...] = (
+        ListenProbe(7777),
+        ListenProbe(38412, "sctp"),
+        LogProbe("/var/log/open5gs/amf.log", "initialize...done"),
+    )
+    ready_dependencies: Tuple[str, ...] = ("NRF",)
     shutdown: Tuple[str, ...] = ()
 
     @classmethod
@@ -486,6 +498,11 @@ class AUSFService(CoreService):
     validation_mode: ServiceMode = ServiceMode.NON_BLOCKING
     validation_timer: int = 5
     validation_period: float = 0.5
+    readiness: Tuple[ReadinessProbe, ...] = (
+        ListenProbe(7777),
+        LogProbe("/var/log/open5gs/ausf.log", "initialize...done"),
+    )
+    ready_dependencies: Tuple[str, ...] = ("NRF",)
     shutdown: Tuple[str, ...] = ()
 
     @classmethod
@@ -747,6 +764,11 @@ class BSFService(CoreService):
     validation_mode: ServiceMode = ServiceMode.NON_BLOCKING
     validation_timer: int = 5
     validation_period: float = 0.5
+    readiness: Tuple[ReadinessProbe, ...] = (
+        ListenProbe(7777),
+        LogProbe("/var/log/open5gs/bsf.log", "initialize...done"),
+    )
+    ready_dependencies: Tuple[str, ...] = ("NRF",)
     shutdown: Tuple[str, ...] = ()
 
     @classmethod
@@ -1013,6 +1035,11 @@ class NRFService(CoreService):
     validation_mode: ServiceMode = ServiceMode.NON_BLOCKING
     validation_timer: int = 5
     validation_period: float = 0.5
+    readiness: Tuple[ReadinessProbe, ...] = (
+        ListenProbe(7777),
+        LogProbe("/var/log/open5gs/nrf.log", "initialize...done"),
+    )
+    ready_dependencies: Tuple[str, ...] = ()
     shutdown: Tuple[str, ...] = ()
 
     @classmethod
@@ -1240,6 +1267,11 @@ class NSSFService(CoreService):
     validation_mode: ServiceMode = ServiceMode.NON_BLOCKING
     validation_timer: int = 5
     validation_period: float = 0.5
+    readiness: Tuple[ReadinessProbe, ...] = (
+        ListenProbe(7777),
+        LogProbe("/var/log/open5gs/nssf.log", "initialize...done"),
+    )
+    ready_dependencies: Tuple[str, ...] = ("NRF",)
     shutdown: Tuple[str, ...] = ()
 
     @classmethod
@@ -1551,6 +1583,11 @@ class PCFService(CoreService):
     validation_mode: ServiceMode = ServiceMode.NON_BLOCKING
     validation_timer: int = 5
     validation_period: float = 0.5
+    readiness: Tuple[ReadinessProbe, ...] = (
+        ListenProbe(7777),
+        LogProbe("/var/log/open5gs/pcf.log", "initialize...done"),
+    )
+    ready_dependencies: Tuple[str, ...] = ("NRF",)
     shutdown: Tuple[str, ...] = ()
 
     @classmethod
@@ -1816,6 +1853,12 @@ class SMFService(CoreService):
     validation_mode: ServiceMode = ServiceMode.NON_BLOCKING
     validation_timer: int = 5
     validation_period: float = 0.5
+    readiness: Tuple[ReadinessProbe, ...] = (
+        ListenProbe(7777),
+        ListenProbe(8805, "udp"),
+        LogProbe("/var/log/open5gs/smf.log", "initialize...done"),
+    )
+    ready_dependencies: Tuple[str, ...] = ("NRF", "UPF")
     shutdown: Tuple[str, ...] = ()
 
     @classmethod
@@ -2467,6 +2510,11 @@ class UDMService(CoreService):
     validation_mode: ServiceMode = ServiceMode.NON_BLOCKING
     validation_timer: int = 5
     validation_period: float = 0.5
+    readiness: Tuple[ReadinessProbe, ...] = (
+        ListenProbe(7777),
+        LogProbe("/var/log/open5gs/udm.log", "initialize...done"),
+    )
+    ready_dependencies: Tuple[str, ...] = ("NRF",)
     shutdown: Tuple[str, ...] = ()
 
     @classmethod
@@ -2728,6 +2776,11 @@ class UDRService(CoreService):
     validation_mode: ServiceMode = ServiceMode.NON_BLOCKING
     validation_timer: int = 5
     validation_period: float = 0.5
+    readiness: Tuple[ReadinessProbe, ...] = (
+        ListenProbe(7777),
+        LogProbe("/var/log/open5gs/udr.log", "initialize...done"),
+    )
+    ready_dependencies: Tuple[str, ...] = ("NRF",)
     shutdown: Tuple[str, ...] = ()
 
     @classmethod
@@ -3001,6 +3054,12 @@ class UPFService(CoreService):
     validation_mode: ServiceMode = ServiceMode.NON_BLOCKING
     validation_timer: int = 5
     validation_period: float = 0.5
+    readiness: Tuple[ReadinessProbe, ...] = (
+        ListenProbe(8805, "udp"),
+        ListenProbe(2152, "udp"),
+        LogProbe("/var/log/open5gs/upf.log", "initialize...done"),
+    )
+    ready_dependencies: Tuple[str, ...] = ()
     shutdown: Tuple[str, ...] = ()
 
     @classmethod
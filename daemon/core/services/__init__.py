@@ -6,15 +6,17 @@ __all__ is automatically loaded by the main core module.
 """
 from pathlib import Path
 
+from core.registry import RegistryCache
 from core.services.coreservices import ServiceManager
 
 _PATH: Path = Path(__file__).resolve().parent
 
 
-def load():
+def load(cache: RegistryCache = None):
     """
     Loads all services from the modules that reside under core.services.
 
+    :param cache: cache of service metadata
     :return: list of services that failed to load
     """
-    return ServiceManager.add_services(_PATH)
+    return ServiceManager.add_services(_PATH, cache)
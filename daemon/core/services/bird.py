@@ -36,11 +36,7 @@ class Bird(CoreService):
         """
         Helper to return the first IPv4 address of a node as its router ID.
         """
-        for iface in node.get_ifaces(control=False):
-            ip4 = iface.get_ip4()
-            if ip4:
-                return str(ip4.ip)
-        return "0.0.0.0"
+        return node.session.topology.router_id(node) or "0.0.0.0"
 
     @classmethod
     def generate_bird_config(cls, node: CoreNode) -> str:
@@ -9,7 +9,11 @@ services.
 
 import enum
 import logging
+import math
+import shlex
+import threading
 import time
+from dataclasses import dataclass
 from pathlib import Path
 from typing import (
     TYPE_CHECKING,
@@ -33,6 +37,7 @@ from core.errors import (
     CoreServiceError,
 )
 from core.nodes.base import CoreNode
+from core.registry import LazyRegistry, RegistryCache, RegistryEntry
 
 logger = logging.getLogger(__name__)
 
@@ -48,6 +53,67 @@ class ServiceMode(enum.Enum):
     TIMER = 2
 
 
+@dataclass(frozen=True)
+class ListenProbe:
+    """
+    Readiness probe checking for a socket listening on a port within a node.
+    """
+
+    port: int
+    protocol: str = "tcp"
+
+    def condition(self) -> str:
+        flag = {"tcp": "t", "udp": "u", "sctp": "S"}[self.protocol]
+        return f"ss -Hln{flag} 'sport = :{self.port}' | grep -q ."
+
+
+@dataclass(frozen=True)
+class LogProbe:
+    """
+    Readiness probe checking for a marker within a log file within a node.
+    """
+
+    path: str
+    marker: str
+
+    def condition(self) -> str:
+        marker = shlex.quote(self.marker)
+        path = shlex.quote(self.path)
+        return f"grep -qF {marker} {path} 2>/dev/null"
+
+
+ReadinessProbe = Union[ListenProbe, LogProbe]
+
+
+def readiness_script(
+    name: str, probes: Iterable[ReadinessProbe], timeout: float, period: float
+) -> str:
+    """
+    Create a shell script that checks all probes periodically within a node,
+    exiting successfully once all probes pass, or with an error on timeout.
+
+    :param name: name of service being probed
+    :param probes: probes to check
+    :param timeout: time in seconds to check probes for
+    :param period: time in seconds between checks
+    :return: readiness script
+    """
+    attempts = max(1, math.ceil(timeout / period))
+    conditions = " && ".join(x.condition() for x in probes)
+    return f"""#!/bin/sh
+# readiness probe for service: {name}
+i=0
+while [ $i -lt {attempts} ]; do
+    if {conditions}; then
+        exit 0
+    fi
+    i=$((i + 1))
+    sleep {period}
+done
+exit 1
+"""
+
+
 class ServiceDependencies:
     """
     Can generate boot paths for services, based on their dependencies. Will validate
@@ -218,7 +284,7 @@ class ServiceManager:
     Manages services available for CORE nodes to use.
     """
 
-    services: Dict[str, Type["CoreService"]] = {}
+    services: LazyRegistry = LazyRegistry(loader=lambda x: x.on_load())
 
     @classmethod
     def add(cls, service: Type["CoreService"]) -> None:
@@ -267,23 +333,58 @@ class ServiceManager:
         return service
 
     @classmethod
-    def add_services(cls, path: Path) -> List[str]:
+    def add_entry(cls, entry: RegistryEntry) -> None:
         """
-        Method for retrieving all CoreServices from a given path.
+        Add a service to manager by its metadata, deferring importing and loading
+        the service until first used, unless it has on load logic to validate.
+
+        :param entry: entry for service to add
+        :return: nothing
+        :raises ValueError: when service is a duplicate or fails on load
+        :raises CoreError: when service has unmet executables
+        """
+        name = entry.name
+        logger.debug("indexing service: class(%s) name(%s)", entry.class_name, name)
+
+        # avoid duplicate services
+        if name in cls.services:
+            raise ValueError("duplicate service being added: %s" % name)
+
+        # validate dependent executables are present
+        for executable in entry.executables:
+            try:
+                utils.which(executable, required=True)
+            except CoreError as e:
+                raise CoreError(f"service({name}): {e}")
+
+        # make service available, to be loaded on first use
+        cls.services.add_entry(entry)
+
+        # validate service on load succeeds
+        if entry.on_load and cls.services.load([name]):
+            raise ValueError(f"error during service({name}) on load")
+
+    @classmethod
+    def add_services(cls, path: Path, cache: RegistryCache = None) -> List[str]:
+        """
+        Method for indexing all CoreServices from a given path.
 
         :param path: path to retrieve services from
+        :param cache: cache of service metadata, avoids importing service modules
+            that have not changed
         :return: list of core services that failed to load
         """
+        cache = cache if cache else RegistryCache()
         service_errors = []
-        services = utils.load_classes(path, CoreService)
-        for service in services:
-            if not service.name:
-                continue
-            try:
-                cls.add(service)
-            except (CoreError, ValueError) as e:
-                service_errors.append(service.name)
-                logger.debug("not loading service(%s): %s", service.name, e)
+        for module, file_path in utils.find_modules(path):
+            for entry in cache.entries(module, file_path, CoreService):
+                if not entry.name:
+                    continue
+                try:
+                    cls.add_entry(entry)
+                except (CoreError, ValueError) as e:
+                    service_errors.append(entry.name)
+                    logger.debug("not loading service(%s): %s", entry.name, e)
         return service_errors
 
 
@@ -316,12 +417,102 @@ class CoreServices:
         }
         # dict of node ids to dict of custom services by name
         self.custom_services: Dict[int, Dict[str, "CoreService"]] = {}
+        # events set once a node service has booted, by node id and service name
+        self.ready: Dict[Tuple[int, str], threading.Event] = {}
+        self.ready_lock: threading.Lock = threading.Lock()
 
     def reset(self) -> None:
         """
         Called when config message with reset flag is received
         """
         self.custom_services.clear()
+        self.clear_ready()
+
+    def clear_ready(self) -> None:
+        """
+        Clear the ready state of all node services, prior to booting.
+
+        :return: nothing
+        """
+        with self.ready_lock:
+            self.ready.clear()
+
+    def ready_event(self, node_id: int, name: str) -> threading.Event:
+        """
+        Retrieve the event set once a node service has booted.
+
+        :param node_id: id of node service is on
+        :param name: name of service
+        :return: ready event
+        """
+        with self.ready_lock:
+            key = (node_id, name)
+            event = self.ready.get(key)
+            if event is None:
+                event = threading.Event()
+                self.ready[key] = event
+            return event
+
+    def ready_providers(self, names: Iterable[str]) -> List[Tuple[CoreNode, str]]:
+        """
+        Find the nodes within the session running any of the given services.
+
+        :param names: names of services to find
+        :return: nodes and names of services found
+        """
+        names = set(names)
+        providers = []
+        for node in self.session.nodes.values():
+            if not isinstance(node, CoreNode):
+                continue
+            for service in node.services:
+                if service.name in names:
+                    providers.append((node, service.name))
+        return providers
+
+    def ready_depth(self, node: CoreNode) -> int:
+        """
+        Determine how deep the chain of ready dependencies is for the services of
+        a node, used to boot nodes providing services before nodes waiting on them.
+
+        :param node: node to determine depth for
+        :return: ready dependency depth for node
+        """
+
+        def depth(name: str, visited: Set[str]) -> int:
+            service = ServiceManager.get(name)
+            if service is None or name in visited:
+                return 0
+            visited = visited | {name}
+            depths = [depth(x, visited) + 1 for x in service.ready_dependencies]
+            return max(depths, default=0)
+
+        return max((depth(x.name, set()) for x in node.services), default=0)
+
+    def wait_ready(self, node: CoreNode, service: "CoreServiceType") -> None:
+        """
+        Wait for the services a service depends on being ready, on any node within
+        the session, to finish booting.
+
+        :param node: node service is being booted on
+        :param service: service to wait for dependencies of
+        :return: nothing
+        """
+        if not service.ready_dependencies:
+            return
+        end = time.monotonic() + service.ready_timeout
+        for provider, name in self.ready_providers(service.ready_dependencies):
+            if provider is node and name == service.name:
+                continue
+            event = self.ready_event(provider.id, name)
+            if not event.wait(max(0.0, end - time.monotonic())):
+                logger.warning(
+                    "node(%s) service(%s) timed out waiting for node(%s) service(%s)",
+                    node.name,
+                    service.name,
+                    provider.name,
+                    name,
+                )
 
     def get_default_services(self, node_type: str) -> List[Type["CoreService"]]:
         """
@@ -451,10 +642,25 @@ class CoreServices:
         """
         boot_paths = ServiceDependencies(node.services).boot_order()
         funcs = []
+        services = []
         for boot_path in boot_paths:
             args = (node, boot_path)
             funcs.append((self._boot_service_path, args, {}))
-        result, exceptions = utils.threadpool(funcs)
+            for service in boot_path:
+                service = self.get_service(node.id, service.name, default_service=True)
+                services.append(service)
+        try:
+            # create directories and files for all services in a single pass
+            try:
+                self.create_node_files(node, services)
+            except Exception as e:
+                logger.exception("exception creating node(%s) files", node.name)
+                raise CoreServiceBootError(e)
+            result, exceptions = utils.threadpool(funcs)
+        finally:
+            # unblock services waiting on services that failed or never started
+            for service in node.services:
+                self.ready_event(node.id, service.name).set()
         if exceptions:
             raise CoreServiceBootError(*exceptions)
 
@@ -467,18 +673,24 @@ class CoreServices:
         for service in boot_path:
             service = self.get_service(node.id, service.name, default_service=True)
             try:
-                self.boot_service(node, service)
+                self.boot_service(node, service, prepared=True)
             except Exception as e:
                 logger.exception("exception booting service: %s", service.name)
                 raise CoreServiceBootError(e)
+            finally:
+                self.ready_event(node.id, service.name).set()
 
-    def boot_service(self, node: CoreNode, service: "CoreServiceType") -> None:
+    def boot_service(
+        self, node: CoreNode, service: "CoreServiceType", prepared: bool = False
+    ) -> None:
         """
         Start a service on a node. Create private dirs, generate config
         files, and execute startup commands.
 
         :param node: node to boot services on
         :param service: service to start
+        :param prepared: True when private dirs and config files were already
+            created for the node, False otherwise
         :return: nothing
         """
         logger.info(
@@ -488,25 +700,26 @@ class CoreServices:
             service.validation_mode.name,
         )
 
-        # create service directories
-        for directory in service.dirs:
-            dir_path = Path(directory)
-            try:
-                node.create_dir(dir_path)
-            except (CoreCommandError, CoreError) as e:
-                logger.warning(
-                    "error mounting private dir '%s' for service '%s': %s",
-                    directory,
-                    service.name,
-                    e,
-                )
+        profiler = node.session.profiler
+        args = dict(node=node.name, service=service.name)
 
-        # create service files
-        self.create_service_files(node, service)
+        # wait for services this service relies on to be ready
+        with profiler.span("ready_dependencies", "service", **args):
+            self.wait_ready(node, service)
+
+        if not prepared:
+            # create service directories
+            with profiler.span("directories", "service", **args):
+                self.create_service_dirs(node, service)
+
+            # create service files
+            with profiler.span("files", "service", **args):
+                self.create_service_files(node, service)
 
         # run startup
         wait = service.validation_mode == ServiceMode.BLOCKING
-        status = self.startup_service(node, service, wait)
+        with profiler.span("startup", "service", **args):
+            status = self.startup_service(node, service, wait)
         if status:
             raise CoreServiceBootError(
                 "node(%s) service(%s) error during startup" % (node.name, service.name)
@@ -516,26 +729,36 @@ class CoreServices:
         if wait:
             return
 
-        # timer mode, sleep and return
-        if service.validation_mode == ServiceMode.TIMER:
-            time.sleep(service.validation_timer)
-        # non-blocking, attempt to validate periodically, up to validation_timer time
-        elif service.validation_mode == ServiceMode.NON_BLOCKING:
-            start = time.monotonic()
-            while True:
-                status = self.validate_service(node, service)
-                if not status:
-                    break
-
-                if time.monotonic() - start > service.validation_timer:
-                    break
-
-                time.sleep(service.validation_period)
-
-            if status:
-                raise CoreServiceBootError(
-                    "node(%s) service(%s) failed validation" % (node.name, service.name)
-                )
+        with profiler.span("validation", "service", **args):
+            # readiness probes, checked by a single probe loop within the node
+            if service.readiness:
+                status = self.probe_service(node, service)
+                if status:
+                    raise CoreServiceBootError(
+                        "node(%s) service(%s) failed readiness probes"
+                        % (node.name, service.name)
+                    )
+            # timer mode, sleep and return
+            elif service.validation_mode == ServiceMode.TIMER:
+                time.sleep(service.validation_timer)
+            # non-blocking, attempt to validate periodically, up to validation_timer
+            elif service.validation_mode == ServiceMode.NON_BLOCKING:
+                start = time.monotonic()
+                while True:
+                    status = self.validate_service(node, service)
+                    if not status:
+                        break
+
+                    if time.monotonic() - start > service.validation_timer:
+                        break
+
+                    time.sleep(service.validation_period)
+
+                if status:
+                    raise CoreServiceBootError(
+                        "node(%s) service(%s) failed validation"
+                        % (node.name, service.name)
+                    )
 
     def copy_service_file(self, node: CoreNode, file_path: Path, cfg: str) -> bool:
         """
@@ -585,6 +808,36 @@ class CoreServices:
 
         return status
 
+    def probe_service(self, node: CoreNode, service: "CoreServiceType") -> int:
+        """
+        Run the readiness probes for a service, within a single probe loop on the
+        node, until all probes pass or the validation timer expires.
+
+        :param node: node to probe service on
+        :param service: service to probe
+        :return: service probe status
+        """
+        logger.debug("probing node(%s) service(%s)", node.name, service.name)
+        script = readiness_script(
+            service.name,
+            service.readiness,
+            service.validation_timer,
+            service.validation_period,
+        )
+        file_path = Path(f"ready_{service.name}.sh")
+        node.create_file(file_path, script)
+        try:
+            node.cmd(f"sh {file_path}")
+        except CoreCommandError as e:
+            logger.debug(
+                "node(%s) service(%s) readiness failed: %s",
+                node.name,
+                service.name,
+                e.output,
+            )
+            return -1
+        return 0
+
     def stop_services(self, node: CoreNode) -> None:
         """
         Stop all services on a node.
@@ -712,14 +965,55 @@ class CoreServices:
             cmds = service.get_startup(node)
 
         status = 0
-        for cmd in cmds:
-            try:
-                node.cmd(cmd, wait)
-            except CoreCommandError:
-                logger.exception("error starting command")
+        for result in node.cmds(list(cmds), wait):
+            if result.status:
+                logger.error(
+                    "error starting command(%s): %s", result.args, result.stderr
+                )
                 status = -1
         return status
 
+    def create_service_dirs(self, node: CoreNode, service: "CoreServiceType") -> None:
+        """
+        Creates node service private directories.
+
+        :param node: node to create directories for
+        :param service: service to create directories for
+        :return: nothing
+        """
+        for directory in service.dirs:
+            dir_path = Path(directory)
+            try:
+                node.create_dir(dir_path)
+            except (CoreCommandError, CoreError) as e:
+                logger.warning(
+                    "error mounting private dir '%s' for service '%s': %s",
+                    directory,
+                    service.name,
+                    e,
+                )
+
+    def create_node_files(
+        self, node: CoreNode, services: List["CoreServiceType"]
+    ) -> None:
+        """
+        Creates private directories and files for all the given node services,
+        writing the files for the node in a single pass.
+
+        :param node: node to create service directories and files for
+        :param services: services to create directories and files for
+        :return: nothing
+        """
+        profiler = node.session.profiler
+        with profiler.span("directories", "services", node=node.name):
+            for service in services:
+                self.create_service_dirs(node, service)
+        with profiler.span("files", "services", node=node.name):
+            files = []
+            for service in services:
+                files.extend(self.get_service_files(node, service))
+            node.create_files(files)
+
     def create_service_files(self, node: CoreNode, service: "CoreServiceType") -> None:
         """
         Creates node service files.
@@ -728,10 +1022,24 @@ class CoreServices:
         :param service: service to reconfigure
         :return: nothing
         """
+        node.create_files(self.get_service_files(node, service))
+
+    def get_service_files(
+        self, node: CoreNode, service: "CoreServiceType"
+    ) -> List[Tuple[Path, str, int]]:
+        """
+        Generates node service files, copying files referenced by custom configs
+        directly to the node.
+
+        :param node: node to generate service files for
+        :param service: service to generate files for
+        :return: tuples of file path, contents, and mode for files to create
+        """
         # get values depending on if custom or not
         config_files = service.configs
         if not service.custom:
             config_files = service.get_configs(node)
+        files = []
         for file_name in config_files:
             file_path = Path(file_name)
             logger.debug(
@@ -750,7 +1058,8 @@ class CoreServices:
                     continue
             else:
                 cfg = service.generate_config(node, file_name)
-            node.create_file(file_path, cfg)
+            files.append((file_path, cfg, 0o644))
+        return files
 
     def service_reconfigure(self, node: CoreNode, service: "CoreService") -> None:
         """
@@ -818,6 +1127,16 @@ class CoreService:
     # validation period in seconds, how frequent validation is attempted
     validation_period: float = 0.5
 
+    # readiness probes checked within the node, used instead of validate commands
+    # in non-blocking mode, when defined
+    readiness: Tuple[ReadinessProbe, ...] = ()
+
+    # services, on any node in the session, that must be ready before starting
+    ready_dependencies: Tuple[str, ...] = ()
+
+    # time to wait in seconds for ready dependencies, before starting regardless
+    ready_timeout: int = 60
+
     # metadata associated with this service
     meta: Optional[str] = None
 
@@ -8,7 +8,7 @@ import netaddr
 
 from core.emane.nodes import EmaneNet
 from core.nodes.base import CoreNode
-from core.nodes.interface import DEFAULT_MTU, CoreInterface
+from core.nodes.interface import CoreInterface
 from core.nodes.network import PtpNet, WlanNode
 from core.nodes.physical import Rj45Node
 from core.services.coreservices import CoreService
@@ -332,11 +332,7 @@ class FrrService(CoreService):
         """
         Helper to return the first IPv4 address of a node as its router ID.
         """
-        for iface in node.get_ifaces(control=False):
-            ip4 = iface.get_ip4()
-            if ip4:
-                return str(ip4.ip)
-        return "0.0.0.0"
+        return node.session.topology.router_id(node) or "0.0.0.0"
 
     @staticmethod
     def rj45check(iface: CoreInterface) -> bool:
@@ -384,15 +380,8 @@ class FRROspfv2(FrrService):
         mtu-ignore command. This is needed when e.g. a node is linked via a
         GreTap device.
         """
-        if iface.mtu != DEFAULT_MTU:
-            # a workaround for PhysicalNode GreTap, which has no knowledge of
-            # the other nodes/nets
+        if iface.session.topology.has_mtu_mismatch(iface):
             return "  ip ospf mtu-ignore\n"
-        if not iface.net:
-            return ""
-        for iface in iface.net.get_ifaces():
-            if iface.mtu != iface.mtu:
-                return "  ip ospf mtu-ignore\n"
         return ""
 
     @staticmethod
@@ -441,13 +430,7 @@ class FRROspfv3(FrrService):
         Helper to discover the minimum MTU of interfaces linked with the
         given interface.
         """
-        mtu = iface.mtu
-        if not iface.net:
-            return mtu
-        for iface in iface.net.get_ifaces():
-            if iface.mtu < mtu:
-                mtu = iface.mtu
-        return mtu
+        return iface.session.topology.min_mtu(iface)
 
     @classmethod
     def mtu_check(cls, iface: CoreInterface) -> str:
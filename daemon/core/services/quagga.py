@@ -8,7 +8,7 @@ import netaddr
 from core.emane.nodes import EmaneNet
 from core.emulator.enumerations import LinkTypes
 from core.nodes.base import CoreNode
-from core.nodes.interface import DEFAULT_MTU, CoreInterface
+from core.nodes.interface import CoreInterface
 from core.nodes.network import PtpNet, WlanNode
 from core.nodes.physical import Rj45Node
 from core.services.coreservices import CoreService
@@ -249,11 +249,8 @@ class QuaggaService(CoreService):
         """
         Helper to return the first IPv4 address of a node as its router ID.
         """
-        for iface in node.get_ifaces(control=False):
-            ip4 = iface.get_ip4()
-            if ip4:
-                return str(ip4.ip)
-        return f"0.0.0.{node.id:d}"
+        router_id = node.session.topology.router_id(node)
+        return router_id or f"0.0.0.{node.id:d}"
 
     @staticmethod
     def rj45check(iface: CoreInterface) -> bool:
@@ -301,15 +298,8 @@ class Ospfv2(QuaggaService):
         mtu-ignore command. This is needed when e.g. a node is linked via a
         GreTap device.
         """
-        if iface.mtu != DEFAULT_MTU:
-            # a workaround for PhysicalNode GreTap, which has no knowledge of
-            # the other nodes/nets
+        if iface.session.topology.has_mtu_mismatch(iface):
             return "  ip ospf mtu-ignore\n"
-        if not iface.net:
-            return ""
-        for iface in iface.net.get_ifaces():
-            if iface.mtu != iface.mtu:
-                return "  ip ospf mtu-ignore\n"
         return ""
 
     @staticmethod
@@ -370,13 +360,7 @@ class Ospfv3(QuaggaService):
         Helper to discover the minimum MTU of interfaces linked with the
         given interface.
         """
-        mtu = iface.mtu
-        if not iface.net:
-            return mtu
-        for iface in iface.net.get_ifaces():
-            if iface.mtu < mtu:
-                mtu = iface.mtu
-        return mtu
+        return iface.session.topology.min_mtu(iface)
 
     @classmethod
     def mtu_check(cls, iface: CoreInterface) -> str:
@@ -16,6 +16,7 @@ import shlex
 import shutil
 import sys
 import threading
+import time
 from pathlib import Path
 from subprocess import PIPE, STDOUT, Popen
 from typing import (
@@ -33,8 +34,7 @@ from typing import (
     Union,
 )
 
-import netaddr
-
+from core.emulator import profiler
 from core.errors import CoreCommandError, CoreError
 
 logger = logging.getLogger(__name__)
@@ -47,6 +47,7 @@ T = TypeVar("T")
 
 DEVNULL = open(os.devnull, "wb")
 IFACE_CONFIG_FACTOR: int = 1000
+_PATH_EXECUTABLES: Dict[str, Dict[str, List[str]]] = {}
 
 
 def execute_script(coreemu: "CoreEmu", file_path: Path, args: str) -> None:
@@ -158,16 +159,48 @@ def close_onexec(fd: int) -> None:
     fcntl.fcntl(fd, fcntl.F_SETFD, fdflags | fcntl.FD_CLOEXEC)
 
 
+def path_executables() -> Dict[str, List[str]]:
+    """
+    Index the files within current PATH directories by name, scanning each
+    directory once for a given PATH.
+
+    :return: file names mapped to paths, in PATH order
+    """
+    path = os.environ.get("PATH", os.defpath)
+    index = _PATH_EXECUTABLES.get(path)
+    if index is None:
+        index = {}
+        for directory in path.split(os.pathsep):
+            try:
+                names = os.listdir(directory)
+            except OSError:
+                continue
+            for name in names:
+                index.setdefault(name, []).append(os.path.join(directory, name))
+        _PATH_EXECUTABLES.clear()
+        _PATH_EXECUTABLES[path] = index
+    return index
+
+
 def which(command: str, required: bool) -> str:
     """
-    Find location of desired executable within current PATH.
+    Find location of desired executable within current PATH. Names are looked
+    up from an index of PATH, falling back to searching PATH for executables
+    added since it was indexed.
 
     :param command: command to find location for
     :param required: command is required to be found, false otherwise
     :return: command location or None
     :raises ValueError: when not found and required
     """
-    found_path = shutil.which(command)
+    found_path = None
+    if not os.path.dirname(command):
+        for candidate in path_executables().get(command, []):
+            if os.access(candidate, os.X_OK) and not os.path.isdir(candidate):
+                found_path = candidate
+                break
+    if found_path is None:
+        found_path = shutil.which(command)
     if found_path is None and required:
         raise CoreError(f"failed to find required executable({command}) in path")
     return found_path
@@ -227,6 +260,8 @@ def cmd(
         execute is not found
     """
     logger.debug("command cwd(%s) wait(%s): %s", cwd, wait, args)
+    start = time.monotonic()
+    command = args
     if shell is False:
         args = shlex.split(args)
     try:
@@ -245,24 +280,29 @@ def cmd(
     except OSError as e:
         logger.error("cmd error: %s", e.strerror)
         raise CoreCommandError(1, args, "", e.strerror)
+    finally:
+        profiler.record_command(command, start)
 
 
 def file_munge(pathname: str, header: str, text: str) -> None:
     """
-    Insert text at the end of a file, surrounded by header comments.
+    Insert text at the end of a file, surrounded by header comments, replacing
+    any text previously inserted with the same header within a single write.
 
     :param pathname: file path to add text to
     :param header: header text comments
     :param text: text to append to file
     :return: nothing
     """
+    with open(pathname, "r") as read_file:
+        lines = read_file.readlines()
     # prevent duplicates
-    file_demunge(pathname, header)
-
-    with open(pathname, "a") as append_file:
-        append_file.write(f"# BEGIN {header}\n")
-        append_file.write(text)
-        append_file.write(f"# END {header}\n")
+    lines = _demunge_lines(lines, header)
+    lines.append(f"# BEGIN {header}\n")
+    lines.append(text)
+    lines.append(f"# END {header}\n")
+    with open(pathname, "w") as write_file:
+        write_file.write("".join(lines))
 
 
 def file_demunge(pathname: str, header: str) -> None:
@@ -275,22 +315,31 @@ def file_demunge(pathname: str, header: str) -> None:
     """
     with open(pathname, "r") as read_file:
         lines = read_file.readlines()
+    demunged = _demunge_lines(lines, header)
+    if len(demunged) == len(lines):
+        return
+    with open(pathname, "w") as write_file:
+        write_file.write("".join(demunged))
+
+
+def _demunge_lines(lines: List[str], header: str) -> List[str]:
+    """
+    Remove lines surrounded by header comments.
 
+    :param lines: lines to remove header text from
+    :param header: header text to target for removal
+    :return: lines without header text
+    """
     start = None
     end = None
-
     for i, line in enumerate(lines):
         if line == f"# BEGIN {header}\n":
             start = i
         elif line == f"# END {header}\n":
             end = i + 1
-
     if start is None or end is None:
-        return
-
-    with open(pathname, "w") as write_file:
-        lines = lines[:start] + lines[end:]
-        write_file.write("".join(lines))
+        return list(lines)
+    return lines[:start] + lines[end:]
 
 
 def expand_corepath(
@@ -363,13 +412,12 @@ def load_module(import_statement: str, clazz: Generic[T]) -> List[T]:
     return classes
 
 
-def load_classes(path: Path, clazz: Generic[T]) -> List[T]:
+def find_modules(path: Path) -> List[Tuple[str, Path]]:
     """
-    Dynamically load classes for use within CORE.
+    Find the modules within a path, making them importable.
 
-    :param path: path to load classes from
-    :param clazz: class type expected to be inherited from for loading
-    :return: list of classes loaded
+    :param path: path to find modules in
+    :return: list of module import statements and file paths
     """
     # validate path exists
     logger.debug("attempting to load modules from path: %s", path)
@@ -380,12 +428,25 @@ def load_classes(path: Path, clazz: Generic[T]) -> List[T]:
     if parent not in sys.path:
         logger.debug("adding parent path to allow imports: %s", parent)
         sys.path.append(parent)
-    # import and add all service modules in the path
-    classes = []
+    modules = []
     for p in path.iterdir():
         if not _valid_module(p):
             continue
-        import_statement = f"{path.name}.{p.stem}"
+        modules.append((f"{path.name}.{p.stem}", p))
+    return modules
+
+
+def load_classes(path: Path, clazz: Generic[T]) -> List[T]:
+    """
+    Dynamically load classes for use within CORE.
+
+    :param path: path to load classes from
+    :param clazz: class type expected to be inherited from for loading
+    :return: list of classes loaded
+    """
+    # import and add all service modules in the path
+    classes = []
+    for import_statement, _ in find_modules(path):
         logger.debug("importing custom module: %s", import_statement)
         loaded = load_module(import_statement, clazz)
         classes.extend(loaded)
@@ -418,7 +479,9 @@ def threadpool(
     with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
         futures = []
         for func, args, kwargs in funcs:
-            future = executor.submit(func, *args, **kwargs)
+            # run within a copy of the current context, to retain profiler spans
+            context = profiler.copy_context()
+            future = executor.submit(context.run, func, *args, **kwargs)
             futures.append(future)
         results = []
         exceptions = []
@@ -440,8 +503,21 @@ def random_mac() -> str:
     """
     value = random.randint(0, 0xFFFFFF)
     value |= 0x00163E << 24
-    mac = netaddr.EUI(value, dialect=netaddr.mac_unix_expanded)
-    return str(mac)
+    return format_mac(value)
+
+
+def format_mac(value: int) -> str:
+    """
+    Format an integer as a mac address, in the same format as a netaddr EUI using
+    the unix expanded dialect.
+
+    :param value: mac address value
+    :return: formatted mac address
+    """
+    text = f"{value:012x}"
+    return ":".join(
+        (text[0:2], text[2:4], text[4:6], text[6:8], text[8:10], text[10:12])
+    )
 
 
 def iface_config_id(node_id: int, iface_id: int = None) -> int:
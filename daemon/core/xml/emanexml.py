@@ -1,7 +1,8 @@
+import hashlib
 import logging
 from pathlib import Path
 from tempfile import NamedTemporaryFile
-from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Set, Tuple
 
 from lxml import etree
 
@@ -11,8 +12,9 @@ from core.emane.nodes import EmaneNet
 from core.emulator.distributed import DistributedServer
 from core.errors import CoreError
 from core.nodes.base import CoreNode, CoreNodeBase
+from core.nodes.docker import DockerNode
 from core.nodes.interface import CoreInterface
-from core.xml import corexml
+from core.nodes.lxd import LxcNode
 
 logger = logging.getLogger(__name__)
 
@@ -51,6 +53,47 @@ def _value_to_params(value: str) -> Optional[Tuple[str]]:
     return None
 
 
+def render_xml(xml_element: etree.Element, doc_name: str) -> bytes:
+    """
+    Render an emane xml document.
+
+    :param xml_element: root element to render
+    :param doc_name: name to use in the emane doctype
+    :return: rendered xml document
+    """
+    doctype = (
+        f'<!DOCTYPE {doc_name} SYSTEM "file:///usr/share/emane/dtd/{doc_name}.dtd">'
+    )
+    return etree.tostring(
+        xml_element,
+        xml_declaration=True,
+        pretty_print=True,
+        encoding="UTF-8",
+        doctype=doctype,
+    )
+
+
+def write_file(data: bytes, file_path: Path, server: DistributedServer = None) -> None:
+    """
+    Write a rendered xml document to a file.
+
+    :param data: rendered xml document
+    :param file_path: file path to write xml file to
+    :param server: remote server to create file on
+    :return: nothing
+    """
+    if server:
+        temp = NamedTemporaryFile(delete=False)
+        temp_path = Path(temp.name)
+        temp.write(data)
+        temp.close()
+        server.remote_put(temp_path, file_path)
+        temp_path.unlink()
+    else:
+        with file_path.open("wb") as f:
+            f.write(data)
+
+
 def create_file(
     xml_element: etree.Element,
     doc_name: str,
@@ -66,18 +109,21 @@ def create_file(
     :param server: remote server to create file on
     :return: nothing
     """
-    doctype = (
-        f'<!DOCTYPE {doc_name} SYSTEM "file:///usr/share/emane/dtd/{doc_name}.dtd">'
-    )
-    if server:
-        temp = NamedTemporaryFile(delete=False)
-        temp_path = Path(temp.name)
-        corexml.write_xml_file(xml_element, temp_path, doctype=doctype)
-        temp.close()
-        server.remote_put(temp_path, file_path)
-        temp_path.unlink()
+    write_file(render_xml(xml_element, doc_name), file_path, server)
+
+
+def node_file_path(node: CoreNodeBase, file_name: str) -> Path:
+    """
+    Retrieve the path of an emane xml file for a node.
+
+    :param node: node running emane
+    :param file_name: name of xml file
+    :return: path of xml file
+    """
+    if isinstance(node, CoreNode):
+        return node.directory / file_name
     else:
-        corexml.write_xml_file(xml_element, file_path, doctype=doctype)
+        return node.session.directory / file_name
 
 
 def create_node_file(
@@ -92,13 +138,54 @@ def create_node_file(
     :param file_name: name of xml file
     :return:
     """
-    if isinstance(node, CoreNode):
-        file_path = node.directory / file_name
-    else:
-        file_path = node.session.directory / file_name
+    file_path = node_file_path(node, file_name)
     create_file(xml_element, doc_name, file_path, node.server)
 
 
+def config_values(
+    configurations: List[Configuration], config: Dict[str, str], config_ignore: Set
+) -> Tuple[str, ...]:
+    """
+    Retrieve the values of the configurations used within a model xml document.
+
+    :param configurations: configurations used within document
+    :param config: configuration values
+    :param config_ignore: configuration options to ignore
+    :return: configuration values in order
+    """
+    return tuple(str(config[x.id]) for x in configurations if x.id not in config_ignore)
+
+
+def render_model_xml(
+    emane_model: "EmaneModel",
+    doc_name: str,
+    configurations: List[Configuration],
+    config: Dict[str, str],
+    create_element: Callable[[], etree.Element],
+) -> bytes:
+    """
+    Render a model xml document, reusing a previously rendered document for the
+    same model and configuration values.
+
+    :param emane_model: emane model to render xml for
+    :param doc_name: name of document
+    :param configurations: configurations used within document
+    :param config: configuration values
+    :param create_element: creates the root element of the document
+    :return: rendered xml document
+    """
+    values = config_values(configurations, config, emane_model.config_ignore)
+    key = (emane_model.name, doc_name, values)
+    cache = emane_model.session.emane.xml_cache
+    data = cache.get(key)
+    if data is None:
+        element = create_element()
+        add_configurations(element, configurations, config, emane_model.config_ignore)
+        data = render_xml(element, doc_name)
+        cache[key] = data
+    return data
+
+
 def add_param(xml_element: etree.Element, name: str, value: str) -> None:
     """
     Add emane configuration parameter to xml element.
@@ -237,52 +324,125 @@ def create_transport_xml(iface: CoreInterface, config: Dict[str, str]) -> None:
     create_node_file(iface.node, transport_element, doc_name, transport_name)
 
 
+def model_file_name(emane_model: "EmaneModel", doc_name: str, data: bytes) -> str:
+    """
+    Create a content addressed name for a model xml file, e.g.
+    "emane_rfpipe-mac-0123456789abcdef.xml"
+
+    :param emane_model: emane model the xml was rendered for
+    :param doc_name: name of document
+    :param data: rendered xml document
+    :return: model xml file name
+    """
+    digest = hashlib.sha256(data).hexdigest()[:16]
+    return f"{emane_model.name}-{doc_name}-{digest}.xml"
+
+
+def shared_file_path(node: CoreNodeBase, file_name: str) -> Path:
+    """
+    Retrieve the path of an emane xml file shared by all nems on the same server.
+    Container nodes cannot see the session directory, so fall back to their own
+    node directory.
+
+    :param node: node running emane
+    :param file_name: name of xml file
+    :return: path of xml file
+    """
+    if isinstance(node, (DockerNode, LxcNode)):
+        return node.directory / file_name
+    else:
+        return node.session.directory / file_name
+
+
+def create_model_file(
+    emane_model: "EmaneModel",
+    iface: CoreInterface,
+    doc_name: str,
+    configurations: List[Configuration],
+    config: Dict[str, str],
+    create_element: Callable[[], etree.Element],
+) -> str:
+    """
+    Create a shared model xml file, named by its contents, writing it only once
+    for each server it is used on.
+
+    :param emane_model: emane model to create xml for
+    :param iface: interface to create xml for
+    :param doc_name: name of document
+    :param configurations: configurations used within document
+    :param config: configuration values
+    :param create_element: creates the root element of the document
+    :return: path of model xml file, to be used as its definition
+    """
+    data = render_model_xml(
+        emane_model, doc_name, configurations, config, create_element
+    )
+    file_name = model_file_name(emane_model, doc_name, data)
+    node = iface.node
+    file_path = shared_file_path(node, file_name)
+    key = (node.server.name if node.server else None, file_path)
+    xml_files = emane_model.session.emane.xml_files
+    if key not in xml_files:
+        write_file(data, file_path, node.server)
+        xml_files.add(key)
+    return str(file_path)
+
+
 def create_phy_xml(
     emane_model: "EmaneModel", iface: CoreInterface, config: Dict[str, str]
-) -> None:
+) -> str:
     """
-    Create the phy xml document.
+    Create the phy xml document, shared by all nems with the same phy
+    configuration.
 
     :param emane_model: emane model to create xml
     :param iface: interface to create xml for
     :param config: all current configuration values
-    :return: nothing
+    :return: phy xml definition
     """
-    phy_element = etree.Element("phy", name=f"{emane_model.name} PHY")
-    if emane_model.phy_library:
-        phy_element.set("library", emane_model.phy_library)
-    add_configurations(
-        phy_element, emane_model.phy_config, config, emane_model.config_ignore
+
+    def create_element() -> etree.Element:
+        phy_element = etree.Element("phy", name=f"{emane_model.name} PHY")
+        if emane_model.phy_library:
+            phy_element.set("library", emane_model.phy_library)
+        return phy_element
+
+    return create_model_file(
+        emane_model, iface, "phy", emane_model.phy_config, config, create_element
     )
-    file_name = phy_file_name(iface)
-    create_node_file(iface.node, phy_element, "phy", file_name)
 
 
 def create_mac_xml(
     emane_model: "EmaneModel", iface: CoreInterface, config: Dict[str, str]
-) -> None:
+) -> str:
     """
-    Create the mac xml document.
+    Create the mac xml document, shared by all nems with the same mac
+    configuration.
 
     :param emane_model: emane model to create xml
     :param iface: interface to create xml for
     :param config: all current configuration values
-    :return: nothing
+    :return: mac xml definition
     """
     if not emane_model.mac_library:
         raise CoreError("must define emane model library")
-    mac_element = etree.Element(
-        "mac", name=f"{emane_model.name} MAC", library=emane_model.mac_library
-    )
-    add_configurations(
-        mac_element, emane_model.mac_config, config, emane_model.config_ignore
+
+    def create_element() -> etree.Element:
+        return etree.Element(
+            "mac", name=f"{emane_model.name} MAC", library=emane_model.mac_library
+        )
+
+    return create_model_file(
+        emane_model, iface, "mac", emane_model.mac_config, config, create_element
     )
-    file_name = mac_file_name(iface)
-    create_node_file(iface.node, mac_element, "mac", file_name)
 
 
 def create_nem_xml(
-    emane_model: "EmaneModel", iface: CoreInterface, config: Dict[str, str]
+    emane_model: "EmaneModel",
+    iface: CoreInterface,
+    config: Dict[str, str],
+    mac_name: str = None,
+    phy_name: str = None,
 ) -> None:
     """
     Create the nem xml document.
@@ -290,6 +450,8 @@ def create_nem_xml(
     :param emane_model: emane model to create xml
     :param iface: interface to create xml for
     :param config: all current configuration values
+    :param mac_name: mac xml definition, defaults to the interface mac file
+    :param phy_name: phy xml definition, defaults to the interface phy file
     :return: nothing
     """
     nem_element = etree.Element("nem", name=f"{emane_model.name} NEM")
@@ -298,9 +460,9 @@ def create_nem_xml(
     else:
         transport_name = transport_file_name(iface)
         etree.SubElement(nem_element, "transport", definition=transport_name)
-    mac_name = mac_file_name(iface)
+    mac_name = mac_name if mac_name else mac_file_name(iface)
     etree.SubElement(nem_element, "mac", definition=mac_name)
-    phy_name = phy_file_name(iface)
+    phy_name = phy_name if phy_name else phy_file_name(iface)
     etree.SubElement(nem_element, "phy", definition=phy_name)
     nem_name = nem_file_name(iface)
     create_node_file(iface.node, nem_element, "nem", nem_name)
@@ -61,6 +61,7 @@ def patcher(request):
             LinuxNetClient, "get_mac", return_value="00:00:00:00:00:00"
         )
         patch_manager.patch_obj(CoreNode, "create_file")
+        patch_manager.patch_obj(CoreNode, "create_files")
         patch_manager.patch_obj(Session, "write_state")
         patch_manager.patch_obj(Session, "write_nodes")
     yield patch_manager
@@ -69,7 +70,7 @@ def patcher(request):
 
 @pytest.fixture(scope="session")
 def global_coreemu(patcher):
-    coreemu = CoreEmu(config={"emane_prefix": "/usr"})
+    coreemu = CoreEmu(config={"emane_prefix": "/usr", "registry_cache": ""})
     yield coreemu
     coreemu.shutdown()
 
@@ -0,0 +1,149 @@
+import netaddr
+import pytest
+
+from core import utils
+from core.emulator.addresses import AddressPool, MacPool
+from core.emulator.data import IpPrefixes
+
+
+class TestAddressPool:
+    @pytest.mark.parametrize(
+        "prefix,index",
+        [
+            ("10.0.0.0/24", 1),
+            ("10.0.0.5/24", 10),
+            ("10.0.0.0/8", 70000),
+            ("10.0.0.0/24", -2),
+            ("2001::/64", 1),
+            ("2001::/64", 0x10000),
+            ("::ffff:0:0/96", 0x01020304),
+        ],
+    )
+    def test_address(self, prefix: str, index: int):
+        # given
+        pool = AddressPool(prefix)
+
+        # when
+        address = pool.address(index)
+
+        # then
+        assert address == str(netaddr.IPNetwork(prefix)[index])
+        assert pool.address(pool.index(address)) == address
+
+    def test_address_outside_prefix(self):
+        # given
+        pool = AddressPool("10.0.0.0/24")
+
+        # then
+        with pytest.raises(IndexError):
+            pool.address(256)
+        with pytest.raises(ValueError):
+            pool.index("10.0.1.1")
+
+    def test_allocate(self):
+        # given
+        pool = AddressPool("10.0.0.0/24")
+        pool.reserve(2, owner=1)
+
+        # when
+        addresses = [pool.allocate() for _ in range(3)]
+
+        # then
+        assert addresses == ["10.0.0.1", "10.0.0.3", "10.0.0.4"]
+        assert len(pool) == 4
+
+    def test_allocate_exhausted(self):
+        # given
+        pool = AddressPool("10.0.0.0/30")
+        block = pool.allocate_many(2)
+
+        # then
+        assert list(block) == ["10.0.0.1", "10.0.0.2"]
+        with pytest.raises(IndexError):
+            pool.allocate()
+        pool.release(1)
+        assert pool.allocate() == "10.0.0.1"
+
+    def test_reserve_collision(self):
+        # given
+        pool = AddressPool("10.0.0.0/24")
+
+        # when
+        first = pool.reserve(1, owner=1)
+        same = pool.reserve(1, owner=1)
+        other = pool.reserve(1, owner=2)
+
+        # then
+        assert first
+        assert same
+        assert not other
+
+    def test_allocate_many(self):
+        # given
+        pool = AddressPool("10.0.0.0/16")
+
+        # when
+        block = pool.allocate_many(1000)
+
+        # then
+        assert len(block) == 1000
+        assert block[0] == "10.0.0.1"
+        assert block[-1] == "10.0.3.232"
+        assert block[255:257] == ["10.0.1.0", "10.0.1.1"]
+        assert len(set(block)) == 1000
+
+
+class TestMacPool:
+    def test_allocate(self):
+        # given
+        pool = MacPool(start=0xFFFFFF)
+        pool.reserve("00:16:3e:00:00:00")
+
+        # when
+        macs = pool.allocate_many(2)
+
+        # then
+        assert macs == ["00:16:3e:ff:ff:ff", "00:16:3e:00:00:01"]
+        for mac in macs:
+            assert str(netaddr.EUI(mac, dialect=netaddr.mac_unix_expanded)) == mac
+
+    def test_format_mac(self):
+        # given
+        value = 0x00163E0A0B0C
+
+        # when
+        mac = utils.format_mac(value)
+
+        # then
+        assert mac == str(netaddr.EUI(value, dialect=netaddr.mac_unix_expanded))
+
+
+class TestIpPrefixes:
+    def test_gen_ifaces(self):
+        # given
+        prefixes = IpPrefixes(ip4_prefix="10.0.0.0/16", ip6_prefix="2001::/64")
+        node_ids = list(range(1, 300))
+
+        # when
+        ifaces = prefixes.gen_ifaces(node_ids)
+
+        # then
+        for node_id, iface_data in zip(node_ids, ifaces):
+            expected = prefixes.gen_iface(node_id)
+            assert iface_data.ip4 == expected.ip4
+            assert iface_data.ip4_mask == expected.ip4_mask
+            assert iface_data.ip6 == expected.ip6
+            assert iface_data.ip6_mask == expected.ip6_mask
+        macs = {x.mac for x in ifaces}
+        assert len(macs) == len(node_ids)
+
+    def test_allocate_skips_node_addresses(self):
+        # given
+        prefixes = IpPrefixes(ip4_prefix="10.0.0.0/24")
+        prefixes.gen_iface(1)
+
+        # when
+        address = prefixes.ip4_pool.allocate()
+
+        # then
+        assert address == "10.0.0.2"
@@ -0,0 +1,90 @@
+from core.emulator.changes import SessionChanges, link_key, link_key_matches
+from core.emulator.data import InterfaceData
+from core.emulator.session import Session
+from core.nodes.base import CoreNode
+from core.nodes.network import SwitchNode
+
+
+class TestSessionChanges:
+    def test_since(self):
+        # given
+        changes = SessionChanges()
+        changes.node_changed(1)
+        version = changes.node_changed(2)
+        changes.node_changed(1)
+        changes.link_changed(2, 1, 0, 1)
+        changes.node_changed(2, deleted=True)
+
+        # when
+        change_set = changes.since(version)
+
+        # then
+        assert change_set.version == 5
+        assert change_set.nodes == {1: False, 2: True}
+        assert change_set.links == {((1, 1), (2, 0)): False}
+
+    def test_since_truncated(self):
+        # given
+        changes = SessionChanges(size=2)
+        version = changes.node_changed(1)
+        changes.node_changed(2)
+        changes.node_changed(3)
+
+        # when
+        truncated = changes.since(version - 1)
+        change_set = changes.since(version)
+
+        # then
+        assert truncated is None
+        assert change_set.nodes == {2: False, 3: False}
+        assert changes.since(changes.version + 1) is None
+
+    def test_truncate(self):
+        # given
+        changes = SessionChanges()
+        version = changes.node_changed(1)
+
+        # when
+        changes.truncate()
+
+        # then
+        assert changes.since(version) is None
+        assert changes.since(changes.version).nodes == {}
+
+    def test_link_key_matches(self):
+        # given
+        key = link_key(2, 1, None, 0)
+
+        # then
+        assert link_key_matches(key, 1, 2, 0, 3)
+        assert link_key_matches(key, 2, 1, 3, 0)
+        assert not link_key_matches(key, 1, 2, 1, 3)
+        assert not link_key_matches(key, 1, 3, 0, 3)
+
+
+class TestSessionChangeTracking:
+    def test_session_changes(self, session: Session):
+        # given
+        node = session.add_node(CoreNode)
+        switch = session.add_node(SwitchNode)
+        version = session.changes.version
+
+        # when
+        session.add_link(node.id, switch.id, InterfaceData(id=1))
+        session.set_node_pos(switch, 10, 10)
+        change_set = session.changes.since(version)
+
+        # then
+        assert change_set.nodes == {switch.id: False}
+        assert change_set.links == {link_key(node.id, switch.id, 1): False}
+
+    def test_session_clear(self, session: Session):
+        # given
+        session.add_node(CoreNode)
+        version = session.changes.version
+
+        # when
+        session.clear()
+
+        # then
+        assert session.changes.since(version) is None
@@ -9,6 +9,7 @@ from core.configservice.base import (
     ConfigServiceBootError,
     ConfigServiceMode,
 )
+from core.emulator.data import CommandResult
 from core.errors import CoreCommandError, CoreError
 
 TEMPLATE_TEXT = "echo hello"
@@ -80,7 +81,7 @@ class TestConfigServices:
 
         # then
         file_path = Path(MyService.files[0])
-        node.create_file.assert_called_with(file_path, text)
+        node.create_files.assert_called_with([(file_path, text, 0o644)])
 
     def test_create_files_text(self):
         # given
@@ -92,7 +93,23 @@ class TestConfigServices:
 
         # then
         file_path = Path(MyService.files[0])
-        node.create_file.assert_called_with(file_path, TEMPLATE_TEXT)
+        node.create_files.assert_called_with([(file_path, TEMPLATE_TEXT, 0o644)])
+
+    def test_start_prepared(self):
+        # given
+        node = mock.MagicMock()
+        service = MyService(node)
+        service.create_dirs = mock.MagicMock()
+        service.create_files = mock.MagicMock()
+        service.run_startup = mock.MagicMock()
+
+        # when
+        service.start(prepared=True)
+
+        # then
+        service.create_dirs.assert_not_called()
+        service.create_files.assert_not_called()
+        service.run_startup.assert_called_once()
 
     def test_run_startup(self):
         # given
@@ -104,12 +121,12 @@ class TestConfigServices:
         service.run_startup(wait=wait)
 
         # then
-        node.cmd.assert_called_with(MyService.startup[0], wait=wait)
+        node.cmds.assert_called_with(MyService.startup, wait=wait, stop_on_error=True)
 
     def test_run_startup_exception(self):
         # given
         node = mock.MagicMock()
-        node.cmd.side_effect = CoreCommandError(1, "error")
+        node.cmds.return_value = [CommandResult(MyService.startup[0], 1)]
         service = MyService(node)
 
         # when
@@ -0,0 +1,117 @@
+from pathlib import Path
+
+import mock
+import pytest
+
+from core import utils
+from core.emulator.controlnet import ControlNetPlan, uses_default_iface
+from core.emulator.session import Session
+from core.nodes.base import CoreNode
+from core.nodes.docker import DockerNode
+from core.nodes.lxd import LxcNode
+from core.nodes.network import CtrlNet
+
+HEADER: str = "CORE session 1 host entries"
+
+
+@pytest.fixture
+def control_session(session: Session):
+    session.options.set_config("controlnet", "172.16.0.0/24")
+    yield session
+    session.options.set_config("controlnet", "")
+
+
+class TestControlNet:
+    def test_add_control_ifaces(self, control_session: Session):
+        # given
+        session = control_session
+        nodes = [session.add_node(CoreNode) for _ in range(3)]
+
+        # when
+        with mock.patch("core.utils.cmd") as cmd:
+            session.add_control_ifaces(nodes)
+
+        # then
+        control_net = session.get_control_net(0)
+        assert len(control_net.ifaces) == len(nodes)
+        for node in nodes:
+            iface = node.get_iface(CtrlNet.CTRLIF_IDX_BASE)
+            assert iface.control
+            assert iface.name == "ctrl0"
+            assert iface.net == control_net
+            assert str(iface.get_ip4()) == f"172.16.0.{node.id}/24"
+        batches = [x for x in cmd.call_args_list if "-batch" in x.args[0]]
+        assert len(batches) == 2
+
+    def test_add_control_ifaces_existing(self, control_session: Session):
+        # given
+        session = control_session
+        node = session.add_node(CoreNode)
+        session.add_control_ifaces([node])
+        iface = node.get_iface(CtrlNet.CTRLIF_IDX_BASE)
+
+        # when
+        session.add_control_ifaces([node])
+
+        # then
+        assert node.get_iface(CtrlNet.CTRLIF_IDX_BASE) is iface
+        assert len(session.get_control_net(0).ifaces) == 1
+
+    def test_uses_default_iface(self, session: Session):
+        # given
+        node = session.add_node(CoreNode)
+        docker_node = object.__new__(DockerNode)
+        lxc_node = object.__new__(LxcNode)
+
+        # when
+        results = [uses_default_iface(x) for x in (node, docker_node, lxc_node)]
+
+        # then
+        assert results == [True, False, False]
+
+    def test_add_others_error(self, control_session: Session):
+        # given
+        session = control_session
+        node = session.add_node(CoreNode)
+        control_net = session.add_remove_control_net(0)
+        plan = ControlNetPlan(session, control_net, 0)
+        iface_data = session.control_iface_data(control_net, node, 0)
+        plan.others.append((node, iface_data))
+
+        # when
+        with mock.patch.object(node, "new_iface", side_effect=ValueError):
+            plan.add_others()
+
+        # then
+        assert node.ifaces.get(CtrlNet.CTRLIF_IDX_BASE) is None
+
+    def test_instantiate_metrics(self, control_session: Session):
+        # given
+        session = control_session
+        session.add_node(CoreNode)
+
+        # when
+        session.instantiate()
+
+        # then
+        assert "control_ifaces" in session.start_metrics
+        assert 0 <= session.start_metrics["control_share"] <= 1
+
+
+class TestFileMunge:
+    def test_file_munge(self, tmp_path: Path):
+        # given
+        path = tmp_path / "hosts"
+        path.write_text("127.0.0.1 localhost\n")
+
+        # when
+        utils.file_munge(str(path), HEADER, "10.0.0.1 n1\n")
+        utils.file_munge(str(path), HEADER, "10.0.0.2 n2\n")
+
+        # then
+        expected = (
+            f"127.0.0.1 localhost\n# BEGIN {HEADER}\n10.0.0.2 n2\n# END {HEADER}\n"
+        )
+        assert path.read_text() == expected
+        utils.file_demunge(str(path), HEADER)
+        assert path.read_text() == "127.0.0.1 localhost\n"
@@ -0,0 +1,96 @@
+import tracemalloc
+from dataclasses import FrozenInstanceError, dataclass
+from typing import Any, Callable, List
+
+import pytest
+
+from core.emulator.data import (
+    InterfaceData,
+    InterfaceSnapshot,
+    IpPrefixes,
+    LinkData,
+    LinkOptions,
+    LinkOptionsSnapshot,
+)
+from core.emulator.session import Session
+from core.nodes.base import CoreNode, Position
+from core.nodes.network import SwitchNode
+
+COUNT: int = 1000
+
+
+@dataclass
+class DictInterfaceData:
+    id: int = None
+    name: str = None
+    mac: str = None
+    ip4: str = None
+    ip4_mask: int = None
+    ip6: str = None
+    ip6_mask: int = None
+    mtu: int = None
+
+
+def traced_size(create: Callable[[], Any]) -> int:
+    tracemalloc.start()
+    try:
+        start, _ = tracemalloc.get_traced_memory()
+        values: List[Any] = [create() for _ in range(COUNT)]
+        end, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert len(values) == COUNT
+    return end - start
+
+
+class TestData:
+    @pytest.mark.parametrize(
+        "cls", [InterfaceData, LinkOptions, LinkData, InterfaceSnapshot, Position]
+    )
+    def test_slots(self, cls):
+        # given
+        value = cls()
+
+        # then
+        assert not hasattr(value, "__dict__")
+
+    def test_slots_memory(self):
+        # when
+        slotted = traced_size(lambda: InterfaceData(id=1, name="eth0"))
+        unslotted = traced_size(lambda: DictInterfaceData(id=1, name="eth0"))
+
+        # then
+        assert slotted < unslotted * 0.75
+
+    def test_iface_slots(self, session: Session, ip_prefixes: IpPrefixes):
+        # given
+        node = session.add_node(CoreNode)
+        switch = session.add_node(SwitchNode)
+        iface_data = ip_prefixes.create_iface(node)
+        iface, _ = session.add_link(node.id, switch.id, iface_data)
+
+        # then
+        assert not hasattr(iface, "__dict__")
+        with pytest.raises(AttributeError):
+            iface.unknown = True
+
+    def test_snapshot(self):
+        # given
+        options = LinkOptions(delay=10, unidirectional=1)
+        data = InterfaceData(id=1, ip4="10.0.0.1", ip4_mask=24)
+
+        # when
+        options_snapshot = LinkOptionsSnapshot(delay=10, unidirectional=1)
+        data_snapshot = InterfaceSnapshot(id=1, ip4="10.0.0.1", ip4_mask=24)
+
+        # then
+        assert options_snapshot == options
+        assert data_snapshot == data
+        assert data == data_snapshot
+        assert data_snapshot.get_ips() == ["10.0.0.1/24"]
+        with pytest.raises(FrozenInstanceError):
+            options_snapshot.update(LinkOptions(delay=20))
+        with pytest.raises(FrozenInstanceError):
+            data_snapshot.id = 2
+        with pytest.raises(TypeError):
+            InterfaceSnapshot(unknown=1)
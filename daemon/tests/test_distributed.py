@@ -1,9 +1,50 @@
+import shutil
+import threading
+from pathlib import Path
+from unittest import mock
+
+import pytest
+from invoke import Context
+
 from core.emulator.data import NodeOptions
+from core.emulator.distributed import (
+    ConnectionPool,
+    DistributedController,
+    DistributedServer,
+)
 from core.emulator.session import Session
+from core.errors import CoreCommandError
 from core.nodes.base import CoreNode
 from core.nodes.network import HubNode
 
 
+class LocalConnection:
+    """
+    Stand-in for a fabric ssh connection, running commands and transfers locally.
+    """
+
+    def __init__(self, host: str) -> None:
+        self.host = host
+        self.context = Context()
+        self.sources = []
+
+    def run(self, cmd: str, **kwargs):
+        return self.context.run(cmd, in_stream=False, **kwargs)
+
+    def cd(self, path: str):
+        return self.context.cd(path)
+
+    def put(self, local, remote: str) -> None:
+        self.sources.append(local)
+        if hasattr(local, "read"):
+            Path(remote).write_bytes(local.read())
+        else:
+            shutil.copy(local, remote)
+
+    def close(self) -> None:
+        pass
+
+
 class TestDistributed:
     def test_remote_node(self, session: Session):
         # given
@@ -38,3 +79,224 @@ class TestDistributed:
         assert node.server.name == server_name
         assert node.server.host == host
         assert len(session.distributed.tunnels) > 0
+
+    def test_batched_tunnels(self, session: Session):
+        # given
+        session.distributed.address = "127.0.0.1"
+        session.distributed.add_server("core2", "127.0.0.2")
+        session.distributed.add_server("core1", "127.0.0.3")
+        session.add_node(HubNode)
+        session.add_node(HubNode)
+
+        # when
+        session.instantiate()
+
+        # then
+        assert len(session.distributed.tunnels) == 4
+        for local_tap, remote_tap in session.distributed.tunnels.values():
+            assert local_tap.up
+            assert remote_tap.up
+        assert "distributed_tunnels" in session.start_metrics
+        for name in ("local", "core1", "core2", "total"):
+            assert f"distributed_tunnels.{name}" in session.start_metrics
+
+    def test_batched_tunnels_failure(self, session: Session):
+        # given
+        distributed = DistributedController(session)
+        distributed.address = "127.0.0.1"
+        distributed.add_server("core2", "127.0.0.2")
+        node = session.add_node(HubNode)
+
+        def run_ip_batch(server, cmds) -> None:
+            if server is not None:
+                raise CoreCommandError(1, "ip -batch -", "", "error")
+
+        # when
+        with mock.patch.object(distributed, "run_ip_batch", side_effect=run_ip_batch):
+            exceptions = distributed.start_batched([node], 1500)
+
+        # then
+        assert len(exceptions) == 1
+        assert not distributed.tunnels
+
+    def test_execute_parallel(self, session: Session):
+        # given
+        total = 3
+        for i in range(total):
+            session.distributed.servers[f"core{i}"] = DistributedServer(
+                f"core{i}", f"10.0.0.{i}", factory=LocalConnection
+            )
+        barrier = threading.Barrier(total, timeout=5)
+        names = []
+
+        # when
+        def func(server: DistributedServer) -> None:
+            barrier.wait()
+            names.append(server.name)
+
+        session.distributed.execute(func)
+        session.distributed.servers.clear()
+
+        # then
+        assert sorted(names) == ["core0", "core1", "core2"]
+
+    def test_shutdown_closes_connections(self, session: Session):
+        # given
+        server = DistributedServer("core2", "127.0.0.2", factory=LocalConnection)
+        session.distributed.servers[server.name] = server
+        server.pool.run("true")
+        assert len(server.pool.created) == 1
+
+        # when
+        session.distributed.shutdown()
+        session.distributed.servers.clear()
+
+        # then
+        assert not server.pool.created
+
+
+class TestConnectionPool:
+    def test_run(self, tmp_path: Path):
+        # given
+        pool = ConnectionPool("127.0.0.1", 2, LocalConnection)
+
+        # when
+        result = pool.run("pwd", cwd=str(tmp_path))
+
+        # then
+        assert result.stdout.strip() == str(tmp_path)
+        assert pool.stats.commands == 1
+        assert pool.stats.pending == 0
+
+    def test_concurrent_connections(self):
+        # given
+        size = 3
+        pool = ConnectionPool("127.0.0.1", size, LocalConnection)
+        barrier = threading.Barrier(size, timeout=5)
+
+        # when
+        def borrow() -> None:
+            with pool.connection():
+                barrier.wait()
+
+        threads = [threading.Thread(target=borrow) for _ in range(size * 2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # then
+        assert len(pool.created) == size
+        assert pool.stats.commands == size * 2
+        assert pool.stats.max_pending >= size
+        assert pool.stats.pending == 0
+
+    def test_close_borrowed(self):
+        # given
+        pool = ConnectionPool("127.0.0.1", 1, LocalConnection)
+
+        # when
+        with mock.patch.object(LocalConnection, "close") as close:
+            with pool.connection() as conn:
+                pool.close()
+                close.assert_not_called()
+            with pool.connection() as new_conn:
+                pass
+
+        # then
+        close.assert_called_once()
+        assert new_conn is not conn
+        assert pool.created == [new_conn]
+        assert pool.closing == 0
+
+    def test_connection_error(self):
+        # given
+        factory = mock.MagicMock(side_effect=OSError("unreachable"))
+        pool = ConnectionPool("127.0.0.1", 1, factory)
+
+        # when
+        with pytest.raises(OSError):
+            pool.run("true")
+
+        # then
+        assert not pool.created
+        assert pool.stats.pending == 0
+        assert pool.stats.errors == 1
+
+    def test_put_from_memory(self, tmp_path: Path):
+        # given
+        server = DistributedServer("core2", "127.0.0.1", factory=LocalConnection)
+        dst_path = tmp_path / "file.txt"
+        data = "remote data"
+
+        # when
+        server.remote_put_temp(dst_path, data)
+
+        # then
+        assert dst_path.read_text() == data
+        conn = server.pool.created[0]
+        assert all(hasattr(x, "read") for x in conn.sources)
+        assert server.stats.transfers == 1
+
+
+class TestRemoteBatch:
+    def test_run(self, tmp_path: Path):
+        # given
+        server = DistributedServer("core2", "127.0.0.1", factory=LocalConnection)
+        batch = server.remote_batch()
+        file_path = tmp_path / "dir" / "file.sh"
+        batch.add_file(file_path, "echo file", 0o755)
+        batch.add_cmd(f"sh {file_path}")
+        batch.add_cmd("echo error >&2; exit 3")
+        batch.add_cmd("echo done")
+
+        # when
+        results = batch.run()
+
+        # then
+        assert file_path.read_text() == "echo file"
+        assert file_path.stat().st_mode & 0o777 == 0o755
+        assert [x.status for x in results] == [0, 3, 0]
+        assert results[0].stdout == "file"
+        assert results[1].stderr == "error"
+        assert results[2].stdout == "done"
+        assert server.stats.transfers == 1
+        assert server.stats.commands == 1
+
+    def test_run_stop_on_error(self):
+        # given
+        server = DistributedServer("core2", "127.0.0.1", factory=LocalConnection)
+        batch = server.remote_batch()
+        batch.add_cmd("false")
+        batch.add_cmd("echo skipped")
+
+        # when
+        results = batch.run(stop_on_error=True)
+
+        # then
+        assert len(results) == 1
+        with pytest.raises(CoreCommandError):
+            results[0].check()
+
+    def test_node_cmd_batch(self, session: Session):
+        # given
+        server = DistributedServer("core2", "127.0.0.1", factory=LocalConnection)
+        node = CoreNode(session, 1, server=server)
+        node.client = mock.MagicMock()
+        node.client.create_cmd.side_effect = lambda args, shell: args
+
+        # when
+        try:
+            with node.cmd_batch():
+                output = node.cmd("true")
+                node.cmd("echo done")
+            with pytest.raises(CoreCommandError):
+                with node.cmd_batch():
+                    node.cmd("false")
+        finally:
+            node.position.detach()
+
+        # then
+        assert output == ""
+        assert server.stats.transfers == 2
+        assert server.stats.commands == 2
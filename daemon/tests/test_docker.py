@@ -0,0 +1,243 @@
+import io
+import json
+import re
+import socketserver
+import tarfile
+import threading
+import urllib.parse
+from http.server import BaseHTTPRequestHandler
+from pathlib import Path
+
+import pytest
+
+from core.errors import CoreCommandError
+from core.nodes.docker import DockerApi, DockerApiClient
+
+
+class FakeDockerHandler(BaseHTTPRequestHandler):
+    """
+    Minimal docker engine api, over a unix socket, storing state on the server.
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def address_string(self) -> str:
+        return "fake"
+
+    def log_message(self, *args) -> None:
+        pass
+
+    def reply(self, status: int, data: bytes = b"", close: bool = False) -> None:
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(data)))
+        if close:
+            self.send_header("Connection", "close")
+        self.end_headers()
+        self.wfile.write(data)
+
+    def reply_json(self, status: int, data: dict) -> None:
+        self.reply(status, json.dumps(data).encode("utf-8"))
+
+    def read_body(self) -> bytes:
+        size = int(self.headers.get("Content-Length", 0))
+        return self.rfile.read(size)
+
+    def do_POST(self) -> None:
+        body = self.read_body()
+        server = self.server
+        path = self.path.split("?")[0]
+        if path == "/containers/create":
+            name = self.path.split("name=")[1]
+            image = json.loads(body)["Image"]
+            if image not in server.images:
+                self.reply_json(404, {"message": f"no such image: {image}"})
+                return
+            with server.lock:
+                server.containers[name] = {"State": {"Pid": 100, "Running": False}}
+            self.reply_json(201, {"Id": name})
+        elif path == "/images/create":
+            params = urllib.parse.parse_qs(self.path.split("?")[1])
+            image = params["fromImage"][0]
+            if image == "missing":
+                data = {"error": f"pull access denied for {image}"}
+            else:
+                server.images.add(image)
+                data = {"status": f"Pulling from library/{image}"}
+            self.reply(200, json.dumps(data).encode("utf-8"))
+        elif re.match(r"/containers/\w+/start", path):
+            name = path.split("/")[2]
+            server.containers[name]["State"]["Running"] = True
+            self.reply(204)
+        elif re.match(r"/containers/\w+/exec", path):
+            config = json.loads(body)
+            exec_id = str(len(server.execs))
+            server.execs[exec_id] = config["Cmd"]
+            self.reply_json(201, {"Id": exec_id})
+        elif re.match(r"/exec/\w+/start", path):
+            args = server.execs[path.split("/")[2]]
+            stdout = " ".join(args[1:]).encode("utf-8")
+            stderr = b"warning"
+            data = b"".join(
+                bytes([stream, 0, 0, 0]) + len(x).to_bytes(4, "big") + x
+                for stream, x in ((1, stdout), (2, stderr))
+            )
+            self.reply(200, data, close=True)
+        else:
+            self.reply_json(404, {"message": "not found"})
+
+    def do_GET(self) -> None:
+        path = self.path
+        if re.match(r"/containers/\w+/json", path):
+            name = path.split("/")[2]
+            container = self.server.containers.get(name)
+            if container is None:
+                self.reply_json(404, {"message": f"no such container: {name}"})
+            else:
+                self.reply_json(200, container)
+        elif re.match(r"/exec/\w+/json", path):
+            args = self.server.execs[path.split("/")[2]]
+            self.reply_json(200, {"ExitCode": 1 if args[0] == "false" else 0})
+        else:
+            self.reply_json(404, {"message": "not found"})
+
+    def do_PUT(self) -> None:
+        name = self.path.split("/")[2]
+        self.server.archives.append((name, self.read_body()))
+        self.reply(200)
+
+    def do_DELETE(self) -> None:
+        name = self.path.split("/")[2].split("?")[0]
+        self.server.containers.pop(name)
+        self.reply(204)
+
+
+@pytest.fixture
+def docker_server(tmp_path: Path):
+    path = str(tmp_path / "docker.sock")
+    server = socketserver.ThreadingUnixStreamServer(path, FakeDockerHandler)
+    server.daemon_threads = True
+    server.lock = threading.Lock()
+    server.containers = {}
+    server.execs = {}
+    server.archives = []
+    server.images = {"ubuntu"}
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+class TestDockerApi:
+    def test_create_container(self, docker_server):
+        # given
+        api = DockerApi(docker_server.server_address)
+        client = DockerApiClient("node1", "ubuntu", api)
+
+        # when
+        pid = client.create_container()
+
+        # then
+        assert pid == "100"
+        assert client.is_alive()
+        assert len(api.created) == 1
+
+    def test_create_container_pulls_image(self, docker_server):
+        # given
+        api = DockerApi(docker_server.server_address)
+        client = DockerApiClient("node1", "debian", api)
+
+        # when
+        client.create_container()
+
+        # then
+        assert "debian" in docker_server.images
+        assert client.is_alive()
+
+    def test_create_container_pull_error(self, docker_server):
+        # given
+        api = DockerApi(docker_server.server_address)
+        client = DockerApiClient("node1", "missing", api)
+
+        # then
+        with pytest.raises(CoreCommandError):
+            client.create_container()
+
+    def test_create_containers_concurrently(self, docker_server):
+        # given
+        size = 3
+        api = DockerApi(docker_server.server_address, size)
+        clients = [DockerApiClient(f"node{i}", "ubuntu", api) for i in range(10)]
+
+        # when
+        threads = [threading.Thread(target=x.create_container) for x in clients]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # then
+        assert len(docker_server.containers) == 10
+        assert all(x.pid == "100" for x in clients)
+        assert len(api.created) <= size
+
+    def test_stop_container(self, docker_server):
+        # given
+        api = DockerApi(docker_server.server_address)
+        client = DockerApiClient("node1", "ubuntu", api)
+        client.create_container()
+
+        # when
+        client.stop_container()
+
+        # then
+        assert not client.is_alive()
+
+    def test_check_cmd(self, docker_server):
+        # given
+        api = DockerApi(docker_server.server_address)
+        client = DockerApiClient("node1", "ubuntu", api)
+        client.create_container()
+
+        # when
+        output = client.check_cmd("echo hello world")
+
+        # then
+        assert output == "hello world"
+
+    def test_check_cmd_error(self, docker_server):
+        # given
+        api = DockerApi(docker_server.server_address)
+        client = DockerApiClient("node1", "ubuntu", api)
+        client.create_container()
+
+        # when
+        with pytest.raises(CoreCommandError) as e:
+            client.check_cmd("false value")
+
+        # then
+        assert e.value.returncode == 1
+        assert e.value.stderr == "warning"
+
+    def test_put_files(self, docker_server):
+        # given
+        api = DockerApi(docker_server.server_address)
+        client = DockerApiClient("node1", "ubuntu", api)
+        client.create_container()
+        files = [
+            (Path("/etc/core/file1.sh"), b"echo file1", 0o755),
+            (Path("file2.txt"), b"file2", 0o644),
+        ]
+
+        # when
+        client.put_files(files)
+
+        # then
+        assert len(docker_server.archives) == 1
+        name, data = docker_server.archives[0]
+        assert name == "node1"
+        with tarfile.open(fileobj=io.BytesIO(data)) as tar:
+            members = {x.name: x for x in tar.getmembers()}
+            assert members["etc/core/file1.sh"].mode == 0o755
+            assert tar.extractfile("etc/core/file1.sh").read() == b"echo file1"
+            assert tar.extractfile("file2.txt").read() == b"file2"
@@ -0,0 +1,167 @@
+from pathlib import Path
+from typing import List, Type
+
+import mock
+import pytest
+from lxml import etree
+
+from core.config import ConfigString, Configuration
+from core.emane.emanemodel import EmaneModel
+from core.emane.modelmanager import EmaneModelManager
+from core.emane.nodes import EmaneNet
+from core.emulator.data import IpPrefixes
+from core.emulator.session import Session
+from core.nodes.base import CoreNode
+from core.nodes.docker import DockerNode
+from core.xml import emanexml
+
+
+class EmaneTestModel(EmaneModel):
+    name: str = "emane_test"
+    mac_library: str = "testmaclayer"
+    mac_config: List[Configuration] = [ConfigString(id="macparam", default="1")]
+    phy_config: List[Configuration] = [ConfigString(id="phyparam", default="a")]
+
+    @classmethod
+    def load(cls, emane_prefix: Path) -> None:
+        pass
+
+
+@pytest.fixture
+def emane_model() -> Type[EmaneModel]:
+    EmaneModelManager.models[EmaneTestModel.name] = EmaneTestModel
+    yield EmaneTestModel
+    del EmaneModelManager.models[EmaneTestModel.name]
+
+
+@pytest.fixture
+def emane_net(session: Session, emane_model: Type[EmaneModel]) -> EmaneNet:
+    session.directory.mkdir(parents=True, exist_ok=True)
+    emane_net = session.add_node(EmaneNet)
+    emane_net.setmodel(emane_model, {})
+    prefixes = IpPrefixes(ip4_prefix="10.0.0.0/24")
+    for _ in range(3):
+        node = session.add_node(CoreNode)
+        iface_data = prefixes.create_iface(node)
+        session.add_link(node.id, emane_net.id, iface1_data=iface_data)
+    yield emane_net
+    session.emane.config_reset()
+
+
+class TestEmaneConfig:
+    def test_get_iface_config_cached(self, session: Session, emane_net: EmaneNet):
+        # given
+        iface = emane_net.get_ifaces()[0]
+
+        # when
+        config1 = session.emane.get_iface_config(emane_net, iface)
+        config2 = session.emane.get_iface_config(emane_net, iface)
+
+        # then
+        assert config1 is config2
+        assert config1["macparam"] == "1"
+
+    def test_get_iface_config_shared(self, session: Session, emane_net: EmaneNet):
+        # given
+        iface1, iface2, iface3 = emane_net.get_ifaces()
+        session.emane.set_config(iface3.node.id, EmaneTestModel.name, {"phyparam": "b"})
+
+        # when
+        config1 = session.emane.get_iface_config(emane_net, iface1)
+        config2 = session.emane.get_iface_config(emane_net, iface2)
+        config3 = session.emane.get_iface_config(emane_net, iface3)
+
+        # then
+        assert config1 is config2
+        assert config1 is not config3
+        assert config3["phyparam"] == "b"
+
+    def test_get_iface_config_invalidated(self, session: Session, emane_net: EmaneNet):
+        # given
+        iface = emane_net.get_ifaces()[0]
+        config = session.emane.get_iface_config(emane_net, iface)
+        assert config["macparam"] == "1"
+
+        # when
+        session.emane.set_config(emane_net.id, EmaneTestModel.name, {"macparam": "2"})
+        set_config = session.emane.get_iface_config(emane_net, iface)
+        session.emane.config_reset(emane_net.id)
+        reset_config = session.emane.get_iface_config(emane_net, iface)
+
+        # then
+        assert set_config["macparam"] == "2"
+        assert reset_config["macparam"] == "1"
+
+    def test_model_xml_shared(self, session: Session, emane_net: EmaneNet):
+        # given
+        ifaces = emane_net.get_ifaces()
+
+        # when
+        with mock.patch.object(
+            emanexml, "render_xml", wraps=emanexml.render_xml
+        ) as render_xml, mock.patch.object(
+            emanexml, "write_file", wraps=emanexml.write_file
+        ) as write_file:
+            mac_names = set()
+            phy_names = set()
+            for iface in ifaces:
+                config = session.emane.get_iface_config(emane_net, iface)
+                mac_names.add(emanexml.create_mac_xml(emane_net.model, iface, config))
+                phy_names.add(emanexml.create_phy_xml(emane_net.model, iface, config))
+
+        # then
+        assert render_xml.call_count == 2
+        assert write_file.call_count == 2
+        assert len(mac_names) == 1
+        assert len(phy_names) == 1
+        mac_path = Path(mac_names.pop())
+        assert mac_path.parent == session.directory
+        assert b'name="macparam" value="1"' in mac_path.read_bytes()
+
+    def test_model_xml_content_addressed(self, session: Session, emane_net: EmaneNet):
+        # given
+        iface1, iface2, _ = emane_net.get_ifaces()
+        session.emane.set_config(iface2.node.id, EmaneTestModel.name, {"phyparam": "b"})
+        config1 = session.emane.get_iface_config(emane_net, iface1)
+        config2 = session.emane.get_iface_config(emane_net, iface2)
+
+        # when
+        mac_name1 = emanexml.create_mac_xml(emane_net.model, iface1, config1)
+        mac_name2 = emanexml.create_mac_xml(emane_net.model, iface2, config2)
+        phy_name1 = emanexml.create_phy_xml(emane_net.model, iface1, config1)
+        phy_name2 = emanexml.create_phy_xml(emane_net.model, iface2, config2)
+
+        # then
+        assert mac_name1 == mac_name2
+        assert phy_name1 != phy_name2
+        data = Path(phy_name2).read_bytes()
+        expected = emanexml.model_file_name(emane_net.model, "phy", data)
+        assert Path(phy_name2).name == expected
+
+    def test_nem_xml_references_shared(self, session: Session, emane_net: EmaneNet):
+        # given
+        iface = emane_net.get_ifaces()[0]
+        iface.node.directory.mkdir(parents=True, exist_ok=True)
+        config = session.emane.get_iface_config(emane_net, iface)
+
+        # when
+        emane_net.model.build_xml_files(config, iface)
+
+        # then
+        nem_path = iface.node.directory / emanexml.nem_file_name(iface)
+        nem_element = etree.parse(str(nem_path)).getroot()
+        for doc_name in ("mac", "phy"):
+            definition = nem_element.find(doc_name).get("definition")
+            assert Path(definition).parent == session.directory
+            assert Path(definition).is_file()
+
+    def test_shared_file_path_container(self, session: Session):
+        # given
+        node = mock.MagicMock(spec=DockerNode)
+        node.directory = session.directory / "docker.conf"
+
+        # when
+        file_path = emanexml.shared_file_path(node, "test.xml")
+
+        # then
+        assert file_path == node.directory / "test.xml"
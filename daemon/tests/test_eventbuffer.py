@@ -0,0 +1,98 @@
+from mock import MagicMock
+
+from core.api.grpc.wrappers import (
+    Link,
+    LinkEvent,
+    LinkType,
+    MessageType,
+    Node,
+    NodeEvent,
+    Position,
+)
+from core.gui.eventbuffer import EventBuffer
+
+
+def create_app() -> MagicMock:
+    app = MagicMock()
+    app.guiconfig.preferences.frame_rate = 20
+    return app
+
+
+def node_event(node_id: int, x: float, message_type=MessageType.NONE) -> NodeEvent:
+    node = Node(id=node_id, position=Position(x=x, y=0))
+    return NodeEvent(message_type=message_type, node=node)
+
+
+def wireless_event(node1_id: int, node2_id: int, message_type) -> LinkEvent:
+    link = Link(node1_id=node1_id, node2_id=node2_id, type=LinkType.WIRELESS)
+    return LinkEvent(message_type=message_type, link=link)
+
+
+class TestEventBuffer:
+    def test_schedule(self):
+        # given
+        app = create_app()
+        event_buffer = EventBuffer(app)
+
+        # when
+        event_buffer.add_node_event(node_event(1, 10))
+        event_buffer.add_node_event(node_event(1, 20))
+
+        # then
+        app.after.assert_called_once_with(50, event_buffer.flush)
+
+    def test_flush_positions(self):
+        # given
+        app = create_app()
+        canvas_node = MagicMock()
+        edge = MagicMock()
+        canvas_node.edges = {edge}
+        canvas_node.wireless_edges = set()
+        app.core.canvas_nodes = {1: canvas_node}
+        event_buffer = EventBuffer(app)
+        for x in range(10):
+            event_buffer.add_node_event(node_event(1, x))
+
+        # when
+        event_buffer.flush()
+
+        # then
+        canvas_node.move.assert_called_once_with(9, 0, move_edges=False)
+        edge.move_nodes.assert_called_once_with({canvas_node})
+        assert not event_buffer.scheduled
+
+    def test_flush_ordered(self):
+        # given
+        app = create_app()
+        app.core.canvas_nodes = {}
+        event_buffer = EventBuffer(app)
+        add_event = node_event(2, 0, MessageType.ADD)
+        delete_event = node_event(2, 0, MessageType.DELETE)
+        event_buffer.add_node_event(add_event)
+        event_buffer.add_node_event(node_event(2, 10))
+        event_buffer.add_node_event(delete_event)
+
+        # when
+        event_buffer.flush()
+
+        # then
+        calls = [x[0][0] for x in app.core.handle_node_event.call_args_list]
+        assert calls == [add_event, delete_event]
+
+    def test_flush_wireless(self):
+        # given
+        app = create_app()
+        app.core.canvas_nodes = {1: MagicMock(), 2: MagicMock()}
+        event_buffer = EventBuffer(app)
+        event_buffer.add_link_event(wireless_event(1, 2, MessageType.ADD))
+        event_buffer.add_link_event(wireless_event(2, 1, MessageType.NONE))
+        event_buffer.add_link_event(wireless_event(1, 3, MessageType.ADD))
+
+        # when
+        event_buffer.flush()
+
+        # then
+        app.core.handle_link_event.assert_called_once()
+        event = app.core.handle_link_event.call_args[0][0]
+        assert event.message_type == MessageType.ADD
+        assert event.link.node1_id == 2
@@ -1,4 +1,6 @@
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from queue import Queue
 from tempfile import TemporaryFile
@@ -6,10 +8,11 @@ from typing import Optional
 
 import grpc
 import pytest
-from mock import patch
+from mock import MagicMock, patch
 
 from core.api.grpc import core_pb2, wrappers
 from core.api.grpc.client import CoreGrpcClient, InterfaceHelper, MoveNodesStreamer
+from core.api.grpc.commands import ERROR_STATUS, CommandExecutor, NodeCommandRunner
 from core.api.grpc.server import CoreGrpcServer
 from core.api.grpc.wrappers import (
     ConfigOption,
@@ -35,9 +38,15 @@ from core.api.tlv.dataconversion import ConfigShim
 from core.api.tlv.enumerations import ConfigFlags
 from core.emane.models.ieee80211abg import EmaneIeee80211abgModel
 from core.emane.nodes import EmaneNet
-from core.emulator.data import EventData, IpPrefixes, NodeData, NodeOptions
+from core.emulator.data import (
+    EventData,
+    InterfaceData,
+    IpPrefixes,
+    NodeData,
+    NodeOptions,
+)
 from core.emulator.enumerations import EventTypes, ExceptionLevels
-from core.errors import CoreError
+from core.errors import CoreCommandError, CoreError
 from core.location.mobility import BasicRangeModel, Ns2ScriptedMobility
 from core.nodes.base import CoreNode
 from core.nodes.network import SwitchNode, WlanNode
@@ -218,6 +227,58 @@ class TestGrpc:
         assert len(session.nodes) == 1
         assert len(session.links) == 0
 
+    def test_get_session_changes(self, grpc_server: CoreGrpcServer):
+        # given
+        client = CoreGrpcClient()
+        session = grpc_server.coreemu.create_session()
+        node1 = session.add_node(CoreNode)
+        node2 = session.add_node(CoreNode)
+        switch = session.add_node(SwitchNode)
+        iface_data = InterfaceData(id=0)
+        session.add_link(node1.id, switch.id, iface_data)
+        with client.context_connect():
+            version = client.get_session(session.id).version
+        session.set_node_pos(node1, 10, 10)
+        session.add_link(node2.id, switch.id, InterfaceData(id=0))
+        session.delete_link(node1.id, switch.id, iface_data.id)
+        session.delete_node(node2.id)
+
+        # then
+        with client.context_connect():
+            changes = client.get_session_changes(session.id, version)
+            snapshot = client.get_session_changes(session.id, -1)
+
+        # then
+        assert changes.session is None
+        assert changes.version == session.changes.version
+        assert [x.id for x in changes.nodes] == [node1.id]
+        assert changes.deleted_node_ids == [node2.id]
+        assert not changes.links
+        assert len(changes.deleted_links) == 2
+        assert snapshot.session is not None
+        assert len(snapshot.session.nodes) == 2
+
+    def test_get_session_profile(self, grpc_server: CoreGrpcServer):
+        # given
+        client = CoreGrpcClient()
+        session = grpc_server.coreemu.create_session()
+        session.add_node(CoreNode)
+        with session.profiler.span("test") as span:
+            session.profiler.add_command(span, "true", 0)
+        session.instantiate()
+
+        # when
+        with client.context_connect():
+            profile = client.get_session_profile(session.id, commands=True)
+
+        # then
+        names = {(x.category, x.name) for x in profile.spans}
+        assert ("phase", "boot_nodes") in names
+        assert ("node", "boot") in names
+        assert len(profile.commands) == 1
+        assert profile.commands[0].span == "test"
+        assert profile.path == session.directory / "boot-profile.json"
+
     def test_get_sessions(self, grpc_server: CoreGrpcServer):
         # given
         client = CoreGrpcClient()
@@ -365,6 +426,41 @@ class TestGrpc:
         # then
         assert (expected_status, expected_output) == output
 
+    def test_node_commands(self, grpc_server: CoreGrpcServer):
+        # given
+        client = CoreGrpcClient()
+        session = grpc_server.coreemu.create_session()
+        nodes = [session.add_node(CoreNode) for _ in range(5)]
+        node_ids = [x.id for x in nodes[:3]]
+
+        def cmd(node: CoreNode, args: str, wait: bool = True, shell: bool = False):
+            return f"{node.name} {args}"
+
+        # when
+        with patch.object(CoreNode, "cmd", autospec=True, side_effect=cmd):
+            with client.context_connect():
+                results = list(
+                    client.node_commands(session.id, "hostname", node_ids, parallel=2)
+                )
+
+        # then
+        assert sorted(x.node_id for x in results) == node_ids
+        for result in results:
+            node = session.get_node(result.node_id, CoreNode)
+            assert result.output == f"{node.name} hostname"
+            assert result.return_code == 0
+            assert not result.timed_out
+
+    def test_node_commands_exception(self, grpc_server: CoreGrpcServer):
+        # given
+        client = CoreGrpcClient()
+        session = grpc_server.coreemu.create_session()
+
+        # then
+        with pytest.raises(grpc.RpcError):
+            with client.context_connect():
+                list(client.node_commands(session.id, "hostname", [1]))
+
     def test_get_node_terminal(self, grpc_server: CoreGrpcServer):
         # given
         client = CoreGrpcClient()
@@ -906,6 +1002,7 @@ class TestGrpc:
         streamer = MoveNodesStreamer(session.id)
         streamer.send_position(node.id, x, y)
         streamer.stop()
+        version = session.changes.version
 
         # then
         with client.context_connect():
@@ -914,6 +1011,7 @@ class TestGrpc:
         # assert
         assert node.position.x == x
         assert node.position.y == y
+        assert session.changes.version == version + 1
 
     def test_move_nodes_geo(self, grpc_server: CoreGrpcServer):
         # given
@@ -945,6 +1043,64 @@ class TestGrpc:
         assert node.position.lat == lat
         assert node.position.alt == alt
 
+    def test_move_nodes_batched(self, grpc_server: CoreGrpcServer):
+        # given
+        client = CoreGrpcClient()
+        session = grpc_server.coreemu.create_session()
+        wlan = session.add_node(WlanNode)
+        session.mobility.set_model(wlan, BasicRangeModel)
+        ip_prefixes = IpPrefixes(ip4_prefix="10.83.0.0/16")
+        nodes = []
+        for _ in range(2):
+            node = session.add_node(CoreNode)
+            iface_data = ip_prefixes.create_iface(node)
+            session.add_link(node.id, wlan.id, iface1_data=iface_data)
+            nodes.append(node)
+        streamer = MoveNodesStreamer(session.id)
+        for i in range(50):
+            for node in nodes:
+                streamer.send_position(node.id, i, i)
+        streamer.stop()
+
+        # then
+        with patch.object(BasicRangeModel, "set_position", autospec=True) as set_pos:
+            with patch.object(BasicRangeModel, "update", autospec=True) as update:
+                with client.context_connect():
+                    stats = client.move_nodes(streamer)
+
+        # assert
+        assert not [x for x in set_pos.call_args_list if x[0][0] is wlan.model]
+        updates = [x for x in update.call_args_list if x[0][0] is wlan.model]
+        assert len(updates) == stats.batches
+        assert stats.received == 100
+        assert stats.applied + stats.coalesced == stats.received
+        assert stats.applied < stats.received
+        for node in nodes:
+            assert node.position.x == 49
+            assert node.position.y == 49
+
+    def test_move_nodes_cancelled(self, grpc_server: CoreGrpcServer):
+        # given
+        context = MagicMock()
+        context.is_active.return_value = False
+        event = threading.Event()
+
+        def requests():
+            event.wait(5)
+            yield from ()
+
+        # when
+        start = time.monotonic()
+        try:
+            response = grpc_server.MoveNodes(requests(), context)
+        finally:
+            event.set()
+        elapsed = time.monotonic() - start
+
+        # then
+        assert response.received == 0
+        assert elapsed < 5
+
     def test_move_nodes_exception(self, grpc_server: CoreGrpcServer):
         # given
         client = CoreGrpcClient()
@@ -958,3 +1114,156 @@ class TestGrpc:
         with pytest.raises(grpc.RpcError):
             with client.context_connect():
                 client.move_nodes(streamer)
+
+
+class TestNodeCommandRunner:
+    def test_run_bounded(self):
+        # given
+        lock = threading.Lock()
+        running = []
+        peak = []
+
+        def cmd(args: str, shell: bool = False) -> str:
+            with lock:
+                running.append(args)
+                peak.append(len(running))
+            time.sleep(0.05)
+            with lock:
+                running.remove(args)
+            return "done"
+
+        nodes = [MagicMock(id=x, cmd=cmd) for x in range(10)]
+        executor = ThreadPoolExecutor(max_workers=10)
+        runner = NodeCommandRunner(executor, nodes, "hostname", parallel=3)
+
+        # when
+        results = list(runner.run(lambda: True))
+
+        # then
+        assert sorted(x.node_id for x in results) == list(range(10))
+        assert max(peak) <= 3
+        executor.shutdown()
+
+    def test_run_cancelled(self):
+        # given
+        nodes = [MagicMock(id=x, cmd=MagicMock(return_value="")) for x in range(10)]
+        executor = ThreadPoolExecutor(max_workers=2)
+        runner = NodeCommandRunner(executor, nodes, "hostname", parallel=2)
+        active = [True]
+
+        # when
+        results = []
+        for result in runner.run(lambda: active[0]):
+            results.append(result)
+            active[0] = False
+
+        # then
+        assert len(results) < len(nodes)
+        assert sum(x.cmd.call_count for x in nodes) <= len(results) + 2
+        executor.shutdown()
+
+    def test_run_timeout(self):
+        # given
+        error = CoreCommandError(124, "sleep 10", "", "")
+        node = MagicMock(id=1, cmd=MagicMock(side_effect=error))
+        executor = ThreadPoolExecutor(max_workers=1)
+        runner = NodeCommandRunner(executor, [node], "sleep 10", True, 0.01)
+
+        # when
+        results = list(runner.run(lambda: True))
+
+        # then
+        args, kwargs = node.cmd.call_args
+        assert args[0] == "timeout -k 1 0.01 bash -c 'sleep 10'"
+        assert kwargs["shell"] is False
+        assert results[0].return_code == 124
+        executor.shutdown()
+
+    def test_run_node_error(self):
+        # given
+        error = ValueError("api error")
+        nodes = [
+            MagicMock(id=1, cmd=MagicMock(side_effect=error)),
+            MagicMock(id=2, cmd=MagicMock(return_value="done")),
+        ]
+        executor = ThreadPoolExecutor(max_workers=1)
+        runner = NodeCommandRunner(executor, nodes, "hostname")
+
+        # when
+        results = list(runner.run(lambda: True))
+
+        # then
+        assert [x.node_id for x in results] == [1, 2]
+        assert results[0].return_code == ERROR_STATUS
+        assert results[0].output == "api error"
+        assert results[1].output == "done"
+        executor.shutdown()
+
+    def test_run_executor_shutdown(self):
+        # given
+        started = threading.Event()
+        release = threading.Event()
+
+        def cmd(args: str, shell: bool = False) -> str:
+            started.set()
+            release.wait(5)
+            return "done"
+
+        nodes = [MagicMock(id=x, cmd=cmd) for x in range(3)]
+        executor = CommandExecutor(1)
+        runner = NodeCommandRunner(executor, nodes, "hostname", parallel=3)
+
+        def shutdown() -> None:
+            started.wait(5)
+            executor.shutdown(wait=False)
+            release.set()
+
+        thread = threading.Thread(target=shutdown)
+        thread.start()
+
+        # when
+        results = list(runner.run(lambda: True))
+
+        # then
+        thread.join()
+        assert [x.node_id for x in results] == [0]
+
+    def test_run_after_executor_shutdown(self):
+        # given
+        nodes = [MagicMock(id=x) for x in range(3)]
+        executor = CommandExecutor(1)
+        executor.shutdown()
+        runner = NodeCommandRunner(executor, nodes, "hostname", parallel=3)
+
+        # when
+        results = list(runner.run(lambda: True))
+
+        # then
+        assert not results
+        for node in nodes:
+            node.cmd.assert_not_called()
+
+
+class TestCommandExecutor:
+    def test_shutdown_cancels_pending(self):
+        # given
+        executor = CommandExecutor(1)
+        started = threading.Event()
+        release = threading.Event()
+
+        def block() -> None:
+            started.set()
+            release.wait(5)
+
+        running = executor.submit(block)
+        started.wait(5)
+        pending = [executor.submit(lambda: None) for _ in range(3)]
+
+        # when
+        executor.shutdown(wait=False)
+        release.set()
+
+        # then
+        assert all(x.cancelled() for x in pending)
+        assert running.result(5) is None
+        assert not executor.pending.intersection(pending)
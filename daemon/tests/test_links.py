@@ -1,3 +1,5 @@
+import tracemalloc
+from dataclasses import FrozenInstanceError
 from typing import Tuple
 
 import pytest
@@ -364,3 +366,51 @@ class TestLinks:
         # when
         with pytest.raises(CoreError):
             session.delete_link(node1.id, node3.id)
+
+    def test_links_reuse_snapshots(self, session: Session, ip_prefixes: IpPrefixes):
+        # given
+        switch = session.add_node(SwitchNode)
+        for _ in range(100):
+            node = session.add_node(CoreNode)
+            iface_data = ip_prefixes.create_iface(node)
+            session.add_link(node.id, switch.id, iface_data, options=LINK_OPTIONS)
+
+        # when
+        tracemalloc.start()
+        try:
+            start, _ = tracemalloc.get_traced_memory()
+            links1 = switch.links()
+            first, _ = tracemalloc.get_traced_memory()
+            links2 = switch.links()
+            second, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        # then
+        assert len(links1) == len(links2) == 100
+        for link1, link2 in zip(links1, links2):
+            assert link1.iface2 is link2.iface2
+            assert link1.options is link2.options
+        assert second - first < (first - start) / 2
+        with pytest.raises(FrozenInstanceError):
+            links1[0].options.delay = 0
+
+    def test_links_snapshot_updated(self, session: Session, ip_prefixes: IpPrefixes):
+        # given
+        node1 = session.add_node(CoreNode)
+        switch = session.add_node(SwitchNode)
+        iface1_data = ip_prefixes.create_iface(node1)
+        iface, _ = session.add_link(node1.id, switch.id, iface1_data)
+        link1 = switch.links()[0]
+
+        # when
+        session.update_link(node1.id, switch.id, iface1_data.id, options=LINK_OPTIONS)
+        iface.add_ip("10.1.0.1/24")
+        link2 = switch.links()[0]
+
+        # then
+        assert link1.options != LINK_OPTIONS
+        assert link2.options == LINK_OPTIONS
+        assert link2.options.unidirectional == 0
+        assert link1.iface2 is not link2.iface2
+        assert link2.iface2 == link1.iface2
@@ -1,6 +1,20 @@
+from pathlib import Path
+from typing import Dict
+
 import pytest
 
-from core.location.mobility import WayPoint
+from core.emulator.data import IpPrefixes, NodeOptions
+from core.emulator.session import Session
+from core.location.contactplan import (
+    build_trajectory,
+    compute_contacts,
+    create_plan,
+    load_plan,
+    plan_path,
+)
+from core.location.mobility import BasicRangeModel, WayPoint
+from core.nodes.base import CoreNode
+from core.nodes.network import WlanNode
 
 POSITION = (0.0, 0.0, 0.0)
 
@@ -17,3 +31,208 @@ class TestMobility:
     )
     def test_waypoint_lessthan(self, wp1, wp2, expected):
         assert (wp1 < wp2) == expected
+
+
+def create_range_model(
+    session: Session, ip_prefixes: IpPrefixes, config: Dict[str, str]
+):
+    wlan = session.add_node(WlanNode)
+    session.mobility.set_model(wlan, BasicRangeModel, config)
+    options = NodeOptions(model=None)
+    options.set_position(0, 0)
+    node1 = session.add_node(CoreNode, options=options)
+    node2 = session.add_node(CoreNode, options=options)
+    for node in (node1, node2):
+        iface_data = ip_prefixes.create_iface(node)
+        session.add_link(node.id, wlan.id, iface1_data=iface_data)
+    model = wlan.model
+    iface1 = node1.get_iface(0)
+    iface2 = node2.get_iface(0)
+    return model, iface1, iface2
+
+
+def move(model: BasicRangeModel, iface1, iface2, distance: float) -> bool:
+    model.iface_to_pos[iface1] = (0.0, 0.0, None)
+    model.iface_to_pos[iface2] = (distance, 0.0, None)
+    model.calclink(iface1, iface2)
+    a, b = min(iface1, iface2), max(iface1, iface2)
+    return model.wlan.is_linked(a, b)
+
+
+class TestBasicRangeModel:
+    def test_range(self, session: Session, ip_prefixes: IpPrefixes):
+        # given
+        model, iface1, iface2 = create_range_model(
+            session, ip_prefixes, {"range": "100"}
+        )
+
+        # when
+        linked = [move(model, iface1, iface2, x) for x in (50, 101, 99, 150)]
+
+        # then
+        assert linked == [True, False, True, False]
+        assert model.suppressed == {"hysteresis": 0, "dwell": 0}
+
+    def test_hysteresis(self, session: Session, ip_prefixes: IpPrefixes):
+        # given
+        config = {"range": "100", "inner_range": "90", "outer_range": "110"}
+        model, iface1, iface2 = create_range_model(session, ip_prefixes, config)
+
+        # when
+        distances = (200, 95, 85, 105, 99, 101, 109, 111, 100, 89)
+        linked = [move(model, iface1, iface2, x) for x in distances]
+
+        # then
+        assert linked == [
+            False,
+            False,
+            True,
+            True,
+            True,
+            True,
+            True,
+            False,
+            False,
+            True,
+        ]
+        assert model.suppressed["hysteresis"] == 5
+
+    def test_dwell(self, session: Session, ip_prefixes: IpPrefixes):
+        # given
+        config = {"range": "100", "dwell": "60000"}
+        model, iface1, iface2 = create_range_model(session, ip_prefixes, config)
+
+        # when
+        linked = [move(model, iface1, iface2, x) for x in (50, 150, 150, 50)]
+
+        # then
+        assert linked == [True, True, True, True]
+        assert model.suppressed["dwell"] == 2
+
+    def test_dwell_prune(self, session: Session, ip_prefixes: IpPrefixes):
+        # given
+        config = {"range": "100", "dwell": "1000"}
+        model, iface1, iface2 = create_range_model(session, ip_prefixes, config)
+        move(model, iface1, iface2, 50)
+        pair = (min(iface1, iface2), max(iface1, iface2))
+        assert pair in model.changed
+
+        # when
+        model.prune_changed(model.changed[pair] + 0.5)
+        kept = pair in model.changed
+        model.prune_changed(model.changed[pair] + 1.0)
+
+        # then
+        assert kept
+        assert pair not in model.changed
+
+    def test_remove_iface(self, session: Session, ip_prefixes: IpPrefixes):
+        # given
+        config = {"range": "100", "dwell": "60000"}
+        model, iface1, iface2 = create_range_model(session, ip_prefixes, config)
+        move(model, iface1, iface2, 50)
+
+        # when
+        session.delete_link(iface1.node.id, model.wlan.id, iface1.node_id)
+
+        # then
+        assert iface1 not in model.iface_to_pos
+        assert not model.changed
+
+
+class TestContactPlan:
+    def test_trajectory(self):
+        # given
+        waypoints = [
+            (1.0, (100.0, 0.0, None), 10.0),
+            (6.0, (0.0, 0.0, None), 10.0),
+            (20.0, (50.0, 50.0, None), 0.0),
+        ]
+
+        # when
+        trajectory = build_trajectory((0.0, 0.0, None), waypoints)
+
+        # then
+        assert trajectory.position(0.5) == (0.0, 0.0, None)
+        assert trajectory.position(3.0) == (20.0, 0.0, None)
+        # redirected before reaching first destination
+        assert trajectory.position(6.0) == (50.0, 0.0, None)
+        assert trajectory.position(8.0) == (30.0, 0.0, None)
+        assert trajectory.position(15.0) == (0.0, 0.0, None)
+        assert trajectory.position(20.0) == (50.0, 50.0, None)
+        assert trajectory.end == 20.0
+
+    def test_compute_contacts(self):
+        # given
+        trajectory1 = build_trajectory((0.0, 0.0, None), [])
+        waypoints = [(0.0, (0.0, 0.0, None), 10.0), (40.0, (300.0, 0.0, None), 10.0)]
+        trajectory2 = build_trajectory((300.0, 0.0, None), waypoints)
+
+        # when
+        initial, changes = compute_contacts(trajectory1, trajectory2, 100.0)
+
+        # then
+        assert initial is False
+        assert len(changes) == 2
+        (up_time, up), (down_time, down) = changes
+        assert up_time == pytest.approx(20.0)
+        assert up is True
+        assert down_time == pytest.approx(50.0)
+        assert down is False
+
+    def test_create_plan_matches_sampling(self):
+        # given
+        initial = {1: (0.0, 0.0, None), 2: (250.0, 0.0, None), 3: (300.0, 400.0, None)}
+        waypoints = {
+            1: [(1.0, (400.0, 400.0, None), 25.0)],
+            2: [(2.0, (0.0, 300.0, None), 15.0), (12.0, (250.0, 0.0, None), 40.0)],
+        }
+        radius = 150.0
+
+        # when
+        plan = create_plan(initial, waypoints, radius)
+
+        # then
+        assert len(plan.contacts) > 2
+
+        def linked(t: float, node1_id: int, node2_id: int) -> bool:
+            p1 = plan.trajectories[node1_id].position(t)
+            p2 = plan.trajectories[node2_id].position(t)
+            return (p1[0] - p2[0]) ** 2 + (p1[1] - p2[1]) ** 2 <= radius * radius
+
+        pairs = [(1, 2), (1, 3), (2, 3)]
+        states = {x: linked(0.0, *x) for x in pairs}
+        contacts = list(plan.contacts)
+        t = 0.0
+        while t < plan.end + 1:
+            t += 0.05
+            while contacts and contacts[0].time <= t:
+                contact = contacts.pop(0)
+                states[(contact.node1_id, contact.node2_id)] = contact.linked
+            for pair in pairs:
+                near_contact = any(
+                    abs(x.time - t) < 0.05
+                    for x in plan.contacts
+                    if (x.node1_id, x.node2_id) == pair
+                )
+                if not near_contact:
+                    assert states[pair] == linked(t, *pair)
+        assert plan.contacts == sorted(plan.contacts, key=lambda x: x.time)
+
+    def test_load_plan_cache(self, tmp_path: Path):
+        # given
+        script_path = tmp_path / "mobility.scen"
+        initial = {1: (0.0, 0.0, None), 2: (300.0, 0.0, None)}
+        waypoints = {2: [(0.0, (0.0, 0.0, None), 10.0)]}
+
+        # when
+        plan = load_plan(script_path, initial, waypoints, 100.0)
+        cached = load_plan(script_path, initial, waypoints, 100.0)
+        changed = load_plan(script_path, initial, waypoints, 50.0)
+
+        # then
+        assert plan_path(script_path).exists()
+        assert cached.contacts == plan.contacts
+        assert cached.key == plan.key
+        assert changed.key != plan.key
+        assert changed.contacts[0].time == pytest.approx(25.0)
@@ -1,4 +1,7 @@
+from pathlib import Path
+
 import pytest
+from mock import MagicMock
 
 from core.emulator.data import InterfaceData, NodeOptions
 from core.emulator.session import Session
@@ -8,6 +11,7 @@ from core.nodes.network import HubNode, SwitchNode, WlanNode
 
 MODELS = ["router", "host", "PC", "mdr"]
 NET_TYPES = [SwitchNode, HubNode, WlanNode]
+CREATE_FILES = CoreNode.create_files
 
 
 class TestNodes:
@@ -131,6 +135,35 @@ class TestNodes:
         with pytest.raises(CoreError):
             node.add_ip(iface.node_id, ip)
 
+    def test_node_create_files(self, session: Session, tmpdir):
+        # given
+        node = session.add_node(CoreNode)
+        node.directory = Path(tmpdir)
+        node.path_exists = MagicMock()
+        node.host_cmd = MagicMock()
+        mount_path = node.directory / "etc.app"
+        node._mounts = [(mount_path, Path("/etc/app"))]
+        files = [
+            (Path("/etc/app/app.conf"), "app", 0o644),
+            (Path("/etc/app/conf.d/extra.conf"), "extra", 0o600),
+            (Path("start.sh"), "start", 0o755),
+        ]
+
+        # when
+        CREATE_FILES(node, files)
+
+        # then
+        node.path_exists.assert_not_called()
+        node.host_cmd.assert_not_called()
+        app_path = mount_path / "app.conf"
+        extra_path = mount_path / "conf.d" / "extra.conf"
+        start_path = node.host_path(Path("start.sh"))
+        assert app_path.read_text() == "app"
+        assert extra_path.read_text() == "extra"
+        assert extra_path.stat().st_mode & 0o777 == 0o600
+        assert start_path.read_text() == "start"
+        assert start_path.stat().st_mode & 0o777 == 0o755
+
     @pytest.mark.parametrize("net_type", NET_TYPES)
     def test_net(self, session, net_type):
         # given
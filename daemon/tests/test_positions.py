@@ -0,0 +1,140 @@
+from core.emulator.positions import DEFAULT_STORE, PositionStore
+from core.emulator.session import Session
+from core.nodes.base import CoreNode, Position
+
+
+class TestPositionStore:
+    def test_set(self):
+        # given
+        store = PositionStore()
+        slot = store.allocate(1)
+
+        # when
+        changed = store.set(slot, 10, 20)
+        unchanged = store.set(slot, 10, 20)
+
+        # then
+        assert changed
+        assert not unchanged
+        assert store.get(slot) == (10, 20, None)
+        assert store.get_geo(slot) == (None, None, None)
+
+    def test_value_types(self):
+        # given
+        store = PositionStore()
+        slot = store.allocate(1)
+
+        # when
+        store.set(slot, 10, 20.5, 30)
+        store.set_geo(slot, 1.5, 2, None)
+        position = store.get(slot)
+        geo = store.get_geo(slot)
+        store.set(slot, 10.0, 20, None)
+
+        # then
+        assert [type(x) for x in position] == [int, float, int]
+        assert [type(x) for x in geo] == [float, int, type(None)]
+        assert [type(x) for x in store.get(slot)[:2]] == [float, int]
+        assert [type(x) for x in store.get_geo(slot)[:2]] == [float, int]
+
+    def test_changed(self):
+        # given
+        store = PositionStore()
+        slot1 = store.allocate(1)
+        slot2 = store.allocate(2)
+        store.set(slot1, 1, 1)
+        sequence, _ = store.changed(0)
+
+        # when
+        store.set(slot2, 2, 2)
+        store.set(slot1, 1, 1)
+        sequence2, positions = store.changed(sequence)
+        sequence3, unchanged = store.changed(sequence2)
+
+        # then
+        assert positions == {slot2: (2, 2, None)}
+        assert sequence3 == sequence2
+        assert not unchanged
+
+    def test_release(self):
+        # given
+        store = PositionStore()
+        slot = store.allocate(1)
+        store.set(slot, 1, 1)
+
+        # when
+        store.release(slot)
+        reused = store.allocate(2)
+
+        # then
+        assert reused == slot
+        assert len(store) == 1
+        assert store.get(reused) == (None, None, None)
+
+    def test_release_later(self):
+        # given
+        store = PositionStore()
+        slot = store.allocate(1)
+        store.set(slot, 1, 1)
+
+        # when
+        store.release_later(slot)
+        reused = store.allocate(2)
+
+        # then
+        assert reused == slot
+        assert len(store) == 1
+        assert store.get(reused) == (None, None, None)
+        assert store.changed(0)[1] == {}
+
+
+class TestPosition:
+    def test_standalone(self):
+        # given
+        position = Position(1, 2, 3)
+
+        # when
+        position.lat = 10.0
+
+        # then
+        assert position.store is DEFAULT_STORE
+        assert position.get() == (1, 2, 3)
+        assert position.get_geo() == (None, 10.0, None)
+
+    def test_session_nodes(self, session: Session):
+        # given
+        node1 = session.add_node(CoreNode)
+        node2 = session.add_node(CoreNode)
+
+        # when
+        session.set_node_pos(node2, 50, 60)
+
+        # then
+        assert node1.position.store is session.positions
+        slots = [node1.position.slot, node2.position.slot]
+        assert session.positions.get_many(slots) == [(0, 0, None), (50, 60, None)]
+
+    def test_delete_node(self, session: Session):
+        # given
+        node = session.add_node(CoreNode)
+        session.set_node_pos(node, 50, 60)
+        slot = node.position.slot
+
+        # when
+        session.delete_node(node.id)
+
+        # then
+        assert node.position.store is not session.positions
+        assert node.position.get() == (50, 60, None)
+        assert slot in session.positions.free
+
+    def test_clear(self, session: Session):
+        # given
+        nodes = [session.add_node(CoreNode) for _ in range(3)]
+
+        # when
+        session.clear()
+
+        # then
+        assert len(session.positions) == 0
+        assert all(x.position.store is not session.positions for x in nodes)
@@ -0,0 +1,206 @@
+from pathlib import Path
+from unittest import mock
+
+from core.emulator.prewarm import ContainerOverlay, ContainerPool
+from core.emulator.session import Session
+from core.nodes.docker import DockerNode
+from core.nodes.lxd import LxcNode
+
+
+class FakeContainerNode:
+    clients = []
+
+    def __init__(self, _id: int, image: str = "ubuntu", model: str = "PC") -> None:
+        self.id = _id
+        self.image = image
+        self.type = model
+        self.server = None
+        self.up = False
+        self.overlay = {}
+        self.services = []
+        self.config_services = {}
+
+    @classmethod
+    def resolve_path(cls, file_path: Path) -> Path:
+        return Path("/") / file_path
+
+    @classmethod
+    def create_client(cls, session: Session, name: str, image: str):
+        client = mock.MagicMock()
+        client.name = name
+        cls.clients.append(client)
+        return client
+
+
+class TestContainerOverlay:
+    def test_common(self):
+        # given
+        overlay = ContainerOverlay()
+        shared = (b"shared", 0o644)
+        overlay.add_files(1, {Path("/a"): shared, Path("/b"): (b"node1", 0o644)})
+        overlay.add_files(2, {Path("/a"): shared, Path("/b"): (b"node2", 0o644)})
+        overlay.add_files(2, {Path("/c"): shared})
+
+        # when
+        common = overlay.common()
+
+        # then
+        assert common == {Path("/a"): shared}
+
+
+class TestContainerPool:
+    def test_prewarm_nodes(self, session: Session):
+        # given
+        pool = ContainerPool(session)
+        nodes = [
+            FakeContainerNode(1),
+            FakeContainerNode(2),
+            FakeContainerNode(3, "alt"),
+        ]
+        nodes[1].up = True
+
+        # when
+        exceptions = pool.prewarm_nodes(nodes)
+
+        # then
+        assert not exceptions
+        assert pool.available((FakeContainerNode, "ubuntu", "PC", ())) == 1
+        assert pool.available((FakeContainerNode, "alt", "PC", ())) == 1
+
+    def test_claim(self, session: Session):
+        # given
+        pool = ContainerPool(session)
+        node = FakeContainerNode(1)
+        pool.prewarm(FakeContainerNode, "ubuntu", "PC", 1)
+
+        # when
+        claimed = pool.claim(node)
+        empty = pool.claim(node)
+
+        # then
+        assert claimed is not None
+        client, overlay = claimed
+        client.create.assert_called_once()
+        client.put_overlay.assert_not_called()
+        assert overlay == {}
+        assert empty is None
+
+    def test_overlay_baked(self, tmp_path: Path):
+        # given
+        session = mock.MagicMock(id=1, directory=tmp_path)
+        pool = ContainerPool(session)
+        shared = (Path("/etc/shared.sh"), b"shared", 0o755)
+        for _id in (1, 2):
+            node = FakeContainerNode(_id)
+            unique = (Path("/etc/unique.sh"), f"{_id}".encode(), 0o755)
+            pool.add_files(node, [shared, unique])
+        pool.prewarm(FakeContainerNode, "ubuntu", "PC", 1)
+        node = FakeContainerNode(3)
+
+        # when
+        client, node.overlay = pool.claim(node)
+        unique = (Path("/etc/unique.sh"), b"3", 0o755)
+        files = pool.add_files(node, [shared, unique])
+
+        # then
+        client.put_overlay.assert_called_once()
+        assert node.overlay == {shared[0]: (shared[1], shared[2])}
+        assert files == [unique]
+
+    def test_overlay_rendered(self, tmp_path: Path):
+        # given
+        session = mock.MagicMock(id=1, directory=tmp_path)
+        pool = ContainerPool(session)
+        nodes = []
+        for _id in (1, 2):
+            node = FakeContainerNode(_id)
+            service = mock.MagicMock()
+            service.get_files.return_value = [
+                (Path("etc/shared.sh"), "shared", 0o755),
+                (Path("etc/unique.sh"), f"{_id}", 0o755),
+            ]
+            node.config_services = {"zebra": service}
+            nodes.append(node)
+
+        # when
+        exceptions = pool.prewarm_nodes(nodes)
+        client, overlay = pool.claim(nodes[0])
+
+        # then
+        assert not exceptions
+        client.put_overlay.assert_called_once()
+        assert overlay == {Path("/etc/shared.sh"): (b"shared", 0o755)}
+
+    def test_overlay_services(self, tmp_path: Path):
+        # given
+        session = mock.MagicMock(id=1, directory=tmp_path)
+        pool = ContainerPool(session)
+        shared = (Path("/etc/shared.sh"), b"shared", 0o755)
+        for _id in (1, 2):
+            node = FakeContainerNode(_id)
+            node.config_services = {"zebra": None}
+            pool.add_files(node, [shared])
+        node = FakeContainerNode(3)
+
+        # when
+        pool.prewarm_nodes([node])
+        client, node.overlay = pool.claim(node)
+
+        # then
+        client.put_overlay.assert_not_called()
+        assert node.overlay == {}
+
+    def test_shutdown(self, session: Session):
+        # given
+        pool = ContainerPool(session)
+        pool.prewarm(FakeContainerNode, "ubuntu", "PC", 2)
+        clients = FakeContainerNode.clients[-2:]
+
+        # when
+        pool.shutdown()
+
+        # then
+        for client in clients:
+            client.stop_container.assert_called_once()
+        assert pool.available((FakeContainerNode, "ubuntu", "PC", ())) == 0
+
+    def test_clear(self, session: Session):
+        # given
+        pool = session.container_pool
+        key = (FakeContainerNode, "ubuntu", "PC", ())
+        pool.add_files(FakeContainerNode(1), [(Path("/etc/a.sh"), b"a", 0o755)])
+
+        # when
+        session.clear()
+
+        # then
+        assert key not in pool.overlays
+
+    def test_resolve_path(self):
+        # given
+        file_path = Path("etc/test.sh")
+
+        # when
+        docker_path = DockerNode.resolve_path(file_path)
+        lxc_path = LxcNode.resolve_path(file_path)
+
+        # then
+        assert docker_path == Path("/etc/test.sh")
+        assert lxc_path == Path("/root/etc/test.sh")
+
+    def test_claim_hostname(self, session: Session):
+        # given
+        node = DockerNode(session, 1)
+        client = mock.MagicMock()
+        client.start_container.return_value = "100"
+        key = ContainerPool.key(node)
+        session.container_pool.containers[key] = [(client, {})]
+
+        # when
+        with mock.patch.object(DockerNode, "makenodedir"):
+            node.startup()
+
+        # then
+        client.rename.assert_called_once_with(node.name)
+        command = f"hostname {node.name} && echo {node.name} > /etc/hostname"
+        client.check_cmd.assert_called_once_with(f"sh -c '{command}'")
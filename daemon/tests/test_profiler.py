@@ -0,0 +1,134 @@
+import json
+import threading
+from pathlib import Path
+
+from core import utils
+from core.emulator import profiler
+from core.emulator.data import IpPrefixes
+from core.emulator.profiler import BootProfiler
+from core.emulator.session import Session
+from core.nodes.base import CoreNode
+from core.nodes.network import SwitchNode
+
+
+class TestBootProfiler:
+    def test_span_commands(self):
+        # given
+        boot_profiler = BootProfiler(1)
+
+        # when
+        with boot_profiler.span("outer") as outer:
+            with boot_profiler.span("inner", "node", node="n1") as inner:
+                profiler.record_command("ip link show", 0)
+            profiler.record_command(["ip", "addr", "show"], 0)
+        profiler.record_command("ignored", 0)
+
+        # then
+        assert inner.parent is outer
+        assert inner.args == {"node": "n1"}
+        assert inner.commands == 1
+        assert outer.commands == 1
+        assert [x.command for x in boot_profiler.commands] == [
+            "ip link show",
+            "ip addr show",
+        ]
+        assert profiler.current_span() is None
+
+    def test_threadpool_spans(self):
+        # given
+        boot_profiler = BootProfiler(1)
+        threads = []
+
+        def work(name: str) -> None:
+            threads.append(threading.get_ident())
+            with boot_profiler.span(name):
+                profiler.record_command(name, 0)
+
+        # when
+        with boot_profiler.span("parent") as parent:
+            funcs = [(work, (f"work{x}",), {}) for x in range(3)]
+            utils.threadpool(funcs)
+
+        # then
+        spans = [x for x in boot_profiler.spans if x is not parent]
+        assert len(spans) == 3
+        assert all(x.parent is parent for x in spans)
+        assert all(x.commands == 1 for x in spans)
+        assert threading.get_ident() not in threads
+
+    def test_thread_var_fallback(self):
+        # given
+        var = profiler._ThreadVar("test")
+        values = []
+
+        def work() -> None:
+            values.append(var.get())
+            var.set("thread")
+
+        # when
+        token = var.set("main")
+        thread = threading.Thread(target=work)
+        thread.start()
+        thread.join()
+        value = var.get()
+        var.reset(token)
+
+        # then
+        assert values == [None]
+        assert value == "main"
+        assert var.get() is None
+
+    def test_stop(self):
+        # given
+        boot_profiler = BootProfiler(1)
+        with boot_profiler.span("boot"):
+            profiler.record_command("ip link show", 0)
+
+        # when
+        boot_profiler.stop()
+        with boot_profiler.span("runtime") as span:
+            profiler.record_command("ip link show", 0)
+
+        # then
+        assert span.commands == 1
+        assert [x.name for x in boot_profiler.spans] == ["boot"]
+        assert len(boot_profiler.commands) == 1
+
+    def test_to_trace(self, tmpdir):
+        # given
+        boot_profiler = BootProfiler(1)
+        with boot_profiler.span("outer"):
+            profiler.record_command("ip link show", 0)
+        path = Path(tmpdir) / "profile.json"
+
+        # when
+        boot_profiler.write(path)
+
+        # then
+        trace = json.loads(path.read_text())
+        events = [x for x in trace["traceEvents"] if x["ph"] == "X"]
+        assert {x["cat"] for x in events} == {"phase", "command"}
+        command = next(x for x in events if x["cat"] == "command")
+        assert command["args"]["span"] == "outer"
+
+    def test_session_boot(self, session: Session, ip_prefixes: IpPrefixes):
+        # given
+        node1 = session.add_node(CoreNode)
+        node2 = session.add_node(CoreNode)
+        switch = session.add_node(SwitchNode)
+        for node in (node1, node2):
+            iface_data = ip_prefixes.create_iface(node)
+            session.add_link(node.id, switch.id, iface1_data=iface_data)
+
+        # when
+        session.instantiate()
+
+        # then
+        metrics = session.profiler.metrics()
+        assert "interfaces.link" in metrics
+        assert "node.boot" in metrics
+        for name in ("control_net", "distributed_tunnels", "emane", "boot_nodes"):
+            assert f"phase.{name}" in metrics
+        boots = [x for x in session.profiler.spans if x.name == "boot"]
+        assert len(boots) == 2
+        assert all(x.parent.name == "nodes" for x in boots)
@@ -0,0 +1,179 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+from core import utils
+from core.registry import LazyRegistry, RegistryCache, RegistryEntry
+from core.services.coreservices import CoreService
+
+_PATH: Path = Path(__file__).resolve().parent
+_SERVICES_PATH = _PATH / "myservices"
+
+
+class TestRegistryCache:
+    def test_entries(self, tmpdir):
+        # given
+        path = Path(tmpdir) / "registry.json"
+        cache = RegistryCache(path)
+        module, file_path = next(
+            x for x in utils.find_modules(_SERVICES_PATH) if x[1].stem == "sample"
+        )
+
+        # when
+        entries = cache.entries(module, file_path, CoreService)
+        cache.save()
+        cache = RegistryCache(path)
+        cached_entries = cache.entries(module, file_path, CoreService)
+
+        # then
+        assert {x.name for x in entries} == {"MyService", "MyService2"}
+        assert not any(x.on_load for x in entries)
+        assert cached_entries == entries
+        assert cache.hits == 1
+        assert cache.misses == 0
+
+    def test_entries_changed(self, tmpdir):
+        # given
+        path = Path(tmpdir) / "registry.json"
+        cache = RegistryCache(path)
+        module, file_path = next(
+            x for x in utils.find_modules(_SERVICES_PATH) if x[1].stem == "sample"
+        )
+        cache.entries(module, file_path, CoreService)
+        key = next(iter(cache.modules))
+        cache.modules[key]["mtime"] = 0
+
+        # when
+        cache.entries(module, file_path, CoreService)
+
+        # then
+        assert cache.hits == 0
+        assert cache.misses == 2
+
+    def test_load_outdated(self, tmpdir):
+        # given
+        path = Path(tmpdir) / "registry.json"
+        path.write_text('{"header": {"version": 0}, "modules": {"a": {}}}')
+
+        # when
+        cache = RegistryCache(path)
+
+        # then
+        assert not cache.modules
+
+    def test_symlink(self, tmpdir):
+        # given
+        target = Path(tmpdir) / "target.json"
+        target.write_text("")
+        path = Path(tmpdir) / "registry.json"
+        path.symlink_to(target)
+        cache = RegistryCache(path)
+        module, file_path = next(
+            x for x in utils.find_modules(_SERVICES_PATH) if x[1].stem == "sample"
+        )
+        cache.entries(module, file_path, CoreService)
+
+        # when
+        cache.save()
+
+        # then
+        assert target.read_text() == ""
+        assert cache.changed
+
+    def test_untrusted_directory(self, tmpdir):
+        # given
+        directory = Path(tmpdir) / "cache"
+        path = directory / "registry.json"
+        cache = RegistryCache(path)
+        module, file_path = next(
+            x for x in utils.find_modules(_SERVICES_PATH) if x[1].stem == "sample"
+        )
+        cache.entries(module, file_path, CoreService)
+        cache.save()
+        directory.chmod(0o777)
+
+        # when
+        cache = RegistryCache(path)
+
+        # then
+        assert not cache.modules
+
+
+class TestLazyRegistry:
+    def test_lazy_import(self):
+        # given
+        module = "registrytest.lazy"
+        entry = RegistryEntry(module, "MyService", "MyService")
+        registry = LazyRegistry(CoreService)
+
+        # when
+        registry.add_entry(entry)
+
+        # then
+        assert "MyService" in registry
+        assert list(registry) == ["MyService"]
+        assert len(registry) == 1
+        assert module not in sys.modules
+        assert registry.get_entry("MyService") is entry
+
+    def test_getitem(self):
+        # given
+        module, _ = next(
+            x for x in utils.find_modules(_SERVICES_PATH) if x[1].stem == "sample"
+        )
+        loaded = []
+        registry = LazyRegistry(CoreService, loader=loaded.append)
+        registry.add_entry(RegistryEntry(module, "MyService", "MyService"))
+
+        # when
+        clazz = registry["MyService"]
+
+        # then
+        assert clazz.name == "MyService"
+        assert loaded == [clazz]
+        assert registry["MyService"] is clazz
+        assert len(loaded) == 1
+
+    def test_getitem_error(self):
+        # given
+        registry = LazyRegistry(CoreService)
+        registry.add_entry(RegistryEntry("registrytest.missing", "Missing", "Missing"))
+
+        # when
+        with pytest.raises(KeyError):
+            registry["Missing"]
+
+        # then
+        assert "Missing" not in registry
+        assert registry.get("Missing") is None
+        assert registry.errors == ["Missing"]
+
+    def test_values_skip_errors(self):
+        # given
+        module, _ = next(
+            x for x in utils.find_modules(_SERVICES_PATH) if x[1].stem == "sample"
+        )
+        registry = LazyRegistry(CoreService)
+        registry.add_entry(RegistryEntry(module, "MyService", "MyService"))
+        registry.add_entry(RegistryEntry("registrytest.missing", "Missing", "Missing"))
+
+        # when
+        values = registry.values()
+
+        # then
+        assert [x.name for x in values] == ["MyService"]
+        assert [x for x, _ in registry.items()] == ["MyService"]
+        assert registry.errors == ["Missing"]
+
+    def test_load(self):
+        # given
+        registry = LazyRegistry(CoreService)
+        registry.add_entry(RegistryEntry("registrytest.missing", "Missing", "Missing"))
+
+        # when
+        errors = registry.load(["Missing"])
+
+        # then
+        assert errors == ["Missing"]
+        assert "Missing" not in registry
@@ -1,13 +1,23 @@
 import itertools
+import threading
+import time
 from pathlib import Path
 
 import pytest
 from mock import MagicMock
 
 from core.emulator.session import Session
-from core.errors import CoreCommandError
+from core.errors import CoreCommandError, CoreServiceBootError
 from core.nodes.base import CoreNode
-from core.services.coreservices import CoreService, ServiceDependencies, ServiceManager
+from core.registry import RegistryEntry
+from core.services.coreservices import (
+    CoreService,
+    ListenProbe,
+    LogProbe,
+    ServiceDependencies,
+    ServiceManager,
+    readiness_script,
+)
 
 _PATH: Path = Path(__file__).resolve().parent
 _SERVICES_PATH = _PATH / "myservices"
@@ -16,6 +26,27 @@ SERVICE_ONE = "MyService"
 SERVICE_TWO = "MyService2"
 
 
+class ProviderService(CoreService):
+    name = "ProviderService"
+    startup = ("provider",)
+    readiness = (ListenProbe(7777), LogProbe("/var/log/provider.log", "done"))
+
+
+class WaitingService(CoreService):
+    name = "WaitingService"
+    startup = ("waiting",)
+    ready_dependencies = (ProviderService.name,)
+    ready_timeout = 5
+
+
+class FailingService(CoreService):
+    name = "FailingService"
+
+    @classmethod
+    def on_load(cls) -> None:
+        raise ValueError("failed")
+
+
 class TestServices:
     def test_service_all_files(self, session: Session):
         # given
@@ -74,6 +105,27 @@ class TestServices:
         if not request.config.getoption("mock"):
             assert file_path.exists()
 
+    def test_service_boot_files(self, session: Session):
+        # given
+        ServiceManager.add_services(_SERVICES_PATH)
+        node = session.add_node(CoreNode)
+        node.services = [
+            ServiceManager.get(SERVICE_ONE),
+            ServiceManager.get(SERVICE_TWO),
+        ]
+        node.create_files = MagicMock()
+
+        # when
+        session.services.boot_services(node)
+
+        # then
+        node.create_files.assert_called_once()
+        files = node.create_files.call_args[0][0]
+        assert sorted(files) == [
+            (Path("myservice.sh"), "# test file", 0o644),
+            (Path("myservice2.sh"), "exit 1", 0o644),
+        ]
+
     def test_service_validate(self, session: Session):
         # given
         ServiceManager.add_services(_SERVICES_PATH)
@@ -101,6 +153,96 @@ class TestServices:
         # then
         assert status
 
+    def test_service_readiness(self, session: Session):
+        # given
+        node = session.add_node(CoreNode)
+        node.cmd = MagicMock()
+        node.create_file = MagicMock()
+
+        # when
+        session.services.boot_service(node, ProviderService)
+
+        # then
+        node.cmd.assert_called_with("sh ready_ProviderService.sh")
+        file_path, script = node.create_file.call_args[0]
+        assert file_path == Path("ready_ProviderService.sh")
+        assert script == readiness_script(
+            ProviderService.name,
+            ProviderService.readiness,
+            ProviderService.validation_timer,
+            ProviderService.validation_period,
+        )
+        assert "ss -Hlnt 'sport = :7777'" in script
+        assert "grep -qF done /var/log/provider.log" in script
+
+    def test_service_readiness_error(self, session: Session):
+        # given
+        node = session.add_node(CoreNode)
+        node.create_file = MagicMock()
+        node.cmd = MagicMock()
+        node.cmd.side_effect = [
+            None,
+            CoreCommandError(1, "sh ready_ProviderService.sh"),
+        ]
+
+        # when
+        with pytest.raises(CoreServiceBootError):
+            session.services.boot_service(node, ProviderService)
+
+    def test_service_wait_ready(self, session: Session):
+        # given
+        provider = session.add_node(CoreNode)
+        provider.services = [ProviderService]
+        node = session.add_node(CoreNode)
+        session.services.clear_ready()
+        event = session.services.ready_event(provider.id, ProviderService.name)
+        timer = threading.Timer(0.1, event.set)
+
+        # when
+        start = time.monotonic()
+        timer.start()
+        session.services.wait_ready(node, WaitingService)
+        total = time.monotonic() - start
+
+        # then
+        assert event.is_set()
+        assert total < WaitingService.ready_timeout
+
+    def test_service_ready_depth(self, session: Session):
+        # given
+        provider = session.add_node(CoreNode)
+        provider.services = [ProviderService]
+        node = session.add_node(CoreNode)
+        node.services = [WaitingService]
+        ServiceManager.services[ProviderService.name] = ProviderService
+        ServiceManager.services[WaitingService.name] = WaitingService
+
+        # when
+        try:
+            provider_depth = session.services.ready_depth(provider)
+            node_depth = session.services.ready_depth(node)
+        finally:
+            del ServiceManager.services[ProviderService.name]
+            del ServiceManager.services[WaitingService.name]
+
+        # then
+        assert provider_depth == 0
+        assert node_depth == 1
+
+    def test_service_on_load_error(self, session: Session):
+        # given
+        entry = RegistryEntry.from_class(
+            FailingService.__module__, FailingService, CoreService
+        )
+
+        # when
+        with pytest.raises(ValueError):
+            ServiceManager.add_entry(entry)
+
+        # then
+        assert entry.on_load
+        assert FailingService.name not in ServiceManager.services
+
     def test_service_startup(self, session: Session):
         # given
         ServiceManager.add_services(_SERVICES_PATH)
@@ -0,0 +1,69 @@
+from unittest import mock
+
+from core.emulator.data import IpPrefixes
+from core.emulator.session import Session
+from core.emulator.teardown import TeardownPlan
+from core.nodes.base import CoreNode
+from core.nodes.network import SwitchNode
+
+
+class OtherNode(CoreNode):
+    def shutdown(self) -> None:
+        pass
+
+
+class TestTeardownPlan:
+    def test_add_nodes(self, session: Session, ip_prefixes: IpPrefixes):
+        # given
+        node1 = session.add_node(CoreNode)
+        node2 = session.add_node(CoreNode)
+        switch = session.add_node(SwitchNode)
+        for node in (node1, node2):
+            iface_data = ip_prefixes.create_iface(node)
+            session.add_link(node.id, switch.id, iface1_data=iface_data)
+        session.instantiate()
+        other = session.add_node(OtherNode)
+        plan = TeardownPlan(session)
+
+        # when
+        plan.add_nodes([node1, node2, switch, other])
+
+        # then
+        assert plan.nodes == [node1, node2]
+        assert plan.nets == [switch]
+        assert plan.others == [other]
+        assert plan.pids == [node1.pid, node2.pid]
+        assert node1.ctrlchnlname in plan.paths
+        assert plan.devices == [switch.brname]
+
+    def test_delete_nodes(self, session: Session, ip_prefixes: IpPrefixes):
+        # given
+        node1 = session.add_node(CoreNode)
+        node2 = session.add_node(CoreNode)
+        switch = session.add_node(SwitchNode)
+        for node in (node1, node2):
+            iface_data = ip_prefixes.create_iface(node)
+            session.add_link(node.id, switch.id, iface1_data=iface_data)
+        session.instantiate()
+
+        # when
+        with mock.patch("core.utils.cmd") as cmd:
+            session.delete_nodes()
+
+        # then
+        args = [x[0][0] for x in cmd.call_args_list]
+        assert len([x for x in args if x.startswith("kill -9")]) == 1
+        assert len([x for x in args if "link delete" in x]) == 1
+        assert len([x for x in args if x.startswith("rm -rf")]) == 1
+        assert not node1.up
+        assert not node2.up
+        assert not switch.up
+        assert not node1.ifaces
+        assert set(session.stop_metrics) == {
+            "nodes",
+            "processes",
+            "nftables",
+            "devices",
+            "directories",
+            "total",
+        }
@@ -0,0 +1,74 @@
+from core.configservices.frrservices.services import get_router_id
+from core.emulator.data import IpPrefixes
+from core.emulator.session import Session
+from core.nodes.base import CoreNode
+from core.nodes.interface import DEFAULT_MTU
+from core.nodes.network import SwitchNode
+
+
+class TestTopologyIndex:
+    def test_mtu(self, session: Session, ip_prefixes: IpPrefixes):
+        # given
+        node1 = session.add_node(CoreNode)
+        node2 = session.add_node(CoreNode)
+        switch = session.add_node(SwitchNode)
+        iface1_data = ip_prefixes.create_iface(node1)
+        iface1, _ = session.add_link(node1.id, switch.id, iface1_data)
+        iface2_data = ip_prefixes.create_iface(node2)
+        iface2, _ = session.add_link(node2.id, switch.id, iface2_data)
+        topology = session.topology
+
+        # when
+        iface2.mtu = 1400
+        topology.invalidate()
+
+        # then
+        assert topology.min_mtu(iface1) == 1400
+        assert topology.has_mtu_mismatch(iface1)
+        assert topology.has_mtu_mismatch(iface2)
+        assert switch in topology.mtus
+
+    def test_mtu_match(self, session: Session, ip_prefixes: IpPrefixes):
+        # given
+        node1 = session.add_node(CoreNode)
+        node2 = session.add_node(CoreNode)
+        iface1_data = ip_prefixes.create_iface(node1)
+        iface2_data = ip_prefixes.create_iface(node2)
+        iface1, _ = session.add_link(node1.id, node2.id, iface1_data, iface2_data)
+
+        # then
+        assert session.topology.min_mtu(iface1) == DEFAULT_MTU
+        assert not session.topology.has_mtu_mismatch(iface1)
+
+    def test_router_id(self, session: Session, ip_prefixes: IpPrefixes):
+        # given
+        node = session.add_node(CoreNode)
+        switch = session.add_node(SwitchNode)
+        assert get_router_id(node) == "0.0.0.0"
+
+        # when
+        iface_data = ip_prefixes.create_iface(node)
+        session.add_link(node.id, switch.id, iface_data)
+
+        # then
+        assert get_router_id(node) == iface_data.ip4
+        assert session.topology.router_ids[node] == iface_data.ip4
+
+    def test_common_nets(self, session: Session, ip_prefixes: IpPrefixes):
+        # given
+        node1 = session.add_node(CoreNode)
+        node2 = session.add_node(CoreNode)
+        switch = session.add_node(SwitchNode)
+        iface1_data = ip_prefixes.create_iface(node1)
+        iface1, _ = session.add_link(node1.id, switch.id, iface1_data)
+        iface2_data = ip_prefixes.create_iface(node2)
+        iface2, _ = session.add_link(node2.id, switch.id, iface2_data)
+
+        # when
+        common = node1.commonnets(node2)
+
+        # then
+        assert common == [(switch, iface1, iface2)]
+        session.delete_link(node2.id, switch.id, iface2.node_id)
+        assert not session.topology.node_nets
+        assert node1.commonnets(node2) == []